@@ -0,0 +1,419 @@
+# Purpose: Iterate over the modelspace of huge DXF files without loading the whole DXF document
+# Created: 17.10.2019
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+IterDXF
+=======
+
+This add-on iterates over the entities of the modelspace of huge DXF files (> 1 GB), which do not fit into memory,
+without building a complete :class:`~ezdxf.drawing.Drawing`. Only the HEADER, CLASSES and TABLES sections are loaded
+into a minimal resource document, all other sections are skipped and the modelspace entities of the ENTITIES section
+are loaded one at a time. Memory consumption depends only on the size of the resource sections and the biggest
+entity, but not on the size of the DXF file.
+
+Only ASCII DXF files are supported.
+
+.. warning::
+
+    The iterated entities are not stored in an entity database and do not belong to a layout, they are just
+    virtual entities for data extraction and for copying into a new DXF file by :class:`IterDXFWriter`.
+
+Example::
+
+    from ezdxf.addons import iterdxf
+
+    doc = iterdxf.opendxf('big.dxf')
+    line_exporter = doc.export('lines.dxf')
+    text_exporter = doc.export('text.dxf')
+    try:
+        for entity in doc.modelspace():
+            if entity.dxftype() == 'LINE':
+                line_exporter.write(entity)
+            elif entity.dxftype() in ('TEXT', 'MTEXT'):
+                text_exporter.write(entity)
+    finally:
+        line_exporter.close()
+        text_exporter.close()
+        doc.close()
+
+"""
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, List, Tuple, Set, TextIO, BinaryIO, Union
+import io
+import os
+import re
+import mmap
+import codecs
+
+from ezdxf.lldxf.const import DXFStructureError, DXF12
+from ezdxf.lldxf.types import DXFTag
+from ezdxf.lldxf.tags import Tags
+from ezdxf.lldxf.tagger import ascii_tag_compiler
+from ezdxf.lldxf.tagwriter import TagWriter
+from ezdxf.lldxf.validator import is_binary_dxf_file
+from ezdxf.entities.dxfgfx import entity_linker
+from ezdxf.filemanagement import dxf_file_info
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing, DXFGraphic
+
+__all__ = ['opendxf', 'modelspace', 'single_pass_modelspace', 'IterDXF', 'IterDXFWriter']
+
+# Sections required to create the resource document
+RESOURCE_SECTIONS = {'HEADER', 'CLASSES', 'TABLES'}
+# Main entities with linked sub entities: VERTEX, ATTRIB and SEQEND
+LINKED_ENTITIES = {'POLYLINE', 'INSERT'}
+SUB_ENTITIES = {'VERTEX', 'ATTRIB', 'SEQEND'}
+
+# Start of the ENTITIES section, includes the section name line.
+# Group codes and values are alternating lines, therefore 'SECTION' after a '0' line is always a section start.
+ENTITIES_SECTION = re.compile(rb'(?:^|\n)[ \t]*0[ \t]*\r?\nSECTION[ \t]*\r?\n[ \t]*2[ \t]*\r?\nENTITIES[ \t]*\r?\n')
+# End of a section, the match starts at the '0' line
+END_OF_SECTION = re.compile(rb'\n([ \t]*0[ \t]*\r?\nENDSEC)')
+SCAN_BLOCK_SIZE = 1 << 22  # 4 MB
+SCAN_OVERLAP = 128  # bytes, has to be greater than a section marker
+
+
+class IterDXF:
+    """
+    Iterator for DXF entities stored in the modelspace of a huge DXF file, use the factory function :func:`opendxf`.
+
+    Args:
+        filename: DXF filename
+        errors: string decoding error handler
+        use_mmap: use memory mapped file as input if ``True``, else a regular binary file object
+
+    :ivar doc: minimal resource :class:`~ezdxf.drawing.Drawing`, loaded from the HEADER, CLASSES and TABLES sections
+    :ivar encoding: DXF file encoding
+
+    """
+
+    def __init__(self, filename: str, errors: str = 'ignore', use_mmap: bool = True):
+        if is_binary_dxf_file(filename):
+            raise DXFStructureError('Binary DXF files are not supported: "{}".'.format(filename))
+        self.name = filename
+        self.errors = errors
+        self.encoding = dxf_file_info(filename).encoding
+        self._file = open(filename, mode='rb')
+        self._mmap = None  # type: Optional[mmap.mmap]
+        if use_mmap:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._source = self._file if self._mmap is None else self._mmap  # type: Union[mmap.mmap, BinaryIO]
+        self._size = os.path.getsize(filename)
+        # byte range of the content of the ENTITIES section, without the section head and the ENDSEC tag
+        self._entities_start, self._entities_end = self._locate_entities_section()
+        self.doc = _load_resources(self._tagger(0, self._entities_start))
+
+    def _locate_entities_section(self) -> Tuple[int, int]:
+        match = _search(self._source, ENTITIES_SECTION, 0, self._size)
+        if match is None:
+            raise DXFStructureError('ENTITIES section not found in "{}".'.format(self.name))
+        start = match[1]
+        # END_OF_SECTION requires the line ending in front of the '0' line, which could be the last byte of the
+        # section head for an empty ENTITIES section
+        match = _search(self._source, END_OF_SECTION, start - 1, self._size)
+        if match is None:
+            raise DXFStructureError('Missing ENDSEC tag of ENTITIES section in "{}".'.format(self.name))
+        return start, match[0]
+
+    def _tagger(self, start: int, end: int) -> Iterator[DXFTag]:
+        return iter(ascii_tag_compiler(_TextReader(self._source, start, end, self.encoding, self.errors)))
+
+    def modelspace(self, types: Iterable[str] = None) -> Iterable['DXFGraphic']:
+        """
+        Yields all DXF entities from the modelspace, each entity is constructed at iteration and not stored, linked
+        entities like VERTEX and ATTRIB are yielded as part of their main entities POLYLINE and INSERT.
+
+        Args:
+            types: DXF types like ``['LINE', '3DFACE']`` which should be returned, ``None`` returns all supported
+                   types.
+
+        """
+        return _modelspace_entities(self._tagger(self._entities_start, self._entities_end), self.doc, types)
+
+    def export(self, filename: str) -> 'IterDXFWriter':
+        """
+        Returns a companion object to export parts from the source DXF file into another DXF file, the new file will
+        have the same HEADER, CLASSES, TABLES, BLOCKS and OBJECTS sections, which guarantees all necessary
+        dependencies are present in the new file.
+
+        Args:
+            filename: filename, accepts also any binary stream opened by :code:`open(filename, 'wb')`
+
+        """
+        return IterDXFWriter(filename, self)
+
+    def copy_raw(self, stream: BinaryIO, start: int, end: int) -> None:
+        """ Copy byte range [`start`, `end`) of the source DXF file into binary `stream`. (internal API) """
+        source = self._source
+        while start < end:
+            source.seek(start)
+            data = source.read(min(SCAN_BLOCK_SIZE, end - start))
+            if not data:
+                break
+            stream.write(data)
+            start += len(data)
+
+    def copy_head(self, stream: BinaryIO) -> None:
+        """ Copy DXF file until start of the ENTITIES section content into binary `stream`. (internal API) """
+        self.copy_raw(stream, 0, self._entities_start)
+
+    def copy_tail(self, stream: BinaryIO) -> None:
+        """ Copy DXF file from the end of the ENTITIES section content into binary `stream`. (internal API) """
+        self.copy_raw(stream, self._entities_end, self._size)
+
+    def close(self) -> None:
+        """ Safe closing source DXF file. """
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+
+class IterDXFWriter:
+    """
+    Writes entities into a new DXF file, the content of all sections except the ENTITIES section is copied
+    from the source DXF file. Do not instantiate this class directly, use :meth:`IterDXF.export`.
+
+    Args:
+        filename: output filename or binary stream
+        source: source :class:`IterDXF` object
+
+    """
+
+    def __init__(self, filename: Union[str, BinaryIO], source: IterDXF):
+        self._close_file = isinstance(filename, str)
+        self._file = open(filename, mode='wb') if self._close_file else filename  # type: BinaryIO
+        self._source = source
+        doc = source.doc
+        dxfversion = doc.dxfversion
+        write_handles = bool(doc.header.get('$HANDLING', 0)) if dxfversion == DXF12 else True
+        self._text = io.StringIO()
+        self._tagwriter = TagWriter(self._text, dxfversion=dxfversion, write_handles=write_handles)
+        source.copy_head(self._file)
+
+    def write(self, entity: 'DXFGraphic') -> None:
+        """
+        Write a DXF entity from the source DXF file to the export file.
+
+        Don't write entities from different documents than the source DXF file, dependencies and resources will not
+        match, maybe it will work once, but not in a reliable way for different DXF documents.
+
+        """
+        tagwriter = self._tagwriter
+        entity.export_dxf(tagwriter)
+        if hasattr(entity, 'linked_entities'):  # only POLYLINE & INSERT can have linked entities
+            seqend = False
+            for linked in entity.linked_entities():
+                seqend = True
+                linked.export_dxf(tagwriter)
+            if seqend:
+                entity.export_seqend(tagwriter)
+        text = self._text.getvalue()
+        self._text.seek(0)
+        self._text.truncate()
+        self._file.write(text.encode(self._source.encoding, errors='dxfreplace'))
+
+    def close(self) -> None:
+        """ Safe closing of exported DXF file. Copying of OBJECTS section happens only at closing the file, without
+        closing the new DXF file is invalid.
+        """
+        self._source.copy_tail(self._file)
+        if self._close_file:
+            self._file.close()
+
+
+def opendxf(filename: str, errors: str = 'ignore', use_mmap: bool = True) -> IterDXF:
+    """
+    Open DXF file for iterating, be sure to open valid DXF files, no DXF structure checks will be applied.
+
+    Use this function to split up big DXF files as shown in the example above.
+
+    Args:
+        filename: DXF filename of a seekable DXF file.
+        errors: string decoding error handler
+        use_mmap: use memory mapped file as input if ``True``
+
+    """
+    return IterDXF(filename, errors=errors, use_mmap=use_mmap)
+
+
+def modelspace(filename: str, types: Iterable[str] = None, errors: str = 'ignore',
+               use_mmap: bool = True) -> Iterable['DXFGraphic']:
+    """
+    Iterate over all modelspace entities as :class:`DXFGraphic` objects of a seekable file.
+
+    Use this function to iterate "quick" over modelspace entities of a DXF file, filtering DXF types may speed up
+    things if many entity types will be skipped.
+
+    Args:
+        filename: filename of a seekable DXF file
+        types: DXF types like ``['LINE', '3DFACE']`` which should be returned, ``None`` returns all supported types.
+        errors: string decoding error handler
+        use_mmap: use memory mapped file as input if ``True``
+
+    """
+    doc = IterDXF(filename, errors=errors, use_mmap=use_mmap)
+    try:
+        yield from doc.modelspace(types)
+    finally:
+        doc.close()
+
+
+def single_pass_modelspace(stream: TextIO, types: Iterable[str] = None) -> Iterable['DXFGraphic']:
+    """
+    Iterate over all modelspace entities as :class:`DXFGraphic` objects in one single pass.
+
+    Use this function to 'quick' iterate over modelspace entities of a **not** seekable text stream. The stream has
+    to be opened with the correct encoding like for :func:`ezdxf.read`, only the :meth:`read` method is required.
+    BLOCKS and all sections following the ENTITIES section are skipped.
+
+    Args:
+        stream: text stream, requires a :meth:`read` method
+        types: DXF types like ``['LINE', '3DFACE']`` which should be returned, ``None`` returns all supported types.
+
+    """
+    tagger = iter(ascii_tag_compiler(stream))
+    doc = _load_resources(tagger)
+    # skip all sections between TABLES and ENTITIES, like BLOCKS
+    prev = None
+    for tag in tagger:
+        if prev == (0, 'SECTION') and tag == (2, 'ENTITIES'):
+            break
+        prev = tag
+    else:
+        return
+    yield from _modelspace_entities(tagger, doc, types)
+
+
+def _search(source: Union[mmap.mmap, BinaryIO], pattern, start: int, end: int):
+    """ Returns (start, end) of the first match of `pattern` in `source` or ``None``. """
+    if isinstance(source, mmap.mmap):
+        match = pattern.search(source, start, end)
+        return None if match is None else match.span(match.lastindex or 0)
+
+    while start < end:
+        source.seek(start)
+        data = source.read(min(SCAN_BLOCK_SIZE, end - start))
+        if not data:
+            break
+        match = pattern.search(data)
+        if match is not None:
+            span = match.span(match.lastindex or 0)
+            return start + span[0], start + span[1]
+        if start + len(data) >= end:
+            break
+        start += max(len(data) - SCAN_OVERLAP, 1)
+    return None
+
+
+class _TextReader:
+    """ Text stream of the byte range [`start`, `end`) of a seekable binary `source`, translates line endings
+    '\\r\\n' into '\\n', provides the :meth:`read` method required by :func:`ascii_tag_compiler`.
+    """
+
+    def __init__(self, source: Union[mmap.mmap, BinaryIO], start: int, end: int, encoding: str, errors: str):
+        self._source = source
+        self._pos = start
+        self._end = end
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        self._cr = ''  # pending '\r' at the end of the previous block
+
+    def read(self, size: int) -> str:
+        text = ''
+        while not text and self._pos < self._end:
+            self._source.seek(self._pos)
+            data = self._source.read(min(size, self._end - self._pos))
+            if not data:  # unexpected end of file
+                self._end = self._pos
+                break
+            self._pos += len(data)
+            text = self._cr + self._decoder.decode(data, final=self._pos >= self._end)
+            self._cr = ''
+            if text.endswith('\r') and self._pos < self._end:
+                self._cr = '\r'
+                text = text[:-1]
+            text = text.replace('\r\n', '\n')
+        if not text and self._cr:
+            text, self._cr = self._cr, ''
+        return text
+
+
+def _load_resources(tagger: Iterator[DXFTag]) -> 'Drawing':
+    """ Load resource sections HEADER, CLASSES and TABLES until the first other section into a minimal DXF document.
+    """
+    from ezdxf.drawing import Drawing
+
+    tags = []  # type: List[DXFTag]
+    for tag in tagger:
+        if tag == (0, 'SECTION'):
+            name = next(tagger)
+            if name.value not in RESOURCE_SECTIONS:
+                break
+            tags.append(tag)
+            tags.append(name)
+        elif tag == (0, 'EOF'):
+            break
+        else:
+            tags.append(tag)
+    tags.append(DXFTag(0, 'EOF'))
+    return Drawing.from_tags(tags)
+
+
+def _modelspace_entities(tagger: Iterator[DXFTag], doc: 'Drawing', types: Iterable[str] = None
+                         ) -> Iterable['DXFGraphic']:
+    """ Yields modelspace entities from `tagger` until the end of the ENTITIES section. """
+    requested_types = set(types) if types is not None else None  # type: Optional[Set[str]]
+    factory = doc.dxffactory
+    msp_handle = doc.block_records.get('*Model_Space').dxf.handle
+    psp_handle = doc.block_records.get('*Paper_Space').dxf.handle
+
+    def is_modelspace_entity(entity: 'DXFGraphic') -> bool:
+        owner = entity.dxf.get('owner')
+        if owner == msp_handle:
+            return True
+        if owner == psp_handle:
+            return False
+        return not entity.dxf.get('paperspace', 0)
+
+    def entity_tags() -> Iterable[Tags]:
+        tags = None
+        for tag in tagger:
+            if tag.code == 0:
+                if tags is not None:
+                    yield tags
+                if tag.value == 'ENDSEC':
+                    return
+                tags = Tags([tag])
+            elif tags is not None:
+                tags.append(tag)
+        if tags is not None:  # missing ENDSEC
+            yield tags
+
+    def is_requested(entity: 'DXFGraphic') -> bool:
+        return requested_types is None or entity.dxftype() in requested_types
+
+    linked_entity = entity_linker()
+    queued = None
+    skip_sub_entities = False
+    for tags in entity_tags():
+        dxftype = tags[0].value
+        if skip_sub_entities:
+            # skip sub entities of not requested main entities without constructing DXF entities
+            if dxftype in SUB_ENTITIES:
+                if dxftype == 'SEQEND':
+                    skip_sub_entities = False
+                continue
+            skip_sub_entities = False
+        if requested_types is not None and dxftype not in requested_types and dxftype not in SUB_ENTITIES:
+            if dxftype in LINKED_ENTITIES:
+                # INSERT has only following ATTRIB entities if attribs_follow (66) is 1
+                skip_sub_entities = dxftype == 'POLYLINE' or tags.get_first_value(66, 0) == 1
+            continue
+        entity = factory.entity(tags)
+        if not linked_entity(entity):
+            if queued is not None:
+                yield queued
+            queued = entity if is_requested(entity) and is_modelspace_entity(entity) else None
+    if queued is not None:
+        yield queued
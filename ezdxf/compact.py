@@ -0,0 +1,483 @@
+# Purpose: columnar storage of simple graphical entities
+# Created: 2019-12-02
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Tuple, Any, Optional, Type
+from array import array
+
+from ezdxf.math import Vector
+from ezdxf.lldxf.const import DXF12, DXFAttributeError, DXFTypeError, DXFValueError
+from ezdxf.lldxf.const import SUBCLASS_MARKER, STRUCTURE_MARKER, OWNER_CODE
+from ezdxf.entities import Line, Point, Circle, Arc, Face3d
+from ezdxf.entities.dxfentity import ERR_INVALID_DXF_ATTRIB
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Drawing, TagWriter, Vertex, DXFEntity
+
+__all__ = ['CompactEntityStore', 'CompactEntity', 'CompactDXFNamespace', 'COMPACT_TYPES']
+
+# column definition: (name, typecode, width, group code)
+Column = Tuple[str, str, int, int]
+
+# columns of the subclass 'AcDbEntity', string values are stored as index into the string table of the store
+ENTITY_COLUMNS = [
+    ('layer', 'I', 1, 8),
+    ('linetype', 'I', 1, 6),
+    ('color', 'h', 1, 62),
+    ('lineweight', 'h', 1, 370),
+]  # type: List[Column]
+
+STRING_COLUMNS = {'layer', 'linetype'}
+
+# supported DXF types: (entity class, [(subclass name, columns), ...])
+COMPACT_TYPES = {
+    'LINE': (Line, [
+        ('AcDbLine', [('start', 'd', 3, 10), ('end', 'd', 3, 11)]),
+    ]),
+    'POINT': (Point, [
+        ('AcDbPoint', [('location', 'd', 3, 10)]),
+    ]),
+    'CIRCLE': (Circle, [
+        ('AcDbCircle', [('center', 'd', 3, 10), ('radius', 'd', 1, 40)]),
+    ]),
+    'ARC': (Arc, [
+        ('AcDbCircle', [('center', 'd', 3, 10), ('radius', 'd', 1, 40)]),
+        ('AcDbArc', [('start_angle', 'd', 1, 50), ('end_angle', 'd', 1, 51)]),
+    ]),
+    '3DFACE': (Face3d, [
+        ('AcDbFace', [('vtx0', 'd', 3, 10), ('vtx1', 'd', 3, 11), ('vtx2', 'd', 3, 12), ('vtx3', 'd', 3, 13),
+                      ('invisible', 'h', 1, 70)]),
+    ]),
+}  # type: Dict[str, Tuple[Type[DXFGraphic], List[Tuple[str, List[Column]]]]]
+
+# DXF attributes provided by the store for all entities
+STORE_ATTRIBS = {'handle', 'owner', 'paperspace'}
+
+# optional DXF attributes, which are accepted by converting existing entities if set to the default value
+IGNORED_DEFAULTS = {
+    'thickness': 0,
+    'extrusion': (0, 0, 1),
+}
+
+
+class CompactTable:
+    """ Columns of all entities of one DXF type. (internal API) """
+
+    def __init__(self, store: 'CompactEntityStore', dxftype: str):
+        self.store = store
+        self.dxftype = dxftype
+        entity_class, subclasses = COMPACT_TYPES[dxftype]
+        self.dxfattribs = entity_class.DXFATTRIBS
+        self.subclasses = [(name, [column[0] for column in columns]) for name, columns in subclasses]
+        self.columns = {}  # type: Dict[str, Column]
+        for column in ENTITY_COLUMNS:
+            self.columns[column[0]] = column
+        for _, columns in subclasses:
+            for column in columns:
+                self.columns[column[0]] = column
+        # integer handles, a handle of 0 marks a deleted entity
+        self.handles = array('Q')
+        self.data = {name: array(typecode) for name, typecode, _, _ in self.columns.values()}  # type: Dict[str, array]
+
+    def __len__(self) -> int:
+        """ Count of rows including deleted entities. """
+        return len(self.handles)
+
+    def append(self, handle: str, dxfattribs: Dict[str, Any]) -> int:
+        """ Append a new row and returns the row index, `dxfattribs` have to be valid for a compact entity. """
+        for key in dxfattribs:
+            self.check_supported(key)
+        index = len(self.handles)
+        self.handles.append(int(handle, 16))
+        for name, (_, typecode, width, _) in self.columns.items():
+            value = dxfattribs.get(name)
+            if value is None:
+                value = self.dxfattribs.get(name).default
+            self.data[name].extend(self.encode(name, width, value))
+        return index
+
+    def check_supported(self, key: str) -> None:
+        if key not in self.columns and key not in STORE_ATTRIBS:
+            if self.dxfattribs.get(key) is None:
+                raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
+            raise DXFAttributeError('DXF attribute "{}" is not supported by compact {} entities'.format(
+                key, self.dxftype))
+
+    def encode(self, name: str, width: int, value: Any) -> Iterable:
+        if name in STRING_COLUMNS:
+            return self.store.string_index(value),
+        if width == 3:
+            return Vector(value).xyz
+        return value,
+
+    def get(self, index: int, key: str) -> Any:
+        """ Returns the value of DXF attribute `key` of row `index` or raises :class:`KeyError` for attributes without
+        column.
+        """
+        column = self.data[key]
+        width = self.columns[key][2]
+        if width == 3:
+            start = index * 3
+            return Vector(column[start:start + 3])
+        value = column[index]
+        if key in STRING_COLUMNS:
+            return self.store.strings[value]
+        return value
+
+    def set(self, index: int, key: str, value: Any) -> None:
+        self.check_supported(key)
+        if key in STORE_ATTRIBS:
+            raise DXFAttributeError('DXF attribute "{}" of compact entities is read only'.format(key))
+        width = self.columns[key][2]
+        values = self.encode(key, width, value)
+        self.data[key][index * width:index * width + width] = array(self.columns[key][1], values)
+
+    def is_alive(self, index: int) -> bool:
+        return self.handles[index] != 0
+
+    def delete(self, index: int) -> None:
+        self.handles[index] = 0
+
+    def purge(self) -> None:
+        """ Remove all deleted rows. """
+        alive = [index for index, handle in enumerate(self.handles) if handle]
+        if len(alive) == len(self.handles):
+            return
+        self.handles = array('Q', (self.handles[index] for index in alive))
+        for name, (_, typecode, width, _) in self.columns.items():
+            column = self.data[name]
+            if width == 1:
+                self.data[name] = array(typecode, (column[index] for index in alive))
+            else:
+                data = array(typecode)
+                for index in alive:
+                    data.extend(column[index * width:index * width + width])
+                self.data[name] = data
+
+    def export_dxf(self, tagwriter: 'TagWriter') -> None:
+        """ Export all entities straight from the columns. """
+        dxfversion = tagwriter.dxfversion
+        modern = dxfversion > DXF12
+        write_handles = modern or tagwriter.write_handles
+        write = tagwriter.write_tag2
+        dxftype = self.dxftype
+        owner = self.store.owner
+        paperspace = self.store.paperspace
+        strings = self.store.strings
+        layers = self.data['layer']
+        linetypes = self.data['linetype']
+        colors = self.data['color']
+        lineweights = self.data['lineweight']
+        bylayer = self.store.string_index('BYLAYER')
+        subclasses = [(name, [(self.data[column], self.columns[column]) for column in columns])
+                      for name, columns in self.subclasses]
+
+        for index, handle in enumerate(self.handles):
+            if not handle:
+                continue
+            write(STRUCTURE_MARKER, dxftype)
+            if write_handles:
+                write(5, '%X' % handle)
+            if modern:
+                write(OWNER_CODE, owner)
+                write(SUBCLASS_MARKER, 'AcDbEntity')
+            if paperspace:
+                write(67, 1)
+            write(8, strings[layers[index]])
+            if linetypes[index] != bylayer:
+                write(6, strings[linetypes[index]])
+            if colors[index] != 256:
+                write(62, colors[index])
+            if modern and lineweights[index] != -1:
+                write(370, lineweights[index])
+            for subclass, columns in subclasses:
+                if modern:
+                    write(SUBCLASS_MARKER, subclass)
+                for data, (name, _, width, code) in columns:
+                    if width == 3:
+                        start = index * 3
+                        write(code, data[start])
+                        write(code + 10, data[start + 1])
+                        write(code + 20, data[start + 2])
+                    elif code == 70:  # optional flags
+                        if data[index]:
+                            write(code, data[index])
+                    else:
+                        write(code, data[index])
+
+
+class CompactDXFNamespace:
+    """ DXF namespace of a :class:`CompactEntity`, provides the same attribute access as the DXF namespace of a
+    regular entity, supported attributes are stored in the columns of the :class:`CompactEntityStore`.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: CompactTable, index: int):
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_index', index)
+
+    @property
+    def dxftype(self) -> str:
+        return self._table.dxftype
+
+    def __getattr__(self, key: str) -> Any:
+        table = self._table
+        if key == 'handle':
+            return '%X' % table.handles[self._index]
+        if key == 'owner':
+            return table.store.owner
+        if key == 'paperspace':
+            return table.store.paperspace
+        try:
+            return table.get(self._index, key)
+        except KeyError:
+            pass
+        attrib_def = table.dxfattribs.get(key)
+        if attrib_def is None:
+            raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, table.dxftype))
+        return attrib_def.default
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self._table.set(self._index, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """ Returns DXF attribute `key` or `default` if not stored. """
+        if self.hasattr(key):
+            return self.__getattr__(key)
+        if not self.is_supported(key):
+            raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self._table.dxftype))
+        return default
+
+    def set(self, key: str, value: Any) -> None:
+        """ Set DXF attribute `key` to `value`, raises :class:`DXFAttributeError` for attributes without column. """
+        self._table.set(self._index, key, value)
+
+    def hasattr(self, key: str) -> bool:
+        """ ``True`` if DXF attribute `key` is stored. """
+        return key in self._table.columns or key in ('handle', 'owner')
+
+    def is_supported(self, key: str) -> bool:
+        """ ``True`` if the DXF attribute `key` is supported by the DXF type. """
+        return self._table.dxfattribs.get(key) is not None
+
+    def get_default(self, key: str) -> Any:
+        """ Returns the DXF default value for DXF attribute `key`. """
+        attrib_def = self._table.dxfattribs.get(key)
+        if attrib_def is None:
+            raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self._table.dxftype))
+        return attrib_def.default
+
+    def all_existing_dxf_attribs(self) -> dict:
+        """ Returns all stored DXF attributes. """
+        return {key: self.__getattr__(key) for key in ['handle', 'owner'] + list(self._table.columns)}
+
+
+class CompactEntity:
+    """ Lightweight proxy object for an entity stored in a :class:`CompactEntityStore`, proxy objects are created on
+    demand and two proxies for the same entity are equal.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: CompactTable, index: int):
+        self._table = table
+        self._index = index
+
+    def __eq__(self, other: 'CompactEntity') -> bool:
+        if not isinstance(other, CompactEntity):
+            return NotImplemented
+        return self._table is other._table and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._table), self._index))
+
+    def __repr__(self):
+        return '<compact {} #{}>'.format(self._table.dxftype, self.dxf.handle)
+
+    def dxftype(self) -> str:
+        return self._table.dxftype
+
+    @property
+    def dxf(self) -> CompactDXFNamespace:
+        return CompactDXFNamespace(self._table, self._index)
+
+    @property
+    def doc(self) -> Optional['Drawing']:
+        return self._table.store.doc
+
+    @property
+    def is_alive(self) -> bool:
+        """ ``False`` if entity was deleted. """
+        return self._table.is_alive(self._index)
+
+    def get_dxf_attrib(self, key: str, default: Any = None) -> Any:
+        return self.dxf.get(key, default)
+
+    def set_dxf_attrib(self, key: str, value: Any) -> None:
+        self.dxf.set(key, value)
+
+
+class CompactEntityStore:
+    """
+    Columnar storage of simple graphical entities of a layout, supported are LINE, POINT, CIRCLE, ARC and 3DFACE.
+    The DXF attributes are stored in typed :class:`array.array` columns and the entities are exposed as
+    :class:`CompactEntity` proxy objects with the same :attr:`dxf` attribute access as regular entities.
+
+    Supported DXF attributes are `layer`, `linetype`, `color`, `lineweight` and the geometry of the DXF type, compact
+    entities do not support XDATA, app data, reactors or extension dictionaries and are not stored in the entity
+    database. The entities are exported after the regular entities of the layout.
+
+    Args:
+        doc: DXF document
+        owner: handle of the owner BLOCK_RECORD
+        paperspace: ``True`` for entities of paperspace layouts
+
+    """
+
+    def __init__(self, doc: 'Drawing', owner: str, paperspace: bool = False):
+        self.doc = doc
+        self.owner = owner
+        self.paperspace = int(paperspace)
+        self.strings = []  # type: List[str]
+        self._string_index = {}  # type: Dict[str, int]
+        self.tables = {}  # type: Dict[str, CompactTable]
+        self._deleted = 0
+
+    def string_index(self, s: str) -> int:
+        """ Returns the index of string `s` in the string table. (internal API) """
+        try:
+            return self._string_index[s]
+        except KeyError:
+            index = len(self.strings)
+            self.strings.append(s)
+            self._string_index[s] = index
+            return index
+
+    def _table(self, dxftype: str) -> CompactTable:
+        table = self.tables.get(dxftype)
+        if table is None:
+            table = CompactTable(self, dxftype)
+            self.tables[dxftype] = table
+        return table
+
+    def __len__(self) -> int:
+        """ Count of entities. """
+        return sum(len(table) for table in self.tables.values()) - self._deleted
+
+    def __iter__(self) -> Iterator[CompactEntity]:
+        """ Yields all entities as :class:`CompactEntity` proxies, grouped by DXF type. """
+        for table in self.tables.values():
+            for index, handle in enumerate(table.handles):
+                if handle:
+                    yield CompactEntity(table, index)
+
+    def new_entity(self, dxftype: str, dxfattribs: Dict[str, Any]) -> CompactEntity:
+        """ Add a new entity of type `dxftype`, raises :class:`DXFTypeError` for unsupported DXF types. """
+        if dxftype not in COMPACT_TYPES:
+            raise DXFTypeError('DXF type {} is not supported by the compact entity store'.format(dxftype))
+        dxfattribs = dict(dxfattribs or {})
+        handle = dxfattribs.pop('handle', None)
+        if handle is None:
+            handle = self.doc.entitydb.next_handle()
+        table = self._table(dxftype)
+        return CompactEntity(table, table.append(handle, dxfattribs))
+
+    def add_line(self, start: 'Vertex', end: 'Vertex', dxfattribs: dict = None) -> CompactEntity:
+        """ Add a LINE from `start` to `end`. """
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['start'] = start
+        dxfattribs['end'] = end
+        return self.new_entity('LINE', dxfattribs)
+
+    def add_point(self, location: 'Vertex', dxfattribs: dict = None) -> CompactEntity:
+        """ Add a POINT at `location`. """
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['location'] = location
+        return self.new_entity('POINT', dxfattribs)
+
+    def add_circle(self, center: 'Vertex', radius: float, dxfattribs: dict = None) -> CompactEntity:
+        """ Add a CIRCLE. """
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['center'] = center
+        dxfattribs['radius'] = radius
+        return self.new_entity('CIRCLE', dxfattribs)
+
+    def add_arc(self, center: 'Vertex', radius: float, start_angle: float, end_angle: float,
+                dxfattribs: dict = None) -> CompactEntity:
+        """ Add an ARC, angles in degrees. """
+        dxfattribs = dict(dxfattribs or {})
+        dxfattribs['center'] = center
+        dxfattribs['radius'] = radius
+        dxfattribs['start_angle'] = start_angle
+        dxfattribs['end_angle'] = end_angle
+        return self.new_entity('ARC', dxfattribs)
+
+    def add_3dface(self, points: Iterable['Vertex'], dxfattribs: dict = None) -> CompactEntity:
+        """ Add a 3DFACE defined by 3 or 4 `points`. """
+        dxfattribs = dict(dxfattribs or {})
+        points = list(points)
+        if len(points) == 3:
+            points.append(points[2])
+        if len(points) != 4:
+            raise DXFValueError('3 or 4 points required')
+        for index, point in enumerate(points):
+            dxfattribs['vtx' + str(index)] = point
+        return self.new_entity('3DFACE', dxfattribs)
+
+    def add_entity(self, entity: 'DXFGraphic') -> Optional[CompactEntity]:
+        """
+        Add a copy of `entity` with the same handle, returns ``None`` if `entity` can not be stored as compact entity.
+        The source `entity` is not changed, delete the source entity from its layout.
+
+        """
+        attribs = compact_attribs(entity)
+        if attribs is None:
+            return None
+        return self.new_entity(entity.dxftype(), attribs)
+
+    def delete_entity(self, entity: CompactEntity) -> None:
+        """ Delete `entity`, the proxy objects of deleted entities are not alive anymore. """
+        if entity.is_alive:
+            entity._table.delete(entity._index)
+            self._deleted += 1
+
+    def purge(self) -> None:
+        """ Remove deleted entities, existing :class:`CompactEntity` proxies are invalid after purging. """
+        for table in self.tables.values():
+            table.purge()
+        self._deleted = 0
+
+    def clear(self) -> None:
+        """ Delete all entities. """
+        self.tables.clear()
+        self._deleted = 0
+
+    def export_dxf(self, tagwriter: 'TagWriter') -> None:
+        """ Export all entities straight from the columns. (internal API) """
+        for table in self.tables.values():
+            table.export_dxf(tagwriter)
+
+
+def compact_attribs(entity: 'DXFEntity') -> Optional[Dict[str, Any]]:
+    """ Returns the DXF attributes of `entity` for a compact entity or ``None`` if `entity` is not compatible. """
+    dxftype = entity.dxftype()
+    if dxftype not in COMPACT_TYPES:
+        return None
+    if entity.appdata or entity.reactors or entity.extension_dict or entity.xdata or entity.embedded_objects:
+        return None
+    entity_class, subclasses = COMPACT_TYPES[dxftype]
+    supported = {column[0] for column in ENTITY_COLUMNS}
+    for _, columns in subclasses:
+        supported.update(column[0] for column in columns)
+    attribs = {}
+    for key, value in entity.dxf.all_existing_dxf_attribs().items():
+        if key in supported or key == 'handle':
+            attribs[key] = value
+        elif key == 'extrusion':
+            if not Vector(value).isclose(IGNORED_DEFAULTS[key]):
+                return None
+        elif key in IGNORED_DEFAULTS:
+            if value != IGNORED_DEFAULTS[key]:
+                return None
+        elif key not in STORE_ATTRIBS:
+            return None
+    return attribs
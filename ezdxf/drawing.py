@@ -1,7 +1,7 @@
 # Created: 11.03.2011
 # Copyright (c) 2011-2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, TextIO, Iterable, Union, Sequence, Tuple, Callable, cast
+from typing import TYPE_CHECKING, TextIO, BinaryIO, Iterable, Union, Sequence, Tuple, Callable, Set, cast
 from datetime import datetime
 import io
 import logging
@@ -10,9 +10,10 @@ from itertools import chain
 from ezdxf.lldxf.const import acad_release, BLK_XREF, BLK_EXTERNAL, DXFValueError, acad_release_to_dxf_version
 from ezdxf.lldxf.const import DXF13, DXF14, DXF2000, DXF2007, DXF12, DXF2013, versions_supported_by_save
 from ezdxf.lldxf.const import DXFVersionError
-from ezdxf.lldxf.loader import load_dxf_structure, fill_database
+from ezdxf.lldxf.loader import load_dxf_structure, fill_database, skip_sections, filter_entities, EntityFilter
 from ezdxf.lldxf import repair
-from .lldxf.tagwriter import TagWriter
+from ezdxf.options import options
+from .lldxf.tagwriter import TagWriter, BinaryTagWriter
 
 from ezdxf.entitydb import EntityDB
 from ezdxf.entities.factory import EntityFactory
@@ -96,6 +97,12 @@ class Drawing:
         # New created handles could collide with handles loaded from DXF file.
         assert len(self.entitydb) == 0
 
+    def __setstate__(self, state: dict) -> None:
+        """ Pickle support, restores the back link of all database entities to this document. (internal API) """
+        self.__dict__.update(state)
+        for entity in self.entitydb.values():
+            entity.doc = self
+
     @classmethod
     def new(cls, dxfversion: str = DXF2013) -> 'Drawing':
         """ Create new drawing. Package users should use the factory function :func:`ezdxf.new`.
@@ -217,7 +224,8 @@ class Drawing:
         return version
 
     @classmethod
-    def read(cls, stream: TextIO, legacy_mode: bool = False, filter_stack: TFilterStack = None) -> 'Drawing':
+    def read(cls, stream: TextIO, legacy_mode: bool = False, filter_stack: TFilterStack = None,
+             sections: Set[str] = None, entity_filter: EntityFilter = None) -> 'Drawing':
         """ Open an existing drawing. Package users should use the factory function :func:`ezdxf.read`.
 
         Args:
@@ -230,9 +238,15 @@ class Drawing:
                 TFilterStack: Sequence[Sequence[Callable[[Iterable[DXFTag]], Iterable[DXFTag]]]]
                 e.g. [(raw_tag_filter1, raw_tag_filter2), (compiled_tag_filter1, )]
 
+             sections: load only DXF sections in `sections`, ``None`` for all sections
+             entity_filter: load only entities of the ENTITIES section accepted by this function
+
+        Uses the fast path :func:`~ezdxf.lldxf.tagger.ascii_tag_compiler` if no raw tag filters are required and
+        `stream` supports the :meth:`read` method.
+
         (internal API)
         """
-        from .lldxf.tagger import low_level_tagger, tag_compiler
+        from .lldxf.tagger import low_level_tagger, tag_compiler, ascii_tag_compiler
         raw_tag_filters = []
         compiled_tag_filters = []
 
@@ -245,33 +259,42 @@ class Drawing:
             raw_tag_filters = [repair.tag_reorder_layer, repair.filter_invalid_yz_point_codes]
             compiled_tag_filters = []
 
-        # low level tag compiler, creates simple tuple like tags DXFTag(group code, value)
-        tagger = low_level_tagger(stream)
+        if raw_tag_filters or not hasattr(stream, 'read'):
+            # low level tag compiler, creates simple tuple like tags DXFTag(group code, value)
+            tagger = low_level_tagger(stream)
 
-        # apply low level filters
-        for _filter in raw_tag_filters:
-            tagger = _filter(tagger)
+            # apply low level filters
+            for _filter in raw_tag_filters:
+                tagger = _filter(tagger)
 
-        # compiles vertices and binary tags into DXFVertex() or DXFBinaryTag()
-        tagger = tag_compiler(tagger)
+            # compiles vertices and binary tags into DXFVertex() or DXFBinaryTag()
+            tagger = tag_compiler(tagger)
+        else:
+            # fast path: low level tagging and tag compiling in one step
+            tagger = ascii_tag_compiler(stream)
 
         # apply compiled tags filter
         for _filter in compiled_tag_filters:
             tagger = _filter(tagger)
 
-        doc = Drawing()
-        doc._load(tagger)
-        return doc
+        return cls.from_tags(tagger, sections=sections, entity_filter=entity_filter)
 
     @classmethod
-    def from_tags(cls, compiled_tags: Iterable['DXFTag']) -> 'Drawing':
+    def from_tags(cls, compiled_tags: Iterable['DXFTag'], sections: Set[str] = None,
+                  entity_filter: EntityFilter = None) -> 'Drawing':
         """ Create new drawing from compiled tags. (internal API)"""
+        if sections is not None:
+            compiled_tags = skip_sections(compiled_tags, sections)
         doc = Drawing()
-        doc._load(compiled_tags)
+        doc._load(compiled_tags, entity_filter)
         return doc
 
-    def _load(self, tagger: Iterable['DXFTag']):
+    def _load(self, tagger: Iterable['DXFTag'], entity_filter: EntityFilter = None):
         sections = load_dxf_structure(tagger)  # load complete DXF entity structure
+        if entity_filter is not None and 'ENTITIES' in sections:
+            entities = sections['ENTITIES']
+            # first entity is the SECTION entity
+            sections['ENTITIES'] = entities[:1] + list(filter_entities(entities[1:], entity_filter))
         try:  # discard section THUMBNAILIMAGE
             del sections['THUMBNAILIMAGE']
         except KeyError:
@@ -340,6 +363,9 @@ class Drawing:
 
         self.layouts = Layouts.load(self)
         self._finalize_setup()
+        if options.incremental_save:
+            for entity in self.entitydb.values():
+                entity.commit_loaded_state()
 
     def _create_required_block_records(self):
         if '*Model_Space' not in self.block_records:
@@ -347,20 +373,21 @@ class Drawing:
         if '*Paper_Space' not in self.block_records:
             self.block_records.new('*Paper_Space')
 
-    def saveas(self, filename: str, encoding: str = None) -> None:
+    def saveas(self, filename: str, encoding: str = None, fmt: str = 'asc') -> None:
         """
         Write drawing to file-system by setting the :attr:`~ezdxf.drawing.Drawing.filename`
-        attribute to `filename`. For argument `encoding` see: :meth:`~ezdxf.drawing.Drawing.save`.
+        attribute to `filename`. For arguments `encoding` and `fmt` see: :meth:`~ezdxf.drawing.Drawing.save`.
 
         Args:
             filename: file name as string
             encoding: override file encoding
+            fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
 
         """
         self.filename = filename
-        self.save(encoding=encoding)
+        self.save(encoding=encoding, fmt=fmt)
 
-    def save(self, encoding: str = None) -> None:
+    def save(self, encoding: str = None, fmt: str = 'asc') -> None:
         """
         Write drawing to file-system by using the :attr:`~ezdxf.drawing.Drawing.filename` attribute as filename.
         Override file encoding by argument `encoding`, handle with care, but this option allows you to create
@@ -368,6 +395,7 @@ class Drawing:
 
         Args:
             encoding: override default encoding as Python encoding string like ``'utf-8'``
+            fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
 
         """
         # DXF R12, R2000, R2004 - ASCII encoding
@@ -377,19 +405,31 @@ class Drawing:
             enc = self.output_encoding
         else:  # override default encoding, for applications that handles encoding different than AutoCAD
             enc = encoding
-        # in ASCII mode, unknown characters will be escaped as \U+nnnn unicode characters.
 
-        with io.open(self.filename, mode='wt', encoding=enc, errors='dxfreplace') as fp:
-            self.write(fp)
+        if fmt.startswith('asc'):
+            # in ASCII mode, unknown characters will be escaped as \U+nnnn unicode characters.
+            with io.open(self.filename, mode='wt', encoding=enc, errors='dxfreplace') as fp:
+                self.write(fp, fmt='asc')
+        elif fmt.startswith('bin'):
+            with io.open(self.filename, mode='wb') as fp:
+                self.write(fp, fmt='bin', encoding=enc)
+        else:
+            raise DXFValueError('Unknown output format: "{}".'.format(fmt))
 
-    def write(self, stream: TextIO) -> None:
+    def write(self, stream: Union[TextIO, BinaryIO], fmt: str = 'asc', encoding: str = None) -> None:
         """
         Write drawing to a text stream. For DXF R2004 (AC1018) and prior open stream with drawing
         :attr:`~ezdxf.drawing.Drawing.encoding` and :code:`mode='wt'`. For DXF R2007 (AC1021) and later use
         :code:`encoding='utf-8'`.
 
+        For binary DXF (`fmt` is ``'bin'``) `stream` has to be a binary stream opened with :code:`mode='wb'`, the
+        string encoding is set by argument `encoding` or by :attr:`~ezdxf.drawing.Drawing.output_encoding` if
+        `encoding` is ``None``.
+
         Args:
-            stream: output text stream
+            stream: output text stream or binary stream
+            fmt: ``'asc'`` for ASCII DXF (default) or ``'bin'`` for binary DXF
+            encoding: string encoding for binary DXF, ignored for ASCII DXF
 
         """
         dxfversion = self.dxfversion
@@ -403,7 +443,12 @@ class Drawing:
         self._create_appids()
         self._update_header_vars()
         self._update_metadata()
-        tagwriter = TagWriter(stream, write_handles=handles, dxfversion=dxfversion)
+        if fmt.startswith('bin'):
+            tagwriter = BinaryTagWriter(stream, write_handles=handles, dxfversion=dxfversion,
+                                        encoding=encoding or self.output_encoding)
+            tagwriter.write_signature()
+        else:
+            tagwriter = TagWriter(stream, write_handles=handles, dxfversion=dxfversion)
         self.export_sections(tagwriter)
 
     def export_sections(self, tagwriter: 'TagWriter') -> None:
@@ -438,6 +483,10 @@ class Drawing:
         # set ACAD maintenance version - same values as used by BricsCAD
         self.header['$ACADMAINTVER'] = acad_maint_ver.get(self.dxfversion, 0)
 
+        if options.update_extents:
+            from ezdxf.extents import update_header_extents
+            update_header_extents(self)
+
     def _update_metadata(self):
         now = datetime.now()
         self.header['$TDUPDATE'] = juliandate(now)
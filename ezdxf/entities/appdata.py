@@ -7,6 +7,7 @@ from ezdxf.lldxf.types import dxftag, uniform_appid
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.const import DXFKeyError, DXFStructureError
 from ezdxf.lldxf.const import ACAD_REACTORS, REACTOR_HANDLE_CODE, APP_DATA_MARKER
+from ezdxf.lldxf.packedtags import ModificationTracker
 
 if TYPE_CHECKING:
     from ezdxf.lldxf.tagwriter import TagWriter
@@ -17,7 +18,7 @@ ERR_INVALID_DXF_ATTRIB = 'Invalid DXF attribute for entity {}'
 ERR_DXF_ATTRIB_NOT_EXITS = 'DXF attribute {} does not exist'
 
 
-class AppData:
+class AppData(ModificationTracker):
     def __init__(self):
         # no back links, no self.clone() required, use deepcopy
         self.data = OrderedDict()
@@ -37,6 +38,7 @@ class AppData:
     def set(self, tags: Tags) -> None:
         if len(tags):
             appid = tags[0].value
+            self._modified()
             self.data[appid] = tags
 
     def add(self, appid: str, data: Iterable[Sequence]) -> None:
@@ -51,6 +53,7 @@ class AppData:
     def discard(self, appid: str):
         _appid = uniform_appid(appid)
         if _appid in self.data:
+            self._modified()
             del self.data[_appid]
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
@@ -58,7 +61,7 @@ class AppData:
             tagwriter.write_tags(data)
 
 
-class Reactors:
+class Reactors(ModificationTracker):
     """ Handle storage for related reactors.
 
     Reactors are other objects related to the object that contains this Reactor() instance.
@@ -101,12 +104,15 @@ class Reactors:
         return sorted(self.reactors, key=lambda x: int(x, base=16))
 
     def set(self, handles: Iterable[str]) -> None:
+        self._modified()
         self.reactors = set(handles or [])
 
     def add(self, handle: str) -> None:
+        self._modified()
         self.reactors.add(handle)
 
     def discard(self, handle: str):
+        self._modified()
         self.reactors.discard(handle)
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
@@ -2,6 +2,8 @@
 # License: MIT License
 # Created 2019-02-15
 from typing import TYPE_CHECKING
+from array import array
+from ezdxf.math import flatten
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
 from .dxfentity import base_class, SubclassProcessor
@@ -46,6 +48,21 @@ class Arc(Circle):
         # for all DXF versions
         self.dxf.export_dxf_attribs(tagwriter, ['start_angle', 'end_angle'])
 
+    def flattening(self, distance: float) -> array:
+        """
+        Returns the arc approximated by line segments in :ref:`WCS` as flat ``array('d')`` of ``x, y, z``
+        values, the max. distance of the line segments to the arc is `distance`, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the arc
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        vertices = flatten.arc(dxf.center, dxf.radius, dxf.start_angle, dxf.end_angle, distance)
+        return flatten.ocs_to_wcs(vertices, self.ocs())
+
     @property
     def start_point(self) -> 'Vector':
         v = list(self.vertices([self.dxf.start_angle]))
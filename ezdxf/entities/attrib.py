@@ -214,6 +214,7 @@ class Attrib(BaseAttrib):
 
     DXFTYPE = 'ATTRIB'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_text, acdb_attrib)  # don't add acdb_attdef_xrecord here
+    LAZY_LOADING = False  # linked entity
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super(DXFGraphic, self).load_dxf_attribs(processor)
@@ -1,7 +1,7 @@
 # Created: 17.02.2019
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 import logging
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXF2007, DXFInternalEzdxfError
@@ -213,3 +213,25 @@ class BlockRecord(DXFEntity):
         """
         self.unlink_entity(entity)  # 1. unlink from entity space
         self.entitydb.delete_entity(entity)  # 2. delete from drawing database
+
+    def unlink_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Unlink multiple `entities` from BLOCK_RECORD, see :meth:`unlink_entity`.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        for entity in list(entities):  # entities could be the entity space itself
+            self.unlink_entity(entity)
+
+    def delete_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Delete multiple `entities` from BLOCK_RECORD entity space and drawing database, see :meth:`delete_entity`.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        for entity in list(entities):  # entities could be the entity space itself
+            self.delete_entity(entity)
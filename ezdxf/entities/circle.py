@@ -2,8 +2,8 @@
 # License: MIT License
 # Created 2019-02-15
 from typing import TYPE_CHECKING, Iterable
-
-from ezdxf.math import Vector
+from array import array
+from ezdxf.math import Vector, flatten
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER
 from .dxfentity import base_class, SubclassProcessor
@@ -63,3 +63,18 @@ class Circle(DXFGraphic):
             v = Vector.from_deg_angle(angle, self.dxf.radius) + self.dxf.center
             # convert from OCS to WCS
             yield ocs.to_wcs(v)
+
+    def flattening(self, distance: float) -> array:
+        """
+        Returns the circle approximated by line segments in :ref:`WCS` as flat ``array('d')`` of ``x, y, z``
+        values, the max. distance of the line segments to the circle is `distance`, the vertex count depends on the
+        radius, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the circle
+
+        .. versionadded:: 0.11
+
+        """
+        vertices = flatten.circle(self.dxf.center, self.dxf.radius, distance)
+        return flatten.ocs_to_wcs(vertices, self.ocs())
@@ -2,7 +2,7 @@
 # License: MIT License
 # Created 2019-02-15
 from typing import TYPE_CHECKING, Tuple
-from .dxfentity import DXFEntity, SubclassProcessor, DXFNamespace
+from .dxfentity import DXFEntity, SubclassProcessor, namespace_class
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF2004, DXF2000
 from .factory import register_entity
@@ -63,7 +63,7 @@ class DXFClass(DXFEntity):
         """ Called by load constructor. CLASS is special. """
         if tags:
             # do not process base class!!!
-            self.dxf = DXFNamespace(entity=self)
+            self.dxf = namespace_class(self.__class__)(entity=self)
             processor = SubclassProcessor(tags)
             processor.load_dxfattribs_into_namespace(self.dxf, class_def)
 
@@ -2,17 +2,22 @@
 # License: MIT License
 # Created 2019-02-13
 # DXFEntity - Root Entity
-from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar
+from typing import TYPE_CHECKING, List, Any, Iterable, Optional, Union, Type, TypeVar, Dict, FrozenSet, Callable, Tuple
 import copy
+import sys
+from itertools import islice
+from weakref import WeakSet
 from ezdxf import options
-from ezdxf.lldxf.types import handle_code, dxftag, cast_value
+from ezdxf.lldxf.types import handle_code, dxftag, cast_value, POINT_CODES, TYPE_TABLE
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.extendedtags import ExtendedTags
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
+from ezdxf.lldxf.packedtags import ModificationHook, ModificationTracker
 from ezdxf.lldxf.const import DXF2000, STRUCTURE_MARKER, OWNER_CODE, DXF12
 from ezdxf.lldxf.const import ACAD_REACTORS, ACAD_XDICTIONARY
 from ezdxf.lldxf.const import DXFAttributeError, DXFValueError, DXFTypeError, DXFKeyError
 from ezdxf.tools import set_flag_state
+from ezdxf.math import Vector
 from .xdata import XData, EmbeddedObjects
 from .appdata import AppData, Reactors
 from .xdict import ExtensionDict
@@ -23,7 +28,8 @@ logger = logging.getLogger('ezdxf')
 if TYPE_CHECKING:
     from ezdxf.eztypes import Auditor, TagWriter, Drawing, EntityDB, EntityFactory, Dictionary, BaseLayout
 
-__all__ = ['DXFNamespace', 'DXFEntity', 'DXFTagStorage', 'SubclassProcessor', 'base_class']
+__all__ = ['DXFNamespace', 'LazyDXFNamespace', 'SlotsDXFNamespace', 'namespace_class', 'DXFEntity', 'DXFTagStorage',
+           'SubclassProcessor', 'base_class']
 
 """
 DXFEntity() is the base class of **all** DXF entities.
@@ -52,6 +58,10 @@ SETTER_EVENTS = {
     'linetype': 'on_linetype_change',
 }
 
+# attribute indexes of entity spaces by DXF attribute name, setting or discarding an indexed DXF attribute updates the
+# index entry of the entity, see ezdxf.entitydb.AttributeIndex
+ATTRIBUTE_INDEXES = {}  # type: Dict[str, WeakSet]
+
 
 class DXFNamespace:
     """
@@ -60,10 +70,17 @@ class DXFNamespace:
     The namespace can only contain immutable objects: string, int, float, bool, Vector
     Because of the immutability, copy and deepcopy are the same.
 
+    This namespace stores the DXF attributes in the dict `_attribs`, the namespace classes generated by
+    :func:`namespace_class` store the most used DXF attributes in ``__slots__``. All raw attribute access goes through
+    the storage methods :meth:`hasattr`, :meth:`_get_raw`, :meth:`_set_raw`, :meth:`_del_raw` and
+    :meth:`_raw_attribs`.
+
     (internal class)
     """
+    __slots__ = ('_entity', '_attribs')
 
     def __init__(self, processor: 'SubclassProcessor' = None, entity: 'DXFEntity' = None):
+        self._init_storage()
         if processor:
             base_class_ = processor.base_class
             code = handle_code(base_class_[0].value)
@@ -78,18 +95,29 @@ class DXFNamespace:
 
     def copy(self, entity: 'DXFEntity'):
         namespace = self.__class__()
-        for k, v in self.__dict__.items():
-            namespace.__dict__[k] = v
+        for k, v in self._raw_attribs().items():
+            namespace._set_raw(k, v)
         namespace.rewire(entity)
         return namespace
 
     def __deepcopy__(self, memodict: dict = None):
         return self.copy(self._entity)
 
+    def __getstate__(self) -> dict:
+        """ Pickle support, the back link to the parent entity is restored by the parent entity. """
+        return self._raw_attribs()
+
+    def __setstate__(self, state: dict) -> None:
+        # bypass __setattr__()
+        object.__setattr__(self, '_entity', None)
+        self._init_storage()
+        for key, value in state.items():
+            self._set_raw(key, value)
+
     def reset_handles(self):
         """ Reset handle and owner to None. """
-        self.__dict__['handle'] = None
-        self.__dict__['owner'] = None
+        self._set_raw('handle', None)
+        self._set_raw('owner', None)
 
     def rewire(self, entity: 'DXFEntity', handle: str = None, owner: str = None) -> None:
         """
@@ -102,15 +130,20 @@ class DXFNamespace:
 
         """
         # bypass __setattr__()
-        self.__dict__['_entity'] = entity
+        object.__setattr__(self, '_entity', entity)
         if handle is not None:
-            self.__dict__['handle'] = handle
+            self._set_raw('handle', handle)
         if owner is not None:
-            self.__dict__['owner'] = owner
+            self._set_raw('owner', owner)
 
     def __getattr__(self, key: str) -> Any:
-        """ called if key does not exist, returns default value or None for unset default values
+        """ called if key is not a slot attribute, returns stored value, default value or None for unset default
+        values
         """
+        try:
+            return self._get_raw(key)
+        except KeyError:
+            pass
         attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
         if attrib_def:
             if attrib_def.xtype == XType.callback:
@@ -126,10 +159,12 @@ class DXFNamespace:
             if attrib_def.xtype == XType.callback:
                 attrib_def.set_callback_value(self._entity, value)
             else:
-                self.__dict__[key] = cast_value(attrib_def.code, value)
+                self._set_raw(key, cast_value(attrib_def.code, value))
         else:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
 
+        if key in ATTRIBUTE_INDEXES:
+            self._update_attribute_indexes(key)
         if key in SETTER_EVENTS:
             handler = getattr(self._entity, SETTER_EVENTS[key], None)
             if handler:
@@ -137,16 +172,18 @@ class DXFNamespace:
 
     def __delattr__(self, key: str) -> None:
         if self.hasattr(key):
-            del self.__dict__[key]
+            self._del_raw(key)
+            if key in ATTRIBUTE_INDEXES:
+                self._update_attribute_indexes(key)
         else:
             raise DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
     def get(self, key: str, default: Any = None) -> Any:
         """ Returns given `default` value not DXF default value for unset attributes. """
-        # callback values should not exist as attribute in __dict__
+        # callback values should not exist as stored attribute
         if self.hasattr(key):
             # do not return the DXF default value
-            return self.__dict__[key]
+            return self._get_raw(key)
         attrib_def = self.dxfattribs.get(key, None)  # type: DXFAttr
         if attrib_def:
             if attrib_def.xtype == XType.callback:
@@ -163,18 +200,30 @@ class DXFNamespace:
         Contains only DXF attributes, which are accessible by DXFNamespace.
 
         """
-        attribs = dict(self.__dict__)
-        del attribs['_entity']
-        return attribs
+        return self._raw_attribs()
 
     def set(self, key: str, value: Any) -> None:
         self.__setattr__(key, value)
 
     def discard(self, key: str) -> None:
         try:
-            del self.__dict__[key]
+            self._del_raw(key)
         except KeyError:
             pass
+        else:
+            if key in ATTRIBUTE_INDEXES:
+                self._update_attribute_indexes(key)
+
+    def _update_attribute_indexes(self, key: str) -> None:
+        """ Update the index entries of the parent entity in all attribute indexes of the DXF attribute `key`. """
+        indexes = ATTRIBUTE_INDEXES[key]
+        if not indexes:  # all attribute indexes of `key` are garbage collected
+            del ATTRIBUTE_INDEXES[key]
+            return
+        entity = self._entity
+        if entity is not None:
+            for index in list(indexes):
+                index.refresh(entity)
 
     def is_supported(self, key: str) -> bool:
         """
@@ -194,7 +243,26 @@ class DXFNamespace:
         Does no check if attribute `key` is supported, but implicit supported if exists.
 
         """
-        return key in self.__dict__
+        return key in self._attribs
+
+    def _init_storage(self) -> None:
+        object.__setattr__(self, '_attribs', dict())
+
+    def _get_raw(self, key: str) -> Any:
+        """ Returns the stored value of attribute `key`, raises :class:`KeyError` for unset attributes. """
+        return self._attribs[key]
+
+    def _set_raw(self, key: str, value: Any) -> None:
+        """ Store `value` as attribute `key`, bypasses type casting and setter events. """
+        self._attribs[key] = value
+
+    def _del_raw(self, key: str) -> None:
+        """ Delete stored attribute `key`, raises :class:`KeyError` for unset attributes. """
+        del self._attribs[key]
+
+    def _raw_attribs(self) -> dict:
+        """ Returns a copy of all stored attributes. """
+        return dict(self._attribs)
 
     @property
     def dxftype(self):
@@ -267,6 +335,393 @@ class DXFNamespace:
             raise DXFAttributeError(ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype))
 
 
+class SlotsDXFNamespace(DXFNamespace):
+    """
+    Base class of the namespace classes generated by :func:`namespace_class`. The most used DXF attributes are
+    stored in ``__slots__`` derived from the DXFATTRIBS definition of the entity class, all other DXF attributes
+    are stored in the dict `_attribs`, which is created at the first usage. Default values and type casters are
+    precomputed for each generated class. Callback attributes are not stored and still resolved by the DXF
+    attribute definition.
+
+    (internal class)
+    """
+    __slots__ = ()
+    _ENTITY_CLASS = None  # type: Type[DXFEntity]
+    _NAMES = frozenset()  # type: FrozenSet[str]  # names of the slot attributes
+    _SLOTS = ()  # type: Tuple[str, ...]  # names of the slot attributes in definition order
+    _DEFAULTS = {}  # type: Dict[str, Any]
+    _CASTERS = {}  # type: Dict[str, Callable[[Any], Any]]
+
+    def __reduce__(self):
+        """ Pickle support, generated classes are not importable, they are rebuild from the entity class. """
+        return _new_slots_namespace, (self._ENTITY_CLASS,), self.__getstate__()
+
+    def __getattr__(self, key: str) -> Any:
+        """ Called for unset slot attributes and all other attributes. """
+        attribs = self._attribs
+        if attribs is not None and key in attribs:
+            return attribs[key]
+        try:
+            return self._DEFAULTS[key]
+        except KeyError:  # callback attribute or invalid attribute
+            return super().__getattr__(key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        try:
+            caster = self._CASTERS[key]
+        except KeyError:  # callback attribute or invalid attribute
+            super().__setattr__(key, value)
+            return
+        if value is not None:
+            value = caster(value)
+        if key in self._NAMES:
+            object.__setattr__(self, key, value)
+        else:
+            self._set_raw(key, value)
+        if key in ATTRIBUTE_INDEXES:
+            self._update_attribute_indexes(key)
+        if key in SETTER_EVENTS:
+            handler = getattr(self._entity, SETTER_EVENTS[key], None)
+            if handler:
+                handler(value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """ Returns given `default` value not DXF default value for unset attributes. """
+        if key in self._NAMES:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                return default
+        return super().get(key, default)
+
+    def hasattr(self, key: str) -> bool:
+        if key in self._NAMES:
+            try:
+                object.__getattribute__(self, key)
+            except AttributeError:
+                return False
+            return True
+        attribs = self._attribs
+        return attribs is not None and key in attribs
+
+    def _init_storage(self) -> None:
+        object.__setattr__(self, '_attribs', None)
+
+    def _get_raw(self, key: str) -> Any:
+        if key in self._NAMES:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        attribs = self._attribs
+        if attribs is None:
+            raise KeyError(key)
+        return attribs[key]
+
+    def _set_raw(self, key: str, value: Any) -> None:
+        if key in self._NAMES:
+            object.__setattr__(self, key, value)
+            return
+        attribs = self._attribs
+        if attribs is None:
+            attribs = dict()
+            object.__setattr__(self, '_attribs', attribs)
+        attribs[key] = value
+
+    def _del_raw(self, key: str) -> None:
+        if key in self._NAMES:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+            return
+        attribs = self._attribs
+        if attribs is None:
+            raise KeyError(key)
+        del attribs[key]
+        if not attribs:
+            object.__setattr__(self, '_attribs', None)
+
+    def _raw_attribs(self) -> dict:
+        attribs = dict()
+        for name in self._SLOTS:  # slots of the generated class
+            try:
+                attribs[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        if self._attribs:
+            attribs.update(self._attribs)
+        return attribs
+
+
+def _caster(code: int) -> Callable[[Any], Any]:
+    if code in POINT_CODES:
+        return Vector
+    return TYPE_TABLE.get(code, str)
+
+
+# optional DXF attributes stored as slot attributes, because they are set for many entities
+SLOT_ATTRIBS = {'handle', 'owner', 'layer', 'linetype', 'color', 'lineweight', 'paperspace'}
+
+# generated namespace classes, key is the entity class
+_NAMESPACE_CLASSES = {}  # type: Dict[Type[DXFEntity], Type[DXFNamespace]]
+
+
+def namespace_class(entity_class: Type['DXFEntity']) -> Type[DXFNamespace]:
+    """
+    Returns the DXF namespace class for `entity_class`. The class is generated at the first request with
+    ``__slots__`` for all required DXF attributes of the DXFATTRIBS definition and the optional attributes in
+    :attr:`SLOT_ATTRIBS`, callback attributes are never stored. Returns :class:`DXFNamespace` if a DXF attribute
+    name can not be used as slot name.
+
+    (internal API)
+    """
+    try:
+        return _NAMESPACE_CLASSES[entity_class]
+    except KeyError:
+        pass
+    dxfattribs = entity_class.DXFATTRIBS
+    names = ['handle', 'owner']  # always stored, see DXFNamespace.reset_handles()
+    names.extend(
+        name for name, attrib in dxfattribs.items()
+        if attrib.xtype != XType.callback and (not attrib.optional or name in SLOT_ATTRIBS) and name not in names
+    )
+    if any(hasattr(SlotsDXFNamespace, name) or not name.isidentifier() for name in names):
+        cls = DXFNamespace
+    else:
+        cls = type(entity_class.__name__ + 'Namespace', (SlotsDXFNamespace,), {
+            '__slots__': tuple(names),
+            '__module__': __name__,
+            '_ENTITY_CLASS': entity_class,
+            '_NAMES': frozenset(names),
+            '_SLOTS': tuple(names),
+            '_DEFAULTS': {
+                name: attrib.default for name, attrib in dxfattribs.items() if attrib.xtype != XType.callback
+            },
+            '_CASTERS': {
+                name: _caster(attrib.code) for name, attrib in dxfattribs.items() if attrib.xtype != XType.callback
+            },
+        })
+    _NAMESPACE_CLASSES[entity_class] = cls
+    return cls
+
+
+def _new_slots_namespace(entity_class: Type['DXFEntity']) -> DXFNamespace:
+    """ Unpickle helper for generated namespace classes. """
+    cls = namespace_class(entity_class)
+    return cls.__new__(cls)
+
+
+def _new_namespace(cls: Type[DXFNamespace]) -> DXFNamespace:
+    """ Unpickle helper for tracking namespace classes. """
+    return cls.__new__(cls)
+
+
+class TrackingNamespace:
+    """
+    Mixin of the namespace classes generated by :func:`tracking_namespace_class`, setting or discarding DXF
+    attributes sets the dirty flag of the parent entity. The namespace of an entity with loaded tags is switched to
+    the tracking class by :meth:`DXFEntity.commit_loaded_state`, therefore new entities and entities without loaded
+    tags do not pay for the modification tracking.
+
+    (internal class)
+    """
+    __slots__ = ()
+    _UNTRACKED_CLASS = None  # type: Type[DXFNamespace]
+
+    def __reduce__(self):
+        """ Pickle support, the namespace is pickled as untracked namespace, the tracking is restored by the parent
+        entity.
+        """
+        cls = self._UNTRACKED_CLASS
+        if issubclass(cls, SlotsDXFNamespace):
+            return _new_slots_namespace, (cls._ENTITY_CLASS,), self.__getstate__()
+        return _new_namespace, (cls,), self.__getstate__()
+
+    def copy(self, entity: 'DXFEntity'):
+        namespace = super().copy(entity)
+        object.__setattr__(namespace, '__class__', self._UNTRACKED_CLASS)
+        return namespace
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        super().__setattr__(key, value)
+        self._entity.mark_modified()
+
+    def __delattr__(self, key: str) -> None:
+        super().__delattr__(key)
+        self._entity.mark_modified()
+
+    def discard(self, key: str) -> None:
+        super().discard(key)
+        self._entity.mark_modified()
+
+
+# generated tracking namespace classes, key is the untracked namespace class
+_TRACKING_NAMESPACE_CLASSES = {}  # type: Dict[Type[DXFNamespace], Type[DXFNamespace]]
+
+
+def tracking_namespace_class(cls: Type[DXFNamespace]) -> Type[DXFNamespace]:
+    """ Returns the tracking subclass of the namespace class `cls`, see :class:`TrackingNamespace`. (internal API) """
+    try:
+        return _TRACKING_NAMESPACE_CLASSES[cls]
+    except KeyError:
+        pass
+    tracking_class = type('Tracking' + cls.__name__, (TrackingNamespace, cls), {
+        '__slots__': (),
+        '__module__': __name__,
+        '_UNTRACKED_CLASS': cls,
+    })
+    _TRACKING_NAMESPACE_CLASSES[cls] = tracking_class
+    return tracking_class
+
+
+class LazyDXFNamespace(DXFNamespace):
+    """
+    DXF namespace of a lazy loaded entity, provides the base attributes `handle`, `owner`, `paperspace` and `layer`
+    without loading the entity. Access to any other DXF attribute loads the entity and all further requests are
+    delegated to the DXF namespace of the loaded entity.
+
+    Only `handle`, `owner` and `paperspace` can be changed without loading the entity, these attributes are managed
+    by the entity database and the layouts. The base attributes are stored in ``__slots__``, which are deleted by
+    loading the entity.
+
+    (internal class)
+    """
+    LOCAL_ATTRIBS = frozenset(('handle', 'owner', 'paperspace'))
+    SCANNED_ATTRIBS = ('handle', 'owner', 'paperspace', 'layer')
+    __slots__ = SCANNED_ATTRIBS + ('_modified',)
+
+    def __init__(self, entity: 'DXFEntity', attribs: dict):
+        object.__setattr__(self, '_entity', entity)
+        object.__setattr__(self, '_modified', False)
+        self._init_storage()
+        for key, value in attribs.items():
+            object.__setattr__(self, key, value)
+
+    def __getstate__(self) -> tuple:
+        return self._raw_attribs(), self._modified
+
+    def __setstate__(self, state: tuple) -> None:
+        attribs, modified = state
+        super().__setstate__(attribs)
+        object.__setattr__(self, '_modified', modified)
+
+    @property
+    def is_lazy(self) -> bool:
+        return self._entity.is_lazy
+
+    @property
+    def is_modified(self) -> bool:
+        """ Returns ``True`` if base attributes `handle`, `owner` or `paperspace` have been changed, changes of the
+        owner are ignored for documents loaded from DXF R12 files, because DXF R12 does not store the owner.
+        """
+        return self._modified
+
+    def _set_modified(self, key: str) -> None:
+        if key == 'owner':
+            doc = self._entity.doc
+            if doc is not None and doc._loaded_dxfversion == DXF12:
+                return
+        object.__setattr__(self, '_modified', True)
+
+    def _namespace(self) -> DXFNamespace:
+        """ Returns DXF namespace of the loaded entity. """
+        entity = self._entity
+        entity.load_lazy_tags()
+        return entity.dxf
+
+    def detach(self) -> dict:
+        """ Returns the actual base attributes and detach them from the namespace, all further requests are delegated
+        to the DXF namespace of the loaded entity.
+        """
+        attribs = self._raw_attribs()
+        for key in attribs:
+            object.__delattr__(self, key)
+        return {key: value for key, value in attribs.items() if key in self.LOCAL_ATTRIBS}
+
+    def __getattr__(self, key: str) -> Any:
+        """ Called for unset base attributes and all other attributes. """
+        if key in self.SCANNED_ATTRIBS and self.is_lazy:
+            return self.dxf_default_value(key)
+        return getattr(self._namespace(), key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key in self.LOCAL_ATTRIBS and self.is_lazy:
+            if self.get(key) != value:
+                self._set_modified(key)
+            super().__setattr__(key, value)
+        else:
+            self._namespace().__setattr__(key, value)
+
+    def __delattr__(self, key: str) -> None:
+        self._namespace().__delattr__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.SCANNED_ATTRIBS and self.is_lazy:
+            try:
+                return self._get_raw(key)
+            except KeyError:
+                return default
+        return self._namespace().get(key, default)
+
+    def hasattr(self, key: str) -> bool:
+        if key in self.SCANNED_ATTRIBS and self.is_lazy:
+            return key in self._raw_attribs()
+        return self._namespace().hasattr(key)
+
+    def discard(self, key: str) -> None:
+        if key in self.LOCAL_ATTRIBS and self.is_lazy:
+            try:
+                self._del_raw(key)
+            except KeyError:
+                return
+            self._set_modified(key)
+        else:
+            self._namespace().discard(key)
+
+    def _init_storage(self) -> None:
+        object.__setattr__(self, '_attribs', None)  # not used
+
+    def _get_raw(self, key: str) -> Any:
+        try:
+            return object.__getattribute__(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def _set_raw(self, key: str, value: Any) -> None:
+        object.__setattr__(self, key, value)
+
+    def _del_raw(self, key: str) -> None:
+        try:
+            object.__delattr__(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def _raw_attribs(self) -> dict:
+        attribs = dict()
+        for key in self.SCANNED_ATTRIBS:
+            try:
+                attribs[key] = object.__getattribute__(self, key)
+            except AttributeError:
+                pass
+        return attribs
+
+    def all_existing_dxf_attribs(self) -> dict:
+        return self._namespace().all_existing_dxf_attribs()
+
+    def copy(self, entity: 'DXFEntity'):
+        return self._namespace().copy(entity)
+
+    def reset_handles(self):
+        self._namespace().reset_handles()
+
+    def rewire(self, entity: 'DXFEntity', handle: str = None, owner: str = None) -> None:
+        self._namespace().rewire(entity, handle, owner)
+
+    def export_dxf_attribs(self, tagwriter: 'TagWriter', attribs: Union[str, Iterable]) -> None:
+        self._namespace().export_dxf_attribs(tagwriter, attribs)
+
+
 class SubclassProcessor:
     """  Helper class for loading tags into entities. (internal class) """
     def __init__(self, tags: ExtendedTags, dxfversion=None):
@@ -397,6 +852,79 @@ base_class = DefSubclass(None, {
 T = TypeVar('T', bound='DXFEntity')
 
 
+def scan_base_attribs(tags: Tags) -> dict:
+    """
+    Returns `handle`, `owner`, `paperspace` and `layer` of a DXF graphic entity without building the entity, only
+    existing attributes are included.
+
+    (internal API)
+    """
+    attribs = {}
+    # DXF R12 has no subclasses, all tags belong to the 'base class'
+    subclass = 0  # 0 = base class, 1 = AcDbEntity
+    appdata = False
+    for tag in islice(tags, 1, None):
+        code = tag.code
+        if code >= 1000 or code == 101:  # XDATA or embedded objects
+            break
+        if code == 102:
+            appdata = tag.value.startswith('{')
+        elif appdata:
+            continue
+        elif code == 100:
+            if subclass:  # all required attributes are located in the base class and AcDbEntity
+                break
+            subclass = 1
+        elif code == 8:
+            attribs.setdefault('layer', tag.value)
+        elif code == 67:
+            attribs.setdefault('paperspace', tag.value)
+        elif subclass == 0:
+            if code == 5:
+                attribs.setdefault('handle', tag.value)
+            elif code == 330:
+                attribs.setdefault('owner', tag.value)
+    return attribs
+
+
+def has_extended_data(tags: Tags) -> bool:
+    """ Returns ``True`` if `tags` contain app data, reactors, an extension dictionary, extended data or embedded
+    objects. (internal API)
+    """
+    for tag in tags:
+        code = tag.code
+        if code == 102 or code == 101 or code >= 1000:
+            return True
+    return False
+
+
+# instance attributes created by the default constructor
+_INSTANCE_ATTRIBS = {}  # type: Dict[Type[DXFEntity], FrozenSet[str]]
+
+
+def instance_attribs(cls: Type['DXFEntity']) -> FrozenSet[str]:
+    try:
+        return _INSTANCE_ATTRIBS[cls]
+    except KeyError:
+        attribs = frozenset(cls(None).__dict__.keys())
+        _INSTANCE_ATTRIBS[cls] = attribs
+        return attribs
+
+
+def supports_lazy_loading(cls: Type['DXFEntity']) -> bool:
+    """ Returns ``True`` if entities of class `cls` can be loaded lazy, the default constructor of the class must not
+    create entity specific instance attributes like vertices, because they are not available before loading.
+    (internal API)
+    """
+    return cls.LAZY_LOADING and instance_attribs(cls) == instance_attribs(DXFEntity)
+
+
+# instance attributes which are not exported and the attributes of the modification tracking, assigning these
+# attributes does not mark an entity as modified
+UNTRACKED_ATTRIBS = frozenset({'doc', 'priority', '_loaded_tags', '_loaded_state', '_dirty'})
+_MISSING = object()
+
+
 class DXFEntity:
     """ Common base class for all DXF entities. """
     DXFTYPE = 'DXFENTITY'  # storing as class var needs less memory
@@ -408,6 +936,11 @@ class DXFEntity:
     # in the dxf namespace.
     DEFAULT_ATTRIBS = None  # type: dict
     MIN_DXF_VERSION_FOR_EXPORT = DXF12
+    # supports lazy loading by options.lazy_loading, see supports_lazy_loading()
+    LAZY_LOADING = False
+    # instance attributes of linked entities like ATTRIB or VERTEX, which are exported as separated entities,
+    # assigning these attributes does not mark an entity with loaded tags as modified, see is_modified()
+    LINKED_ENTITIES = frozenset()  # type: FrozenSet[str]
 
     # Explicit excluding is better than implicit excluding; idea to exclude attribs with leading '_' prevents
     # 'protected' members from cloning, which may cause other problems.
@@ -417,7 +950,7 @@ class DXFEntity:
         """ Default constructor. (internal API)"""
         # public attributes for package users
         self.doc = doc  # type: Drawing
-        self.dxf = DXFNamespace(entity=self)  # type: DXFNamespace
+        self.dxf = namespace_class(self.__class__)(entity=self)  # type: DXFNamespace
         # priority order: highest value first - 100 (top) before 0 (default) before -100 (bottom)
         # whole int range allowed
         self.priority = 0  # type: int  # public
@@ -453,6 +986,147 @@ class DXFEntity:
         entity.load_tags(tags)
         return entity
 
+    @classmethod
+    def load_lazy(cls: Type[T], tags: Tags, doc: 'Drawing' = None) -> Optional[T]:
+        """
+        Constructor for lazy loading, just the base attributes `handle`, `owner`, `paperspace` and `layer` are
+        available, the entity is loaded from the stored `tags` at first access to any other DXF attribute.
+
+        The `tags` are stored as compact DXF string, the instance attributes of the entity are set to the default
+        values of the default constructor, therefore only entities without app data, reactors, extension dictionary,
+        extended data and embedded objects can be loaded lazy.
+
+        Returns ``None`` for entities without handle or with extended data, which have to be loaded immediately.
+
+        Args:
+            tags: DXF tags as Tags()
+            doc: DXF Document
+
+        (internal API)
+        """
+        attribs = scan_base_attribs(tags)
+        if 'handle' not in attribs or has_extended_data(tags):
+            return None
+        # share the same string objects for the few distinct layers and owners
+        for key in ('owner', 'layer'):
+            if key in attribs:
+                attribs[key] = sys.intern(attribs[key])
+        entity = cls.__new__(cls)
+        # bypass the default constructor, same instance attributes in same order as a loaded entity without extended
+        # data, which keeps the key sharing of the instance dict
+        entity.doc = doc
+        entity.dxf = LazyDXFNamespace(entity, attribs)
+        entity.priority = 0
+        entity.appdata = None
+        entity.reactors = None
+        entity.extension_dict = None
+        entity.xdata = None
+        entity.embedded_objects = None
+        entity._lazy_tags = ''.join(tag.dxfstr() for tag in tags)  # compact DXF string
+        return entity
+
+    def set_loaded_tags(self, tags: Union[Tags, str]) -> None:
+        """ Keep the loaded `tags` as Tags() or DXF string to export the entity as loaded as long the entity is not
+        modified, call :meth:`commit_loaded_state` after finishing the loading process. (internal API)
+        """
+        self.__dict__['_loaded_tags'] = tags
+
+    def commit_loaded_state(self) -> None:
+        """ Clear the dirty flag set while loading and start tracking the changes of entity specific data. Discards
+        the loaded tags, if handle, owner or paperspace flag do not match the loaded tags. (internal API)
+        """
+        state = self.__dict__
+        tags = state.get('_loaded_tags')
+        if tags is None or isinstance(tags, str):  # lazy loaded entities are committed by load_lazy_tags()
+            return
+        loaded = scan_base_attribs(tags)
+        dxf = self.dxf
+        # owner is not stored in DXF R12 files
+        ignore_owner = self.doc is not None and self.doc._loaded_dxfversion == DXF12
+        if loaded.get('handle') != dxf.handle or loaded.get('paperspace') != dxf.get('paperspace') or \
+                (not ignore_owner and loaded.get('owner') != dxf.owner):
+            self.discard_loaded_tags()
+        else:
+            state.pop('_dirty', None)
+            self._set_modification_hooks()
+
+    def _set_modification_hooks(self) -> None:
+        """ Start tracking changes: switch the DXF namespace to the tracking namespace class, link entity specific
+        data like vertices, extended data or boundary paths to this entity and record the instance attributes. The
+        first change of DXF attributes or data by its methods sets the dirty flag, rebinding an instance attribute
+        is detected by :meth:`is_modified`.
+        """
+        state = self.__dict__
+        dxf = state['dxf']
+        if not isinstance(dxf, TrackingNamespace):
+            object.__setattr__(dxf, '__class__', tracking_namespace_class(dxf.__class__))
+        hook = ModificationHook(self)
+        for value in state.values():
+            if isinstance(value, ModificationTracker):
+                value.set_modification_hook(hook)
+        linked = self.LINKED_ENTITIES
+        state['_loaded_state'] = tuple(
+            (key, value) for key, value in state.items() if key not in UNTRACKED_ATTRIBS and key not in linked
+        )
+
+    def mark_modified(self) -> None:
+        """ Set the dirty flag of an entity with loaded tags, modified entities are not exported as loaded.
+
+        The dirty flag is set by changing DXF attributes, by the methods which change extended data, app data,
+        reactors or the extension dictionary and by the methods which change entity specific data like vertices or
+        boundary paths. Reading data does not set the dirty flag. (internal API)
+        """
+        state = self.__dict__
+        if '_loaded_tags' in state:
+            state['_dirty'] = True
+
+    def discard_loaded_tags(self) -> None:
+        """ Discard the loaded tags, the entity is exported by :meth:`export_dxf`. (internal API) """
+        state = self.__dict__
+        state.pop('_loaded_tags', None)
+        state.pop('_loaded_state', None)
+        state.pop('_dirty', None)
+        dxf = state.get('dxf')
+        if isinstance(dxf, TrackingNamespace):
+            object.__setattr__(dxf, '__class__', dxf._UNTRACKED_CLASS)
+
+    def is_modified(self) -> bool:
+        """ Returns ``True`` if entity was modified since loading or has no loaded tags, assigning a new object to
+        an instance attribute like :attr:`MText.text` is also a modification. (internal API)
+        """
+        state = self.__dict__
+        if '_loaded_tags' not in state or '_dirty' in state:
+            return True
+        get = state.get
+        return any(get(key, _MISSING) is not value for key, value in state.get('_loaded_state', ()))
+
+    @property
+    def is_lazy(self) -> bool:
+        """ Returns ``True`` if entity is not loaded yet. (internal API) """
+        return '_lazy_tags' in self.__dict__
+
+    def load_lazy_tags(self) -> None:
+        """ Load the stored tags of a lazy entity, does nothing for a loaded entity. (internal API) """
+        try:
+            dxfstr = self.__dict__.pop('_lazy_tags')
+        except KeyError:
+            return
+        lazy_namespace = self.__dict__['dxf']  # type: LazyDXFNamespace
+        modified = lazy_namespace.is_modified
+        attribs = lazy_namespace.detach()
+        priority = self.priority
+        self.__class__.__init__(self, self.doc)
+        self.priority = priority
+        self.load_tags(ExtendedTags(Tags.from_text(dxfstr)))
+        # restore base attributes, which could be changed before loading
+        namespace = self.dxf
+        namespace.discard('paperspace')
+        for key, value in attribs.items():
+            namespace._set_raw(key, value)
+        if not modified:  # keep the DXF string for export of unmodified entities
+            self.set_loaded_tags(dxfstr)
+            self._set_modification_hooks()
+
     @classmethod
     def from_text(cls: Type[T], text: str, doc: 'Drawing' = None) -> T:
         """ Load constructor from text for testing. (internal API)"""
@@ -486,6 +1160,7 @@ class DXFEntity:
 
         (internal API)
         """
+        self.load_lazy_tags()
         entity = self.__class__(doc=self.doc)
         # copy and bind dxf namespace to new entity
         entity.dxf = self.dxf.copy(entity)
@@ -519,6 +1194,29 @@ class DXFEntity:
             memodict[id(self)] = copy
             return copy
 
+    def __getstate__(self) -> dict:
+        """ Pickle support, the back link to the DXF document is not pickled, restored by
+        :meth:`Drawing.__setstate__`. (internal API)
+        """
+        state = dict(self.__dict__)
+        if 'doc' in state:  # destroyed entities have no attribute doc
+            state['doc'] = None
+        # modification hooks and the recorded instance attributes are not pickled, restored by __setstate__()
+        if '_loaded_tags' in state and self.is_modified():
+            del state['_loaded_tags']
+        state.pop('_loaded_state', None)
+        state.pop('_dirty', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """ Pickle support, rewire DXF namespace. (internal API) """
+        self.__dict__.update(state)
+        if 'dxf' in state:  # destroyed entities have no attribute dxf
+            # bypass rewire(), lazy entities should not be loaded
+            object.__setattr__(state['dxf'], '_entity', self)
+        if '_loaded_tags' in state:
+            self._set_modification_hooks()
+
     def load_tags(self, tags: ExtendedTags) -> None:
         """ Generic tag loading interface, called if DXF drawing is loaded from a stream or file. (internal API) """
         if tags:
@@ -570,7 +1268,7 @@ class DXFEntity:
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> DXFNamespace:
         # inheritance hook (internal API)
-        return DXFNamespace(processor, self)
+        return namespace_class(self.__class__)(processor, self)
 
     def setup_app_data(self, appdata: List[Tags]) -> None:
         """ Setup data structures from APP data. (internal API) """
@@ -739,6 +1437,12 @@ class DXFEntity:
         (internal API)
 
         """
+        if self.is_lazy:
+            if self._export_lazy_tags(tagwriter):
+                return
+            self.load_lazy_tags()
+        if '_loaded_tags' in self.__dict__ and self._export_loaded_tags(tagwriter):
+            return
         if tagwriter.dxfversion < self.MIN_DXF_VERSION_FOR_EXPORT:
             return
         if not self.preprocess_export(tagwriter):
@@ -755,6 +1459,37 @@ class DXFEntity:
         self.export_xdata(tagwriter)
         self.export_embedded_objects(tagwriter)
 
+    def _can_export_loaded_tags(self, tagwriter: 'TagWriter') -> bool:
+        doc = self.doc
+        if doc is None or doc._loaded_dxfversion != tagwriter.dxfversion:
+            return False
+        # handles are required to write the loaded tags
+        return tagwriter.dxfversion > DXF12 or tagwriter.write_handles
+
+    def _export_lazy_tags(self, tagwriter: 'TagWriter') -> bool:
+        """ Write unmodified lazy entities as loaded, returns ``False`` if export by tags is not possible. """
+        if not self._can_export_loaded_tags(tagwriter):
+            return False
+        # owner is not exported for DXF R12
+        if self.__dict__['dxf'].is_modified:
+            return False
+        tagwriter.write_str(self._lazy_tags)
+        return True
+
+    def _export_loaded_tags(self, tagwriter: 'TagWriter') -> bool:
+        """ Write unmodified entities as loaded, returns ``False`` if export by tags is not possible. """
+        if not self._can_export_loaded_tags(tagwriter):
+            return False
+        if self.is_modified():
+            self.discard_loaded_tags()  # modified entities stay modified
+            return False
+        tags = self._loaded_tags
+        if isinstance(tags, str):  # DXF string of lazy loaded entities
+            tagwriter.write_str(tags)
+        else:
+            tagwriter.write_tags(tags)
+        return True
+
     def export_base_class(self, tagwriter: 'TagWriter') -> None:
         """ Export base class DXF attributes and structures. (internal API) """
         # 1. tag: (0, DXFTYPE)
@@ -835,6 +1570,7 @@ class DXFEntity:
         """ Returns the existing :class:`~ezdxf.entities.xdict.ExtensionDict` or a new created one. """
 
         def new_extension_dict():
+            self.mark_modified()
             self.extension_dict = ExtensionDict.new(self)
             return self.extension_dict
 
@@ -873,12 +1609,14 @@ class DXFEntity:
              tags: iterable of (code, value) tuples or :class:`~ezdxf.lldxf.types.DXFTag`
 
         """
+        self.mark_modified()
         if self.appdata is None:
             self.appdata = AppData()
         self.appdata.add(appid, tags)
 
     def discard_app_data(self, appid: str):
         """ Discard application defined data for `appid`. Does not raise an exception if no data for `appid` exist. """
+        self.mark_modified()
         if self.appdata:
             self.appdata.discard(appid)
 
@@ -912,12 +1650,14 @@ class DXFEntity:
              tags: iterable of (code, value) tuples or :class:`~ezdxf.lldxf.types.DXFTag`
 
         """
+        self.mark_modified()
         if self.xdata is None:
             self.xdata = XData()
         self.xdata.add(appid, tags)
 
     def discard_xdata(self, appid: str) -> None:
         """ Discard extended data for `appid`. Does not raise an exception if no extended data for `appid` exist. """
+        self.mark_modified()
         if self.xdata:
             self.xdata.discard(appid)
 
@@ -953,6 +1693,7 @@ class DXFEntity:
              tags: iterable of (code, value) tuples or :class:`~ezdxf.lldxf.types.DXFTag`
 
         """
+        self.mark_modified()
         if self.xdata is None:
             self.xdata = XData()
         self.xdata.set_xlist(appid, name, tags)
@@ -962,6 +1703,7 @@ class DXFEntity:
         Discard tag list `name` for extended data `appid`. Does not raise an exception if no extended data for `appid`
         or no tag list `name` exist.
         """
+        self.mark_modified()
         if self.xdata:
             self.xdata.discard_xlist(appid, name)
 
@@ -979,6 +1721,7 @@ class DXFEntity:
             DXFValueError: no extended data for `appid` found
 
         """
+        self.mark_modified()
         self.xdata.replace_xlist(appid, name, tags)
 
     def has_reactors(self) -> bool:
@@ -991,18 +1734,21 @@ class DXFEntity:
 
     def set_reactors(self, handles: Iterable[str]) -> None:
         """ Set reactors as list of handles. """
+        self.mark_modified()
         if self.reactors is None:
             self.reactors = Reactors()
         self.reactors.set(handles)
 
     def append_reactor_handle(self, handle: str) -> None:
         """ Append `handle` to reactors. """
+        self.mark_modified()
         if self.reactors is None:
             self.reactors = Reactors()
         self.reactors.add(handle)
 
     def discard_reactor_handle(self, handle: str) -> None:
         """ Discard `handle` from reactors. Does not raise an exception if `handle` does not exist. """
+        self.mark_modified()
         if self.reactors:
             self.reactors.discard(handle)
 
@@ -1036,10 +1782,10 @@ class DXFTagStorage(DXFEntity):
         self.DXFTYPE = self.base_class[0].value
         try:
             acdb_entity = tags.get_subclass('AcDbEntity')
-            self.dxf.__dict__['paperspace'] = acdb_entity.get_first_value(67, 0)
+            self.dxf._set_raw('paperspace', acdb_entity.get_first_value(67, 0))
         except DXFKeyError:
             # just fake it
-            self.dxf.__dict__['paperspace'] = 0
+            self.dxf._set_raw('paperspace', 0)
 
     def export_entity(self, tagwriter: 'TagWriter') -> None:
         """ Write subclass tags as they are
@@ -16,7 +16,7 @@ from ezdxf.tools import float2transparency, transparency2float
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import Auditor, TagWriter, BaseLayout, DXFNamespace
+    from ezdxf.eztypes import Auditor, TagWriter, BaseLayout, DXFNamespace, Matrix44
 
 __all__ = ['DXFGraphic', 'acdb_entity', 'entity_linker', 'SeqEnd']
 
@@ -73,6 +73,7 @@ class DXFGraphic(DXFEntity):
     """
     DXFTYPE = 'DXFGFX'
     DEFAULT_ATTRIBS = {'layer': '0'}
+    LAZY_LOADING = True
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity)  # DXF attribute definitions
 
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
@@ -137,6 +138,20 @@ class DXFGraphic(DXFEntity):
         else:
             return None
 
+    def transform(self, m: 'Matrix44') -> 'DXFGraphic':
+        """
+        Transforms entity inplace by the transformation matrix `m` and returns the entity, see
+        :func:`ezdxf.transform.transform`.
+
+        Raises:
+            DXFTypeError: transformation of the DXF type is not supported
+            DXFValueError: the transformation is not supported for this entity, like non uniform scaling of
+                CIRCLE and ARC
+
+        """
+        from ezdxf.transform import transform
+        return transform(self, m)
+
     def set_owner(self, owner: str, paperspace: int = 0) -> None:
         """ Set owner attribute and paperspace flag. (internal API)"""
         self.dxf.owner = owner
@@ -254,6 +269,7 @@ class DXFGraphic(DXFEntity):
 @register_entity
 class SeqEnd(DXFGraphic):
     DXFTYPE = 'SEQEND'
+    LAZY_LOADING = False  # linked entity
 
 
 LINKED_ENTITIES = {
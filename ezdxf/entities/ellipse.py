@@ -3,7 +3,8 @@
 # Created 2019-02-15
 from typing import TYPE_CHECKING, Iterable
 import math
-from ezdxf.math import Vector
+from array import array
+from ezdxf.math import Vector, flatten
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000
 from .dxfentity import base_class, SubclassProcessor
@@ -84,6 +85,21 @@ class Ellipse(DXFGraphic):
             # the ellipse plane.
             yield center + (x_axis * x) + (y_axis * y)
 
+    def flattening(self, distance: float) -> array:
+        """
+        Returns the ellipse approximated by line segments in :ref:`WCS` as flat ``array('d')`` of ``x, y, z``
+        values, the max. distance of the line segments to the ellipse is `distance`, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the ellipse
+
+        .. versionadded:: 0.11
+
+        """
+        dxf = self.dxf
+        return flatten.ellipse(dxf.center, dxf.major_axis, dxf.ratio, dxf.start_param, dxf.end_param,
+                               dxf.extrusion, distance)
+
     @property
     def start_point(self) -> 'Vector':
         v = list(self.vertices([self.dxf.start_param]))
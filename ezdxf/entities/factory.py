@@ -1,11 +1,11 @@
 # Created: 2019-02-15
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Optional
 from ezdxf.tools.handle import ImageKeyGenerator, UnderlayKeyGenerator
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.extendedtags import ExtendedTags
-from ezdxf.entities.dxfentity import DXFEntity, DXFTagStorage
+from ezdxf.entities.dxfentity import DXFEntity, DXFTagStorage, supports_lazy_loading
 from ezdxf.lldxf.const import DXFInternalEzdxfError
 
 if TYPE_CHECKING:
@@ -50,11 +50,22 @@ class EntityFactory:
             entity.seqend = seqend
         return entity
 
-    def load(self, tags: Union['ExtendedTags', 'Tags']) -> 'DXFEntity':
-        entity = self.entity(tags)
+    def load(self, tags: Union['ExtendedTags', 'Tags'], lazy: bool = False) -> 'DXFEntity':
+        entity = None
+        if lazy:
+            entity = self.lazy_entity(tags)
+        if entity is None:
+            entity = self.entity(tags)
         self.doc.entitydb.add(entity)
         return entity
 
+    def lazy_entity(self, tags: 'Tags') -> Optional['DXFEntity']:
+        """ Returns a lazy loaded entity or ``None`` if the DXF type does not support lazy loading. """
+        class_ = ENTITY_CLASSES.get(tags[0].value, DEFAULT_CLASS)
+        if supports_lazy_loading(class_):
+            return class_.load_lazy(tags, self.doc)
+        return None
+
     def entity(self, tags: Union['ExtendedTags', 'Tags']) -> 'DXFEntity':
         if not isinstance(tags, ExtendedTags):
             tags = ExtendedTags(tags)
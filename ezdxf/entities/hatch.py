@@ -12,6 +12,7 @@ from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.tags import Tags, group_tags
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXF2004
 from ezdxf.lldxf import const
+from ezdxf.lldxf.packedtags import TrackedList, TrackedObject
 from ezdxf.math.bspline import bspline_control_frame
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
@@ -149,7 +150,7 @@ class Hatch(DXFGraphic):
         self.paths = BoundaryPaths()
         self.pattern = None  # type: Pattern
         self.gradient = None  # type: Gradient
-        self.seeds = []
+        self.seeds = TrackedList()
 
     def _copy_data(self, entity: 'Hatch') -> None:
         """ Copy paths, pattern, gradient, seeds. """
@@ -225,7 +226,7 @@ class Hatch(DXFGraphic):
         del tags[start_index: start_index + len(seed_data) + 1]
 
         # just process vertices with group code 10
-        self.seeds = [value for code, value in seed_data if code == 10]
+        self.seeds = TrackedList(value for code, value in seed_data if code == 10)
 
         return tags
 
@@ -304,6 +305,7 @@ class Hatch(DXFGraphic):
     @contextmanager
     def edit_boundary(self) -> 'BoundaryPaths':
         """ Context manager to edit hatch boundary data, yields a :class:`BoundaryPaths` object. """
+        self.mark_modified()
         yield self.paths
 
     def set_solid_fill(self, color: int = 7, style: int = 1, rgb: 'RGB' = None):
@@ -394,6 +396,7 @@ class Hatch(DXFGraphic):
         """ Context manager to edit hatch gradient data, yields a :class:`GradientData` object. """
         if not self.gradient:
             raise const.DXFValueError('HATCH has no gradient data.')
+        self.mark_modified()
         yield self.gradient
 
     def set_pattern_fill(self, name: str, color: int = 7, angle: float = 0., scale: float = 1., double: int = 0,
@@ -434,6 +437,7 @@ class Hatch(DXFGraphic):
         """ Context manager to edit hatch pattern data, yields a :class:`PatternData` object. """
         if not self.pattern:
             raise const.DXFValueError('Solid fill HATCH has no pattern data.')
+        self.mark_modified()
         yield self.pattern
 
     def set_pattern_definition(self, lines: Sequence) -> None:
@@ -468,16 +472,16 @@ class Hatch(DXFGraphic):
         if len(points) < 1:
             raise const.DXFValueError(
                 "Param points should be a collection of 2D points and requires at least one point.")
-        self.seeds = list(points)
+        self.seeds = TrackedList(points)
         self.dxf.n_seed_points = len(self.seeds)
 
 
 TPath = Union['PolylinePath', 'EdgePath']
 
 
-class BoundaryPaths:
+class BoundaryPaths(TrackedObject):
     def __init__(self, paths: List[TPath] = None):
-        self.paths = paths or []  # type: List[TPath]
+        self.paths = TrackedList(paths or [])  # type: List[TPath]
 
     def __len__(self):
         return len(self.paths)
@@ -498,9 +502,15 @@ class BoundaryPaths:
             paths.append(path)
         return cls(paths)
 
+    def _add_path(self, path: TPath) -> None:
+        self._modified()
+        path.set_modification_hook(self._hook)
+        self.paths.append(path)
+
     def clear(self) -> None:
         """ Remove all boundary paths. """
-        self.paths = []
+        self._modified()
+        self.paths = TrackedList()
 
     def add_polyline_path(self, path_vertices: Sequence[Tuple[float, float]], is_closed: bool = True,
                           flags: int = 1) -> 'PolylinePath':
@@ -516,7 +526,7 @@ class BoundaryPaths:
         new_path = PolylinePath()
         new_path.set_vertices(path_vertices, is_closed)
         new_path.path_type_flags = flags | const.BOUNDARY_PATH_POLYLINE
-        self.paths.append(new_path)
+        self._add_path(new_path)
         return new_path
 
     def add_edge_path(self, flags: int = 1) -> 'EdgePath':
@@ -529,7 +539,7 @@ class BoundaryPaths:
         """
         new_path = EdgePath()
         new_path.path_type_flags = flags
-        self.paths.append(new_path)
+        self._add_path(new_path)
         return new_path
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
@@ -559,26 +569,27 @@ def export_source_boundary_objects(tagwriter: 'TagWriter', handles: Sequence[str
         tagwriter.write_tag2(330, handle)
 
 
-class PolylinePath:
+class PolylinePath(TrackedObject):
     PATH_TYPE = 'PolylinePath'
 
     def __init__(self):
         self.path_type_flags = const.BOUNDARY_PATH_POLYLINE
         self.is_closed = False
-        self.vertices = []  # type: List[Tuple[float, float, float]]  # list of 2D coordinates with bulge values (x, y, bulge); bulge default = 0.0
-        self.source_boundary_objects = []  # type: List[str]  # (330, handle) tags
+        self.vertices = TrackedList()  # type: List[Tuple[float, float, float]]  # list of 2D coordinates with bulge values (x, y, bulge); bulge default = 0.0
+        self.source_boundary_objects = TrackedList()  # type: List[str]  # (330, handle) tags
 
     @classmethod
     def load_tags(cls, tags: Tags) -> 'PolylinePath':
         path = PolylinePath()
-        path.source_boundary_objects = pop_source_boundary_objects_tags(tags)
+        path.source_boundary_objects = TrackedList(pop_source_boundary_objects_tags(tags))
+        vertices = []
         for tag in tags:
             code, value = tag
             if code == 10:  # vertex coordinates
-                path.vertices.append((value[0], value[1], 0.0))  # (x, y, bulge); bulge default = 0.0
+                vertices.append((value[0], value[1], 0.0))  # (x, y, bulge); bulge default = 0.0
             elif code == 42:  # bulge value
-                x, y, bulge = path.vertices.pop()  # last value
-                path.vertices.append((x, y, value))  # last coordinates with new bulge value
+                x, y, bulge = vertices.pop()  # last value
+                vertices.append((x, y, value))  # last coordinates with new bulge value
             elif code == 72:
                 pass  # ignore this value
             elif code == 73:
@@ -587,6 +598,7 @@ class PolylinePath:
                 path.path_type_flags = value
             elif code == 93:  # number of polyline vertices
                 pass  # ignore this value
+        path.vertices = TrackedList(vertices)
         return path
 
     def set_vertices(self, vertices: Sequence[Sequence[float]], is_closed: bool = True) -> None:
@@ -602,14 +614,16 @@ class PolylinePath:
             else:
                 raise const.DXFValueError("Invalid vertex format, expected (x, y) or (x, y, bulge)")
             new_vertices.append((x, y, bulge))
-        self.vertices = new_vertices
+        self._modified()
+        self.vertices = TrackedList(new_vertices)
         self.is_closed = is_closed
 
     def clear(self) -> None:
         """ Removes all vertices and all handles to associated DXF objects (:attr:`source_boundary_objects`). """
-        self.vertices = []
+        self._modified()
+        self.vertices = TrackedList()
         self.is_closed = False
-        self.source_boundary_objects = []
+        self.source_boundary_objects = TrackedList()
 
     def has_bulge(self) -> bool:
         for x, y, bulge in self.vertices:
@@ -633,21 +647,20 @@ class PolylinePath:
         export_source_boundary_objects(tagwriter, self.source_boundary_objects)
 
 
-class EdgePath:
+class EdgePath(TrackedObject):
     PATH_TYPE = 'EdgePath'
 
     def __init__(self):
         self.path_type_flags = const.BOUNDARY_PATH_DEFAULT
-        self.edges = []
-        self.source_boundary_objects = []
+        self.edges = TrackedList()
+        self.source_boundary_objects = TrackedList()
 
     @classmethod
     def load_tags(cls, tags: Tags) -> 'EdgePath':
         edge_path = cls()
-        edge_path.source_boundary_objects = pop_source_boundary_objects_tags(tags)
+        edge_path.source_boundary_objects = TrackedList(pop_source_boundary_objects_tags(tags))
         edge_groups = group_tags(tags, splitcode=72)
-        for edge_tags in edge_groups:
-            edge_path.edges.append(edge_path.load_edge(edge_tags))
+        edge_path.edges = TrackedList(edge_path.load_edge(edge_tags) for edge_tags in edge_groups)
         return edge_path
 
     @staticmethod
@@ -670,6 +683,7 @@ class EdgePath:
         line = LineEdge()
         line.start = start
         line.end = end
+        self._modified()
         self.edges.append(line)
         return line
 
@@ -701,6 +715,7 @@ class EdgePath:
         arc.start_angle = start_angle
         arc.end_angle = end_angle
         arc.is_counter_clockwise = 1 if bool(is_counter_clockwise) else 0
+        self._modified()
         self.edges.append(arc)
         return arc
 
@@ -731,6 +746,7 @@ class EdgePath:
         ellipse.start_angle = start_angle
         ellipse.end_angle = end_angle
         ellipse.is_counter_clockwise = is_counter_clockwise
+        self._modified()
         self.edges.append(ellipse)
         return ellipse
 
@@ -767,16 +783,17 @@ class EdgePath:
         """
         spline = SplineEdge()
         if fit_points is not None:
-            spline.fit_points = list(fit_points)
+            spline.fit_points = TrackedList(fit_points)
         if control_points is not None:
-            spline.control_points = list(control_points)
+            spline.control_points = TrackedList(control_points)
         if knot_values is not None:
-            spline.knot_values = list(knot_values)
+            spline.knot_values = TrackedList(knot_values)
         if weights is not None:
-            spline.weights = list(weights)
+            spline.weights = TrackedList(weights)
         spline.degree = degree
         spline.rational = int(rational)
         spline.periodic = int(periodic)
+        self._modified()
         self.edges.append(spline)
         return spline
 
@@ -793,7 +810,8 @@ class EdgePath:
 
     def clear(self) -> None:
         """ Delete all edges."""
-        self.edges = []
+        self._modified()
+        self.edges = TrackedList()
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         tagwriter.write_tag2(92, int(self.path_type_flags))
@@ -803,7 +821,7 @@ class EdgePath:
         export_source_boundary_objects(tagwriter, self.source_boundary_objects)
 
 
-class LineEdge:
+class LineEdge(TrackedObject):
     EDGE_TYPE = "LineEdge"
 
     def __init__(self):
@@ -833,7 +851,7 @@ class LineEdge:
         tagwriter.write_tag2(21, float(y))
 
 
-class ArcEdge:
+class ArcEdge(TrackedObject):
     EDGE_TYPE = "ArcEdge"
 
     def __init__(self):
@@ -871,7 +889,7 @@ class ArcEdge:
         tagwriter.write_tag2(73, self.is_counter_clockwise)
 
 
-class EllipseEdge:
+class EllipseEdge(TrackedObject):
     EDGE_TYPE = "EllipseEdge"
 
     def __init__(self):
@@ -916,17 +934,17 @@ class EllipseEdge:
         tagwriter.write_tag2(73, self.is_counter_clockwise)
 
 
-class SplineEdge:
+class SplineEdge(TrackedObject):
     EDGE_TYPE = "SplineEdge"
 
     def __init__(self):
         self.degree = 3  # code = 94
         self.rational = 0  # code = 73
         self.periodic = 0  # code = 74
-        self.knot_values = []  # type: List[float]
-        self.control_points = []  # type: List[Tuple[float, float]]
-        self.fit_points = []  # type: List[Tuple[float, float]]
-        self.weights = []  # type: List[float]
+        self.knot_values = TrackedList()  # type: List[float]
+        self.control_points = TrackedList()  # type: List[Tuple[float, float]]
+        self.fit_points = TrackedList()  # type: List[Tuple[float, float]]
+        self.weights = TrackedList()  # type: List[float]
         # do not set tangents by default to (0, 0)
         self.start_tangent = None  # type: Optional[Tuple[float, float]]
         self.end_tangent = None  # type: Optional[Tuple[float, float]]
@@ -1005,9 +1023,9 @@ EDGE_CLASSES = [None, LineEdge, ArcEdge, EllipseEdge, SplineEdge]
 EdgeTypes = Union[LineEdge, ArcEdge, EllipseEdge, SplineEdge]
 
 
-class Pattern:
+class Pattern(TrackedObject):
     def __init__(self, lines=None):
-        self.lines = lines or []
+        self.lines = TrackedList(lines or [])
 
     @classmethod
     def load_tags(cls, tags: Tags) -> 'Pattern':
@@ -1016,7 +1034,7 @@ class Pattern:
 
     def clear(self) -> None:
         """ Delete all pattern definition lines. """
-        self.lines = []
+        self.lines = TrackedList()
 
     def add_line(self,
                  angle: float = 0.,
@@ -1049,7 +1067,7 @@ class Pattern:
         return "[" + ",".join(str(line) for line in self.lines) + "]"
 
 
-class PatternLine:
+class PatternLine(TrackedObject):
     def __init__(self,
                  angle: float = 0.,
                  base_point: Tuple[float, float] = (0., 0.),
@@ -1058,7 +1076,7 @@ class PatternLine:
         self.angle = angle  # as always in degrees (circle = 360 deg)
         self.base_point = base_point
         self.offset = offset
-        self.dash_length_items = [] if dash_length_items is None else dash_length_items  # type: List[float]
+        self.dash_length_items = TrackedList(dash_length_items or [])  # type: List[float]
         # dash_length_items = [item0, item1, ...]
         # item > 0 is line, < 0 is gap, 0.0 = dot;
 
@@ -1089,7 +1107,7 @@ class PatternLine:
         return "[{0.angle}, {0.base_point}, {0.offset}, {0.dash_length_items}]".format(self)
 
 
-class Gradient:
+class Gradient(TrackedObject):
     def __init__(self):
         self.kind = 1  # 1 for gradient by default, 0 for Solid
         self.color1 = (0, 0, 0)  # type: RGB
@@ -10,7 +10,8 @@ from .dxfgfx import DXFGraphic, acdb_entity, SeqEnd
 from .factory import register_entity
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import TagWriter, Vertex, DXFNamespace, DXFEntity, Drawing, Attrib, AttDef
+    from ezdxf.eztypes import TagWriter, Vertex, DXFNamespace, DXFEntity, Drawing, Attrib, AttDef, DXFGraphic
+    from ezdxf.explode import Cache
 
 __all__ = ['Insert']
 
@@ -36,6 +37,8 @@ class Insert(DXFGraphic):
     """ DXF INSERT entity """
     DXFTYPE = 'INSERT'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_block_reference)
+    LAZY_LOADING = False  # has linked entities
+    LINKED_ENTITIES = frozenset({'attribs', 'seqend'})
 
     def __init__(self, doc: 'Drawing' = None):
         super().__init__(doc)
@@ -251,6 +254,7 @@ class Insert(DXFGraphic):
         dxfattribs['text'] = text
         dxfattribs['insert'] = insert
         attrib = cast('Attrib', self._new_compound_entity('ATTRIB', dxfattribs))
+        self.mark_modified()  # attribs follow flag
         self.attribs.append(attrib)
 
         # this case is only possible if INSERT is read from file without attached ATTRIBS
@@ -278,6 +282,7 @@ class Insert(DXFGraphic):
         """
         for index, attrib in enumerate(self.attribs):
             if attrib.dxf.tag == tag:
+                self.mark_modified()  # attribs follow flag
                 del self.attribs[index]
                 self.entitydb.delete_entity(attrib)
                 return
@@ -289,4 +294,18 @@ class Insert(DXFGraphic):
         db = self.entitydb
         for attrib in self.attribs:
             db.delete_entity(attrib)
+        self.mark_modified()  # attribs follow flag
         self.attribs = []
+
+    def virtual_entities(self, cache: 'Cache' = None) -> Iterable['DXFGraphic']:
+        """
+        Yields the content of the block reference as virtual DXF entities in :ref:`WCS`, nested block references
+        and MINSERT grids are resolved, see :func:`ezdxf.explode.virtual_entities`.
+
+        Args:
+            cache: :class:`ezdxf.explode.Cache` for block definition content, reuse the cache for multiple block
+                references
+
+        """
+        from ezdxf.explode import virtual_entities
+        return virtual_entities(self, cache)
@@ -5,12 +5,12 @@ from typing import TYPE_CHECKING, Tuple, Sequence, Iterable, cast, List
 import array
 import copy
 from contextlib import contextmanager
-from ezdxf.math import Vector
+from ezdxf.math import Vector, flatten
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
-from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF14, LWPOLYLINE_CLOSED, LWPOLYLINE_PLINEGEN
+from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF14, LWPOLYLINE_CLOSED, LWPOLYLINE_PLINEGEN, DXFValueError
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.types import DXFTag, DXFVertex
-from ezdxf.lldxf.packedtags import VertexArray
+from ezdxf.lldxf.packedtags import VertexArray, is_ndarray, numpy_module
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
@@ -162,6 +162,26 @@ class LWPolyline(DXFGraphic):
         for x, y in self.vertices():
             yield ocs.to_wcs((x, y, elevation))
 
+    def flattening(self, distance: float) -> 'array.array':
+        """
+        Returns the polyline in :ref:`WCS` as flat ``array('d')`` of ``x, y, z`` values, bulge segments are
+        approximated by line segments, the max. distance of the line segments to the arcs is `distance`,
+        see :mod:`ezdxf.math.flatten`. The first vertex is appended as last vertex for closed polylines.
+
+        Args:
+            distance: max. distance of the line segments to the arcs
+
+        .. versionadded:: 0.11
+
+        """
+        vertices = flatten.polyline(
+            ((x, y, b) for x, y, s, e, b in self),
+            distance,
+            closed=self.closed,
+            elevation=self.dxf.get('elevation', 0.),
+        )
+        return flatten.ocs_to_wcs(vertices, self.ocs())
+
     def append(self, point: Sequence[float], format: str = DEFAULT_FORMAT) -> None:
         """
         Append `point` to polyline, `format`` specifies a user defined point format.
@@ -197,12 +217,12 @@ class LWPolyline(DXFGraphic):
         All coordinates in :ref:`OCS`.
 
         Args:
-            points: iterable of point, point is (x, y, [start_width, [end_width, [bulge]]]) tuple
+            points: iterable of point, point is (x, y, [start_width, [end_width, [bulge]]]) tuple, or a NumPy
+                    array of shape ``(n, m)``, format code ``'v'`` is not supported for NumPy arrays
             format: format string, default is ``'xyseb'``, see: `format codes`_
 
         """
-        for point in points:
-            self.lwpoints.append(point, format=format)
+        self.lwpoints.extend(points, format=format)
 
     @contextmanager
     def points(self, format: str = DEFAULT_FORMAT) -> List[Sequence[float]]:
@@ -239,12 +259,19 @@ class LWPolyline(DXFGraphic):
         All coordinates in :ref:`OCS`.
 
         Args:
-            points: iterable of point, point is (x, y, [start_width, [end_width, [bulge]]]) tuple
+            points: iterable of point, point is (x, y, [start_width, [end_width, [bulge]]]) tuple, or a NumPy
+                    array of shape ``(n, m)``, format code ``'v'`` is not supported for NumPy arrays
             format: format string, default is ``'xyseb'``, see `format codes`_
 
         """
+        # compile all points before the existing points are removed, invalid input raises an exception and
+        # leaves the polyline untouched
+        if is_ndarray(points):
+            points = compile_ndarray(points, format=format)
+        else:
+            points = [compile_array(point, format=format) for point in points]
         self.lwpoints.clear()
-        self.append_points(points, format=format)
+        VertexArray.extend(self.lwpoints, points)
 
     def clear(self) -> None:
         """ Remove all points. """
@@ -291,6 +318,13 @@ class LWPolylinePoints(VertexArray):
     def append(self, point: Sequence[float], format: str = DEFAULT_FORMAT) -> None:
         super().append(compile_array(point, format=format))
 
+    def extend(self, points: Iterable[Sequence[float]], format: str = DEFAULT_FORMAT) -> None:
+        if is_ndarray(points):
+            super().extend(compile_ndarray(points, format=format))
+        else:
+            for point in points:
+                self.append(point, format=format)
+
     def dxftags(self) -> Iterable[DXFTag]:
         for point in self:
             x, y, start_width, end_width, bulge = point
@@ -363,3 +397,24 @@ def compile_array(data: Sequence[float], format='xyseb') -> array.array:
         else:
             a['xyseb'.index(code)] = value
     return a
+
+
+def compile_ndarray(points, format='xyseb'):
+    """
+    Gather point components from NumPy array `points` of shape ``(n, m)``, the columns of `points` are associated
+    to the format codes like the point components by :func:`compile_array`, format code ``v`` is not supported.
+
+    Returns:
+        NumPy array of shape ``(n, 5)``, columns are (x, y, start_width, end_width, bulge)
+
+    """
+    np = numpy_module()
+    format = [code for code in format.lower() if code in FORMAT_CODES]
+    if 'v' in format:
+        raise DXFValueError('Format code "v" not supported for NumPy arrays.')
+    if points.ndim != 2:
+        raise DXFValueError('NumPy array of shape (n, m) required.')
+    result = np.zeros((len(points), 5))
+    for column, code in zip(range(points.shape[1]), format):
+        result[:, 'xyseb'.index(code)] = points[:, column]
+    return result
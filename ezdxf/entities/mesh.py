@@ -9,7 +9,7 @@ from itertools import chain
 from contextlib import contextmanager
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXFValueError, DXFStructureError
-from ezdxf.lldxf.packedtags import VertexArray, TagArray, TagList
+from ezdxf.lldxf.packedtags import VertexArray, TagArray, TagList, is_ndarray, packed_array, numpy_view, numpy_module
 from ezdxf.tools import take2
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
@@ -62,7 +62,13 @@ class EdgeArray(TagArray):
             yield edge
 
     def set_data(self, edges: Iterable[Tuple[int, int]]) -> None:
-        self.values = array.array(self.DTYPE, chain.from_iterable(edges))
+        self._modified()
+        self.values = packed_array(self.DTYPE, edges if is_ndarray(edges) else chain.from_iterable(edges))
+
+    def as_numpy(self):
+        """ Returns a NumPy view of shape ``(n, 2)`` without copying. """
+        self._modified()  # changes of the view are not tracked
+        return numpy_view(self.values, 2)
 
     def export_dxf(self, tagwriter: 'TagWriter'):
         # count = count of edges not tags!
@@ -90,11 +96,22 @@ class FaceList(TagList):
         return len(self.values) + sum(len(f) for f in self.values)
 
     def set_data(self, faces: Iterable[Sequence[int]]) -> None:
+        if is_ndarray(faces):
+            faces = faces.tolist()
         _faces = []
         for face in faces:
             _faces.append(face_to_array(face))
+        self._modified()
         self.values = _faces
 
+    def as_numpy(self):
+        """ Returns a NumPy array of shape ``(n, m)`` as copy of the faces, all faces require the same count of
+        vertices `m`.
+        """
+        if len(set(len(face) for face in self.values)) > 1:
+            raise DXFValueError('Faces with different vertex counts can not be converted into a NumPy array.')
+        return numpy_module().array([face.tolist() for face in self.values], dtype=int)
+
 
 def face_to_array(face: Sequence[int]) -> array.array:
     max_index = max(face)
@@ -270,20 +287,24 @@ class Mesh(DXFGraphic):
 
     @creases.setter
     def creases(self, values: Iterable[float]) -> None:
-        self._creases = array.array('f', values)
+        self._creases = packed_array('f', values)
 
     @property
     def vertices(self):
-        """ Vertices as list like :class:`~ezdxf.lldxf.packedtags.VertexArray`. (read/write)"""
+        """ Vertices as list like :class:`~ezdxf.lldxf.packedtags.VertexArray`, accepts also a NumPy array of
+        shape ``(n, 3)``. (read/write)
+        """
         return self._vertices
 
     @vertices.setter
     def vertices(self, points: Iterable['Vertex']) -> None:
-        self._vertices = VertexArray(chain.from_iterable(points))
+        self._vertices = VertexArray(points if is_ndarray(points) else chain.from_iterable(points))
 
     @property
     def edges(self):
-        """ Edges as list like :class:`~ezdxf.lldxf.packedtags.TagArray`. (read/write)"""
+        """ Edges as list like :class:`~ezdxf.lldxf.packedtags.TagArray`, accepts also a NumPy array of shape
+        ``(n, 2)``. (read/write)
+        """
         return self._edges
 
     @edges.setter
@@ -292,7 +313,9 @@ class Mesh(DXFGraphic):
 
     @property
     def faces(self):
-        """ Faces as list like :class:`~ezdxf.lldxf.packedtags.TagList`. (read/write)"""
+        """ Faces as list like :class:`~ezdxf.lldxf.packedtags.TagList`, accepts also a NumPy array of shape
+        ``(n, m)``. (read/write)
+        """
         return self._faces
 
     @faces.setter
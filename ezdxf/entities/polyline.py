@@ -3,7 +3,8 @@
 # Created 2019-02-16
 from typing import TYPE_CHECKING, Iterable, Union, List, cast, Tuple, Sequence, Dict
 from itertools import chain
-from ezdxf.math import Vector
+from array import array
+from ezdxf.math import Vector, flatten
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, VERTEXNAMES
 from ezdxf.lldxf import const
@@ -53,6 +54,8 @@ class Polyline(DXFGraphic):
     """ DXF POLYLINE entity """
     DXFTYPE = 'POLYLINE'
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_polyline)
+    LAZY_LOADING = False  # requires cast() at loading and has linked entities
+    LINKED_ENTITIES = frozenset({'vertices', 'seqend'})
     # polyline flags (70)
     CLOSED = 1
     MESH_CLOSED_M_DIRECTION = CLOSED
@@ -274,6 +277,36 @@ class Polyline(DXFGraphic):
         """ Returns iterable of all polyline vertices as ``(x, y, z)`` tuples, not as :class:`Vertex` objects."""
         return (vertex.dxf.location for vertex in self.vertices)
 
+    def flattening(self, distance: float) -> array:
+        """
+        Returns the 2D or 3D polyline in :ref:`WCS` as flat ``array('d')`` of ``x, y, z`` values, bulge segments
+        of 2D polylines are approximated by line segments, the max. distance of the line segments to the arcs is
+        `distance`, see :mod:`ezdxf.math.flatten`. The first vertex is appended as last vertex for closed polylines.
+
+        Args:
+            distance: max. distance of the line segments to the arcs
+
+        Raises:
+            DXFTypeError: for polygon meshes and poly face meshes
+
+        .. versionadded:: 0.11
+
+        """
+        if self.is_3d_polyline:
+            points = list(self.points())
+            if self.is_closed and points:
+                points.append(points[0])
+            return array('d', chain.from_iterable(Vector(point).xyz for point in points))
+        if not self.is_2d_polyline:
+            raise const.DXFTypeError('Flattening of polygon meshes or poly face meshes not supported.')
+        vertices = flatten.polyline(
+            ((v.dxf.location[0], v.dxf.location[1], v.dxf.bulge) for v in self.vertices),
+            distance,
+            closed=self.is_closed,
+            elevation=Vector(self.dxf.get('elevation', (0, 0, 0))).z,
+        )
+        return flatten.ocs_to_wcs(vertices, self.ocs())
+
     def append_vertices(self, points: Iterable['Vertex'], dxfattribs: dict = None) -> None:
         """ Append multiple :class:`Vertex` entities at location `points`.
 
@@ -738,6 +771,7 @@ acdb_vertex = DefSubclass('AcDbVertex', {  # last subclass index -1
 class DXFVertex(DXFGraphic):
     """ DXF VERTEXE entity """
     DXFTYPE = 'VERTEX'
+    LAZY_LOADING = False  # linked entity
 
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity, acdb_vertex)
     EXTRA_VERTEX_CREATED = 1  # Extra vertex created by curve-fitting
@@ -9,8 +9,9 @@ from contextlib import contextmanager
 from ezdxf.math import Vector
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import SUBCLASS_MARKER, DXF2000, DXFValueError
-from ezdxf.lldxf.packedtags import VertexArray
-from ezdxf.math.bspline import uniform_knot_vector, open_uniform_knot_vector
+from ezdxf.lldxf.packedtags import VertexArray, is_ndarray, packed_array
+from ezdxf.math.bspline import uniform_knot_vector, open_uniform_knot_vector, bspline_control_frame
+from ezdxf.math.bspline import BSpline, BSplineClosed
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
 from .factory import register_entity
@@ -141,12 +142,14 @@ class Spline(DXFGraphic):
 
     @property
     def knots(self) -> 'array.array':  # group code 40
-        """ Knot values as :code:`array.array('d')`. """
+        """ Knot values as :code:`array.array('d')`, accepts also a NumPy array, NumPy view by
+        :func:`~ezdxf.lldxf.packedtags.numpy_view`.
+        """
         return self._knots
 
     @knots.setter
     def knots(self, values: Iterable[float]) -> None:
-        self._knots = array.array('d', values)
+        self._knots = packed_array('d', values)
 
     def knot_count(self) -> int:  # DXF callback attribute Spline.dxf.n_knots
         """ Count of knot values. """
@@ -154,21 +157,25 @@ class Spline(DXFGraphic):
 
     @property
     def weights(self) -> 'array.array':  # group code 41
-        """ Control point weights as :code:`array.array('d')`. """
+        """ Control point weights as :code:`array.array('d')`, accepts also a NumPy array, NumPy view by
+        :func:`~ezdxf.lldxf.packedtags.numpy_view`.
+        """
         return self._weights
 
     @weights.setter
     def weights(self, values: Iterable[float]) -> None:
-        self._weights = array.array('d', values)
+        self._weights = packed_array('d', values)
 
     @property
     def control_points(self) -> VertexArray:  # group code 10
-        """ :class:`~ezdxf.lldxf.packedtags.VertexArray` of control points in :ref:`WCS`. """
+        """ :class:`~ezdxf.lldxf.packedtags.VertexArray` of control points in :ref:`WCS`, accepts also a NumPy array
+        of shape ``(n, 3)``.
+        """
         return self._control_points
 
     @control_points.setter
     def control_points(self, points: Iterable['Vertex']) -> None:
-        self._control_points = VertexArray(chain.from_iterable(points))
+        self._control_points = VertexArray(points if is_ndarray(points) else chain.from_iterable(points))
 
     def control_point_count(self) -> int:  # DXF callback attribute Spline.dxf.n_control_points
         """ Count of control points. """
@@ -176,17 +183,55 @@ class Spline(DXFGraphic):
 
     @property
     def fit_points(self) -> VertexArray:  # group code 11
-        """ :class:`~ezdxf.lldxf.packedtags.VertexArray` of fit points in :ref:`WCS`. """
+        """ :class:`~ezdxf.lldxf.packedtags.VertexArray` of fit points in :ref:`WCS`, accepts also a NumPy array of
+        shape ``(n, 3)``.
+        """
         return self._fit_points
 
     @fit_points.setter
     def fit_points(self, points: Iterable['Vertex']) -> None:
-        self._fit_points = VertexArray(chain.from_iterable(points))
+        self._fit_points = VertexArray(points if is_ndarray(points) else chain.from_iterable(points))
 
     def fit_point_count(self) -> int:  # DXF callback attribute Spline.dxf.n_fit_points
         """ Count of fit points. """
         return len(self.fit_points)
 
+    def construction_tool(self) -> BSpline:
+        """
+        Returns the construction tool :class:`~ezdxf.math.BSpline` for the control points, knots and weights of
+        the SPLINE entity, or a :class:`~ezdxf.math.BSpline` interpolated by the fit points if the SPLINE entity has
+        no control points. Returns a :class:`~ezdxf.math.BSplineClosed` for closed splines without a complete knot
+        vector, like periodic splines created by :meth:`set_periodic`.
+
+        .. versionadded:: 0.11
+
+        """
+        order = self.dxf.degree + 1
+        count = len(self.control_points)
+        if count:
+            weights = self.weights if len(self.weights) else None
+            if len(self.knots) == count + order:
+                return BSpline(self.control_points, order=order, knots=self.knots, weights=weights)
+            if self.closed:
+                return BSplineClosed(self.control_points, order=order, weights=weights)
+            return BSpline(self.control_points, order=order, weights=weights)
+        if len(self.fit_points):
+            return bspline_control_frame(self.fit_points, degree=self.dxf.degree)
+        raise DXFValueError('SPLINE has no control points and no fit points.')
+
+    def flattening(self, distance: float) -> 'array.array':
+        """
+        Returns the spline approximated by line segments in :ref:`WCS` as flat ``array('d')`` of ``x, y, z``
+        values, the max. distance of the line segments to the spline is `distance`, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the spline
+
+        .. versionadded:: 0.11
+
+        """
+        return self.construction_tool().flattening(distance)
+
     def set_open_uniform(self, control_points: Sequence['Vertex'], degree: int = 3) -> None:
         """
         Open B-spline with uniform knot vector, start and end at your first and last control points.
@@ -9,6 +9,7 @@ from ezdxf.lldxf.const import DXFKeyError, XDATA_MARKER, DXFValueError
 from ezdxf.lldxf.tags import xdata_list, remove_named_list_from_xdata, get_named_list_from_xdata, NotFoundException
 from ezdxf import options
 from ezdxf.lldxf.repair import filter_invalid_xdata_group_codes
+from ezdxf.lldxf.packedtags import ModificationTracker
 import logging
 logger = logging.getLogger('ezdxf')
 
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 __all__ = ['XData', 'EmbeddedObjects']
 
 
-class XData:
+class XData(ModificationTracker):
     def __init__(self, xdata: List[Tags] = None):
         # no back links, no self.clone() required, use deepcopy
         self.data = OrderedDict()
@@ -43,6 +44,7 @@ class XData:
         data = Tags(dxftag(code, value) for code, value in tags)
         if data[0] != (XDATA_MARKER, appid):
             data.insert(0, dxftag(XDATA_MARKER, appid))
+        self._modified()
         self._add(data)
 
     def get(self, appid: str) -> Tags:
@@ -53,6 +55,7 @@ class XData:
 
     def discard(self, appid):
         if appid in self.data:
+            self._modified()
             del self.data[appid]
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
@@ -2,13 +2,16 @@
 # Created: 2019-02-14
 # Copyright (c) 2019, Manfred Moitzi
 # License: MIT License
-from typing import Optional, Iterable, Tuple, Union, TYPE_CHECKING
+from typing import Optional, Iterable, Tuple, Union, List, Dict, Any, Callable, TYPE_CHECKING
+from weakref import WeakSet
 from ezdxf.tools.handle import HandleGenerator
-from ezdxf.entities.dxfentity import DXFEntity
+from ezdxf.entities.dxfentity import DXFEntity, ATTRIBUTE_INDEXES
 from ezdxf.order import priority, zorder
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import TagWriter
+    from ezdxf.spatial import SpatialIndex
+    from ezdxf.compact import CompactEntityStore
 
 DATABASE_EXCLUDE = {'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS', 'ACDSRECORD', 'ACDSSCHEMA'}
 
@@ -126,6 +129,94 @@ class EntityDB:
         return new_entity
 
 
+class AttributeIndex:
+    """
+    Secondary index of an :class:`EntitySpace` for the DXF attribute `name`, maps attribute values to entities.
+    Entities which do not support the DXF attribute are not indexed.
+
+    The index is maintained by adding and removing entities and by setting or discarding the DXF attribute `name`
+    of indexed entities.
+
+    """
+
+    def __init__(self, name: str, entities: Iterable['DXFEntity'] = None):
+        self.name = name
+        # key is the attribute value, value is a dict of entities used as ordered set
+        self._values = {}  # type: Dict[Any, Dict[DXFEntity, None]]
+        self._entities = {}  # type: Dict[DXFEntity, Any]
+        self.rebuild(entities or [])
+        self._register()
+
+    def __setstate__(self, state: dict) -> None:
+        """ Pickle support, register unpickled index. """
+        self.__dict__.update(state)
+        self._register()
+
+    def _register(self) -> None:
+        ATTRIBUTE_INDEXES.setdefault(self.name, WeakSet()).add(self)
+
+    def unregister(self) -> None:
+        """ Stop updating the index by changes of the DXF attribute `name`. (internal API) """
+        indexes = ATTRIBUTE_INDEXES.get(self.name)
+        if indexes is not None:
+            indexes.discard(self)
+            if not indexes:  # setting a not indexed DXF attribute does not check for attribute indexes
+                del ATTRIBUTE_INDEXES[self.name]
+
+    def __len__(self) -> int:
+        """ Count of indexed entities. """
+        return len(self._entities)
+
+    def rebuild(self, entities: Iterable['DXFEntity']) -> None:
+        """ Rebuild the index from `entities`. """
+        self._values.clear()
+        self._entities.clear()
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity: 'DXFEntity') -> None:
+        """ Add `entity` to the index. """
+        try:
+            value = entity.get_dxf_attrib(self.name)
+        except (AttributeError, ValueError):  # attribute not supported
+            return
+        self._entities[entity] = value
+        self._values.setdefault(value, {})[entity] = None
+
+    def discard(self, entity: 'DXFEntity') -> None:
+        """ Remove `entity` from the index, does nothing if `entity` is not indexed. """
+        try:
+            value = self._entities.pop(entity)
+        except KeyError:
+            return
+        bucket = self._values[value]
+        del bucket[entity]
+        if not bucket:
+            del self._values[value]
+
+    def update(self, entity: 'DXFEntity') -> None:
+        """ Update index for modified `entity`. """
+        self.discard(entity)
+        self.add(entity)
+
+    def refresh(self, entity: 'DXFEntity') -> None:
+        """ Update index for modified `entity`, does nothing if `entity` is not indexed. (internal API) """
+        if entity in self._entities:
+            self.update(entity)
+
+    def select(self, match: Callable[[Any], bool]) -> Iterable['DXFEntity']:
+        """ Yields all entities with an attribute value for which `match` returns ``True``, the cost is proportional
+        to the count of distinct attribute values and the count of returned entities.
+        """
+        for value, bucket in self._values.items():
+            try:
+                if not match(value):
+                    continue
+            except TypeError:  # incompatible types
+                continue
+            yield from bucket
+
+
 class EntitySpace:
     """
     An :class:`EntitySpace` is a collection of :class:`~ezdxf.entities.dxfentity.DXFEntity` objects, that stores only
@@ -134,15 +225,48 @@ class EntitySpace:
     The :class:`~ezdxf.layouts.Modelspace`, any :class:`~ezdxf.layouts.Paperspace` layout and
     :class:`~ezdxf.layouts.BlockLayout` objects have an :class:`EntitySpace` container to store their entities.
 
+    Removed entities are replaced by a tombstone (``None``) and an entity to slot index provides membership test and
+    removal in constant time, the entity list is compacted, if more than half of the slots are tombstones or at the
+    next index based access.
+
+    The optional spatial index is created at the first request by :meth:`spatial_index` and is maintained by adding
+    and removing entities.
+
+    The DXF type index is created at the first request by :meth:`by_dxftypes` and is maintained by adding and removing
+    entities, it stores the entities of each DXF type in order of appearance.
+
+    Optional attribute indexes are created by :meth:`create_attribute_index` and are used by
+    :class:`~ezdxf.query.EntityQuery` to select candidates for attribute queries.
+
     """
 
     def __init__(self, entities=None):
         entities = entities or []
-        self.entities = list(e for e in entities if e.is_alive)
+        # the slot index requires unique entities, dict used as ordered set
+        self.entities = list(dict.fromkeys(e for e in entities if e.is_alive))  # type: List[Optional[DXFEntity]]
+        self._tombstones = 0
+        self._slots = {}  # type: Dict[DXFEntity, int]
+        # key is the DXF type, value is a dict of entities used as ordered set
+        self._dxftypes = None  # type: Optional[Dict[str, Dict[DXFEntity, None]]]
+        self._attribute_indexes = {}  # type: Dict[str, AttributeIndex]
+        # optional columnar storage of simple entities, exported after the regular entities
+        self.compact_store = None  # type: Optional[CompactEntityStore]
+        self._spatial_index = None  # type: Optional[SpatialIndex]
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self._slots = {entity: slot for slot, entity in enumerate(self.entities)}
+
+    def _compact(self) -> None:
+        """ Remove tombstones. """
+        if self._tombstones:
+            self.entities = [e for e in self.entities if e is not None]
+            self._tombstones = 0
+            self._rebuild_index()
 
     def __iter__(self) -> Iterable['DXFEntity']:
         """ Iterable of all entities. """
-        return (e for e in self.entities if e.is_alive)
+        return (e for e in self.entities if e is not None and e.is_alive)
 
     def __getitem__(self, index) -> 'DXFEntity':
         """ Get entity at index `item`
@@ -152,19 +276,101 @@ class EntitySpace:
         an index slice ``layout[:10]`` to get the first 10 or less entities as ``List[DXFEntity]``.
 
         """
+        self._compact()
         return self.entities[index]
 
     def __len__(self) -> int:
         """ Count of entities. """
-        return len(self.entities)
+        return len(self.entities) - self._tombstones
+
+    def __contains__(self, entity: 'DXFEntity') -> bool:
+        """ ``True`` if `entity` is present. """
+        return entity in self._slots and entity.is_alive
 
     def has_handle(self, handle: str) -> bool:
-        """ ``True`` if `handle` is present. """
-        return any(e.dxf.handle == handle for e in self)
+        """ ``True`` if `handle` is present. The entity is looked up in the entity database of the document, which
+        is always up to date, reassigning handles does not invalidate a separated handle index. Entities without
+        document are searched linearly.
+        """
+        for first in self:
+            break
+        else:  # empty entity space
+            return False
+        if first.doc is None:
+            return any(e.dxf.handle == handle for e in self)
+        entity = first.doc.entitydb.get(handle)
+        return entity is not None and entity.dxf.handle == handle and entity in self
+
+    def by_dxftypes(self, dxftypes: Iterable[str]) -> List['DXFEntity']:
+        """ Returns all entities of the given DXF types in order of appearance, the cost is proportional to the count
+        of returned entities and not to the count of all entities.
+        """
+        if self._dxftypes is None:
+            self._dxftypes = {}
+            for entity in self:
+                self._dxftypes.setdefault(entity.dxftype(), {})[entity] = None
+        entities = []
+        count = 0
+        for dxftype in set(dxftypes):
+            bucket = self._dxftypes.get(dxftype)
+            if bucket:
+                entities.extend(e for e in bucket if e.is_alive)
+                count += 1
+        if count > 1:  # restore order of appearance
+            entities.sort(key=self._slots.__getitem__)
+        return entities
+
+    def create_attribute_index(self, name: str) -> AttributeIndex:
+        """ Returns the :class:`AttributeIndex` for the DXF attribute `name`, creates a new index if not exist. """
+        index = self._attribute_indexes.get(name)
+        if index is None:
+            index = AttributeIndex(name, self)
+            self._attribute_indexes[name] = index
+        return index
+
+    def remove_attribute_index(self, name: str) -> None:
+        """ Remove the :class:`AttributeIndex` for the DXF attribute `name`, does nothing if not exist. """
+        index = self._attribute_indexes.pop(name, None)
+        if index is not None:
+            index.unregister()
+
+    def attribute_index(self, name: str) -> Optional[AttributeIndex]:
+        """ Returns the :class:`AttributeIndex` for the DXF attribute `name` or ``None`` if not exist. """
+        return self._attribute_indexes.get(name)
+
+    def by_attribute(self, name: str, match: Callable[[Any], bool]) -> List['DXFEntity']:
+        """ Returns all entities with a value of the DXF attribute `name` for which `match` returns ``True`` in order
+        of appearance, requires an existing :class:`AttributeIndex` for `name`.
+        """
+        entities = [e for e in self._attribute_indexes[name].select(match) if e.is_alive]
+        entities.sort(key=self._slots.__getitem__)
+        return entities
+
+    def spatial_index(self) -> 'SpatialIndex':
+        """ Returns the :class:`~ezdxf.spatial.SpatialIndex` of all entities, created at the first request. """
+        if self._spatial_index is None:
+            from ezdxf.spatial import SpatialIndex
+            self._spatial_index = SpatialIndex(self)
+        return self._spatial_index
+
+    def update_spatial_index(self, entities: Iterable['DXFEntity'], exclude: Iterable['DXFEntity'] = None) -> None:
+        """ Update an existing spatial index for modified `entities`, except the entities in `exclude`. """
+        if self._spatial_index is None:
+            return
+        exclude = set(exclude or [])
+        for entity in entities:
+            if entity not in exclude:
+                self._spatial_index.update(entity)
 
     def purge(self):
         """ Remove deleted entities. """
         self.entities = list(self)
+        self._tombstones = 0
+        self._dxftypes = None  # rebuild at next usage
+        for index in self._attribute_indexes.values():
+            index.rebuild(self)
+        self._spatial_index = None  # rebuild at next usage
+        self._rebuild_index()
 
     def reorder(self, order: int = 1) -> None:
         """ Reorder entities in place.
@@ -180,15 +386,28 @@ class EntitySpace:
         else:
             return  # do nothing
 
+        self._compact()
         self.entities.sort(key=lambda e: e.priority, reverse=reverse)
+        self._dxftypes = None  # rebuild at next usage
+        self._rebuild_index()
 
     def add(self, entity: 'DXFEntity') -> None:
-        """ Add `entity`. """
+        """ Add `entity`, does nothing if `entity` is already present. """
+        if entity in self._slots:
+            return
+        self._slots[entity] = len(self.entities)
         self.entities.append(entity)
+        if self._dxftypes is not None:
+            self._dxftypes.setdefault(entity.dxftype(), {})[entity] = None
+        for index in self._attribute_indexes.values():
+            index.add(entity)
+        if self._spatial_index is not None:
+            self._spatial_index.add(entity)
 
     def extend(self, entities: Iterable['DXFEntity']) -> None:
         """ Add multiple `entities`."""
-        self.entities.extend(entities)
+        for entity in entities:
+            self.add(entity)
 
     def export_dxf(self, tagwriter: 'TagWriter', order=0) -> None:
         """
@@ -222,11 +441,33 @@ class EntitySpace:
             if seqend:
                 entity.export_seqend(tagwriter)
 
+        if self.compact_store is not None:
+            self.compact_store.export_dxf(tagwriter)
+
     def remove(self, entity: 'DXFEntity') -> None:
-        """ Remove `entity`. """
-        self.entities.remove(entity)
+        """ Remove `entity`, raises :class:`ValueError` if `entity` is not present. """
+        try:
+            slot = self._slots.pop(entity)
+        except KeyError:
+            raise ValueError('entity not in entity space')
+        self.entities[slot] = None
+        self._tombstones += 1
+        if self._dxftypes is not None:
+            self._dxftypes.get(entity.dxftype(), {}).pop(entity, None)
+        for index in self._attribute_indexes.values():
+            index.discard(entity)
+        if self._spatial_index is not None:
+            self._spatial_index.discard(entity)
+        if self._tombstones > len(self.entities) // 2:
+            self._compact()
 
     def clear(self) -> None:
         """ Remove all entities. """
         # do not delete database objects - entity space just manage handles
         self.entities = list()
+        self._tombstones = 0
+        self._dxftypes = None
+        for index in self._attribute_indexes.values():
+            index.rebuild([])
+        self._spatial_index = None
+        self._rebuild_index()
@@ -0,0 +1,348 @@
+# Purpose: virtual entities of block references
+# Created: 2019-12-15
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Optional, Dict, List, Tuple
+import math
+from ezdxf.math import Vector, OCS, Matrix44
+from ezdxf.math.flatten import vertices as flat_vertices, polyline as flatten_polyline, arc as flatten_arc
+from ezdxf.math.flatten import ellipse as flatten_ellipse
+from ezdxf.lldxf.const import DXFTypeError, DXFValueError
+from ezdxf.transform import transform, ocs_to_wcs_matrix
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Insert, BlockLayout
+
+__all__ = ['virtual_entities', 'flatten', 'insert_matrices', 'Cache']
+
+# (entity, transformation matrix into block coordinates or None, inherited DXF attributes)
+FlatItem = Tuple['DXFGraphic', Optional[Matrix44], Dict[str, object]]
+
+# DXF attributes which are inherited from the block reference: attribute name, BYBLOCK value
+INHERITED_ATTRIBS = (('layer', '0'), ('color', 0), ('linetype', 'BYBLOCK'), ('lineweight', -2))
+ATTRIB_DEFAULTS = {'layer': '0', 'color': 256, 'linetype': 'BYLAYER', 'lineweight': -1}
+
+# DXF attributes copied from CIRCLE and ARC entities to the replacing ELLIPSE entity and from 2D polylines to the
+# replacing 3D POLYLINE entity
+GRAPHIC_ATTRIBS = ('layer', 'color', 'linetype', 'lineweight', 'ltscale', 'invisible', 'true_color', 'transparency')
+
+# max. distance of the line segments to the arcs of flattened LWPOLYLINE, POLYLINE and HATCH entities in block
+# coordinates, see virtual_copy()
+FLATTENING_DISTANCE = 0.01
+
+
+class Cache:
+    """
+    Cache for the content of block definitions, the nested content of a block definition is collected only once and
+    reused for all INSERT entities referencing this block definition. The content is stored as source entities with
+    the transformation matrix into block coordinates, which is the result of the nested block references. The cache
+    does not track changes of block definitions, create a new cache or call :meth:`invalidate` after modifying block
+    definitions.
+
+    Attributes:
+        hits: count of reused block definitions
+        misses: count of collected block definitions
+
+    """
+
+    def __init__(self):
+        # key is the handle of the BLOCK_RECORD, value is the flattened block content in block coordinates
+        self._blocks = {}  # type: Dict[str, List[FlatItem]]
+        self._in_progress = set()
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, block: 'BlockLayout' = None) -> None:
+        """ Remove cached content of `block` or all cached content if `block` is ``None``. """
+        if block is None:
+            self._blocks.clear()
+        else:
+            self._blocks.pop(block.block_record_handle, None)
+
+    def block_content(self, block: 'BlockLayout') -> List[FlatItem]:
+        """ Returns the flattened content of the block definition `block` as list of ``(entity, matrix, attribs)``
+        tuples. `matrix` is the transformation matrix from the coordinate system of `entity` into block coordinates or
+        ``None`` for entities of `block` itself, `attribs` are the DXF attributes inherited from nested block
+        references. Nested INSERT entities are resolved, ATTDEF entities are ignored. (internal API)
+        """
+        key = block.block_record_handle
+        try:
+            content = self._blocks[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return content
+        if key in self._in_progress:  # circular block reference
+            return []
+        self.misses += 1
+        self._in_progress.add(key)
+        try:
+            content = self._collect(block)
+        finally:
+            self._in_progress.discard(key)
+        self._blocks[key] = content
+        return content
+
+    def _collect(self, block: 'BlockLayout') -> List[FlatItem]:
+        content = []
+        for entity in block:
+            dxftype = entity.dxftype()
+            if dxftype == 'ATTDEF':
+                continue
+            if dxftype != 'INSERT':
+                content.append((entity, None, dict()))
+                continue
+            for attrib in entity.attribs:
+                content.append((attrib, None, dict()))
+            nested = get_block(entity)
+            if nested is None:
+                continue
+            nested_content = self.block_content(nested)
+            for m in insert_matrices(entity, nested):
+                for sub_entity, sub_m, attribs in nested_content:
+                    content.append((
+                        sub_entity,
+                        m if sub_m is None else sub_m * m,
+                        inherited_attribs(sub_entity, attribs, entity),
+                    ))
+        return content
+
+
+def get_block(insert: 'Insert') -> Optional['BlockLayout']:
+    doc = insert.doc
+    if doc is None:
+        return None
+    return doc.blocks.get(insert.dxf.name)
+
+
+def insert_matrices(insert: 'Insert', block: 'BlockLayout' = None) -> List[Matrix44]:
+    """
+    Returns the transformation matrices from block coordinates to :ref:`WCS` for all grid positions of an INSERT
+    entity, the base point of the block definition is included. Returns one matrix for INSERT and
+    ``column_count * row_count`` matrices for MINSERT entities.
+
+    Args:
+        insert: INSERT entity
+        block: block definition of `insert`, the block definition is looked up in the document of `insert` if
+            ``None``
+
+    """
+    dxf = insert.dxf
+    block = block or get_block(insert)
+    base_point = Vector(block.block.dxf.base_point) if block is not None else Vector()
+    scale = Matrix44.chain(
+        Matrix44.translate(-base_point.x, -base_point.y, -base_point.z),
+        Matrix44.scale(dxf.xscale, dxf.yscale, dxf.zscale),
+    )
+    placement = Matrix44.chain(
+        Matrix44.z_rotate(math.radians(dxf.rotation)),
+        Matrix44.translate(*Vector(dxf.insert).xyz),
+        ocs_to_wcs_matrix(OCS(dxf.extrusion)),
+    )
+    column_count = dxf.get('column_count', 1)
+    row_count = dxf.get('row_count', 1)
+    if column_count == 1 and row_count == 1:
+        return [scale * placement]
+    # grid spacing is not scaled but rotated
+    column_spacing = dxf.get('column_spacing', 0.)
+    row_spacing = dxf.get('row_spacing', 0.)
+    return [
+        Matrix44.chain(scale, Matrix44.translate(col * column_spacing, row * row_spacing, 0.), placement)
+        for row in range(row_count) for col in range(column_count)
+    ]
+
+
+def inherited_attribs(entity: 'DXFGraphic', attribs: Dict[str, object], insert: 'DXFGraphic') -> Dict[str, object]:
+    """ Returns the DXF attributes of `entity` inherited from the block reference `insert`, `attribs` are the DXF
+    attributes already inherited from nested block references.
+    """
+    inherited = dict(attribs)
+    dxf = entity.dxf
+    for name, by_block in INHERITED_ATTRIBS:
+        value = inherited[name] if name in inherited else dxf.get(name, ATTRIB_DEFAULTS[name])
+        if value == by_block or (name == 'linetype' and value.upper() == by_block):
+            inherited[name] = insert.dxf.get(name, ATTRIB_DEFAULTS[name])
+    return inherited
+
+
+def circle_to_ellipse(entity: 'DXFGraphic') -> 'DXFGraphic':
+    """ Returns a virtual ELLIPSE entity for a CIRCLE or an ARC entity, ELLIPSE entities support non uniform
+    scaling.
+    """
+    from ezdxf.entities.ellipse import Ellipse
+    dxf = entity.dxf
+    ocs = OCS(dxf.extrusion)
+    attribs = {name: dxf.get(name) for name in GRAPHIC_ATTRIBS if dxf.hasattr(name)}
+    attribs['center'] = Vector(ocs.to_wcs(dxf.center))
+    attribs['major_axis'] = Vector(ocs.to_wcs((dxf.radius, 0, 0)))
+    attribs['ratio'] = 1.
+    attribs['extrusion'] = ocs.uz
+    if entity.dxftype() == 'ARC':
+        attribs['start_param'] = math.radians(dxf.start_angle)
+        attribs['end_param'] = math.radians(dxf.end_angle)
+    return Ellipse.new(dxfattribs=attribs, doc=entity.doc)
+
+
+def polyline_to_3d_polyline(entity: 'DXFGraphic', distance: float) -> 'DXFGraphic':
+    """ Returns a virtual 3D POLYLINE entity in :ref:`WCS` for a LWPOLYLINE or a 2D POLYLINE entity, bulge segments
+    are flattened, the max. distance of the line segments to the arcs is `distance`. 3D polylines support non
+    uniform scaling, but have no width.
+    """
+    from ezdxf.entities.polyline import Polyline, DXFVertex
+    from ezdxf.entities.dxfgfx import SeqEnd
+    dxf = entity.dxf
+    doc = entity.doc
+    closed = entity.closed if entity.dxftype() == 'LWPOLYLINE' else entity.is_closed
+    vertices = list(flat_vertices(entity.flattening(distance)))
+    if closed:  # remove appended first vertex
+        vertices.pop()
+    attribs = {name: dxf.get(name) for name in GRAPHIC_ATTRIBS if dxf.hasattr(name)}
+    attribs['flags'] = Polyline.POLYLINE_3D | (Polyline.CLOSED if closed else 0)
+    polyline = Polyline.new(dxfattribs=attribs, doc=doc)
+    layer = polyline.dxf.layer
+    polyline.vertices = [
+        DXFVertex.new(dxfattribs={'layer': layer, 'location': vertex, 'flags': DXFVertex.POLYLINE_3D_VERTEX}, doc=doc)
+        for vertex in vertices
+    ]
+    polyline.seqend = SeqEnd.new(dxfattribs={'layer': layer}, doc=doc)
+    return polyline
+
+
+def flatten_hatch_curves(entity: 'DXFGraphic', distance: float) -> 'DXFGraphic':
+    """ Replaces bulge segments of polyline paths and arc and ellipse edges of edge paths of the HATCH `entity`
+    inplace by line segments, the max. distance of the line segments to the curves is `distance`. Line segments
+    support non uniform scaling, returns `entity`.
+    """
+    from ezdxf.entities.hatch import LineEdge
+    for path in entity.paths.paths:
+        if path.PATH_TYPE == 'PolylinePath':
+            if any(bulge for x, y, bulge in path.vertices):
+                vertices = list(flat_vertices(flatten_polyline(path.vertices, distance, closed=path.is_closed)))
+                if path.is_closed:  # remove appended first vertex
+                    vertices.pop()
+                path.set_vertices([(v.x, v.y) for v in vertices], is_closed=path.is_closed)
+            continue
+        edges = []
+        for edge in path.edges:
+            if edge.EDGE_TYPE not in ('ArcEdge', 'EllipseEdge'):
+                edges.append(edge)
+                continue
+            vertices = _flatten_curved_edge(edge, distance)
+            for start, end in zip(vertices, vertices[1:]):
+                line = LineEdge()
+                line.start = (start.x, start.y)
+                line.end = (end.x, end.y)
+                edges.append(line)
+        path.edges = edges
+    return entity
+
+
+def _flatten_curved_edge(edge, distance: float) -> List[Vector]:
+    # returns the vertices of an arc or an ellipse edge in edge direction,
+    # angles of clockwise oriented edges are mirrored about the x-axis
+    ccw = bool(edge.is_counter_clockwise)
+    start, end = (edge.start_angle, edge.end_angle) if ccw else (-edge.end_angle, -edge.start_angle)
+    cx, cy, *_ = edge.center
+    if edge.EDGE_TYPE == 'ArcEdge':
+        vertices = flatten_arc((cx, cy, 0.), edge.radius, start, end, distance)
+    else:
+        mx, my, *_ = edge.major_axis
+        vertices = flatten_ellipse((cx, cy, 0.), (mx, my, 0.), edge.ratio, math.radians(start), math.radians(end),
+                                   (0., 0., 1.), distance)
+    vertices = list(flat_vertices(vertices))
+    if not ccw:
+        vertices.reverse()
+    return vertices
+
+
+def virtual_copy(entity: 'DXFGraphic', m: Matrix44, attribs: Dict[str, object]) -> Optional['DXFGraphic']:
+    """ Returns a transformed virtual copy of `entity` or ``None`` if `entity` can not be transformed by `m`.
+
+    Curved entities which do not support non uniform scaling are replaced: CIRCLE and ARC by ELLIPSE, LWPOLYLINE
+    and 2D POLYLINE with bulges by a flattened 3D POLYLINE and the arc and ellipse edges and bulges of HATCH
+    boundary paths are flattened.
+    (internal API)
+    """
+    try:
+        copy = entity.copy()
+    except DXFTypeError:  # not copyable entities like unknown DXF types
+        return None
+    for name, value in attribs.items():
+        copy.dxf.set(name, value)
+    try:
+        return transform(copy, m)
+    except DXFValueError:  # non uniform scaling of curved entities
+        dxftype = copy.dxftype()
+        if dxftype in ('CIRCLE', 'ARC'):
+            replacement = circle_to_ellipse(copy)
+        elif dxftype in ('LWPOLYLINE', 'POLYLINE'):
+            replacement = polyline_to_3d_polyline(copy, FLATTENING_DISTANCE)
+        elif dxftype == 'HATCH':
+            replacement = flatten_hatch_curves(copy, FLATTENING_DISTANCE)
+        else:
+            return None
+    except DXFTypeError:
+        return None
+    try:
+        return transform(replacement, m)
+    except DXFValueError:  # transformation collapses the entity
+        return None
+
+
+def virtual_entities(insert: 'Insert', cache: Cache = None) -> Iterable['DXFGraphic']:
+    """
+    Yields the content of the block reference `insert` as virtual DXF entities in :ref:`WCS`, nested block
+    references are resolved, MINSERT grids are supported. The virtual entities are copies of the block content,
+    which are not stored in the entity database and do not reside in any layout.
+
+    Layer ``'0'``, BYBLOCK color, linetype and lineweight are replaced by the properties of the block reference,
+    ATTDEF entities are ignored, ATTRIB entities of block references are yielded as virtual copies.
+
+    Non uniform scaling of circular arcs is not supported by :mod:`ezdxf.transform`, therefore CIRCLE and ARC
+    entities are replaced by ELLIPSE entities, LWPOLYLINE and 2D POLYLINE entities with bulges are replaced by
+    flattened 3D POLYLINE entities without width and the arc and ellipse edges and bulges of HATCH boundary paths are
+    replaced by line segments, the max. distance of the line segments to the curves is :data:`FLATTENING_DISTANCE`
+    in block coordinates. Entities which can not be transformed, like DIMENSION or ACIS based entities, are skipped.
+
+    Args:
+        insert: INSERT entity
+        cache: :class:`Cache` for block definition content, reuse the cache for multiple block references
+
+    """
+    for attrib in insert.attribs:
+        yield attrib.copy()
+    block = get_block(insert)
+    if block is None:
+        return
+    if cache is None:
+        cache = Cache()
+    content = cache.block_content(block)
+    for m in insert_matrices(insert, block):
+        for entity, entity_m, attribs in content:
+            copy = virtual_copy(
+                entity,
+                m if entity_m is None else entity_m * m,
+                inherited_attribs(entity, attribs, insert),
+            )
+            if copy is not None:
+                yield copy
+
+
+def flatten(entities: Iterable['DXFGraphic'], cache: Cache = None) -> Iterable['DXFGraphic']:
+    """
+    Yields all `entities`, but INSERT entities are replaced by their virtual content, see :func:`virtual_entities`.
+    All other entities are yielded as they are and are not copied.
+
+    Args:
+        entities: iterable of DXF entities
+        cache: :class:`Cache` for block definition content, a temporary cache is used if ``None``
+
+    """
+    if cache is None:
+        cache = Cache()
+    for entity in entities:
+        if entity.dxftype() == 'INSERT':
+            yield from virtual_entities(entity, cache)
+        else:
+            yield entity
@@ -0,0 +1,590 @@
+# Purpose: bounding boxes of DXF entities
+# Created: 2019-12-01
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Optional, Callable, Dict, List, Tuple
+import math
+import re
+import itertools
+from ezdxf.math import Vector, OCS, Matrix44
+from ezdxf.math.bbox import BoundingBox
+from ezdxf.math.bulge import bulge_to_arc
+from ezdxf.math import flatten
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex, Drawing, BlockLayout
+
+__all__ = ['bbox', 'extents', 'extents_vertices', 'update_header_extents', 'Cache', 'EXTENTS_VERTICES',
+           'FAST_EXTENTS_VERTICES']
+
+# type of functions, which return WCS vertices, whose bounding box contains the entity
+VerticesFunc = Callable[['DXFGraphic', 'Cache'], Iterable['Vertex']]
+
+TWO_PI = math.pi * 2.
+
+# estimated average character width for TEXT and MTEXT as factor of the text height
+CHAR_WIDTH_FACTOR = 0.8
+# distance between two MTEXT base lines as factor of the char height for line spacing factor 1.0
+MTEXT_LINE_SPACING = 5. / 3.
+# max. distance of the flattened SPLINE to the curve as factor of the diagonal of the control point extents
+SPLINE_FLATTENING_FACTOR = 1e-3
+
+
+class Cache:
+    """
+    Cache for block definition extents, the extents of a block definition are calculated only once and reused for
+    all INSERT entities referencing this block definition. The cache does not track changes of block definitions,
+    create a new cache or call :meth:`invalidate` after modifying block definitions.
+
+    Attributes:
+        hits: count of reused block definition extents
+        misses: count of calculated block definition extents
+
+    """
+
+    def __init__(self):
+        # key is the handle of the BLOCK_RECORD and the fast mode, value is the block extents in block coordinates
+        self._blocks = {}  # type: Dict[Tuple[str, bool], Optional[BoundingBox]]
+        self._in_progress = set()
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, block: 'BlockLayout' = None) -> None:
+        """ Remove cached extents of `block` or all cached extents if `block` is ``None``. """
+        if block is None:
+            self._blocks.clear()
+        else:
+            handle = block.block_record_handle
+            self._blocks.pop((handle, False), None)
+            self._blocks.pop((handle, True), None)
+
+    def block_extents(self, block: 'BlockLayout', fast: bool = False) -> Optional[BoundingBox]:
+        """ Returns the extents of the block definition `block` in block coordinates or ``None`` for an empty block.
+        ATTDEF entities are ignored.
+        """
+        key = block.block_record_handle, fast
+        try:
+            box = self._blocks[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return box
+        if key in self._in_progress:  # circular block reference
+            return None
+        self.misses += 1
+        self._in_progress.add(key)
+        try:
+            box = extents((e for e in block if e.dxftype() != 'ATTDEF'), cache=self, fast=fast)
+        finally:
+            self._in_progress.discard(key)
+        self._blocks[key] = box
+        return box
+
+
+def bbox(entity: 'DXFGraphic', cache: Cache = None, fast: bool = False) -> Optional[BoundingBox]:
+    """
+    Returns the :class:`~ezdxf.math.bbox.BoundingBox` of `entity` in :ref:`WCS`, or ``None`` for unsupported
+    entities, infinite entities like XLINE or entities without geometry.
+
+    The fast mode uses the control points for SPLINE, the full circle for ARC, ELLIPSE and bulges and the insertion
+    point for TEXT and MTEXT. The bounding box of TEXT and MTEXT is always an estimation, because font metrics are
+    not available.
+
+    Args:
+        entity: DXF graphic entity
+        cache: :class:`Cache` for block definition extents, reuse the cache for multiple calls
+        fast: ``True`` for fast approximated bounding boxes
+
+    """
+    vertices = list(extents_vertices(entity, cache, fast))
+    if len(vertices):
+        return BoundingBox(vertices)
+    return None
+
+
+def extents(entities: Iterable['DXFGraphic'], cache: Cache = None, fast: bool = False) -> Optional[BoundingBox]:
+    """
+    Returns the :class:`~ezdxf.math.bbox.BoundingBox` of all `entities` in :ref:`WCS` or ``None`` if no entity has
+    a bounding box, see :func:`bbox`.
+
+    Args:
+        entities: iterable of DXF graphic entities
+        cache: :class:`Cache` for block definition extents, a temporary cache is used if ``None``
+        fast: ``True`` for fast approximated bounding boxes
+
+    """
+    if cache is None:
+        cache = Cache()
+    vertices = []
+    for entity in entities:
+        vertices.extend(extents_vertices(entity, cache, fast))
+    if not len(vertices):
+        return None
+    try:  # faster than BoundingBox(vertices) for many 3D vertices
+        xs, ys, zs = zip(*vertices)
+    except ValueError:  # 2D vertices
+        return BoundingBox(vertices)
+    return BoundingBox([(min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))])
+
+
+def extents_vertices(entity: 'DXFGraphic', cache: Cache = None, fast: bool = False) -> Iterable['Vertex']:
+    """ Yields :ref:`WCS` vertices of `entity`, the bounding box of these vertices contains the entity. Yields nothing
+    for unsupported entities.
+    """
+    dxftype = entity.dxftype()
+    func = None
+    if fast:
+        func = FAST_EXTENTS_VERTICES.get(dxftype)
+    if func is None:
+        func = EXTENTS_VERTICES.get(dxftype)
+    if func is None:
+        return ()
+    return func(entity, cache if cache is not None else Cache())
+
+
+def update_header_extents(doc: 'Drawing', cache: Cache = None) -> None:
+    """ Set header variables $EXTMIN and $EXTMAX to the extents of the modelspace including compact entities, does
+    nothing for an empty modelspace or if the modelspace contains not loaded entities of a lazy loaded document.
+    """
+    msp = doc.modelspace()
+    if any(entity.is_lazy for entity in msp):
+        return
+    entities = msp  # type: Iterable[DXFGraphic]
+    if msp.entity_space.compact_store is not None:
+        entities = itertools.chain(msp, msp.entity_space.compact_store)
+    box = extents(entities, cache=cache)
+    if box is not None:
+        doc.header['$EXTMIN'] = box.extmin
+        doc.header['$EXTMAX'] = box.extmax
+
+
+def ocs_to_wcs(entity: 'DXFGraphic', vertices: Iterable['Vertex']) -> Iterable['Vertex']:
+    extrusion = entity.dxf.get('extrusion', None)
+    if extrusion is None or Vector(extrusion).isclose(Vector(0, 0, 1)):
+        return vertices
+    return OCS(extrusion).points_to_wcs(vertices)
+
+
+def ocs_rect(x: float, y: float, dx: float, dy: float, z: float = 0.) -> Iterable['Vertex']:
+    return (x - dx, y - dy, z), (x + dx, y - dy, z), (x + dx, y + dy, z), (x - dx, y + dy, z)
+
+
+def in_ccw_range(angle: float, start: float, end: float) -> bool:
+    """ ``True`` if `angle` is in the counter clockwise range from `start` to `end`, all angles in radians. """
+    span = (end - start) % TWO_PI
+    if span == 0.:  # full circle
+        return True
+    return (angle - start) % TWO_PI <= span
+
+
+def arc_extrema(center: 'Vertex', major: 'Vertex', minor: 'Vertex', start: float = 0.,
+                end: float = TWO_PI) -> List[Vector]:
+    """
+    Returns the start point, the end point and all extreme points along the x-, y- and z-axis of the elliptic arc
+    ``center + major * cos(t) + minor * sin(t)`` for `t` in the counter clockwise range from `start` to `end`.
+    """
+    center = Vector(center)
+    major = Vector(major)
+    minor = Vector(minor)
+
+    def point(t: float) -> Vector:
+        return center + major * math.cos(t) + minor * math.sin(t)
+
+    vertices = [point(start), point(end)]
+    for a, b in zip(major.xyz, minor.xyz):
+        if a == 0. and b == 0.:  # no extension in this axis
+            continue
+        t = math.atan2(b, a)
+        for param in (t, t + math.pi):
+            if in_ccw_range(param, start, end):
+                vertices.append(point(param))
+    return vertices
+
+
+def bulge_extrema(vertices: Iterable[Tuple[float, float, float]], closed: bool = False,
+                  fast: bool = False) -> List[Tuple[float, float]]:
+    """ Returns 2D vertices, whose bounding box contains the polyline defined by ``(x, y, bulge)`` tuples. """
+    points = list(vertices)
+    if closed and len(points) > 1:
+        points.append(points[0])
+    result = []
+    for index, (x, y, bulge) in enumerate(points):
+        result.append((x, y))
+        if bulge and index + 1 < len(points):
+            start = (x, y)
+            end = points[index + 1][:2]
+            center, start_angle, end_angle, radius = bulge_to_arc(start, end, bulge)
+            if fast:
+                result.extend(v[:2] for v in ocs_rect(center[0], center[1], radius, radius))
+            else:
+                result.extend(v.vec2 for v in arc_extrema(
+                    (center[0], center[1], 0), (radius, 0, 0), (0, radius, 0), start_angle, end_angle))
+    return result
+
+
+def line_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return entity.dxf.start, entity.dxf.end
+
+
+def point_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return entity.dxf.location,
+
+
+def insert_point_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return entity.dxf.insert,
+
+
+def circle_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    x, y, z = entity.dxf.center
+    r = entity.dxf.radius
+    return ocs_to_wcs(entity, ocs_rect(x, y, r, r, z))
+
+
+def arc_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    ocs = OCS(dxf.extrusion)
+    r = dxf.radius
+    return arc_extrema(ocs.to_wcs(dxf.center), ocs.to_wcs((r, 0, 0)), ocs.to_wcs((0, r, 0)),
+                       math.radians(dxf.start_angle), math.radians(dxf.end_angle))
+
+
+def ellipse_axis(entity: 'DXFGraphic') -> Tuple[Vector, Vector, Vector]:
+    dxf = entity.dxf
+    major_axis = Vector(dxf.major_axis)
+    minor_axis = Vector(dxf.extrusion).cross(major_axis).normalize(major_axis.magnitude * dxf.ratio)
+    return Vector(dxf.center), major_axis, minor_axis
+
+
+def fast_ellipse_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    center, major_axis, minor_axis = ellipse_axis(entity)
+    return (center + major_axis + minor_axis, center + major_axis - minor_axis,
+            center - major_axis + minor_axis, center - major_axis - minor_axis)
+
+
+def ellipse_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    center, major_axis, minor_axis = ellipse_axis(entity)
+    return arc_extrema(center, major_axis, minor_axis, entity.dxf.start_param, entity.dxf.end_param)
+
+
+def lwpolyline_vertices(entity: 'DXFGraphic', cache: Cache, fast: bool = False) -> Iterable['Vertex']:
+    elevation = entity.dxf.elevation
+    vertices = bulge_extrema(entity.get_points('xyb'), entity.closed, fast)
+    return ocs_to_wcs(entity, [(x, y, elevation) for x, y in vertices])
+
+
+def fast_lwpolyline_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return lwpolyline_vertices(entity, cache, fast=True)
+
+
+def polyline_vertices(entity: 'DXFGraphic', cache: Cache, fast: bool = False) -> Iterable['Vertex']:
+    if entity.is_2d_polyline:
+        elevation = Vector(entity.dxf.get('elevation', (0, 0, 0))).z
+        points = ((v.dxf.location[0], v.dxf.location[1], v.dxf.bulge) for v in entity.vertices)
+        vertices = bulge_extrema(points, entity.is_closed, fast)
+        return ocs_to_wcs(entity, [(x, y, elevation) for x, y in vertices])
+    # face records of polyface meshes have no location
+    return (vertex.dxf.location for vertex in entity.vertices if not vertex.is_face_record)
+
+
+def fast_polyline_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return polyline_vertices(entity, cache, fast=True)
+
+
+def solid_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    vertices = [dxf.vtx0, dxf.vtx1, dxf.vtx2, dxf.get('vtx3', dxf.vtx2)]
+    if entity.dxftype() == '3DFACE':
+        return vertices
+    return ocs_to_wcs(entity, vertices)  # SOLID and TRACE
+
+
+def fast_text_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    vertices = [dxf.insert]
+    if dxf.hasattr('align_point'):
+        vertices.append(dxf.align_point)
+    return ocs_to_wcs(entity, vertices)
+
+
+SPECIAL_CHARS = re.compile(r'%%[cdpouCDPOU]|%%\d{3}')
+
+
+def text_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    height = dxf.height
+    length = len(SPECIAL_CHARS.sub('x', dxf.text))
+    halign = dxf.get('halign', 0)
+    valign = dxf.get('valign', 0)
+    insert = Vector(dxf.insert)
+    if halign in (3, 5) and dxf.hasattr('align_point'):  # ALIGNED and FIT
+        align_point = Vector(dxf.align_point)
+        baseline = align_point - insert
+        width = baseline.magnitude
+        angle = baseline.angle if width > 0. else math.radians(dxf.rotation)
+        location = insert
+        x0, y0 = 0., 0.
+    else:
+        width = length * height * dxf.width * CHAR_WIDTH_FACTOR
+        angle = math.radians(dxf.rotation)
+        location = Vector(dxf.align_point) if (halign or valign) and dxf.hasattr('align_point') else insert
+        x0 = {0: 0., 1: -width / 2., 2: -width, 4: -width / 2.}.get(halign, 0.)
+        y0 = {2: -height / 2., 3: -height}.get(valign, 0.)
+        if halign == 4:  # MIDDLE
+            y0 = -height / 2.
+    xs = (x0, x0 + width)
+    ys = (y0, y0 + height)
+    flags = dxf.get('text_generation_flag', 0)
+    if flags & 2:  # backward
+        xs = (-xs[0], -xs[1])
+    if flags & 4:  # upside down
+        ys = (-ys[0], -ys[1])
+    ux = Vector.from_angle(angle)
+    uy = ux.orthogonal()
+    vertices = [location + ux * x + uy * y for x in xs for y in ys]
+    return ocs_to_wcs(entity, vertices)
+
+
+MTEXT_CODES = re.compile(r'\\[ACcFfHQTWp][^;\\]*;|\\[LlOoKk]|[{}]')
+
+
+def mtext_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    height = dxf.char_height
+    lines = MTEXT_CODES.sub('', entity.text).replace('\n', '\\P').split('\\P')
+    width = dxf.get('width', 0.)
+    if not width:
+        width = max(len(line) for line in lines) * height * CHAR_WIDTH_FACTOR
+    total_height = height + (len(lines) - 1) * height * MTEXT_LINE_SPACING * dxf.get('line_spacing_factor', 1.)
+    attachment_point = dxf.attachment_point
+    column = (attachment_point - 1) % 3  # left, center, right
+    row = (attachment_point - 1) // 3  # top, middle, bottom
+    x0 = -width * column / 2.
+    y0 = -total_height + total_height * row / 2.
+    extrusion = Vector(dxf.extrusion)
+    if dxf.hasattr('text_direction'):
+        ux = Vector(dxf.text_direction).normalize()
+    else:
+        ux = OCS(extrusion).to_wcs(Vector.from_deg_angle(dxf.get('rotation', 0.)))
+    uy = extrusion.cross(ux).normalize()
+    insert = Vector(dxf.insert)
+    return [insert + ux * x + uy * y for x in (x0, x0 + width) for y in (y0, y0 + total_height)]
+
+
+def spline_control_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    # the spline curve is inside the convex hull of the control points, the control points of a SPLINE defined only
+    # by fit points are calculated by the construction tool
+    if len(entity.control_points):
+        return entity.control_points
+    try:
+        return entity.construction_tool().control_points
+    except (ValueError, ArithmeticError):
+        return entity.fit_points
+
+
+def spline_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    # the extents of the flattened curve expanded by the max. distance of the line segments to the curve contain
+    # the curve, the extents of the control points also contain the curve, the result is the intersection of both
+    try:
+        spline = entity.construction_tool()
+    except (ValueError, ArithmeticError):
+        return spline_control_vertices(entity, cache)
+    control_box = BoundingBox(spline.control_points)
+    distance = (control_box.extmax - control_box.extmin).magnitude * SPLINE_FLATTENING_FACTOR
+    if distance == 0.:  # all control points at the same location
+        return control_box.extmin,
+    try:
+        box = BoundingBox(flatten.vertices(spline.flattening(distance)))
+    except (ValueError, ArithmeticError):
+        return spline.control_points
+    pad = Vector(distance, distance, distance)
+    return (
+        Vector(max(a, b) for a, b in zip(box.extmin - pad, control_box.extmin)),
+        Vector(min(a, b) for a, b in zip(box.extmax + pad, control_box.extmax)),
+    )
+
+
+def hatch_vertices(entity: 'DXFGraphic', cache: Cache, fast: bool = False) -> Iterable['Vertex']:
+    elevation = Vector(entity.dxf.elevation).z
+    vertices = []
+    for path in entity.paths:
+        if path.PATH_TYPE == 'PolylinePath':
+            vertices.extend(bulge_extrema(((x, y, b) for x, y, b in path.vertices), path.is_closed, fast))
+            continue
+        for edge in path.edges:
+            edge_type = edge.EDGE_TYPE
+            if edge_type == 'LineEdge':
+                vertices.extend((edge.start[:2], edge.end[:2]))
+            elif edge_type == 'ArcEdge':
+                cx, cy = edge.center[:2]
+                r = edge.radius
+                if edge.is_counter_clockwise and not fast:
+                    vertices.extend(v.vec2 for v in arc_extrema(
+                        (cx, cy, 0), (r, 0, 0), (0, r, 0), math.radians(edge.start_angle),
+                        math.radians(edge.end_angle)))
+                else:
+                    vertices.extend(v[:2] for v in ocs_rect(cx, cy, r, r))
+            elif edge_type == 'EllipseEdge':
+                cx, cy = edge.center[:2]
+                major_axis = Vector(edge.major_axis[0], edge.major_axis[1], 0)
+                minor_axis = major_axis.orthogonal() * edge.ratio
+                # extents of the full ellipse
+                vertices.extend(v.vec2 for v in arc_extrema((cx, cy, 0), major_axis, minor_axis))
+            elif edge_type == 'SplineEdge':
+                points = edge.control_points or edge.fit_points
+                vertices.extend(p[:2] for p in points)
+    return ocs_to_wcs(entity, [(x, y, elevation) for x, y in vertices])
+
+
+def fast_hatch_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return hatch_vertices(entity, cache, fast=True)
+
+
+def mesh_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return entity.vertices
+
+
+def leader_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return entity.vertices
+
+
+def image_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    insert = Vector(dxf.insert)
+    size = dxf.image_size
+    width, height = size[0], size[1]
+    u = Vector(dxf.u_pixel) * width
+    v = Vector(dxf.v_pixel) * height
+    return insert, insert + u, insert + v, insert + u + v
+
+
+def viewport_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    x, y, z = Vector(dxf.center)
+    return ocs_rect(x, y, dxf.width / 2., dxf.height / 2., z)
+
+
+def box_corners(box: BoundingBox) -> List[Vector]:
+    (x0, y0, z0), (x1, y1, z1) = box.extmin, box.extmax
+    return [Vector(x, y, z) for x in (x0, x1) for y in (y0, y1) for z in (z0, z1)]
+
+
+def get_block(entity: 'DXFGraphic', name: str) -> Optional['BlockLayout']:
+    doc = entity.doc
+    if doc is None or not name:
+        return None
+    return doc.blocks.get(name)
+
+
+def insert_matrix(entity: 'DXFGraphic') -> Matrix44:
+    """ Returns the transformation matrix from block coordinates to WCS for an INSERT entity, without base point
+    and MINSERT grid.
+    """
+    dxf = entity.dxf
+    ocs = OCS(dxf.extrusion)
+    ux, uy, uz = ocs.ux, ocs.uy, ocs.uz
+    return Matrix44.chain(
+        Matrix44.scale(dxf.xscale, dxf.yscale, dxf.zscale),
+        Matrix44.z_rotate(math.radians(dxf.rotation)),
+        Matrix44.translate(*Vector(dxf.insert).xyz),
+        Matrix44((
+            ux[0], ux[1], ux[2], 0,
+            uy[0], uy[1], uy[2], 0,
+            uz[0], uz[1], uz[2], 0,
+            0, 0, 0, 1,
+        )),
+    )
+
+
+def insert_vertices(entity: 'DXFGraphic', cache: Cache, fast: bool = False) -> Iterable['Vertex']:
+    vertices = []
+    for attrib in entity.attribs:
+        vertices.extend(extents_vertices(attrib, cache, fast))
+    block = get_block(entity, entity.dxf.name)
+    box = None if block is None else cache.block_extents(block, fast)
+    if box is None:  # unknown or empty block definition
+        vertices.extend(ocs_to_wcs(entity, [entity.dxf.insert]))
+        return vertices
+
+    dxf = entity.dxf
+    base_point = Vector(block.block.dxf.base_point)
+    # block extents relative to the base point
+    box = BoundingBox([box.extmin - base_point, box.extmax - base_point])
+    corners = insert_matrix(entity).transform_vectors(box_corners(box))
+    vertices.extend(corners)
+    if dxf.get('column_count', 1) > 1 or dxf.get('row_count', 1) > 1:  # MINSERT
+        # grid spacing is not scaled, but rotated and in OCS, the extents of all block references are the extents of
+        # the corners moved to the corners of the grid, this works also for scaling factors of 0
+        ocs = OCS(dxf.extrusion)
+        angle = dxf.rotation
+        column = ocs.to_wcs(Vector((dxf.column_count - 1) * dxf.column_spacing, 0, 0).rotate_deg(angle))
+        row = ocs.to_wcs(Vector(0, (dxf.row_count - 1) * dxf.row_spacing, 0).rotate_deg(angle))
+        for offset in (column, row, column + row):
+            vertices.extend(corner + offset for corner in corners)
+    return vertices
+
+
+def fast_insert_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return insert_vertices(entity, cache, fast=True)
+
+
+def dimension_vertices(entity: 'DXFGraphic', cache: Cache, fast: bool = False) -> Iterable['Vertex']:
+    dxf = entity.dxf
+    block = get_block(entity, dxf.get('geometry'))
+    if block is not None:  # rendered dimension graphics in WCS
+        box = cache.block_extents(block, fast)
+        if box is not None:
+            return box.extmin, box.extmax
+    return [dxf.get(name) for name in ('defpoint', 'text_midpoint', 'defpoint2', 'defpoint3', 'defpoint4', 'defpoint5')
+            if dxf.hasattr(name)]
+
+
+def fast_dimension_vertices(entity: 'DXFGraphic', cache: Cache) -> Iterable['Vertex']:
+    return dimension_vertices(entity, cache, fast=True)
+
+
+EXTENTS_VERTICES = {
+    'LINE': line_vertices,
+    'POINT': point_vertices,
+    'CIRCLE': circle_vertices,
+    'ARC': arc_vertices,
+    'ELLIPSE': ellipse_vertices,
+    'LWPOLYLINE': lwpolyline_vertices,
+    'POLYLINE': polyline_vertices,
+    'SOLID': solid_vertices,
+    'TRACE': solid_vertices,
+    '3DFACE': solid_vertices,
+    'TEXT': text_vertices,
+    'ATTRIB': text_vertices,
+    'ATTDEF': text_vertices,
+    'MTEXT': mtext_vertices,
+    'SHAPE': insert_point_vertices,
+    'INSERT': insert_vertices,
+    'SPLINE': spline_vertices,
+    'HATCH': hatch_vertices,
+    'MESH': mesh_vertices,
+    'LEADER': leader_vertices,
+    'IMAGE': image_vertices,
+    'WIPEOUT': image_vertices,
+    'PDFUNDERLAY': insert_point_vertices,
+    'DWFUNDERLAY': insert_point_vertices,
+    'DGNUNDERLAY': insert_point_vertices,
+    'VIEWPORT': viewport_vertices,
+    'DIMENSION': dimension_vertices,
+}  # type: Dict[str, VerticesFunc]
+
+# replacement functions for fast mode
+FAST_EXTENTS_VERTICES = {
+    'ARC': circle_vertices,
+    'ELLIPSE': fast_ellipse_vertices,
+    'LWPOLYLINE': fast_lwpolyline_vertices,
+    'POLYLINE': fast_polyline_vertices,
+    'TEXT': fast_text_vertices,
+    'ATTRIB': fast_text_vertices,
+    'ATTDEF': fast_text_vertices,
+    'MTEXT': insert_point_vertices,
+    'INSERT': fast_insert_vertices,
+    'SPLINE': spline_control_vertices,
+    'HATCH': fast_hatch_vertices,
+    'DIMENSION': fast_dimension_vertices,
+}  # type: Dict[str, VerticesFunc]
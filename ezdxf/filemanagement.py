@@ -3,13 +3,14 @@
 # Copyright (C) 2018-2019, Manfred Moitzi
 # License: MIT License
 # Local imports to avoid cyclic import
-from typing import TextIO, TYPE_CHECKING, Union, Sequence
+from typing import TextIO, TYPE_CHECKING, Union, Sequence, Set, Callable
 from ezdxf.tools.standards import setup_drawing
 from ezdxf.lldxf.const import DXF12, DXF2013
 from ezdxf.drawing import Drawing
+from ezdxf.options import options
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import DXFInfo
+    from ezdxf.eztypes import DXFInfo, Tags
 
 
 def new(dxfversion: str = DXF2013, setup: Union[str, bool, Sequence[str]] = None) -> 'Drawing':
@@ -59,7 +60,8 @@ def new(dxfversion: str = DXF2013, setup: Union[str, bool, Sequence[str]] = None
     return doc
 
 
-def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawing':
+def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None, sections: Set[str] = None,
+         entity_filter: Callable[['Tags'], bool] = None) -> 'Drawing':
     """
     Read DXF drawing from a text-stream. Open stream in text mode (``mode='rt'``) and the correct encoding has to be
     set at the open function, the stream requires at least a :meth:`readline` method. Since DXF version R2007 (AC1021)
@@ -73,6 +75,8 @@ def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawi
         stream: input text stream opened with correct encoding, requires only a :meth:`readline` method.
         legacy_mode: adds an extra trouble shooting import layer if ``True``
         filter_stack: interface to put filters between reading layers
+        sections: load only DXF sections in `sections`, see :func:`readfile`
+        entity_filter: load only accepted entities of the ENTITIES section, see :func:`readfile`
 
     Raises:
         DXFStructureError: for invalid DXF structure
@@ -80,16 +84,20 @@ def read(stream: TextIO, legacy_mode: bool = False, filter_stack=None) -> 'Drawi
     """
     from ezdxf.drawing import Drawing
 
-    return Drawing.read(stream, legacy_mode=legacy_mode, filter_stack=filter_stack)
+    return Drawing.read(stream, legacy_mode=legacy_mode, filter_stack=filter_stack, sections=sections,
+                        entity_filter=entity_filter)
 
 
-def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, filter_stack=None) -> 'Drawing':
+def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, filter_stack=None,
+             sections: Set[str] = None, entity_filter: Callable[['Tags'], bool] = None) -> 'Drawing':
     """
     Read DXF drawing specified by `filename` from file-system.
 
     This is the preferred method to open existing DXF files. Read the DXF drawing from the file-system with
-    auto-detection of encoding. Decoding errors will be ignored. Override encoding detection by setting argument
-    `encoding` to the estimated encoding. (use Python encoding names like in the :func:`open` function).
+    auto-detection of encoding. Decoding errors will be ignored. Binary DXF files are detected automatically,
+    arguments `legacy_mode` and `filter_stack` are ignored for binary DXF files. Override encoding detection by
+    setting argument `encoding` to the estimated encoding. (use Python encoding names like in the :func:`open`
+    function).
 
     If argument `legacy_mode` is ``True``, `ezdxf` tries to reorder the coordinates of the LINE entity in files from
     CAD applications which wrote the coordinates in the order: x1, x2, y1, y2. Additional fixes may be added later. The
@@ -99,11 +107,35 @@ def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, fil
 
         Try argument :code:`legacy_mode=True` if error ``'Missing required y coordinate near line: ...'`` occurs.
 
+    Load only the DXF sections required by setting argument `sections` to a set of section names like
+    :code:`{'TABLES', 'ENTITIES'}`, the content of all other sections is skipped without building DXF entities. The
+    HEADER section is always loaded, the TABLES section is also loaded if the BLOCKS, ENTITIES or OBJECTS section is
+    requested, because the layouts of these sections require the BLOCK_RECORD and LAYER tables. Missing required
+    structures are created like for new drawings, a drawing loaded without BLOCKS or OBJECTS section is not a complete
+    copy of the DXF file.
+
+    The `entity_filter` function is called for each entity of the ENTITIES section with the DXF tags of the entity as
+    :class:`~ezdxf.lldxf.tags.Tags` object and should return ``True`` for entities to load, all other entities are
+    skipped without building DXF entities. The filter function is not called for linked entities (VERTEX, ATTRIB and
+    SEQEND), they are loaded if the POLYLINE or INSERT entity is loaded::
+
+        def lines_on_layer_0(tags: Tags) -> bool:
+            return tags[0].value in ('LINE', 'LWPOLYLINE') and tags.get_first_value(8, '0') == '0'
+
+        doc = ezdxf.readfile('big.dxf', sections={'TABLES', 'ENTITIES'}, entity_filter=lines_on_layer_0)
+
+    Set :attr:`ezdxf.options.load_cache_dir` to a directory name to enable the persistent load cache, loaded documents
+    are stored as pickled snapshots and reused at the next :func:`readfile` call for an unchanged DXF file. The cache is
+    not used if arguments `filter_stack` or `entity_filter` are set. Loading a snapshot can execute arbitrary code, use
+    a private cache directory, which is only writable by the current user.
+
     Args:
         filename: DXF filename
         encoding: use ``None`` for auto detect (default), or set a specific encoding like ``'utf-8'``
         legacy_mode: adds an extra trouble shooting import layer if ``True``
         filter_stack: interface to put filters between reading layers
+        sections: set of DXF section names to load, ``None`` for all sections
+        entity_filter: filter function for entities of the ENTITIES section, ``None`` for all entities
 
     Raises:
         IOError: File `filename` is not a DXF file or does not exist.
@@ -111,27 +143,58 @@ def readfile(filename: str, encoding: str = None, legacy_mode: bool = False, fil
 
     """
     # for argument filter_stack see :class:`~ezdxf.drawing.Drawing.read` for more information
-    from ezdxf.lldxf.validator import is_dxf_file
+    from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
     from ezdxf.tools.codepage import is_supported_encoding
 
-    if not is_dxf_file(filename):
-        raise IOError("File '{}' is not a DXF file.".format(filename))
-
-    info = dxf_file_info(filename)
-    if encoding is not None:
-        # override default encodings if absolute necessary
-        info.encoding = encoding
-    with open(filename, mode='rt', encoding=info.encoding, errors='ignore') as fp:
-        doc = read(fp, legacy_mode=legacy_mode, filter_stack=filter_stack)
+    cache = None
+    # filter functions can not be part of the cache key
+    if options.load_cache_dir and filter_stack is None and entity_filter is None:
+        from ezdxf.tools.loadcache import LoadCache
+        cache = LoadCache(options.load_cache_dir, options.load_cache_max_size)
+        key = cache.key(filename, encoding, legacy_mode, None if sections is None else sorted(sections),
+                        options.lazy_loading, options.incremental_save, options.check_entity_tag_structures,
+                        options.filter_invalid_xdata_group_codes)
+        doc = cache.get(key)
+        if doc is not None:
+            doc.filename = filename
+            return doc
+
+    if is_binary_dxf_file(filename):
+        doc = _read_binary_file(filename, encoding, sections=sections, entity_filter=entity_filter)
+    else:
+        if not is_dxf_file(filename):
+            raise IOError("File '{}' is not a DXF file.".format(filename))
+
+        info = dxf_file_info(filename)
+        if encoding is not None:
+            # override default encodings if absolute necessary
+            info.encoding = encoding
+        with open(filename, mode='rt', encoding=info.encoding, errors='ignore') as fp:
+            doc = read(fp, legacy_mode=legacy_mode, filter_stack=filter_stack, sections=sections,
+                       entity_filter=entity_filter)
 
     doc.filename = filename
     if encoding is not None and is_supported_encoding(encoding):
         # store overridden encoding if supported by AutoCAD, else default encoding stored in $DWGENCODING is used
         # as document encoding or 'cp1252' if $DWGENCODING is unset.
         doc.encoding = encoding
+    if cache is not None:
+        cache.put(key, doc)
     return doc
 
 
+def _read_binary_file(filename: str, encoding: str = None, sections: Set[str] = None,
+                      entity_filter: Callable[['Tags'], bool] = None) -> 'Drawing':
+    from ezdxf.lldxf.tagger import binary_tagger
+    from ezdxf.lldxf.validator import binary_dxf_info
+
+    with open(filename, mode='rb') as fp:
+        data = fp.read()
+    if encoding is None:
+        encoding = binary_dxf_info(data).encoding
+    return Drawing.from_tags(binary_tagger(data, encoding=encoding), sections=sections, entity_filter=entity_filter)
+
+
 def dxf_file_info(filename: str) -> 'DXFInfo':
     """
     Reads basic file information from DXF files: DXF version, encoding and handle seed.
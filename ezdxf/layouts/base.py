@@ -3,13 +3,16 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Dict, Iterable, List, Hashable
 from ezdxf.lldxf.const import DXFValueError, DXFStructureError
-from ezdxf.query import EntityQuery
+from ezdxf.query import EntityQuery, LazyEntityQuery
 from ezdxf.groupby import groupby
-from ezdxf.entitydb import EntityDB
+from ezdxf.entitydb import EntityDB, AttributeIndex
 from ezdxf.graphicsfactory import CreatorInterface
 
 if TYPE_CHECKING:
-    from ezdxf.eztypes import BlockRecord, DXFGraphic, Dictionary, KeyFunc
+    from ezdxf.eztypes import BlockRecord, DXFGraphic, Dictionary, KeyFunc, Vertex, Matrix44
+    from ezdxf.spatial import SpatialIndex
+    from ezdxf.compact import CompactEntityStore
+    from ezdxf.explode import Cache as ExplodeCache
 
 
 class BaseLayout(CreatorInterface):
@@ -119,14 +122,30 @@ class BaseLayout(CreatorInterface):
         """ Delete `entity` from layout entity space and the drawing database, this destroys the `entity`. """
         self.block_record.delete_entity(entity)
 
+    def unlink_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Unlink multiple `entities` from layout but does not delete them from the drawing database, runs in linear
+        time for any count of entities.
+
+        """
+        self.block_record.unlink_entities(entities)
+
+    def delete_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """
+        Delete multiple `entities` from layout entity space and the drawing database, this destroys the `entities`,
+        runs in linear time for any count of entities.
+
+        """
+        self.block_record.delete_entities(entities)
+
     def delete_all_entities(self) -> None:
         """
         Delete all entities from layout entity space and from drawing database, this destroys all entities in this
-        layout.
+        layout, including the entities of the :attr:`compact_store`.
         """
-        # noinspection PyTypeChecker
-        for entity in list(self):  # temp list, because delete modifies the base data structure of the iterator
-            self.delete_entity(entity)
+        self.delete_entities(self)
+        if self.entity_space.compact_store is not None:
+            self.entity_space.compact_store.clear()
 
     def get_entity_by_handle(self, handle: str) -> 'DXFGraphic':
         """
@@ -141,7 +160,120 @@ class BaseLayout(CreatorInterface):
         Get all DXF entities matching the :ref:`entity query string`.
 
         """
-        return EntityQuery(iter(self), query)
+        return EntityQuery(self.entity_space, query)
+
+    def iquery(self, query: str = '*') -> LazyEntityQuery:
+        """
+        Get a :class:`~ezdxf.query.LazyEntityQuery` of all DXF entities matching the :ref:`entity query string`,
+        entities are tested at iteration and the result is not stored.
+
+        """
+        return LazyEntityQuery(self.entity_space, query)
+
+    def create_attribute_index(self, name: str) -> AttributeIndex:
+        """
+        Create an :class:`~ezdxf.entitydb.AttributeIndex` for the DXF attribute `name` like ``'layer'``, ``'color'`` or
+        ``'linetype'``, used by :meth:`query` to select the candidates for relations of the attribute query.
+        The index is maintained by adding and removing entities and by changing the DXF attribute `name` of an
+        entity.
+
+        """
+        return self.entity_space.create_attribute_index(name)
+
+    def remove_attribute_index(self, name: str) -> None:
+        """ Remove the :class:`~ezdxf.entitydb.AttributeIndex` for the DXF attribute `name`. """
+        self.entity_space.remove_attribute_index(name)
+
+    @property
+    def compact_store(self) -> 'CompactEntityStore':
+        """
+        Returns the :class:`~ezdxf.compact.CompactEntityStore` of the layout, created at the first request. Compact
+        entities are not included in the regular entities of the layout, but are exported with the layout.
+
+        """
+        entity_space = self.entity_space
+        if entity_space.compact_store is None:
+            from ezdxf.compact import CompactEntityStore
+            entity_space.compact_store = CompactEntityStore(self.doc, self.block_record_handle,
+                                                            paperspace=self.is_any_paperspace)
+        return entity_space.compact_store
+
+    def compact_entities(self, query: str = 'LINE POINT CIRCLE ARC 3DFACE') -> int:
+        """
+        Move all compatible entities matching the :ref:`entity query string` into the :attr:`compact_store`, entities
+        with XDATA, app data, reactors, extension dictionaries or not supported DXF attributes are not moved. Returns
+        the count of moved entities.
+
+        The moved entities are deleted from the layout and from the entity database, they do not appear anymore in
+        the layout iteration, :meth:`query`, :meth:`query_window` and :meth:`get_entity_by_handle`. Existing
+        references to the regular entities are dead entities after compacting, access them by iterating the
+        :attr:`compact_store` or by :func:`ezdxf.query.new`, the compact entities keep the DXF handles.
+
+        """
+        store = self.compact_store
+        moved = []
+        for entity in self.query(query):
+            if store.add_entity(entity) is not None:
+                moved.append(entity)
+        self.delete_entities(moved)
+        return len(moved)
+
+    @property
+    def spatial_index(self) -> 'SpatialIndex':
+        """
+        Returns the :class:`~ezdxf.spatial.SpatialIndex` of the layout, created at the first request and maintained by
+        adding and removing entities. Call :meth:`SpatialIndex.update` after changing the geometry of an entity.
+
+        """
+        return self.entity_space.spatial_index()
+
+    def query_window(self, bbox, mode: str = 'intersect', query: str = '*') -> EntityQuery:
+        """
+        Get all DXF entities which bounding box intersects the search window `bbox` or is completely inside the search
+        window, and matches the :ref:`entity query string`. The search is done in the xy-plane of the :ref:`WCS` by the
+        :attr:`spatial_index` of the layout, entities without bounding box like XLINE or RAY are never included.
+
+        Args:
+            bbox: search window as :class:`~ezdxf.math.bbox.BoundingBox` or as two ``(x, y)`` corner points
+            mode: ``'intersect'`` or ``'inside'``
+            query: :ref:`entity query string`
+
+        """
+        return EntityQuery(self.spatial_index.query_window(bbox, mode), query)
+
+    def nearest_entities(self, point: 'Vertex', count: int = 1) -> List['DXFGraphic']:
+        """
+        Returns the `count` entities nearest to `point`, nearest entity first. The distance is measured in the
+        xy-plane of the :ref:`WCS` from `point` to the bounding box of an entity.
+
+        """
+        return self.spatial_index.nearest(point, count)
+
+    def transform_all(self, m: 'Matrix44', query: str = '*') -> List['DXFGraphic']:
+        """
+        Transforms all DXF entities matching the :ref:`entity query string` inplace by the transformation matrix `m`,
+        see :func:`ezdxf.transform.transform_all`. Returns a list of all entities which could not be transformed, an
+        existing :attr:`spatial_index` is updated for all transformed entities.
+
+        """
+        from ezdxf.transform import transform_all
+        entities = self.query(query)
+        failed = transform_all(entities, m)
+        self.entity_space.update_spatial_index(entities, exclude=failed)
+        return failed
+
+    def flatten_inserts(self, query: str = '*', cache: 'ExplodeCache' = None) -> Iterable['DXFGraphic']:
+        """
+        Yields all DXF entities matching the :ref:`entity query string`, but INSERT entities are replaced by their
+        content as virtual DXF entities in :ref:`WCS`, see :func:`ezdxf.explode.flatten`.
+
+        Args:
+            query: :ref:`entity query string`
+            cache: :class:`ezdxf.explode.Cache` for block definition content, a temporary cache is used if ``None``
+
+        """
+        from ezdxf.explode import flatten
+        return flatten(self.query(query), cache)
 
     def groupby(self, dxfattrib: str = "", key: 'KeyFunc' = None) -> dict:
         """
@@ -14,6 +14,9 @@ DXF2010 = 'AC1024'
 DXF2013 = 'AC1027'
 DXF2018 = 'AC1032'
 
+# Sentinel of binary DXF files, followed by the first group code
+DXF_BINARY_SIGNATURE = b'AutoCAD Binary DXF\r\n\x1a\x00'
+
 acad_release = {
     DXF12: 'R12',
     DXF13: 'R13',
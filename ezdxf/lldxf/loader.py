@@ -3,7 +3,7 @@
 # Copyright (c) 2018-2019, Manfred Moitzi
 # License: MIT License
 import logging
-from typing import Callable, Dict, Iterable, List, Union, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Union, Set, TYPE_CHECKING
 from collections import OrderedDict
 
 from .const import DXFStructureError
@@ -24,6 +24,7 @@ modern_post_load_tag_processors = {}  # type: Dict[str, TagProcessor]
 legacy_post_load_tag_processors = {}  # type: Dict[str, TagProcessor]
 
 SectionDict = Dict[str, List[Union[Tags, ExtendedTags]]]
+EntityFilter = Callable[[Tags], bool]
 
 
 def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = False) -> SectionDict:
@@ -109,10 +110,82 @@ def load_dxf_structure(tagger: Iterable[DXFTag], ignore_missing_eof: bool = Fals
     return sections
 
 
+TABLES_REQUIRED_BY = {'BLOCKS', 'ENTITIES', 'OBJECTS'}
+
+
+def skip_sections(tagger: Iterable[DXFTag], sections: Set[str]) -> Iterable[DXFTag]:
+    """
+    Yields only the tags of DXF sections in `sections`, tags of all other sections are skipped before they are
+    grouped into DXF structure entities. The HEADER section is always required and can not be skipped, the TABLES
+    section is required by the BLOCKS, ENTITIES and OBJECTS section and is loaded if one of these sections is loaded.
+
+    Args:
+        tagger: generates DXFTag() entities from input data
+        sections: set of section names in uppercase letters like ``{'TABLES', 'ENTITIES'}``
+
+    """
+    sections = set(sections)
+    sections.add('HEADER')
+    if sections & TABLES_REQUIRED_BY:
+        sections.add('TABLES')
+    tags = iter(tagger)
+    for tag in tags:
+        if tag == (0, 'SECTION'):
+            try:
+                name_tag = next(tags)
+            except StopIteration:  # DXFStructureError() is raised by load_dxf_structure()
+                yield tag
+                return
+            if name_tag.code == 2 and name_tag.value not in sections:
+                for tag in tags:  # skip section content
+                    if tag == (0, 'ENDSEC'):
+                        break
+                continue
+            yield tag
+            yield name_tag
+        else:
+            yield tag
+
+
+LINKED_ENTITY_TYPES = {'VERTEX', 'ATTRIB', 'SEQEND'}
+
+
+def filter_entities(entities: Iterable[Tags], entity_filter: EntityFilter) -> Iterable[Tags]:
+    """
+    Yields only DXF entities accepted by the `entity_filter` function, which gets the DXF entity as raw
+    :class:`~ezdxf.lldxf.tags.Tags` and returns ``True`` to accept the entity. Linked entities (VERTEX, ATTRIB, SEQEND)
+    and attached entities (MTEXT without handle) share the decision of their main entity, the filter function is not
+    called for them.
+
+    Args:
+        entities: DXF entities as Tags() of the ENTITIES section, without SECTION entity
+        entity_filter: filter function
+
+    """
+    accept = True
+    linked = False
+    for entity in entities:
+        dxftype = entity[0].value
+        if linked and dxftype in LINKED_ENTITY_TYPES:
+            # invalid structures are detected by the entity linker at loading
+            linked = dxftype != 'SEQEND'
+        elif dxftype == 'MTEXT' and not entity.has_tag(5):  # attached MTEXT entity
+            pass
+        else:
+            accept = entity_filter(entity)
+            linked = dxftype == 'POLYLINE' or (dxftype == 'INSERT' and bool(entity.get_first_value(66, 0)))
+        if accept:
+            yield entity
+
+
 EXCLUDE_STRUCTURE_CHECK = {'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS', 'ACDSRECORD', 'ACDSSCHEMA'}
 
 
-def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory') -> Iterable['DXFEntity']:
+LAZY_LOADING_SECTIONS = {'ENTITIES', 'BLOCKS'}
+
+
+def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory', lazy: bool = False,
+                      keep_tags: bool = False) -> Iterable['DXFEntity']:
     check_tag_structure = options.check_entity_tag_structures
     for entity in dxf_entities:
         if len(entity) == 0:
@@ -123,7 +196,12 @@ def load_dxf_entities(dxf_entities: List[Tags], factory: 'EntityFactory') -> Ite
 
         if check_tag_structure and (dxftype not in EXCLUDE_STRUCTURE_CHECK):
             entity = entity_structure_validator(entity)
-        yield factory.load(entity)
+            if lazy or keep_tags:  # store the validated tags
+                entity = Tags(entity)
+        dxf_entity = factory.load(entity, lazy=lazy)
+        if keep_tags and not dxf_entity.is_lazy:
+            dxf_entity.set_loaded_tags(entity)
+        yield dxf_entity
 
 
 def fill_database(sections: Dict, factory: 'EntityFactory') -> None:
@@ -131,7 +209,9 @@ def fill_database(sections: Dict, factory: 'EntityFactory') -> None:
     for name in ['TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS']:
         if name in sections:
             section = sections[name]
+            lazy = options.lazy_loading and name in LAZY_LOADING_SECTIONS
+            keep_tags = options.incremental_save and name in LAZY_LOADING_SECTIONS
             # entities stored in the database are converted from Tags() to ExtendedTags()
-            for index, entity in enumerate(load_dxf_entities(section, factory)):
+            for index, entity in enumerate(load_dxf_entities(section, factory, lazy, keep_tags)):
                 # all entities are DXFEntity or inherited
                 section[index] = entity
@@ -3,6 +3,7 @@
 # License: MIT License
 from array import array
 from typing import Iterable, Sequence
+import sys
 
 from .types import DXFTag
 from .const import DXFTypeError, DXFIndexError, DXFValueError
@@ -11,12 +12,209 @@ from ezdxf.tools.indexing import Index
 from ezdxf.lldxf.tagwriter import TagWriter
 
 
-class TagList:
+# set to False to use the pure Python implementations of NumPy accelerated functions, even if NumPy is installed
+USE_NUMPY = True
+
+
+def numpy_module(optional: bool = False):
+    """ Returns the :mod:`numpy` module, NumPy is an optional dependency and only required for the NumPy interface
+    of the packed data types.
+
+    Returns ``None`` instead of raising :class:`ImportError` for `optional` is ``True``, if NumPy is not installed or
+    disabled by :data:`USE_NUMPY`, this is used by functions which are accelerated by NumPy but do not require it.
+    """
+    if optional:
+        if not USE_NUMPY:
+            return None
+        try:
+            import numpy
+        except ImportError:
+            return None
+        return numpy
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('NumPy interface requires NumPy: pip install numpy')
+    return numpy
+
+
+def is_ndarray(data) -> bool:
+    """ Returns ``True`` if `data` is a NumPy array, does not import NumPy. """
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(data, numpy.ndarray)
+
+
+def numpy_view(values: array, columns: int = 0):
+    """
+    Returns a NumPy array which shares the memory of :class:`array.array` `values`, changes of the view are changes
+    of `values`. The shape of the view is ``(n, columns)`` if `columns` > 0 else ``(n, )``.
+
+    An :class:`array.array` can not change its size as long as a view exists, appending or deleting values raises
+    :class:`BufferError`.
+
+    """
+    view = numpy_module().frombuffer(values, dtype=values.typecode)
+    if columns:
+        view = view.reshape(-1, columns)
+    return view
+
+
+def packed_array(dtype: str, data: Iterable = None) -> array:
+    """ Returns an :class:`array.array` of type `dtype` filled with values from `data`, NumPy arrays are converted
+    by a bulk memory copy without creating Python objects for each value.
+    """
+    if is_ndarray(data):
+        values = array(dtype)
+        values.frombytes(numpy_module().ascontiguousarray(data, dtype=dtype).tobytes())
+        return values
+    return array(dtype, data or [])
+
+
+def _no_hook() -> None:
+    """ Unpickle helper for :class:`ModificationHook`. """
+    return None
+
+
+class ModificationHook:
+    """
+    Sets the dirty flag of an entity with loaded tags at changing the entity specific data like vertices, extended
+    data or boundary paths, see :meth:`DXFEntity.mark_modified`. The hook is not copied and not pickled, copies of
+    the data are not linked to the entity.
+
+    (internal class)
+    """
+    __slots__ = ('entity',)
+
+    def __init__(self, entity):
+        self.entity = entity
+
+    def __call__(self) -> None:
+        self.entity.mark_modified()
+
+    def __copy__(self) -> None:
+        return None
+
+    def __deepcopy__(self, memodict: dict = None) -> None:
+        return None
+
+    def __reduce__(self) -> tuple:
+        return _no_hook, ()
+
+
+class ModificationTracker:
+    """
+    Mixin for data structures which notify the owner entity about changes, all methods which change the data have
+    to call :meth:`_modified` and :meth:`set_modification_hook` links the data to the owner entity.
+
+    Reading the data does not mark the entity as modified, in-place changes of the raw data like :attr:`values` or
+    NumPy views are not tracked, except :meth:`as_numpy` which marks the entity as modified.
+
+    (internal class)
+    """
+    __slots__ = ()
+    _hook = None  # type: ModificationHook
+
+    def set_modification_hook(self, hook: ModificationHook = None) -> None:
+        self._hook = hook
+
+    def _modified(self) -> None:
+        if self._hook is not None:
+            self._hook()
+
+
+class TrackedList(ModificationTracker, list):
+    """
+    Standard Python ``list`` which notifies the owner entity about changes by its methods, in-place changes of
+    mutable items are only tracked if the items are :class:`ModificationTracker` objects, which are linked to the
+    owner entity by :meth:`set_modification_hook`.
+
+    (internal class)
+    """
+
+    def set_modification_hook(self, hook: ModificationHook = None) -> None:
+        self._hook = hook
+        for item in self:
+            if isinstance(item, ModificationTracker):
+                item.set_modification_hook(hook)
+
+    def __setitem__(self, index, value) -> None:
+        self._modified()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index) -> None:
+        self._modified()
+        super().__delitem__(index)
+
+    def __iadd__(self, other: Iterable) -> 'TrackedList':
+        self._modified()
+        return super().__iadd__(other)
+
+    def __imul__(self, count: int) -> 'TrackedList':
+        self._modified()
+        return super().__imul__(count)
+
+    def append(self, item) -> None:
+        self._modified()
+        super().append(item)
+
+    def extend(self, items: Iterable) -> None:
+        self._modified()
+        super().extend(items)
+
+    def insert(self, index: int, item) -> None:
+        self._modified()
+        super().insert(index, item)
+
+    def pop(self, index: int = -1):
+        self._modified()
+        return super().pop(index)
+
+    def remove(self, item) -> None:
+        self._modified()
+        super().remove(item)
+
+    def clear(self) -> None:
+        self._modified()
+        super().clear()
+
+    def sort(self, *args, **kwargs) -> None:
+        self._modified()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._modified()
+        super().reverse()
+
+
+class TrackedObject(ModificationTracker):
+    """
+    Mixin for data objects with public attributes like the boundary paths of the HATCH entity, assigning an attribute
+    notifies the owner entity about the change and :meth:`set_modification_hook` links all attributes which are
+    :class:`ModificationTracker` objects like :class:`TrackedList` to the owner entity.
+
+    (internal class)
+    """
+
+    def __setattr__(self, key: str, value) -> None:
+        hook = self._hook
+        if hook is not None:
+            hook()
+        object.__setattr__(self, key, value)
+
+    def set_modification_hook(self, hook: ModificationHook = None) -> None:
+        object.__setattr__(self, '_hook', hook)
+        for value in self.__dict__.values():
+            if isinstance(value, ModificationTracker):
+                value.set_modification_hook(hook)
+
+
+class TagList(ModificationTracker):
     """ Store data in a standard Python ``list``. """
-    __slots__ = ('values',)
+    __slots__ = ('values', '_hook')
 
     def __init__(self, data: Iterable = None):
         self.values = list(data or [])
+        self._hook = None
 
     def clone(self) -> 'TagList':
         """ Returns a deep copy. """
@@ -36,6 +234,7 @@ class TagList:
 
     def clear(self) -> None:
         """ Delete all data values. """
+        self._modified()
         del self.values[:]
 
 
@@ -46,21 +245,31 @@ class TagArray(TagList):
     DTYPE = 'i'
 
     def __init__(self, data: Iterable = None):
-        self.values = array(self.DTYPE, data or [])
+        self.values = packed_array(self.DTYPE, data)
+        self._hook = None
 
     def set_values(self, values: Iterable) -> None:
-        """ Replace data by `values`. """
-        self.values[:] = array(self.DTYPE, values)
+        """ Replace data by `values`, accepts also a NumPy array. """
+        self._modified()
+        self.values[:] = packed_array(self.DTYPE, values)
+
+    def as_numpy(self):
+        """ Returns a NumPy view of the data values without copying, see :func:`numpy_view`. """
+        self._modified()  # changes of the view are not tracked
+        return numpy_view(self.values)
 
 
-class VertexArray:
+class VertexArray(ModificationTracker):
     """ Store vertices in an ``array.array('d')``. Vertex size is defined by class variable ``VERTEX_SIZE``. """
     #: Defines the vertex size
     VERTEX_SIZE = 3  # set to 2 for 2d points
-    __slots__ = ('values',)
+    __slots__ = ('values', '_hook')
 
     def __init__(self, data: Iterable = None):
-        self.values = array('d', data or [])
+        if is_ndarray(data):
+            self._check_shape(data)
+        self.values = packed_array('d', data)
+        self._hook = None
 
     def __len__(self) -> int:
         """ Count of vertices. """
@@ -78,10 +287,12 @@ class VertexArray:
         if isinstance(index, slice):
             raise DXFTypeError('slicing not supported')
         else:
+            self._modified()
             self._set_point(self._index(index), point)
 
     def __delitem__(self, index: int) -> None:
         """ Delete vertex at `index`, extended slicing supported. """
+        self._modified()
         if isinstance(index, slice):
             self._del_points(self._slicing(index))
         else:
@@ -112,6 +323,7 @@ class VertexArray:
             raise DXFValueError('point requires exact {} components.'.format(size))
 
         pos = self._index(pos) * size
+        self._modified()
         _insert = self.values.insert
         for value in reversed(point):
             _insert(pos, value)
@@ -136,6 +348,22 @@ class VertexArray:
                 vertices.extend(tag.value)
         return cls(data=vertices)
 
+    def as_numpy(self):
+        """ Returns a NumPy view of shape ``(n, VERTEX_SIZE)`` without copying, changes of the view are changes of
+        the vertices, see :func:`numpy_view`.
+        """
+        self._modified()  # changes of the view are not tracked
+        return numpy_view(self.values, self.VERTEX_SIZE)
+
+    def _check_shape(self, data) -> None:
+        size = self.VERTEX_SIZE
+        if data.ndim == 1:
+            valid = len(data) % size == 0
+        else:
+            valid = data.ndim == 2 and data.shape[1] == size
+        if not valid:
+            raise DXFValueError('NumPy array of shape (n, {}) required.'.format(size))
+
     def _index(self, item) -> int:
         return Index(self).index(item, error=DXFIndexError)
 
@@ -183,15 +411,22 @@ class VertexArray:
         """ Append `point`. """
         if len(point) != self.VERTEX_SIZE:
             raise DXFValueError('point requires exact {} components.'.format(self.VERTEX_SIZE))
+        self._modified()
         self.values.extend(point)
 
     def extend(self, points: Iterable[Sequence[float]]) -> None:
-        """ Extend array by `points`. """
-        for point in points:
-            self.append(point)
+        """ Extend array by `points`, a NumPy array of shape ``(n, VERTEX_SIZE)`` is added by a bulk copy. """
+        if is_ndarray(points):
+            self._check_shape(points)
+            self._modified()
+            self.values.extend(packed_array('d', points))
+        else:
+            for point in points:
+                self.append(point)
 
     def clear(self) -> None:
         """ Delete all vertices. """
+        self._modified()
         del self.values[:]
 
     def set(self, points: Iterable[Sequence[float]]) -> None:
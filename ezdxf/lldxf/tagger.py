@@ -1,12 +1,14 @@
 # Purpose: untrusted stream tag reader, tag compiler for trusted and untrusted sources
 # Created: 10.04.2016
-# Copyright (c) 2016-2018, Manfred Moitzi
+# Copyright (c) 2016-2019, Manfred Moitzi
 # License: MIT License
-from typing import Iterable, TextIO, Iterator
+from typing import Iterable, TextIO, Iterator, List
+import struct
 
 from .types import DXFTag, DXFVertex, DXFBinaryTag
-from .const import DXFStructureError
+from .const import DXFStructureError, DXF_BINARY_SIGNATURE
 from .types import POINT_CODES, TYPE_TABLE, BINARAY_DATA
+from .types import BINARY_BOOL, BINARY_INT16, BINARY_INT32, BINARY_INT64, BINARY_DOUBLE
 
 
 def internal_tag_compiler(s: str) -> Iterable[DXFTag]:
@@ -88,6 +90,201 @@ def low_level_tagger(stream: TextIO, skip_comments: bool = True) -> Iterable[DXF
             return
 
 
+def binary_tagger(data: bytes, encoding: str = 'cp1252', errors: str = 'ignore') -> Iterable[DXFTag]:
+    """
+    Yields compiled DXFTag(), DXFVertex() and DXFBinaryTag() objects from binary DXF `data`, the result is the same
+    tag stream as yielded by :func:`tag_compiler` for ASCII DXF files. Binary DXF files do not contain comments.
+
+    DXF R12 and prior use 1-byte group codes with the escape byte ``0xff`` for 2-byte group codes, DXF R13 and later
+    use always 2-byte group codes, the group code length is detected by the first tag (0, 'SECTION').
+
+    Args:
+        data: binary DXF file content including the leading binary DXF signature
+        encoding: string encoding, see :func:`ezdxf.lldxf.validator.binary_dxf_info` to detect the required encoding
+        errors: string decoding error handler
+
+    Raises:
+        DXFStructureError: Invalid binary DXF signature or unexpected end of data.
+
+    """
+    if not data.startswith(DXF_BINARY_SIGNATURE):
+        raise DXFStructureError('Invalid binary DXF signature.')
+    length = len(data)
+    index = len(DXF_BINARY_SIGNATURE)
+    # R12: 1 byte group code (0) followed by 'SECTION'; R13+: 2 byte group code (0, 0) followed by 'SECTION'
+    short_codes = data[index:index + 8] == b'\x00SECTION'
+    unpack_double = struct.Struct('<d').unpack_from
+    unpack_int16 = struct.Struct('<h').unpack_from
+    unpack_int32 = struct.Struct('<i').unpack_from
+    unpack_int64 = struct.Struct('<q').unpack_from
+
+    def read_code() -> int:
+        nonlocal index
+        code = data[index]
+        if short_codes:
+            index += 1
+            if code == 255:  # escape byte for 2-byte group codes
+                code = data[index] | (data[index + 1] << 8)
+                index += 2
+        else:
+            code |= data[index + 1] << 8
+            index += 2
+        return code
+
+    def read_value(code: int):
+        nonlocal index
+        if code in BINARY_DOUBLE:
+            value = unpack_double(data, index)[0]
+            index += 8
+        elif code in BINARY_INT16:
+            value = unpack_int16(data, index)[0]
+            index += 2
+        elif code in BINARY_INT32:
+            value = unpack_int32(data, index)[0]
+            index += 4
+        elif code in BINARY_BOOL:
+            value = data[index]
+            index += 1
+        elif code in BINARY_INT64:
+            value = unpack_int64(data, index)[0]
+            index += 8
+        elif code in BINARAY_DATA:
+            size = data[index]
+            index += 1
+            value = data[index:index + size]
+            index += size
+        else:  # zero terminated string
+            end = data.index(b'\x00', index)
+            value = data[index:end].decode(encoding, errors=errors)
+            index = end + 1
+        return value
+
+    try:
+        while index < length:
+            code = read_code()
+            value = read_value(code)
+            if code in POINT_CODES:
+                y_code = read_code()
+                if y_code != code + 10:
+                    raise DXFStructureError("Missing required y coordinate near byte offset: {}.".format(index))
+                y = read_value(y_code)
+                if index < length:
+                    z_start = index
+                    z_code = read_code()
+                    if z_code == code + 20:  # 3d point
+                        yield DXFVertex(code, (value, y, read_value(z_code)))
+                        continue
+                    index = z_start  # undo reading z group code
+                yield DXFVertex(code, (value, y))
+            elif code in BINARAY_DATA:
+                yield DXFBinaryTag(code, value)
+            else:
+                yield DXFTag(code, value)
+    except (IndexError, ValueError, struct.error):
+        raise DXFStructureError('Unexpected end of binary DXF data near byte offset: {}.'.format(index))
+
+
+BLOCK_SIZE = 1 << 22  # 4 MB
+
+
+def ascii_tag_compiler(stream: TextIO, skip_comments: bool = True, block_size: int = BLOCK_SIZE) -> Iterable[DXFTag]:
+    """
+    Yields compiled DXFTag(), DXFVertex() and DXFBinaryTag() objects from a text `stream` (untrusted external
+    source), fast path for the combination :code:`tag_compiler(low_level_tagger(stream))`.
+
+    Reads the stream in blocks of `block_size` characters by the read() method, splits each block into lines at once
+    and compiles the tags in a single loop. Comment tags (group code == 999) will be skipped if argument
+    `skip_comments` is `True`. Raw tag filters like the repair filters for legacy DXF files require the low level
+    tags of :func:`low_level_tagger`, use the slow path :func:`tag_compiler` in this case.
+
+    Args:
+        stream: text stream, only required feature is the read() method
+        skip_comments: skip comment tags (group code == 999) if `True`
+        block_size: count of characters to read at once
+
+    Raises:
+        DXFStructureError: Found invalid group code, invalid DXF tag or unexpected coordinate order.
+
+    """
+    lines = []  # type: List[str]
+    tail = ''
+    eof = False
+    pos = 0
+    count = 0
+    line_offset = 0  # line number of lines[0] - 1
+
+    def error_msg(code, value, line):
+        return 'Invalid tag (code={code}, value="{value}") near line: {line}.'.format(code=code, value=value, line=line)
+
+    def group_code(pos: int) -> int:
+        try:
+            return int(lines[pos])
+        except ValueError:
+            raise DXFStructureError('Invalid group code "{}" at line {}.'.format(lines[pos], line_offset + pos + 1))
+
+    while True:
+        # a point requires at most 6 lines: x, y and z tags
+        if count - pos < 6 and not eof:
+            block = stream.read(block_size)
+            if block:
+                new_lines = (tail + block).split('\n')
+                tail = new_lines.pop()
+            else:
+                eof = True
+                new_lines = [tail] if tail else []  # last line without line ending
+            line_offset += pos
+            lines = lines[pos:] + new_lines
+            pos = 0
+            count = len(lines)
+            continue
+
+        if pos + 1 >= count:  # ignore incomplete last tag like low_level_tagger()
+            return
+        try:
+            code = int(lines[pos])
+        except ValueError:
+            raise DXFStructureError('Invalid group code "{}" at line {}.'.format(lines[pos], line_offset + pos + 1))
+        value = lines[pos + 1]
+        pos += 2
+        if code == 999 and skip_comments:
+            continue
+        if code in POINT_CODES:
+            if pos + 1 >= count:  # unexpected EOF like tag_compiler()
+                return
+            if group_code(pos) != code + 10:  # y coordinate is mandatory
+                raise DXFStructureError("Missing required y coordinate near line: {}.".format(line_offset + pos + 2))
+            y = lines[pos + 1]
+            pos += 2
+            try:
+                if pos + 1 < count and group_code(pos) == code + 20:  # z coordinate just for 3d points
+                    point = (float(value), float(y), float(lines[pos + 1]))
+                    pos += 2
+                else:
+                    point = (float(value), float(y))
+            except ValueError:
+                raise DXFStructureError('Invalid floating point values near line: {}.'.format(line_offset + pos))
+            yield DXFVertex(code, point)
+        elif code in BINARAY_DATA:
+            try:
+                yield DXFBinaryTag.from_string(code, value)
+            except ValueError:
+                raise DXFStructureError('Invalid binary data near line: {}.'.format(line_offset + pos))
+        else:  # just a single tag
+            type_ = TYPE_TABLE.get(code, str)
+            try:
+                # fast path!
+                yield DXFTag(code, type_(value))
+            except ValueError:
+                # slow path
+                if type_ is int:  # ProE stores int values as floats :((
+                    try:
+                        yield DXFTag(code, int(float(value)))
+                    except ValueError:
+                        raise DXFStructureError(error_msg(code, value, line_offset + pos))
+                else:
+                    raise DXFStructureError(error_msg(code, value, line_offset + pos))
+
+
 # invalid point codes if not part of a point started with 1010, 1011, 1012, 1013
 INVALID_POINT_CODES = {1020, 1021, 1022, 1023, 1030, 1031, 1032, 1033}
 
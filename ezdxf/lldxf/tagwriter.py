@@ -1,15 +1,17 @@
 # Created: 13.01.2018
-# Copyright (c) 2018, Manfred Moitzi
+# Copyright (c) 2018-2019, Manfred Moitzi
 # License: MIT License
-from typing import Any, TextIO, TYPE_CHECKING, Union, List, Iterable
-from .types import TAG_STRING_FORMAT, cast_tag_value
+from typing import Any, TextIO, BinaryIO, TYPE_CHECKING, Union, List, Iterable
+import struct
+from .types import TAG_STRING_FORMAT, cast_tag_value, DXFVertex, DXFBinaryTag
+from .types import BINARAY_DATA, BINARY_BOOL, BINARY_INT16, BINARY_INT32, BINARY_INT64, BINARY_DOUBLE
 from .tags import DXFTag, Tags
-from .const import LATEST_DXF_VERSION
+from .const import LATEST_DXF_VERSION, DXF12, DXF_BINARY_SIGNATURE
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import ExtendedTags, DXFEntity
 
-__all__ = ['TagWriter', 'TagCollector', 'basic_tags_from_text']
+__all__ = ['TagWriter', 'BinaryTagWriter', 'TagCollector', 'basic_tags_from_text']
 
 
 class TagWriter:
@@ -59,6 +61,86 @@ class TagWriter:
         self._stream.write(s)
 
 
+class BinaryTagWriter(TagWriter):
+    """
+    Writes DXF tags into a binary stream as binary DXF.
+
+    DXF R12 uses 1-byte group codes and the escape byte ``0xff`` for group codes >= 255, DXF R13 and later use
+    always 2-byte group codes. Binary DXF does not support comments, comment tags (group code 999) are ignored.
+
+    Args:
+        stream: binary stream
+        write_handles: if False don't write handles (5, 105), use only for DXF R12 format
+        encoding: string encoding, use ``'utf8'`` for DXF R2007 and later
+
+    """
+    CHUNK_SIZE = 127  # same chunk size as used for binary data in ASCII DXF files
+
+    def __init__(self, stream: BinaryIO, dxfversion=LATEST_DXF_VERSION, write_handles: bool = True,
+                 encoding: str = 'utf8'):
+        super().__init__(stream, dxfversion=dxfversion, write_handles=write_handles)  # type: ignore
+        self._encoding = encoding
+        self._short_codes = dxfversion <= DXF12
+        self._pack_double = struct.Struct('<d').pack
+        self._pack_int16 = struct.Struct('<h').pack
+        self._pack_int32 = struct.Struct('<i').pack
+        self._pack_int64 = struct.Struct('<q').pack
+
+    def write_signature(self) -> None:
+        """ Write binary DXF signature, has to be the first data written to the stream. """
+        self._stream.write(DXF_BINARY_SIGNATURE)
+
+    def _group_code(self, code: int) -> bytes:
+        if self._short_codes:
+            if code < 255:
+                return bytes((code,))
+            return b'\xff' + code.to_bytes(2, 'little')
+        return code.to_bytes(2, 'little')
+
+    def write_tag(self, tag: DXFTag) -> None:
+        if isinstance(tag, DXFVertex):
+            for code, value in tag.dxftags():
+                self.write_tag2(code, value)
+        else:  # DXFBinaryTag() value is already bytes
+            self.write_tag2(tag.code, tag.value)
+
+    def write_tag2(self, code: int, value: Any) -> None:
+        if code == 999:  # binary DXF does not support comments
+            return
+        if code in BINARAY_DATA:
+            self._write_binary_chunks(code, value)
+            return
+        if code in BINARY_DOUBLE:
+            data = self._pack_double(float(value))
+        elif code in BINARY_INT16:
+            data = self._pack_int16(int(value))
+        elif code in BINARY_INT32:
+            data = self._pack_int32(int(value))
+        elif code in BINARY_BOOL:
+            data = bytes((int(value),))
+        elif code in BINARY_INT64:
+            data = self._pack_int64(int(value))
+        else:  # zero terminated string
+            data = str(value).encode(self._encoding, errors='dxfreplace') + b'\x00'
+        self._stream.write(self._group_code(code) + data)
+
+    def _write_binary_chunks(self, code: int, data: Union[bytes, str]) -> None:
+        if isinstance(data, str):  # hex string
+            data = bytes.fromhex(data)
+        group_code = self._group_code(code)
+        write = self._stream.write
+        size = self.CHUNK_SIZE
+        for index in range(0, len(data), size):
+            chunk = data[index: index + size]
+            write(group_code + bytes((len(chunk),)) + chunk)
+
+    def write_str(self, s: str) -> None:
+        """ Write DXF tags from a DXF string, expects well formed tags like ``'  0\\nSECTION\\n'``. """
+        lines = s.split('\n')
+        for index in range(0, len(lines) - 1, 2):
+            self.write_tag2(int(lines[index]), lines[index + 1])
+
+
 class TagCollector:
     """
     Collects DXF tags as DXFTag() entities for testing.
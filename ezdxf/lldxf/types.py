@@ -244,6 +244,16 @@ TYPE_TABLE = _build_type_table([
 ])
 
 
+# Value types of binary DXF tags, all group codes not listed here are stored as zero terminated strings, binary data
+# (BINARAY_DATA) is stored as chunks with a leading length byte.
+BINARY_BOOL = set(range(290, 300))  # stored as single byte
+BINARY_INT16 = set(chain(range(60, 80), range(170, 180), range(270, 290), range(370, 390), range(400, 410),
+                         range(1060, 1071)))
+BINARY_INT32 = set(chain(range(90, 100), range(420, 430), range(440, 460), (1071,)))
+BINARY_INT64 = set(range(160, 170))
+BINARY_DOUBLE = set(chain(range(10, 60), range(110, 150), range(210, 240), range(460, 470), range(1010, 1060)))
+
+
 def is_binary_data(code: int) -> bool:
     return code in BINARAY_DATA
 
@@ -4,12 +4,12 @@
 # License: MIT License
 import logging
 import io
-from typing import TextIO, Iterable, List
+from typing import TextIO, Iterable, List, Iterator
 
 from .const import DXFStructureError, DXFError, DXFValueError, DXFAppDataError, DXFXDataError
 from .const import APP_DATA_MARKER, HEADER_VAR_MARKER, XDATA_MARKER
-from .const import INVALID_LAYER_NAME_CHARACTERS, acad_release
-from .tagger import low_level_tagger
+from .const import INVALID_LAYER_NAME_CHARACTERS, acad_release, DXF_BINARY_SIGNATURE
+from .tagger import low_level_tagger, binary_tagger
 from .types import is_embedded_object_marker, DXFTag, NONE_TAG
 from ezdxf.tools.codepage import toencoding
 
@@ -37,8 +37,19 @@ class DXFInfo:
 
 
 def dxf_info(stream: TextIO) -> DXFInfo:
+    return _dxf_info(low_level_tagger(stream))  # filters already comments
+
+
+def binary_dxf_info(data: bytes) -> DXFInfo:
+    """ Returns basic DXF information from binary DXF `data`: DXF version, encoding and handle seed. """
+    info = _dxf_info(binary_tagger(data))
+    if info.version >= 'AC1021':  # R2007 files and later are always encoded as UTF-8
+        info.encoding = 'utf-8'
+    return info
+
+
+def _dxf_info(tagger: Iterator[DXFTag]) -> DXFInfo:
     info = DXFInfo()
-    tagger = low_level_tagger(stream)  # filters already comments
     if next(tagger) != (0, 'SECTION'):  # maybe a DXF structure error, handled by later processing
         return info
     if next(tagger) != (2, 'HEADER'):  # no leading HEADER section like DXF R12 with only ENTITIES section
@@ -200,6 +211,11 @@ def is_dxf_file(filename: str) -> bool:
         return is_dxf_stream(fp)
 
 
+def is_binary_dxf_file(filename: str) -> bool:
+    with io.open(filename, 'rb') as fp:
+        return fp.read(len(DXF_BINARY_SIGNATURE)) == DXF_BINARY_SIGNATURE
+
+
 def is_dxf_stream(stream: TextIO) -> bool:
     try:
         reader = low_level_tagger(stream)
@@ -1,12 +1,14 @@
 # Copyright (c) 2018 Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Tuple
+from array import array
 
 from .vector import Vec2
 from .bbox import BoundingBox2d
 from .construct2d import ConstructionTool, enclosing_angles
 from .circle import ConstructionCircle
 from .ucs import OCS, UCS
+from . import flatten
 import math
 
 if TYPE_CHECKING:
@@ -54,6 +56,18 @@ class ConstructionArc(ConstructionTool):
         """ end point of arc as :class:`Vec2`. """
         return self.center + Vec2.from_deg_angle(self.end_angle, self.radius)
 
+    def flattening(self, distance: float) -> array:
+        """
+        Returns the arc approximated by line segments, the max. distance of the line segments to the arc is
+        `distance`, returns the vertices as flat ``array('d')`` of ``x, y, z`` values, z-axis is ``0``,
+        see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the arc
+
+        """
+        return flatten.arc((self.center.x, self.center.y), self.radius, self.start_angle, self.end_angle, distance)
+
     @property
     def bounding_box(self) -> 'BoundingBox2d':
         """ bounding box of arc as :class:`BoundingBox2d`. """
@@ -0,0 +1,269 @@
+# Purpose: linear equation solver for banded matrices
+# Created: 2019-12-17
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+Banded Linear Equation Solver
+=============================
+
+The B-spline collocation matrix of the global curve interpolation and the normal equations of the global curve
+approximation have only a few non-zero diagonals around the main diagonal. A banded `n` x `n` matrix with `m1`
+sub-diagonals and `m2` super-diagonals is stored in compact form as `n` rows of ``m1 + m2 + 1`` values, the LU
+decomposition costs O(n * (m1 + m2)²) instead of O(n³) for a dense matrix.
+
+Source: Numerical Recipes in C, 2nd Edition, 2.4 Tridiagonal and Band Diagonal Systems of Equations
+
+"""
+from typing import List, Sequence, Tuple
+
+__all__ = ['BandedMatrix', 'BandedLU', 'tridiagonal_solve', 'banded_solve']
+
+TINY = 1e-20
+
+
+class BandedMatrix:
+    """
+    Banded `n` x `n` matrix in compact storage, the main diagonal is stored in column `m1` of the compact rows,
+    compact value ``rows[i][j]`` is the matrix value at row `i` and column ``i + j - m1``.
+
+    Args:
+        n: count of rows and columns
+        m1: count of sub-diagonals below the main diagonal
+        m2: count of super-diagonals above the main diagonal
+
+    """
+
+    def __init__(self, n: int, m1: int, m2: int):
+        self.n = n
+        self.m1 = m1
+        self.m2 = m2
+        width = m1 + m2 + 1
+        self.rows = [[0.] * width for _ in range(n)]  # type: List[List[float]]
+
+    @classmethod
+    def from_rows(cls, n: int, first_cols: Sequence[int], values: Sequence[Sequence[float]]) -> 'BandedMatrix':
+        """
+        Returns a new :class:`BandedMatrix` from sparse row data, row `i` has the non-zero values `values[i]`
+        starting at column `first_cols[i]`. The bandwidths `m1` and `m2` are determined by the row data, values
+        outside of the matrix are ignored.
+
+        Args:
+            n: count of rows and columns
+            first_cols: column index of the first value for each row
+            values: row values for each row
+
+        """
+        m1 = max(0, max(row - first for row, first in enumerate(first_cols)))
+        m2 = max(0, max(first + len(row_values) - 1 - row for row, (first, row_values) in
+                        enumerate(zip(first_cols, values))))
+        matrix = cls(n, m1, m2)
+        for row, (first, row_values) in enumerate(zip(first_cols, values)):
+            compact = matrix.rows[row]
+            offset = first - row + m1
+            for col, value in enumerate(row_values, start=first):
+                if 0 <= col < n:
+                    compact[col - first + offset] = value
+        return matrix
+
+    def __getitem__(self, index: Tuple[int, int]) -> float:
+        row, col = index
+        j = col - row + self.m1
+        if 0 <= j <= self.m1 + self.m2:
+            return self.rows[row][j]
+        return 0.
+
+    def __setitem__(self, index: Tuple[int, int], value: float) -> None:
+        row, col = index
+        j = col - row + self.m1
+        if not (0 <= j <= self.m1 + self.m2):
+            raise IndexError('Index ({}, {}) outside of the band.'.format(row, col))
+        self.rows[row][j] = value
+
+    def add(self, row: int, col: int, value: float) -> None:
+        """ Add `value` to the matrix value at `row` and `col`. """
+        self.rows[row][col - row + self.m1] += value
+
+    def dense(self) -> List[List[float]]:
+        """ Returns the matrix as dense nested lists, for testing and debugging. """
+        n = self.n
+        return [[self[row, col] for col in range(n)] for row in range(n)]
+
+    def lu(self) -> 'BandedLU':
+        """ Returns the LU decomposition of the matrix as :class:`BandedLU` object. """
+        return BandedLU(self)
+
+    def solve(self, b: Sequence[Sequence[float]]) -> List[List[float]]:
+        """ Solves ``A x = b`` for a matrix `b` of `n` rows and an arbitrary count of columns, returns `x` as
+        nested lists of `n` rows.
+        """
+        return banded_solve(self, b)
+
+
+class BandedLU:
+    """
+    LU decomposition of a :class:`BandedMatrix` with partial pivoting, the decomposition is done at instantiation
+    and can be reused to solve multiple linear equation systems by :meth:`solve`.
+
+    Args:
+        matrix: :class:`BandedMatrix`, the matrix itself is not modified
+
+    """
+
+    def __init__(self, matrix: BandedMatrix):
+        n = matrix.n
+        m1 = matrix.m1
+        mm = m1 + matrix.m2 + 1
+        self.n = n
+        self.m1 = m1
+        self.mm = mm
+        upper = [list(row) for row in matrix.rows]
+        lower = [[0.] * m1 for _ in range(n)]
+        index = [0] * n
+
+        # shift the first m1 rows left, because these rows have less than m1 values below the main diagonal
+        shift = m1
+        for i in range(min(m1, n)):
+            row = upper[i]
+            for j in range(m1 - i, mm):
+                row[j - shift] = row[j]
+            shift -= 1
+            for j in range(mm - shift - 1, mm):
+                row[j] = 0.
+
+        last = min(m1, n)
+        for k in range(n):
+            pivot = upper[k][0]
+            i = k
+            if last < n:
+                last += 1
+            for j in range(k + 1, last):
+                if abs(upper[j][0]) > abs(pivot):
+                    pivot = upper[j][0]
+                    i = j
+            index[k] = i
+            if pivot == 0.:  # singular matrix, but proceed like Numerical Recipes
+                upper[k][0] = TINY
+            if i != k:
+                upper[k], upper[i] = upper[i], upper[k]
+            row_k = upper[k]
+            pivot = row_k[0]
+            for i in range(k + 1, last):
+                row_i = upper[i]
+                factor = row_i[0] / pivot
+                lower[k][i - k - 1] = factor
+                for j in range(1, mm):
+                    row_i[j - 1] = row_i[j] - factor * row_k[j]
+                row_i[mm - 1] = 0.
+        self.upper = upper
+        self.lower = lower
+        self.index = index
+
+    def solve(self, b: Sequence[Sequence[float]]) -> List[List[float]]:
+        """ Solves ``A x = b`` for a matrix `b` of `n` rows and an arbitrary count of columns, returns `x` as
+        nested lists of `n` rows.
+        """
+        n = self.n
+        mm = self.mm
+        upper = self.upper
+        lower = self.lower
+        x = [list(row) for row in b]
+        if len(x) != n:
+            raise ValueError('Row count of matrices do not match.')
+        if n == 0:
+            return x
+        dim = range(len(x[0]))
+
+        # forward substitution
+        last = min(self.m1, n)
+        for k in range(n):
+            i = self.index[k]
+            if i != k:
+                x[k], x[i] = x[i], x[k]
+            if last < n:
+                last += 1
+            row_k = x[k]
+            factors = lower[k]
+            for j in range(k + 1, last):
+                factor = factors[j - k - 1]
+                if factor != 0.:
+                    row_j = x[j]
+                    for d in dim:
+                        row_j[d] -= factor * row_k[d]
+
+        # backward substitution
+        width = 1
+        for i in range(n - 1, -1, -1):
+            row = upper[i]
+            values = x[i]
+            for k in range(1, width):
+                value = row[k]
+                if value != 0.:
+                    row_k = x[k + i]
+                    for d in dim:
+                        values[d] -= value * row_k[d]
+            pivot = row[0]
+            for d in dim:
+                values[d] /= pivot
+            if width < mm:
+                width += 1
+        return x
+
+
+def banded_solve(matrix: BandedMatrix, b: Sequence[Sequence[float]]) -> List[List[float]]:
+    """
+    Solves the linear equation system ``A x = b`` for the banded matrix `A` and a matrix `b` of `n` rows and an
+    arbitrary count of columns, returns `x` as nested lists of `n` rows.
+
+    Args:
+        matrix: :class:`BandedMatrix`
+        b: right hand side as `n` rows
+
+    """
+    return BandedLU(matrix).solve(b)
+
+
+def tridiagonal_solve(lower: Sequence[float], diag: Sequence[float], upper: Sequence[float],
+                      b: Sequence[Sequence[float]]) -> List[List[float]]:
+    """
+    Solves the tridiagonal linear equation system ``A x = b`` without pivoting, which requires a diagonally dominant
+    or totally positive matrix like a B-spline collocation matrix. Returns `x` as nested lists of `n` rows.
+
+    Args:
+        lower: sub-diagonal values, `lower[i]` is the value at row `i` and column ``i - 1``, `lower[0]` is ignored
+        diag: main diagonal values
+        upper: super-diagonal values, `upper[i]` is the value at row `i` and column ``i + 1``, `upper[-1]` is
+            ignored
+        b: right hand side as `n` rows
+
+    """
+    n = len(diag)
+    x = [list(row) for row in b]
+    if len(x) != n:
+        raise ValueError('Row count of matrices do not match.')
+    if n == 0:
+        return x
+    dim = range(len(x[0]))
+    gamma = [0.] * n
+    beta = diag[0]
+    if beta == 0.:
+        raise ZeroDivisionError('Tridiagonal matrix requires pivoting.')
+    values = x[0]
+    for d in dim:
+        values[d] /= beta
+    for i in range(1, n):
+        gamma[i] = upper[i - 1] / beta
+        beta = diag[i] - lower[i] * gamma[i]
+        if beta == 0.:
+            raise ZeroDivisionError('Tridiagonal matrix requires pivoting.')
+        prev = x[i - 1]
+        values = x[i]
+        factor = lower[i]
+        for d in dim:
+            values[d] = (values[d] - factor * prev[d]) / beta
+    for i in range(n - 2, -1, -1):
+        factor = gamma[i + 1]
+        values = x[i]
+        nxt = x[i + 1]
+        for d in dim:
+            values[d] -= factor * nxt[d]
+    return x
@@ -3,7 +3,9 @@
 # Copyright (c) 2010-2018 Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, List, Iterable, Tuple, Dict
+from array import array
 from ezdxf.math.vector import Vector
+from ezdxf.math.flatten import curve as flatten_curve
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -98,6 +100,19 @@ class Bezier:
         for point_index in range(segments + 1):
             yield self.point(point_index * step)
 
+    def flattening(self, distance: float) -> array:
+        """
+        Approximate `Bézier curve`_ by adaptive subdivision, returns the vertices as flat ``array('d')`` of
+        ``x, y, z`` values, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the curve
+
+        """
+        count = max(len(self._defpoints) - 1, 1)
+        params = [index / count for index in range(count + 1)]
+        return flatten_curve(lambda t: Bezier.point(self, t), params, distance)
+
     def point(self, t: float) -> Vector:
         """
         Returns a point for location `t` at the `Bézier curve`_ as :class:`Vector` object.
@@ -3,6 +3,8 @@
 # Copyright (c) 2010-2018 Manfred Moitzi
 # License: MIT License
 from typing import List, TYPE_CHECKING, Iterable, Sequence
+from array import array
+from ezdxf.math.flatten import curve as flatten_curve
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
@@ -86,6 +88,17 @@ class Bezier4P:
             yield self.point(delta_t * segment)
         yield self._cpoints[3]
 
+    def flattening(self, distance: float) -> array:
+        """
+        Approximate `Bézier curve`_ by adaptive subdivision, returns the vertices as flat ``array('d')`` of
+        ``x, y, z`` values, z-axis is ``0`` for 2D curves, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the curve
+
+        """
+        return flatten_curve(self._get_curve_point, (0., 1. / 3., 2. / 3., 1.), distance)
+
     def _get_curve_point(self, t: float) -> 'Vertex':
         b1, b2, b3, b4 = self._cpoints
         one_minus_t = 1. - t
@@ -221,14 +221,24 @@ rather than normal 3D coordinates.
 
 """
 from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional
+from collections import OrderedDict
+from array import array
 from .vector import Vector, distance
-from .matrix import Matrix
+from .banded import BandedMatrix
+from .deboor import find_span, basis_funcs, basis_funcs_derivatives, basis_table, numpy_basis_table
+from .deboor import weighted_basis_funcs, last_point_basis
+from .flatten import curve as flatten_curve
 from math import pow, isclose
 from ezdxf.lldxf.const import DXFValueError
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
 
+# count of cached basis tables of parameter vectors for each B-spline
+BASIS_CACHE_SIZE = 8
+# minimum count of parameters to evaluate basis tables by NumPy
+NUMPY_THRESHOLD = 32
+
 
 def open_uniform_knot_vector(n: int, order: int) -> List[float]:
     """
@@ -518,14 +528,19 @@ def global_curve_interpolation(fit_points: Sequence['Vertex'],
                                degree: int,
                                t_vector: Iterable[float],
                                knots: Iterable[float]) -> List[Vector]:
-    """ Algorithm: http://pages.mtu.edu/~shene/COURSES/cs3621/NOTES/INT-APP/CURVE-INT-global.html """
-    def create_matrix_N():
-        spline = Basis(knots=knots, order=degree + 1, count=len(fit_points))
-        return Matrix([spline.basis(t) for t in t_vector])
+    """
+    Algorithm: http://pages.mtu.edu/~shene/COURSES/cs3621/NOTES/INT-APP/CURVE-INT-global.html
 
-    matrix_N = create_matrix_N()
-    control_points = matrix_N.gauss_matrix(fit_points)
-    return Vector.list(control_points.rows())
+    The collocation matrix N is banded, only `degree` + 1 basis values of each row are non-zero, therefore the linear
+    equation system is solved by the banded solver :mod:`ezdxf.math.banded` in O(n) instead of O(n³).
+
+    """
+    fit_points = Vector.list(fit_points)
+    spline = Basis(knots=knots, order=degree + 1, count=len(fit_points))
+    first_cols, rows = _sparse_basis_rows(spline, t_vector)
+    matrix_N = BandedMatrix.from_rows(len(fit_points), first_cols, rows)
+    control_points = matrix_N.solve([point.xyz for point in fit_points])
+    return Vector.list(control_points)
 
 
 def global_curve_approximation(fit_points: Iterable['Vertex'],
@@ -554,30 +569,79 @@ def global_curve_approximation(fit_points: Iterable['Vertex'],
     d0 = fit_points[0]
     dn = fit_points[n]
     spline = Basis(knots, order=degree + 1, count=len(fit_points))
-    # matrix_N[0] == row 0
-    matrix_N = [spline.basis(t) for t in t_vector]  # 0 .. n
-
-    def Q(k):
-        ntk = matrix_N[k]
-        return fit_points[k] - d0 * ntk[0] - dn * ntk[h]
-
-    # matrix_Q[0] == row 1
-    matrix_Q = [sum(Q(k) * matrix_N[k][i] for k in range(1, n)) for i in range(1, h)]
-    matrix_N = Matrix([row[1:h] for row in matrix_N[1:-1]])
-    matrix_M = matrix_N.transpose() * matrix_N
-    P = matrix_M.gauss_matrix(matrix_Q)
+    # sparse rows of matrix N: row k has the non-zero basis values of t_vector[k] starting at column first_cols[k]
+    first_cols, matrix_N = _sparse_basis_rows(spline, t_vector)  # 0 .. n
+
+    def N(k, i):
+        j = i - first_cols[k]
+        return matrix_N[k][j] if 0 <= j <= degree else 0.
+
+    # normal equations M P = Q for the inner control points 1 .. h-1, matrix M = N^T N is banded by `degree`
+    size = h - 1
+    matrix_M = BandedMatrix(size, degree, degree)
+    matrix_Q = [Vector() for _ in range(size)]
+    for k in range(1, n):
+        Q = fit_points[k] - d0 * N(k, 0) - dn * N(k, h)
+        cols = [(i - 1, value) for i, value in enumerate(matrix_N[k], start=first_cols[k]) if 0 < i < h]
+        for i, value_i in cols:
+            matrix_Q[i] += Q * value_i
+            for j, value_j in cols:
+                matrix_M.add(i, j, value_i * value_j)
+    P = matrix_M.solve([q.xyz for q in matrix_Q])
     control_points = [d0]
-    control_points.extend(Vector.generate(P.rows()))
+    control_points.extend(Vector.generate(P))
     control_points.append(dn)
     return control_points
 
 
+def _sparse_basis_rows(basis: 'Basis', t_vector: Iterable[float]) -> Tuple[List[int], List[List[float]]]:
+    """ Returns the column index of the first non-zero basis value and the non-zero basis values for each parameter
+    of `t_vector` as Python lists.
+    """
+    spans, table = basis.basis_table(t_vector)
+    if not isinstance(table, list):  # NumPy arrays
+        spans = spans.tolist()
+        table = table.tolist()
+    offset = basis.order - 1
+    return [span - offset for span in spans], table
+
+
 class Basis:
+    """
+    B-spline basis functions, only the non-zero basis functions of the knot span of a parameter are evaluated, see
+    :mod:`ezdxf.math.deboor`. The basis values of parameter vectors are cached by :meth:`basis_table`, changing
+    :attr:`knots` or :attr:`count` clears the cache.
+
+    """
+
     def __init__(self, knots: Iterable[float], order: int, count: int, weights: Sequence[float] = None):
-        self.knots = list(knots)  # type: List[float]
+        self._knots = list(knots)  # type: List[float]
         self.order = order  # type: int
-        self.count = count  # type: int
+        self._count = count  # type: int
         self.weights = weights  # type: Optional[Sequence[float]]
+        self._tables = OrderedDict()  # type: OrderedDict
+
+    @property
+    def knots(self) -> List[float]:
+        return self._knots
+
+    @knots.setter
+    def knots(self, knots: Iterable[float]) -> None:
+        self._knots = list(knots)
+        self.clear_cache()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @count.setter
+    def count(self, count: int) -> None:
+        self._count = count
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """ Clear cached basis tables, required after inplace modifications of :attr:`knots`. """
+        self._tables.clear()
 
     @property
     def max_t(self) -> float:
@@ -587,88 +651,146 @@ class Basis:
     def nplusc(self) -> int:
         return self.count + self.order
 
-    def create_nbasis(self, t: float) -> List[float]:
+    def span(self, t: float) -> int:
+        """ Returns the knot span index of parameter `t`. """
+        return find_span(self.knots, self.count, t)
+
+    def basis_funcs(self, t: float) -> Tuple[int, List[float]]:
+        """ Returns the knot span index of parameter `t` and the `order` non-zero basis values
+        ``N[span - order + 1] ... N[span]``.
         """
-        Calculate the first order basis functions N[i][1]
+        if t >= self.max_t or isclose(t, self.max_t):  # pick up last point
+            span = self.count - 1
+            nbasis = last_point_basis(self.order)
+        else:
+            span = self.span(t)
+            nbasis = basis_funcs(self.knots, span, self.order, t)
+        if self.weights is not None:
+            nbasis = weighted_basis_funcs(nbasis, self._span_weights(span))
+        return span, nbasis
 
-        Returns: list of basis values
+    def basis(self, t: float) -> List[float]:
+        """ Returns the full basis vector of all `count` basis values at parameter `t`. """
+        span, nbasis = self.basis_funcs(t)
+        return self._dense(span, nbasis)
 
+    def basis_table(self, t_vector: Iterable[float]):
         """
-        return [1. if k1 <= t < k2 else 0. for k1, k2 in zip(self.knots, self.knots[1:])]
+        Returns the knot spans and the non-zero basis values for all parameters in `t_vector`, as lists or as NumPy
+        arrays of shape ``(m, )`` and ``(m, order)`` for `m` parameters if NumPy is available. The result is cached
+        for repeated parameter vectors.
 
-    def basis(self, t: float) -> List[float]:
-        knots = self.knots
-        nbasis = self.create_nbasis(t)
-        # calculate the higher order basis functions
-        for k in range(2, self.order + 1):
-            for i in range(self.nplusc - k):
-                d = ((t - knots[i]) * nbasis[i]) / (knots[i + k - 1] - knots[i]) if nbasis[i] != 0. else 0.
-                e = ((knots[i + k] - t) * nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if nbasis[i + 1] != 0. else 0.
-                nbasis[i] = d + e
-        if isclose(t, self.max_t):  # pick up last point
-            nbasis[self.count - 1] = 1.
-        if self.weights is None:
-            return nbasis[:self.count]
+        """
+        key = tuple(self.max_t if isclose(t, self.max_t) else t for t in t_vector)
+        try:
+            table = self._tables[key]
+        except KeyError:
+            table = self._create_table(key)
+            self._tables[key] = table
+            if len(self._tables) > BASIS_CACHE_SIZE:
+                self._tables.popitem(last=False)
         else:
-            return self.weighting(nbasis[:self.count])
-
-    def weighting(self, nbasis: Iterable[float]) -> List[float]:
-        products = [nb * w for nb, w in zip(nbasis, self.weights)]
-        s = sum(products)
-        return [0.0] * self.count if s == 0.0 else [p / s for p in products]
+            self._tables.move_to_end(key)
+        return table
+
+    def _create_table(self, t_vector: Sequence[float]):
+        from ezdxf.lldxf.packedtags import numpy_module  # circular import
+        np = numpy_module(optional=True)
+        if np is not None and len(t_vector) >= NUMPY_THRESHOLD:
+            spans, table = numpy_basis_table(np, self.knots, self.count, self.order, t_vector)
+            if self.weights is not None:
+                # zero weights for not existing control points in front and beyond the valid range
+                weights = np.zeros(self.count + 2 * self.order)
+                weights[self.order:self.order + self.count] = self.weights[:self.count]
+                table = table * weights[spans[:, None] + 1 + np.arange(self.order)]
+                s = table.sum(axis=1)[:, None]
+                table = np.divide(table, s, out=np.zeros_like(table), where=s != 0.)
+            return spans, table
+        spans, table = basis_table(self.knots, self.count, self.order, t_vector)
+        if self.weights is not None:
+            table = [weighted_basis_funcs(nbasis, self._span_weights(span)) for span, nbasis in zip(spans, table)]
+        return spans, table
+
+    def _span_weights(self, span: int) -> List[float]:
+        first = span - self.order + 1
+        weights = self.weights
+        return [weights[i] if 0 <= i < self.count else 0. for i in range(first, span + 1)]
+
+    def _dense(self, span: int, nbasis: Sequence[float]) -> List[float]:
+        count = self.count
+        basis = [0.] * count
+        for i, value in enumerate(nbasis, start=span - self.order + 1):
+            if 0 <= i < count:
+                basis[i] = value
+        return basis
 
 
 class DBasis(Basis):
+    def basis_funcs_derivatives(self, t: float) -> Tuple[int, List[float], List[float], List[float]]:
+        """ Returns the knot span index of parameter `t`, the `order` non-zero basis values
+        ``N[span - order + 1] ... N[span]`` and their 1st and 2nd derivatives.
+        """
+        if isclose(t, self.max_t):
+            t = self.max_t
+        span = self.span(t)
+        nbasis, d1nbasis, d2nbasis = basis_funcs_derivatives(self.knots, span, self.order, t)
+        if self.weights is not None:
+            nbasis, d1nbasis, d2nbasis = self._rational_derivatives(span, nbasis, d1nbasis, d2nbasis)
+        return span, nbasis, d1nbasis, d2nbasis
+
     def basis(self, t: float) -> Tuple[List[float], List[float], List[float]]:
-        knots = self.knots
-        nbasis = self.create_nbasis2(t)
-        d1nbasis = [0.] * self.nplusc
-        d2nbasis = d1nbasis[:]
-
-        for k in range(2, self.order + 1):
-            for i in range(self.nplusc - k):
-                # calculate basis functions
-                b1 = ((t - knots[i]) * nbasis[i]) / (knots[i + k - 1] - knots[i]) if nbasis[i] != 0. else 0.
-                b2 = ((knots[i + k] - t) * nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if nbasis[i + 1] != 0. else 0.
-
-                # calculate first derivative
-                f1 = nbasis[i] / (knots[i + k - 1] - knots[i]) if nbasis[i] != 0. else 0.
-                f2 = -nbasis[i + 1] / (knots[i + k] - knots[i + 1]) if nbasis[i + 1] != 0. else 0.
-                f3 = ((t - knots[i]) * d1nbasis[i]) / (knots[i + k - 1] - knots[i]) if d1nbasis[i] != 0. else 0.
-                f4 = ((knots[i + k] - t) * d1nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if d1nbasis[
-                                                                                                   i + 1] != 0. else 0.
-
-                # calculate second derivative
-                s1 = (2 * d1nbasis[i]) / (knots[i + k - 1] - knots[i]) if d1nbasis[i] != 0. else 0.
-                s2 = (-2 * d1nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if d1nbasis[i + 1] != 0. else 0.
-                s3 = ((t - knots[i]) * d2nbasis[i]) / (knots[i + k - 1] - knots[i]) if d2nbasis[i] != 0. else 0.
-                s4 = ((knots[i + k] - t) * d2nbasis[i + 1]) / (knots[i + k] - knots[i + 1]) if d2nbasis[
-                                                                                                   i + 1] != 0. else 0.
-
-                nbasis[i] = b1 + b2
-                d1nbasis[i] = f1 + f2 + f3 + f4
-                d2nbasis[i] = s1 + s2 + s3 + s4
+        span, nbasis, d1nbasis, d2nbasis = self.basis_funcs_derivatives(t)
+        return self._dense(span, nbasis), self._dense(span, d1nbasis), self._dense(span, d2nbasis)
 
-        count = self.count
-        if self.weights is None:
-            return nbasis[:count], d1nbasis[:count], d2nbasis[:count]
-        else:
-            self.weighting(nbasis[:count]), self.weighting(d1nbasis[:count]), self.weighting(d2nbasis[:count])
+    def basis_table(self, t_vector: Iterable[float]):
+        """
+        Returns the knot spans, the non-zero basis values and their 1st and 2nd derivatives for all parameters in
+        `t_vector` as tuple of lists, the result is cached for repeated parameter vectors.
 
-    def create_nbasis2(self, t: float) -> List[float]:
-        nbasis = self.create_nbasis(t)
-        if isclose(t, self.max_t):
-            nbasis[self.count - 1] = 1.
-        return nbasis
+        """
+        key = tuple(t_vector)
+        try:
+            table = self._tables[key]
+        except KeyError:
+            table = list(zip(*(self.basis_funcs_derivatives(t) for t in key))) or [[], [], [], []]
+            self._tables[key] = table
+            if len(self._tables) > BASIS_CACHE_SIZE:
+                self._tables.popitem(last=False)
+        else:
+            self._tables.move_to_end(key)
+        return table
+
+    def _rational_derivatives(self, span: int, nbasis: List[float], d1nbasis: List[float], d2nbasis: List[float]):
+        # quotient rule for R[i] = N[i] * w[i] / W, W = sum(N[j] * w[j])
+        weights = self._span_weights(span)
+        w0 = sum(n * w for n, w in zip(nbasis, weights))
+        if w0 == 0.:
+            zeros = [0.] * len(nbasis)
+            return zeros, zeros[:], zeros[:]
+        w1 = sum(n * w for n, w in zip(d1nbasis, weights))
+        w2 = sum(n * w for n, w in zip(d2nbasis, weights))
+        r0 = [n * w / w0 for n, w in zip(nbasis, weights)]
+        r1 = [(n * w - r * w1) / w0 for n, w, r in zip(d1nbasis, weights, r0)]
+        r2 = [(n * w - 2. * d * w1 - r * w2) / w0 for n, w, d, r in zip(d2nbasis, weights, r1, r0)]
+        return r0, r1, r2
 
 
 class DBasisU(DBasis):
-    def create_nbasis2(self, t: float) -> List[float]:
-        nbasis = self.create_nbasis(t)
+    """ Basis functions and derivatives of uniform B-splines, the parameter at the end of the valid range
+    ``knots[count]`` is located in the last knot span ``count - 1`` of the valid range and not in the following knot
+    span, which is important for the derivatives at the end of the curve.
+    """
+
+    def span(self, t: float) -> int:
         if isclose(t, self.knots[self.count]):
-            nbasis[self.count - 1] = 1.
-            nbasis[self.count] = 0.
-        return nbasis
+            return self.count - 1
+        return super().span(t)
+
+    def basis_funcs_derivatives(self, t: float) -> Tuple[int, List[float], List[float], List[float]]:
+        if t >= self.max_t or isclose(t, self.max_t):  # the last knot is not part of any knot span
+            zeros = [0.] * self.order
+            return self.count - 1, zeros, zeros[:], zeros[:]
+        return super().basis_funcs_derivatives(t)
 
 
 class BSpline:
@@ -740,8 +862,26 @@ class BSpline:
         segments + 1.
         """
         step = self.step_size(segments)
-        for point_index in range(segments + 1):
-            yield self.point(point_index * step)
+        return iter(self.points(point_index * step for point_index in range(segments + 1)))
+
+    def flattening(self, distance: float) -> array:
+        """
+        Approximates the whole B-spline by adaptive subdivision, the max. distance of the line segments to the curve
+        is `distance`, returns the vertices as flat ``array('d')`` of ``x, y, z`` values,
+        see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            distance: max. distance of the line segments to the curve
+
+        """
+        knots = self.knot_values()
+        start = knots[self.order - 1]
+        end = knots[self.count]
+        params = sorted(set(knot for knot in knots if start <= knot <= end))
+        if self.degree > 1:  # knot spans of curved B-splines can have an inflection point
+            params.extend((t0 + t1) * .5 for t0, t1 in zip(params, params[1:]))
+            params.sort()
+        return flatten_curve(lambda t: BSpline.point(self, t), params, distance)
 
     def point(self, t: float) -> Vector:
         """
@@ -753,14 +893,52 @@ class BSpline:
         Returns: Vector(x, y, z)
 
         """
-        if isclose(t, self.max_t):
-            t = self.max_t
-
+        span, nbasis = self.basis.basis_funcs(t)
         p = Vector()
-        for control_point, basis in zip(self.control_points, self.basis_values(t)):
+        for control_point, basis in zip(*self._span_values(span, nbasis)):
             p += control_point * basis
         return p
 
+    def points(self, t: Iterable[float]) -> List[Vector]:
+        """
+        Returns the points for all parameters `t` at once, the basis values of repeated parameter vectors are cached
+        and NumPy is used for many parameters if available.
+
+        Args:
+            t: iterable of parameters in range [0, max_t]
+
+        """
+        spans, table = self.basis.basis_table(t)
+        if not isinstance(table, list):  # NumPy arrays
+            return self._numpy_points(spans, table)
+        points = []
+        for span, nbasis in zip(spans, table):
+            p = Vector()
+            for control_point, basis in zip(*self._span_values(span, nbasis)):
+                p += control_point * basis
+            points.append(p)
+        return points
+
+    def _span_values(self, span: int, *values: Sequence[float]) -> Tuple[Sequence[Vector], ...]:
+        # control points of knot span and the associated sparse basis values, there are no control points in front
+        # of the valid parameter range
+        first = span - self.order + 1
+        if first < 0:
+            return (self.control_points[:span + 1],) + tuple(v[-first:] for v in values)
+        return (self.control_points[first:span + 1],) + values
+
+    def _numpy_points(self, spans, table) -> List[Vector]:
+        from ezdxf.lldxf.packedtags import numpy_module  # circular import
+        np = numpy_module(optional=True)
+        control_points = np.array([v.xyz for v in self.control_points])
+        indices = spans[:, None] - self.order + 1 + np.arange(self.order)
+        # not existing control points in front of the valid range have basis value 0, basis values of not existing
+        # control points beyond the valid range of uniform B-splines are ignored
+        count = self.count
+        table = np.where(indices < count, table, 0.)
+        points = np.einsum('ij,ijk->ik', table, control_points[np.clip(indices, 0, count - 1)])
+        return [Vector(x, y, z) for x, y, z in points.tolist()]
+
     def insert_knot(self, t: float) -> None:
         """
         Insert additional knot, without altering the curve shape.
@@ -851,17 +1029,29 @@ class DerivativePoint:  # Mixin
             t: parameter in range [0, max_t]
 
         """
-        if isclose(self.max_t, t):
-            t = self.max_t
+        span, nbasis, d1nbasis, d2nbasis = self.basis.basis_funcs_derivatives(t)
+        return self._derivative_point(span, nbasis, d1nbasis, d2nbasis)
+
+    def points(self, t: Iterable[float]) -> List[Tuple[Vector, Vector, Vector]]:
+        """
+        Returns point, 1st and 2nd derivative for all parameters `t` at once as list of tuples (p, d1, d2), the basis
+        values of repeated parameter vectors are cached.
+
+        Args:
+            t: iterable of parameters in range [0, max_t]
+
+        """
+        return [self._derivative_point(*values) for values in zip(*self.basis.basis_table(t))]
 
-        nbasis, d1nbasis, d2nbasis = self.basis_values(t)
+    def _derivative_point(self, span: int, nbasis: List[float], d1nbasis: List[float],
+                          d2nbasis: List[float]) -> Tuple[Vector, Vector, Vector]:
         point = Vector()
         d1 = Vector()
         d2 = Vector()
-        for i, control_point in enumerate(self.control_points):
-            point += control_point * nbasis[i]
-            d1 += control_point * d1nbasis[i]
-            d2 += control_point * d2nbasis[i]
+        for control_point, n0, n1, n2 in zip(*self._span_values(span, nbasis, d1nbasis, d2nbasis)):
+            point += control_point * n0
+            d1 += control_point * n1
+            d2 += control_point * n2
         return point, d1, d2
 
 
@@ -0,0 +1,201 @@
+# Purpose: sparse evaluation of B-spline basis functions
+# Created: 2019-12-16
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+Sparse B-spline Evaluation
+==========================
+
+For a parameter t in the knot span [knots[span], knots[span + 1]) only the `order` basis functions
+N[span - order + 1] ... N[span] are non-zero. The functions of this module find the knot span by binary search and
+evaluate only the triangle of non-zero basis functions by the Cox-de Boor recursion, which costs O(order²) instead of
+O(count * order) for the full basis vector.
+
+The recursion uses the same arithmetic as the dense implementation of :class:`ezdxf.math.bspline.Basis`, results
+are equal, not only close.
+
+"""
+from typing import List, Sequence, Tuple, Iterable
+from bisect import bisect_right, bisect_left
+
+__all__ = ['find_span', 'basis_funcs', 'basis_funcs_derivatives', 'basis_table', 'numpy_basis_table',
+           'weighted_basis_funcs', 'last_point_basis']
+
+
+def find_span(knots: Sequence[float], count: int, t: float) -> int:
+    """
+    Returns the index of the knot span ``knots[span] <= t < knots[span + 1]`` for parameter `t` by binary search.
+    Parameters at or beyond the last knot are located in the last not empty knot span, which is the last span
+    ``count - 1`` of the valid range for clamped knot vectors. The spans of uniform knot vectors beyond the valid
+    range ``knots[count]`` are not clamped, the basis values of these spans are equal to the dense implementation.
+
+    Args:
+        knots: knot vector
+        count: count of control points
+        t: parameter
+
+    """
+    span = bisect_right(knots, t) - 1
+    last = bisect_left(knots, knots[-1]) - 1
+    if span > last:
+        return last
+    return max(span, 0)
+
+
+def basis_funcs(knots: Sequence[float], span: int, order: int, t: float) -> List[float]:
+    """
+    Returns the `order` non-zero basis values ``N[span - order + 1] ... N[span]`` at parameter `t`.
+
+    Args:
+        knots: knot vector
+        span: knot span index of `t`, see :func:`find_span`
+        order: order of B-spline
+        t: parameter
+
+    """
+    first = span - order + 1
+    last = len(knots) - 1
+    nbasis = [0.] * (order - 1) + [1.]
+    for k in range(2, order + 1):
+        for j in range(order - k, order):
+            i = first + j
+            if i < 0 or i + k > last:  # not existing basis functions
+                continue
+            n0 = nbasis[j]
+            n1 = nbasis[j + 1] if j + 1 < order else 0.
+            d = ((t - knots[i]) * n0) / (knots[i + k - 1] - knots[i]) if n0 != 0. else 0.
+            e = ((knots[i + k] - t) * n1) / (knots[i + k] - knots[i + 1]) if n1 != 0. else 0.
+            nbasis[j] = d + e
+    return nbasis
+
+
+def basis_funcs_derivatives(knots: Sequence[float], span: int, order: int,
+                            t: float) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Returns the `order` non-zero basis values ``N[span - order + 1] ... N[span]`` at parameter `t` and their 1st and
+    2nd derivatives as tuple of three lists.
+
+    Args:
+        knots: knot vector
+        span: knot span index of `t`, see :func:`find_span`
+        order: order of B-spline
+        t: parameter
+
+    """
+    first = span - order + 1
+    last_knot = len(knots) - 1
+    nbasis = [0.] * (order - 1) + [1.]
+    d1nbasis = [0.] * order
+    d2nbasis = [0.] * order
+    for k in range(2, order + 1):
+        for j in range(order - k, order):
+            i = first + j
+            if i < 0 or i + k > last_knot:  # not existing basis functions
+                continue
+            last = j + 1 == order
+            n0 = nbasis[j]
+            n1 = 0. if last else nbasis[j + 1]
+            d10 = d1nbasis[j]
+            d11 = 0. if last else d1nbasis[j + 1]
+            d20 = d2nbasis[j]
+            d21 = 0. if last else d2nbasis[j + 1]
+            den0 = knots[i + k - 1] - knots[i]
+            den1 = knots[i + k] - knots[i + 1]
+
+            # basis functions
+            b1 = ((t - knots[i]) * n0) / den0 if n0 != 0. else 0.
+            b2 = ((knots[i + k] - t) * n1) / den1 if n1 != 0. else 0.
+
+            # first derivative
+            f1 = n0 / den0 if n0 != 0. else 0.
+            f2 = -n1 / den1 if n1 != 0. else 0.
+            f3 = ((t - knots[i]) * d10) / den0 if d10 != 0. else 0.
+            f4 = ((knots[i + k] - t) * d11) / den1 if d11 != 0. else 0.
+
+            # second derivative
+            s1 = (2 * d10) / den0 if d10 != 0. else 0.
+            s2 = (-2 * d11) / den1 if d11 != 0. else 0.
+            s3 = ((t - knots[i]) * d20) / den0 if d20 != 0. else 0.
+            s4 = ((knots[i + k] - t) * d21) / den1 if d21 != 0. else 0.
+
+            nbasis[j] = b1 + b2
+            d1nbasis[j] = f1 + f2 + f3 + f4
+            d2nbasis[j] = s1 + s2 + s3 + s4
+    return nbasis, d1nbasis, d2nbasis
+
+
+def weighted_basis_funcs(nbasis: Sequence[float], weights: Sequence[float]) -> List[float]:
+    """ Returns the rational basis values for the non-zero basis values `nbasis` and the associated `weights`. """
+    products = [nb * w for nb, w in zip(nbasis, weights)]
+    s = sum(products)
+    return [0.0] * len(products) if s == 0.0 else [p / s for p in products]
+
+
+def basis_table(knots: Sequence[float], count: int, order: int,
+                t_vector: Iterable[float]) -> Tuple[List[int], List[List[float]]]:
+    """
+    Returns the knot spans and the non-zero basis values for all parameters in `t_vector` as tuple of two lists.
+
+    Args:
+        knots: knot vector
+        count: count of control points
+        order: order of B-spline
+        t_vector: parameters
+
+    """
+    spans = []
+    table = []
+    max_t = knots[-1]
+    for t in t_vector:
+        if t >= max_t:
+            spans.append(count - 1)
+            table.append(last_point_basis(order))
+            continue
+        span = find_span(knots, count, t)
+        spans.append(span)
+        table.append(basis_funcs(knots, span, order, t))
+    return spans, table
+
+
+def last_point_basis(order: int) -> List[float]:
+    """ Returns the non-zero basis values of the knot span ``count - 1`` for parameters at the last knot, the
+    B-spline at the last knot is the last control point.
+    """
+    return [0.] * (order - 1) + [1.]
+
+
+def numpy_basis_table(np, knots: Sequence[float], count: int, order: int, t_vector: Sequence[float]):
+    """
+    Returns the knot spans as NumPy array of shape ``(m, )`` and the non-zero basis values as NumPy array of shape
+    ``(m, order)`` for all `m` parameters in `t_vector`, the recursion is evaluated for all parameters at once.
+
+    Args:
+        np: NumPy module
+        knots: knot vector
+        count: count of control points
+        order: order of B-spline
+        t_vector: parameters
+
+    """
+    knots = np.asarray(knots, dtype=float)
+    t = np.asarray(t_vector, dtype=float)
+    last = len(knots) - 1
+    spans = np.clip(np.searchsorted(knots, t, side='right') - 1, 0, np.searchsorted(knots, knots[-1]) - 1)
+    nbasis = np.zeros((len(t), order))
+    nbasis[:, -1] = 1.
+    first = spans - order + 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for k in range(2, order + 1):
+            for j in range(order - k, order):
+                i = first + j
+                valid = (i >= 0) & (i + k <= last)
+                i = np.where(valid, i, 0)
+                n0 = nbasis[:, j]
+                n1 = nbasis[:, j + 1] if j + 1 < order else np.zeros(len(t))
+                d = np.where(n0 != 0., ((t - knots[i]) * n0) / (knots[i + k - 1] - knots[i]), 0.)
+                e = np.where(n1 != 0., ((knots[i + k] - t) * n1) / (knots[i + k] - knots[i + 1]), 0.)
+                nbasis[:, j] = np.where(valid, d + e, n0)
+    at_last_knot = t >= knots[-1]
+    spans[at_last_knot] = count - 1
+    nbasis[at_last_knot] = last_point_basis(order)
+    return spans, nbasis
@@ -1,8 +1,11 @@
 # Created: 26.03.2010
 # License: MIT License
 from typing import Dict, Iterable
+from array import array
+import math
 from ezdxf.math import Vector
 from ezdxf.math.bspline import bspline_control_frame, BSpline
+from ezdxf.math.flatten import curve as flatten_curve
 
 
 class EulerSpiral:
@@ -75,6 +78,22 @@ class EulerSpiral:
         for index in range(1, segments + 1):
             yield self.point(delta_l * index)
 
+    def flattening(self, length: float, distance: float) -> array:
+        """
+        Approximate curve of `length` by adaptive subdivision, returns the vertices as flat ``array('d')`` of
+        ``x, y, z`` values, see :mod:`ezdxf.math.flatten`.
+
+        Args:
+            length: length of euler spiral
+            distance: max. distance of the line segments to the curve
+
+        """
+        # tangent angle at distance t is t² / (2 * curvature²), start intervals of not more than 90 degrees
+        turn = length ** 2 / (2. * self.curvature_powers[2])
+        count = max(int(math.ceil(turn / (math.pi / 2.))), 1)
+        params = [length * index / count for index in range(count + 1)]
+        return flatten_curve(self.point, params, distance)
+
     def circle_center(self, t: float) -> Vector:
         """
         Get circle center at distance `t`.
@@ -0,0 +1,277 @@
+# Purpose: adaptive flattening of curves
+# Created: 2019-12-18
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+Adaptive Curve Flattening
+=========================
+
+Curves are approximated by polylines, the `distance` argument is the maximum chord height (sagitta), the maximum
+distance of a polyline segment to the curve. The vertex count scales with the curvature: big gentle curves get
+few vertices, tight curves get many vertices.
+
+Circular arcs are flattened analytically, all other curves by adaptive subdivision of the parameter range:
+a segment is split into three segments as long as one of the curve points at 1/3 and 2/3 of the parameter interval
+is farther than `distance` from the segment. Each start interval is split at least once, because a sharp turn close
+to the end of an interval can be missed by the two test points.
+
+All functions return the vertices as compact ``array('d')`` of ``x, y, z`` values, use :func:`vertices` to
+iterate over the vertices as :class:`~ezdxf.math.Vector` objects.
+
+"""
+from typing import TYPE_CHECKING, Callable, Sequence, Iterable, List
+from array import array
+import math
+from .vector import Vector, Vec2
+from .ucs import OCS
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['vertices', 'curve', 'segment_count', 'arc', 'circle', 'ellipse', 'bulge', 'polyline', 'ocs_to_wcs']
+
+# maximum subdivision depth of a start interval: max. 3^MAX_LEVEL segments
+MAX_LEVEL = 10
+TAU = math.pi * 2.
+# the chord height of a parabolic segment at 1/3 and 2/3 of the parameter interval is 8/9 of the max. chord height
+HEIGHT_FACTOR = 9. / 8.
+
+
+def vertices(values: Sequence[float]) -> Iterable[Vector]:
+    """ Yields the vertices of a flat ``array('d')`` of ``x, y, z`` values as :class:`~ezdxf.math.Vector`
+    objects.
+    """
+    it = iter(values)
+    for x, y, z in zip(it, it, it):
+        yield Vector(x, y, z)
+
+
+def _check_distance(distance: float) -> None:
+    if distance <= 0.:
+        raise ValueError('Argument distance has to be > 0.')
+
+
+def _segment_distance(start: Vector, end: Vector, point: Vector) -> float:
+    # distance to the chord segment and not to the infinite chord line, a curve which turns sharply inside the
+    # interval can pass the ends of a short chord, close to the extension of the chord line
+    chord = end - start
+    length2 = chord.dot(chord)
+    if length2 < 1e-24:
+        return point.distance(start)
+    t = min(max((point - start).dot(chord) / length2, 0.), 1.)
+    return point.distance(start + chord * t)
+
+
+def curve(point: Callable[[float], 'Vertex'], params: Sequence[float], distance: float) -> array:
+    """
+    Returns the flattened curve defined by the parametric function `point`. Each interval of the sorted start
+    parameters `params` is subdivided into three segments as long as the curve point at 1/3 or at 2/3 of the
+    parameter interval is farther than `distance` from the chord segment of the interval, the evaluated curve points
+    are reused as vertices of the subdivided segments. Each start interval is subdivided at least once.
+
+    The start parameters should split the curve into segments with a turn of not more than 90 degrees, because
+    two test points can't detect all deviations of longer segments.
+
+    Args:
+        point: function which returns the curve point as ``(x, y[, z])`` tuple for a parameter
+        params: sorted start parameters, at least 2 values
+        distance: max. distance of the polyline segments to the curve
+
+    """
+    _check_distance(distance)
+    result = array('d')
+    extend = result.extend
+    t0 = params[0]
+    p0 = Vector(point(t0))
+    extend(p0.xyz)
+    for t1 in params[1:]:
+        p1 = Vector(point(t1))
+        stack = [(t0, p0, t1, p1, 0)]
+        while stack:
+            start_t, start, end_t, end, level = stack.pop()
+            delta = (end_t - start_t) / 3.
+            t_a = start_t + delta
+            t_b = end_t - delta
+            a = Vector(point(t_a))
+            b = Vector(point(t_b))
+            height = max(_segment_distance(start, end, a), _segment_distance(start, end, b)) * HEIGHT_FACTOR
+            if level < MAX_LEVEL and (height > distance or level == 0):  # split start intervals at least once
+                level += 1
+                stack.append((t_b, b, end_t, end, level))
+                stack.append((t_a, a, t_b, b, level))
+                stack.append((start_t, start, t_a, a, level))
+            else:
+                extend(end.xyz)
+        t0 = t1
+        p0 = p1
+    return result
+
+
+def segment_count(radius: float, sweep_angle: float, distance: float) -> int:
+    """
+    Returns the count of polyline segments to approximate a circular arc with a chord height of not more than
+    `distance`.
+
+    Args:
+        radius: arc radius
+        sweep_angle: arc angle in radians
+        distance: max. distance of the polyline segments to the arc
+
+    """
+    _check_distance(distance)
+    radius = abs(radius)
+    if distance >= radius:
+        max_angle = math.pi
+    else:
+        max_angle = 2. * math.acos(1. - distance / radius)
+    return max(int(math.ceil(abs(sweep_angle) / max_angle)), 1)
+
+
+def _arc(center: 'Vertex', radius: float, start: float, sweep: float, distance: float) -> array:
+    cx, cy, cz = Vector(center).xyz
+    count = segment_count(radius, sweep, distance)
+    delta = sweep / count
+    result = array('d')
+    extend = result.extend
+    for index in range(count + 1):
+        angle = start + delta * index
+        extend((cx + math.cos(angle) * radius, cy + math.sin(angle) * radius, cz))
+    return result
+
+
+def arc(center: 'Vertex', radius: float, start_angle: float, end_angle: float, distance: float) -> array:
+    """
+    Returns the flattened counter clockwise circular arc in the xy-plane of `center`.
+
+    Args:
+        center: arc center as ``(x, y[, z])`` tuple
+        radius: arc radius
+        start_angle: start angle in degrees
+        end_angle: end angle in degrees
+        distance: max. distance of the polyline segments to the arc
+
+    """
+    sweep = (end_angle - start_angle) % 360.
+    if math.isclose(sweep, 0., abs_tol=1e-12) and not math.isclose(start_angle, end_angle, abs_tol=1e-12):
+        sweep = 360.
+    return _arc(center, radius, math.radians(start_angle), math.radians(sweep), distance)
+
+
+def circle(center: 'Vertex', radius: float, distance: float) -> array:
+    """
+    Returns the flattened circle in the xy-plane of `center`, first and last vertex are equal.
+
+    Args:
+        center: circle center as ``(x, y[, z])`` tuple
+        radius: circle radius
+        distance: max. distance of the polyline segments to the circle
+
+    """
+    return _arc(center, radius, 0., TAU, distance)
+
+
+def ellipse(center: 'Vertex', major_axis: 'Vertex', ratio: float, start_param: float, end_param: float,
+            extrusion: 'Vertex', distance: float) -> array:
+    """
+    Returns the flattened ellipse in :ref:`WCS`, arguments like the DXF attributes of the
+    :class:`~ezdxf.entities.Ellipse` entity.
+
+    Args:
+        center: ellipse center in :ref:`WCS`
+        major_axis: major axis vector in :ref:`WCS`
+        ratio: ratio of minor axis to major axis
+        start_param: start parameter in radians
+        end_param: end parameter in radians
+        extrusion: normal vector of the ellipse plane
+        distance: max. distance of the polyline segments to the ellipse
+
+    """
+    center = Vector(center)
+    major_axis = Vector(major_axis)
+    minor_axis = Vector(extrusion).cross(major_axis).normalize(major_axis.magnitude * ratio)
+    sweep = (end_param - start_param) % TAU
+    if math.isclose(sweep, 0., abs_tol=1e-12):
+        sweep = TAU
+
+    def point(param: float) -> Vector:
+        return center + major_axis * math.cos(param) + minor_axis * math.sin(param)
+
+    # start intervals of not more than 90 degrees
+    count = max(int(math.ceil(sweep / (math.pi / 2.))), 1)
+    params = [start_param + sweep * index / count for index in range(count + 1)]
+    return curve(point, params, distance)
+
+
+def bulge(start: 'Vertex', end: 'Vertex', bulge: float, distance: float, elevation: float = 0.) -> array:
+    """
+    Returns the flattened bulge segment from `start` to `end` in the xy-plane at z-axis `elevation`, first vertex is
+    `start` and last vertex is `end`.
+
+    Args:
+        start: start point as ``(x, y)`` tuple
+        end: end point as ``(x, y)`` tuple
+        bulge: bulge value, ``0`` for a straight line segment
+        distance: max. distance of the polyline segments to the arc
+        elevation: z-axis value of all vertices
+
+    """
+    start = Vec2(start)
+    end = Vec2(end)
+    if bulge == 0. or start.isclose(end):
+        return array('d', (start.x, start.y, elevation, end.x, end.y, elevation))
+    sweep = 4. * math.atan(bulge)  # signed arc angle, negative for clockwise arcs
+    chord = end - start
+    radius = chord.magnitude / (2. * abs(math.sin(sweep / 2.)))
+    # center is located left of the chord for counter clockwise arcs
+    normal = chord.orthogonal(ccw=True).normalize()
+    center = start + chord * .5 + normal * (radius * math.cos(sweep / 2.) * (1. if sweep > 0. else -1.))
+    start_angle = (start - center).angle
+    result = _arc((center.x, center.y, elevation), radius, start_angle, sweep, distance)
+    # set exact start- and end point
+    result[0:2] = array('d', (start.x, start.y))
+    result[-3:-1] = array('d', (end.x, end.y))
+    return result
+
+
+def polyline(points: Iterable[Sequence[float]], distance: float, closed: bool = False,
+             elevation: float = 0.) -> array:
+    """
+    Returns the flattened 2D polyline in the xy-plane at z-axis `elevation`, bulge segments are flattened by
+    :func:`bulge`.
+
+    Args:
+        points: polyline points as ``(x, y, bulge)`` tuples, the bulge value defines the segment to the next point
+        distance: max. distance of the polyline segments to the arcs
+        closed: ``True`` for a closed polyline
+        elevation: z-axis value of all vertices
+
+    """
+    points = list(points)  # type: List[Sequence[float]]
+    result = array('d')
+    if not points:
+        return result
+    if closed:
+        points.append(points[0])
+    x, y, b = points[0]
+    result.extend((x, y, elevation))
+    for x2, y2, b2 in points[1:]:
+        if b == 0.:
+            result.extend((x2, y2, elevation))
+        else:
+            result.extend(bulge((x, y), (x2, y2), b, distance, elevation)[3:])
+        x, y, b = x2, y2, b2
+    return result
+
+
+def ocs_to_wcs(values: array, ocs: OCS) -> array:
+    """ Returns the vertices `values` from `ocs` transformed into :ref:`WCS`, returns `values` unchanged if no
+    transformation is required.
+    """
+    if not ocs.transform:
+        return values
+    result = array('d')
+    extend = result.extend
+    to_wcs = ocs.to_wcs
+    for vertex in vertices(values):
+        extend(to_wcs(vertex).xyz)
+    return result
@@ -5,9 +5,10 @@
 # Created: 19.04.2010
 # Copyright (c) 2010-2018 Manfred Moitzi
 # License: MIT License
-from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING
+from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING, Any
 from math import sin, cos, tan
 from itertools import chain
+from array import array
 from .vector import Vector
 
 if TYPE_CHECKING:
@@ -15,8 +16,7 @@ if TYPE_CHECKING:
 
 Tuple4Float = Tuple[float, float, float, float]
 
-
-# removed array.array because array is optimized for space not speed, and space optimization is not needed
+# the matrix itself is stored as list, array.array('d') is only used as flat storage for bulk vertex transformation
 
 
 def floats(items: Iterable) -> List[float]:
@@ -490,6 +490,64 @@ class Matrix44:
             ))
         return result
 
+    def transform_array(self, points: Any) -> array:
+        """
+        Returns the transformed `points` as flat ``array('d')`` of ``3 * n`` values. This is much faster than
+        :meth:`transform_vectors` for large point clouds, because no :class:`Vector` objects are created, the
+        transformation is done by NumPy if available. Use :meth:`chain` to combine multiple transformations into
+        one matrix, to transform the points by a single pass.
+
+        Args:
+            points: NumPy array of shape ``(n, 3)``, flat ``array('d')`` or sequence of ``x, y, z`` values, or an
+                iterable of ``(x, y, z)`` tuples
+
+        """
+        from ezdxf.lldxf.packedtags import numpy_module  # circular import
+        np = numpy_module(optional=True)
+        if np is not None:
+            points = _as_ndarray(np, points)
+            result = array('d', [0.]) * points.size
+            # NumPy writes the transformed points directly into the result array
+            self._transform_ndarray(np, points, out=np.frombuffer(result, dtype=np.float64).reshape(-1, 3))
+            return result
+
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = self.matrix
+        if not isinstance(points, array):
+            points = [value for point in points for value in point] if _is_nested(points) else points
+        values = iter(points)
+        result = []
+        extend = result.extend
+        for x, y, z in zip(values, values, values):
+            extend((
+                x * m0 + y * m4 + z * m8 + m12,
+                x * m1 + y * m5 + z * m9 + m13,
+                x * m2 + y * m6 + z * m10 + m14,
+            ))
+        return array('d', result)
+
+    def transform_ndarray(self, points: Any) -> Any:
+        """
+        Returns the transformed `points` as NumPy array of shape ``(n, 3)``, requires NumPy, see
+        :meth:`transform_array`.
+
+        Args:
+            points: NumPy array of shape ``(n, 3)``, flat ``array('d')`` or sequence of ``x, y, z`` values, or an
+                iterable of ``(x, y, z)`` tuples
+
+        Raises:
+            ImportError: NumPy is not installed
+
+        """
+        from ezdxf.lldxf.packedtags import numpy_module  # circular import
+        np = numpy_module()
+        return self._transform_ndarray(np, _as_ndarray(np, points))
+
+    def _transform_ndarray(self, np, points: Any, out: Any = None) -> Any:
+        m = np.array(self.matrix, dtype=float).reshape(4, 4)
+        result = np.matmul(points, m[:3, :3], out=out)
+        result += m[3, :3]
+        return result
+
     def transpose(self) -> None:
         """
         Swaps the rows for columns inplace.
@@ -577,3 +635,19 @@ class Matrix44:
             (
                     m01 * m12 * m20 - m02 * m11 * m20 + m02 * m10 * m21 - m00 * m12 * m21 - m01 * m10 * m22 + m00 * m11 * m22) * f,
         ]
+
+
+def _as_ndarray(np, points: Any) -> Any:
+    """ Returns `points` as NumPy array of shape ``(n, 3)``, an ``array('d')`` is used without copying. """
+    if isinstance(points, array) and points.typecode == 'd':
+        points = np.frombuffer(points, dtype=np.float64)
+    elif not isinstance(points, np.ndarray):
+        points = np.asarray(points if isinstance(points, array) else list(points), dtype=float)
+    return points.astype(float, copy=False).reshape(-1, 3)
+
+
+def _is_nested(points: Any) -> bool:
+    """ Returns ``True`` if `points` is a sequence of ``(x, y, z)`` tuples and not a flat sequence of values. """
+    if not isinstance(points, Sequence):
+        return True
+    return len(points) > 0 and not isinstance(points[0], (int, float))
@@ -0,0 +1,647 @@
+# Purpose: fast 2D geometry for large point sets
+# Created: 2019-12-19
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+"""
+2D Point Arrays
+===============
+
+Convex hull, polyline offset, polygon area and centroid and polyline simplification for large 2D point sets without
+creating a :class:`~ezdxf.math.Vec2` object for each point.
+
+All functions accept NumPy arrays of shape ``(n, 2)`` or ``(n, 3)``, :class:`~ezdxf.lldxf.packedtags.VertexArray`
+objects and iterables of ``(x, y[, z])`` tuples, the z-axis is ignored. The results are always flat ``array('d')``
+of ``x, y`` values, use :func:`vertices` to iterate over the results as :class:`~ezdxf.math.Vec2` objects. The
+``*_ndarray`` variants return NumPy arrays of shape ``(n, 2)`` and require NumPy.
+
+NumPy is an optional dependency, the computation is vectorized by NumPy where possible, the pure Python
+implementation uses the same algorithms.
+
+"""
+from typing import Any, Iterable, List, Sequence, Tuple
+from array import array
+import heapq
+import math
+from .vector import Vec2
+
+__all__ = ['vertices', 'convex_hull', 'offset_polyline', 'signed_areas', 'centroids', 'douglas_peucker',
+           'visvalingam_whyatt', 'convex_hull_ndarray', 'offset_polyline_ndarray', 'signed_areas_ndarray',
+           'centroids_ndarray', 'douglas_peucker_ndarray', 'visvalingam_whyatt_ndarray']
+
+ABS_TOL = 1e-12
+
+
+def vertices(values: Any) -> Iterable[Vec2]:
+    """ Yields the vertices of a NumPy array of shape ``(n, 2)`` or a flat ``array('d')`` of ``x, y`` values as
+    :class:`~ezdxf.math.Vec2` objects.
+    """
+    if isinstance(values, array):
+        it = iter(values)
+        for x, y in zip(it, it):
+            yield Vec2((x, y))
+    else:
+        for x, y in values.tolist():
+            yield Vec2((x, y))
+
+
+def _xy_numpy(np, points: Any):
+    """ Returns `points` as NumPy array of shape ``(n, 2)``, a view of the input data if possible. """
+    if hasattr(points, 'VERTEX_SIZE'):  # VertexArray
+        points = np.frombuffer(points.values, dtype=float).reshape(-1, points.VERTEX_SIZE)
+    elif not isinstance(points, np.ndarray):
+        points = np.array([(p[0], p[1]) for p in points], dtype=float).reshape(-1, 2)
+    if points.ndim != 2 or points.shape[1] < 2:
+        raise ValueError('Array of shape (n, 2) or (n, 3) required.')
+    return points[:, :2].astype(float, copy=False)
+
+
+def _xy_lists(points: Any) -> Tuple[List[float], List[float]]:
+    """ Returns the x- and y-coordinates of `points` as two lists of floats. """
+    if hasattr(points, 'VERTEX_SIZE'):  # VertexArray
+        size = points.VERTEX_SIZE
+        values = points.values
+        return list(values[0::size]), list(values[1::size])
+    if hasattr(points, 'tolist'):  # NumPy array
+        points = points.tolist()
+    xs = []
+    ys = []
+    for p in points:
+        xs.append(float(p[0]))
+        ys.append(float(p[1]))
+    return xs, ys
+
+
+def _flat(xs: Iterable[float], ys: Iterable[float]) -> array:
+    result = array('d')
+    extend = result.extend
+    for x, y in zip(xs, ys):
+        extend((x, y))
+    return result
+
+
+def _from_ndarray(values: Any) -> array:
+    """ Returns the values of a NumPy array as flat ``array('d')``. """
+    result = array('d')
+    result.frombytes(values.astype(float, copy=False).tobytes())
+    return result
+
+
+def _monotone_chain(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """ Returns the clockwise convex hull of lexicographic sorted unique `points`, starting at the first point. """
+
+    def half_hull(points):
+        hull = []
+        for bx, by in points:
+            while len(hull) > 1:
+                ox, oy = hull[-2]
+                ax, ay = hull[-1]
+                if (ax - ox) * (by - oy) - (ay - oy) * (bx - ox) >= 0.:  # not a right turn
+                    hull.pop()
+                else:
+                    break
+            hull.append((bx, by))
+        return hull
+
+    upper = half_hull(points)
+    lower = half_hull(reversed(points))
+    return upper + lower[1:-1]
+
+
+def _hull_candidates(np, points):
+    """ Removes the points inside of the polygon of the extreme points in 8 directions, these points can not be
+    part of the convex hull (Akl-Toussaint heuristic).
+    """
+    if len(points) < 16:
+        return points
+    angles = np.arange(8) * (math.pi / 4.)
+    directions = np.stack((np.cos(angles), np.sin(angles)))
+    extremes = [int(np.argmax(points @ directions[:, i])) for i in range(8)]  # counter clockwise order
+    polygon = []
+    for index in extremes:
+        if not polygon or polygon[-1] != index:
+            polygon.append(index)
+    if len(polygon) > 1 and polygon[0] == polygon[-1]:
+        polygon.pop()
+    if len(polygon) < 3:
+        return points
+    inside = np.ones(len(points), dtype=bool)
+    for index, next_index in zip(polygon, polygon[1:] + polygon[:1]):
+        start = points[index]
+        edge = points[next_index] - start
+        if math.isclose(edge[0], 0., abs_tol=ABS_TOL) and math.isclose(edge[1], 0., abs_tol=ABS_TOL):
+            continue
+        inside &= (edge[0] * (points[:, 1] - start[1]) - edge[1] * (points[:, 0] - start[0])) > 0.
+    return points[~inside]
+
+
+def convex_hull(points: Any) -> array:
+    """
+    Returns the 2D convex hull of `points` by Andrew's monotone chain algorithm in clockwise order, starting at the
+    point with the lowest x- and y-coordinate, like :func:`ezdxf.math.convex_hull`, as flat ``array('d')``.
+
+    All collinear points on the hull are removed, this is different to :func:`ezdxf.math.convex_hull`, which keeps
+    collinear points on vertical hull edges at the right side, therefore the results of both functions are only
+    equal for points without collinear points on the hull. The NumPy implementation removes points which can not be
+    part of the hull in advance by a vectorized inside test, which reduces the count of points to process in the
+    monotone chain to a fraction.
+
+    Args:
+        points: NumPy array, :class:`~ezdxf.lldxf.packedtags.VertexArray` or iterable of ``(x, y[, z])`` tuples
+
+    Raises:
+        ValueError: less than 3 unique points
+
+    """
+    return _flat(*zip(*_convex_hull(points)))
+
+
+def convex_hull_ndarray(points: Any) -> Any:
+    """
+    Returns the 2D convex hull of `points` as NumPy array of shape ``(n, 2)``, requires NumPy, see
+    :func:`convex_hull`.
+
+    Raises:
+        ImportError: NumPy is not installed
+        ValueError: less than 3 unique points
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    return numpy_module().array(_convex_hull(points), dtype=float).reshape(-1, 2)
+
+
+def _convex_hull(points: Any) -> List[Tuple[float, float]]:
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    np = numpy_module(optional=True)
+    if np is not None:
+        candidates = _hull_candidates(np, _xy_numpy(np, points))
+        unique = [tuple(p) for p in np.unique(candidates, axis=0).tolist()]  # lexicographic sorted
+    else:
+        unique = sorted(set(zip(*_xy_lists(points))))
+    if len(unique) < 3:
+        raise ValueError('Convex hull calculation requires 3 or more unique points.')
+    return _monotone_chain(unique)
+
+
+def _remove_duplicates(xs: List[float], ys: List[float]) -> Tuple[List[float], List[float]]:
+    rx = xs[:1]
+    ry = ys[:1]
+    for x, y in zip(xs[1:], ys[1:]):
+        if abs(x - rx[-1]) > ABS_TOL or abs(y - ry[-1]) > ABS_TOL:
+            rx.append(x)
+            ry.append(y)
+    return rx, ry
+
+
+def offset_polyline(points: Any, offset: float, closed: bool = False) -> array:
+    """
+    Returns the vertices of the offset polyline to the polyline defined by `points`, the result is equal to
+    :func:`ezdxf.math.offset_vertices_2d` but all offset vertices are computed at once. The offset vertex of
+    adjacent segments is the intersection of the offset segments. Adjacent collinear segments in opposite directions
+    (U-turn) create an additional vertex. Consecutive duplicate points are removed.
+
+    Args:
+        points: NumPy array, :class:`~ezdxf.lldxf.packedtags.VertexArray` or iterable of ``(x, y[, z])`` tuples
+        offset: line offset perpendicular to direction of polyline segments defined by vertices order,
+            offset > ``0`` is 'left' of line segment, offset < ``0`` is 'right' of line segment
+        closed: ``True`` to handle as closed polyline, first and last vertex can be equal, else an implicit closing
+            segment from last to first vertex is added
+
+    Raises:
+        ValueError: less than 2 unique points
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    np = numpy_module(optional=True)
+    if np is None:
+        return _offset_polyline(*_xy_lists(points), offset=offset, closed=closed)
+    return _from_ndarray(_offset_polyline_numpy(np, points, offset, closed))
+
+
+def offset_polyline_ndarray(points: Any, offset: float, closed: bool = False) -> Any:
+    """
+    Returns the vertices of the offset polyline as NumPy array of shape ``(n, 2)``, requires NumPy, see
+    :func:`offset_polyline`.
+
+    Raises:
+        ImportError: NumPy is not installed
+        ValueError: less than 2 unique points
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    return _offset_polyline_numpy(numpy_module(), points, offset, closed)
+
+
+def _offset_polyline_numpy(np, points: Any, offset: float, closed: bool):
+    points = _xy_numpy(np, points)
+    if len(points) > 1:
+        keep = np.ones(len(points), dtype=bool)
+        keep[1:] = np.abs(np.diff(points, axis=0)).max(axis=1) > ABS_TOL
+        points = points[keep]
+        if closed and len(points) > 1 and np.abs(points[0] - points[-1]).max() <= ABS_TOL:
+            points = points[:-1]
+    if len(points) < 2:
+        raise ValueError('2 or more vertices required.')
+
+    if closed:
+        directions = np.roll(points, -1, axis=0) - points
+    else:
+        directions = np.diff(points, axis=0)
+    lengths = np.hypot(directions[:, 0], directions[:, 1])
+    normals = np.stack((-directions[:, 1], directions[:, 0]), axis=1) / lengths[:, None]
+    if closed:
+        # joints at all vertices between the previous (cyclic) and the next segment
+        joints = points
+        prev_normals = np.roll(normals, 1, axis=0)
+        next_normals = normals
+    else:
+        joints = points[1:-1]
+        prev_normals = normals[:-1]
+        next_normals = normals[1:]
+
+    cos_angle = (prev_normals * next_normals).sum(axis=1)
+    sin_angle = prev_normals[:, 0] * next_normals[:, 1] - prev_normals[:, 1] * next_normals[:, 0]
+    u_turns = np.flatnonzero((np.abs(sin_angle) <= 1e-9) & (cos_angle < 0.))
+    denominator = 1. + cos_angle
+    denominator[u_turns] = 1.
+    # the offset vertex p + offset * m satisfies m . n1 = 1 and m . n2 = 1
+    result = joints + (prev_normals + next_normals) * (offset / denominator)[:, None]
+    if len(u_turns):
+        result[u_turns] = joints[u_turns] + prev_normals[u_turns] * offset
+        result = np.insert(result, u_turns + 1, joints[u_turns] + next_normals[u_turns] * offset, axis=0)
+    if not closed:
+        result = np.concatenate((
+            points[:1] + normals[:1] * offset,
+            result,
+            points[-1:] + normals[-1:] * offset,
+        ))
+    return result
+
+
+def _offset_polyline(xs: List[float], ys: List[float], offset: float, closed: bool) -> array:
+    xs, ys = _remove_duplicates(xs, ys)
+    if closed and len(xs) > 1 and abs(xs[0] - xs[-1]) <= ABS_TOL and abs(ys[0] - ys[-1]) <= ABS_TOL:
+        xs.pop()
+        ys.pop()
+    count = len(xs)
+    if count < 2:
+        raise ValueError('2 or more vertices required.')
+
+    segment_count = count if closed else count - 1
+    normals = []
+    for index in range(segment_count):
+        next_index = (index + 1) % count
+        dx = xs[next_index] - xs[index]
+        dy = ys[next_index] - ys[index]
+        length = math.hypot(dx, dy)
+        normals.append((-dy / length, dx / length))
+
+    result = array('d')
+    extend = result.extend
+    if closed:
+        joints = range(count)
+    else:
+        extend((xs[0] + normals[0][0] * offset, ys[0] + normals[0][1] * offset))
+        joints = range(1, count - 1)
+    for index in joints:
+        x = xs[index]
+        y = ys[index]
+        n1x, n1y = normals[index - 1]
+        n2x, n2y = normals[index]
+        cos_angle = n1x * n2x + n1y * n2y
+        if abs(n1x * n2y - n1y * n2x) <= 1e-9 and cos_angle < 0.:  # U-turn
+            extend((x + n1x * offset, y + n1y * offset, x + n2x * offset, y + n2y * offset))
+        else:
+            factor = offset / (1. + cos_angle)
+            extend((x + (n1x + n2x) * factor, y + (n1y + n2y) * factor))
+    if not closed:
+        extend((xs[-1] + normals[-1][0] * offset, ys[-1] + normals[-1][1] * offset))
+    return result
+
+
+def _shoelace_numpy(np, polygons: Iterable[Any]):
+    """ Returns the vertices of all `polygons` as one array, the next vertex for each vertex as array, the polygon
+    index for each vertex and the count of polygons.
+    """
+    arrays = [_xy_numpy(np, polygon) for polygon in polygons]
+    sizes = np.array([len(a) for a in arrays], dtype=int)
+    if sizes.sum() == 0:
+        return np.zeros((0, 2)), np.zeros((0, 2)), np.zeros(0, dtype=int), len(arrays)
+    points = np.concatenate(arrays)
+    starts = np.cumsum(sizes) - sizes
+    next_index = np.arange(1, len(points) + 1)
+    non_empty = sizes > 0
+    next_index[(starts + sizes - 1)[non_empty]] = starts[non_empty]  # last vertex is connected to the first vertex
+    polygon_index = np.repeat(np.arange(len(arrays)), sizes)
+    return points, points[next_index], polygon_index, len(arrays)
+
+
+def signed_areas(polygons: Iterable[Any]) -> array:
+    """
+    Returns the signed areas of all `polygons` by the shoelace formula, counter clockwise oriented polygons have a
+    positive area, clockwise oriented polygons have a negative area. The polygons are implicit closed, the first and
+    last vertex can be equal. The areas of all polygons are computed in one vectorized pass, if NumPy is available.
+
+    Args:
+        polygons: iterable of polygons, each polygon as NumPy array, :class:`~ezdxf.lldxf.packedtags.VertexArray`
+            or iterable of ``(x, y[, z])`` tuples
+
+    Returns:
+        ``array('d')`` of `m` values for `m` polygons
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    np = numpy_module(optional=True)
+    if np is not None:
+        return _from_ndarray(_signed_areas_numpy(np, polygons))
+    return array('d', (_polygon_area_centroid(*_xy_lists(polygon))[0] for polygon in polygons))
+
+
+def signed_areas_ndarray(polygons: Iterable[Any]) -> Any:
+    """
+    Returns the signed areas of all `polygons` as NumPy array of shape ``(m, )``, requires NumPy, see
+    :func:`signed_areas`.
+
+    Raises:
+        ImportError: NumPy is not installed
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    return _signed_areas_numpy(numpy_module(), polygons)
+
+
+def _signed_areas_numpy(np, polygons: Iterable[Any]):
+    points, next_points, polygon_index, count = _shoelace_numpy(np, polygons)
+    cross = points[:, 0] * next_points[:, 1] - next_points[:, 0] * points[:, 1]
+    return np.bincount(polygon_index, weights=cross, minlength=count) * .5
+
+
+def centroids(polygons: Iterable[Any]) -> array:
+    """
+    Returns the centroids (center of mass) of all `polygons`. The polygons are implicit closed, the first and last
+    vertex can be equal. The centroid of a polygon without area is the mean of its vertices, the centroid of a
+    polygon without vertices is ``(0, 0)``.
+
+    Args:
+        polygons: iterable of polygons, each polygon as NumPy array, :class:`~ezdxf.lldxf.packedtags.VertexArray`
+            or iterable of ``(x, y[, z])`` tuples
+
+    Returns:
+        flat ``array('d')`` of `m` ``x, y`` values for `m` polygons
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    np = numpy_module(optional=True)
+    if np is not None:
+        return _from_ndarray(_centroids_numpy(np, polygons))
+    result = array('d')
+    for polygon in polygons:
+        result.extend(_polygon_area_centroid(*_xy_lists(polygon))[1])
+    return result
+
+
+def centroids_ndarray(polygons: Iterable[Any]) -> Any:
+    """
+    Returns the centroids of all `polygons` as NumPy array of shape ``(m, 2)``, requires NumPy, see
+    :func:`centroids`.
+
+    Raises:
+        ImportError: NumPy is not installed
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    return _centroids_numpy(numpy_module(), polygons)
+
+
+def _centroids_numpy(np, polygons: Iterable[Any]):
+    points, next_points, polygon_index, count = _shoelace_numpy(np, polygons)
+    x0 = points[:, 0]
+    y0 = points[:, 1]
+    x1 = next_points[:, 0]
+    y1 = next_points[:, 1]
+    cross = x0 * y1 - x1 * y0
+    area6 = np.bincount(polygon_index, weights=cross, minlength=count) * 3.
+    cx = np.bincount(polygon_index, weights=(x0 + x1) * cross, minlength=count)
+    cy = np.bincount(polygon_index, weights=(y0 + y1) * cross, minlength=count)
+    sizes = np.bincount(polygon_index, minlength=count)
+    mean_x = np.bincount(polygon_index, weights=x0, minlength=count) / np.maximum(sizes, 1)
+    mean_y = np.bincount(polygon_index, weights=y0, minlength=count) / np.maximum(sizes, 1)
+    degenerated = np.abs(area6) <= ABS_TOL
+    area6[degenerated] = 1.
+    return np.stack((
+        np.where(degenerated, mean_x, cx / area6),
+        np.where(degenerated, mean_y, cy / area6),
+    ), axis=1)
+
+
+def _polygon_area_centroid(xs: List[float], ys: List[float]) -> Tuple[float, Tuple[float, float]]:
+    count = len(xs)
+    if count == 0:
+        return 0., (0., 0.)
+    area2 = 0.
+    cx = 0.
+    cy = 0.
+    x0 = xs[-1]
+    y0 = ys[-1]
+    for x1, y1 in zip(xs, ys):
+        cross = x0 * y1 - x1 * y0
+        area2 += cross
+        cx += (x0 + x1) * cross
+        cy += (y0 + y1) * cross
+        x0 = x1
+        y0 = y1
+    if abs(area2 * 3.) <= ABS_TOL:
+        return area2 * .5, (sum(xs) / count, sum(ys) / count)
+    return area2 * .5, (cx / (area2 * 3.), cy / (area2 * 3.))
+
+
+def douglas_peucker(points: Any, tolerance: float) -> array:
+    """
+    Returns the simplified polyline of `points` by the Ramer-Douglas-Peucker algorithm, the max. distance of the
+    removed points to the simplified polyline is not more than `tolerance`. The first and the last point are always
+    preserved. The NumPy implementation computes the distances of each subdivision step in one vectorized pass.
+
+    Args:
+        points: NumPy array, :class:`~ezdxf.lldxf.packedtags.VertexArray` or iterable of ``(x, y[, z])`` tuples
+        tolerance: max. distance of removed points to the simplified polyline
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    np = numpy_module(optional=True)
+    if np is None:
+        xs, ys = _xy_lists(points)
+        keep = _douglas_peucker(xs, ys, tolerance)
+        return _flat((xs[i] for i in keep), (ys[i] for i in keep))
+    return _from_ndarray(_douglas_peucker_numpy(np, points, tolerance))
+
+
+def douglas_peucker_ndarray(points: Any, tolerance: float) -> Any:
+    """
+    Returns the simplified polyline of `points` by the Ramer-Douglas-Peucker algorithm as NumPy array of shape
+    ``(n, 2)``, requires NumPy, see :func:`douglas_peucker`.
+
+    Raises:
+        ImportError: NumPy is not installed
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    return _douglas_peucker_numpy(numpy_module(), points, tolerance)
+
+
+def _douglas_peucker_numpy(np, points: Any, tolerance: float):
+    points = _xy_numpy(np, points)
+    count = len(points)
+    if count < 3:
+        return points.copy()
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start = points[first]
+        chord = points[last] - start
+        length = math.hypot(chord[0], chord[1])
+        vectors = points[first + 1:last] - start
+        if length > ABS_TOL:
+            distances = np.abs(vectors[:, 0] * chord[1] - vectors[:, 1] * chord[0]) / length
+        else:  # first and last point are coincident
+            distances = np.hypot(vectors[:, 0], vectors[:, 1])
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            index += first + 1
+            keep[index] = True
+            stack.append((index, last))
+            stack.append((first, index))
+    return points[keep]
+
+
+def _douglas_peucker(xs: List[float], ys: List[float], tolerance: float) -> List[int]:
+    """ Returns the indices of the preserved points. """
+    count = len(xs)
+    if count < 3:
+        return list(range(count))
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        sx = xs[first]
+        sy = ys[first]
+        dx = xs[last] - sx
+        dy = ys[last] - sy
+        length = math.hypot(dx, dy)
+        max_distance = -1.
+        max_index = first
+        for index in range(first + 1, last):
+            vx = xs[index] - sx
+            vy = ys[index] - sy
+            if length > ABS_TOL:
+                distance = abs(vx * dy - vy * dx) / length
+            else:  # first and last point are coincident
+                distance = math.hypot(vx, vy)
+            if distance > max_distance:
+                max_distance = distance
+                max_index = index
+        if max_distance > tolerance:
+            keep[max_index] = True
+            stack.append((max_index, last))
+            stack.append((first, max_index))
+    return [index for index, flag in enumerate(keep) if flag]
+
+
+def visvalingam_whyatt(points: Any, min_area: float) -> array:
+    """
+    Returns the simplified polyline of `points` by the Visvalingam-Whyatt algorithm, which removes repeatedly the
+    point with the smallest effective area, the area of the triangle of the point and its neighbors, until all
+    remaining points have an effective area of at least `min_area`. The first and the last point are always
+    preserved.
+
+    Args:
+        points: NumPy array, :class:`~ezdxf.lldxf.packedtags.VertexArray` or iterable of ``(x, y[, z])`` tuples
+        min_area: min. effective area of preserved points
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    np = numpy_module(optional=True)
+    if np is None:
+        xs, ys = _xy_lists(points)
+        keep = _visvalingam_whyatt(xs, ys, None, min_area)
+        return _flat((xs[i] for i in keep), (ys[i] for i in keep))
+    return _from_ndarray(_visvalingam_whyatt_numpy(np, points, min_area))
+
+
+def visvalingam_whyatt_ndarray(points: Any, min_area: float) -> Any:
+    """
+    Returns the simplified polyline of `points` by the Visvalingam-Whyatt algorithm as NumPy array of shape
+    ``(n, 2)``, requires NumPy, see :func:`visvalingam_whyatt`.
+
+    Raises:
+        ImportError: NumPy is not installed
+
+    """
+    from ezdxf.lldxf.packedtags import numpy_module  # circular import
+    return _visvalingam_whyatt_numpy(numpy_module(), points, min_area)
+
+
+def _visvalingam_whyatt_numpy(np, points: Any, min_area: float):
+    points = _xy_numpy(np, points)
+    if len(points) < 3:
+        return points.copy()
+    xs = points[:, 0]
+    ys = points[:, 1]
+    # initial effective areas of all inner points in one vectorized pass
+    areas = np.abs(
+        (xs[:-2] - xs[2:]) * (ys[1:-1] - ys[:-2]) - (xs[:-2] - xs[1:-1]) * (ys[2:] - ys[:-2])
+    ) * .5
+    keep = _visvalingam_whyatt(xs.tolist(), ys.tolist(), areas.tolist(), min_area)
+    return points[keep]
+
+
+def _visvalingam_whyatt(xs: List[float], ys: List[float], areas: Sequence[float], min_area: float) -> List[int]:
+    """ Returns the indices of the preserved points, `areas` are the initial effective areas of the inner points or
+    ``None``.
+    """
+    count = len(xs)
+    if count < 3:
+        return list(range(count))
+    if areas is None:
+        areas = [
+            abs((xs[i - 1] - xs[i + 1]) * (ys[i] - ys[i - 1]) - (xs[i - 1] - xs[i]) * (ys[i + 1] - ys[i - 1])) * .5
+            for i in range(1, count - 1)
+        ]
+    effective = [math.inf]
+    effective.extend(areas)
+    effective.append(math.inf)
+    # only points with an effective area below min_area are candidates for removal
+    heap = [(area, index) for index, area in enumerate(effective[1:-1], start=1) if area < min_area]
+    heapq.heapify(heap)
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    prev_index = list(range(-1, count - 1))
+    next_index = list(range(1, count + 1))
+    removed = [False] * count
+    last = count - 1
+    while heap:
+        area, index = heappop(heap)
+        if removed[index] or area != effective[index]:  # outdated heap entry
+            continue
+        removed[index] = True
+        prev = prev_index[index]
+        nxt = next_index[index]
+        next_index[prev] = nxt
+        prev_index[nxt] = prev
+        for i1 in (prev, nxt):
+            if 0 < i1 < last:
+                i0 = prev_index[i1]
+                i2 = next_index[i1]
+                new_area = abs((xs[i0] - xs[i2]) * (ys[i1] - ys[i0]) - (xs[i0] - xs[i1]) * (ys[i2] - ys[i0])) * .5
+                # the effective area of a point is not less than the area of a previously removed neighbor
+                if new_area < area:
+                    new_area = area
+                effective[i1] = new_area
+                if new_area < min_area:
+                    heappush(heap, (new_area, i1))
+    return [index for index, flag in enumerate(removed) if not flag]
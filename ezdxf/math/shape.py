@@ -5,8 +5,8 @@ from typing import Union, Iterable, List, TYPE_CHECKING
 import math
 from .vector import Vec2
 from .construct2d import ConstructionTool, convex_hull
-from .offset2d import offset_vertices_2d
 from .bbox import BoundingBox2d
+from . import points2d
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -40,6 +40,25 @@ class Shape2d(ConstructionTool):
         """ :class:`BoundingBox2d` """
         return BoundingBox2d(self.vertices)
 
+    @property
+    def area(self) -> float:
+        """ Signed area of the shape as implicit closed polygon, counter clockwise oriented shapes have a positive
+        area, see also :func:`ezdxf.math.points2d.signed_areas`.
+
+        .. versionadded:: 0.11
+
+        """
+        return float(points2d.signed_areas([self.vertices])[0])
+
+    @property
+    def centroid(self) -> Vec2:
+        """ Centroid of the shape as implicit closed polygon, see also :func:`ezdxf.math.points2d.centroids`.
+
+        .. versionadded:: 0.11
+
+        """
+        return next(points2d.vertices(points2d.centroids([self.vertices])))
+
     def translate(self, vector: 'Vertex') -> None:
         """ Translate shape about `vector`. """
         delta = Vec2(vector)
@@ -78,12 +97,25 @@ class Shape2d(ConstructionTool):
             closed: ``True`` to handle as closed shape
 
         """
-        return self.__class__(offset_vertices_2d(self.vertices, offset=offset, closed=closed))
+        return self.__class__(points2d.vertices(points2d.offset_polyline(self.vertices, offset=offset, closed=closed)))
 
     def convex_hull(self) -> 'Shape2d':
         """ Returns convex hull as new shape. """
         return self.__class__(convex_hull(self.vertices))
 
+    def simplify(self, tolerance: float) -> 'Shape2d':
+        """
+        Returns a new simplified shape, the max. distance of the removed vertices to the simplified shape is not more
+        than `tolerance`, see also :func:`ezdxf.math.points2d.douglas_peucker`.
+
+        .. versionadded:: 0.11
+
+        Args:
+            tolerance: max. distance of removed vertices to the simplified shape
+
+        """
+        return self.__class__(points2d.vertices(points2d.douglas_peucker(self.vertices, tolerance)))
+
     # Sequence interface
     def __len__(self) -> int:
         """ Returns `count` of vertices. """
@@ -1,6 +1,6 @@
 # Copyright (c) 2018-2019 Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Tuple, Sequence, Iterable
+from typing import TYPE_CHECKING, Tuple, Sequence, Iterable, Any
 from .vector import Vector, X_AXIS, Y_AXIS, Z_AXIS
 from .matrix44 import Matrix44
 
@@ -16,6 +16,22 @@ def render_axis(layout: 'BaseLayout',
         layout.add_line(start, point, dxfattribs={'color': color})
 
 
+def _axis_matrix(ux: 'Vertex', uy: 'Vertex', uz: 'Vertex', origin: 'Vertex' = (0, 0, 0)) -> Matrix44:
+    """ Returns the transformation matrix from a coordinate system defined by the axis `ux`, `uy`, `uz` and `origin`
+    to :ref:`WCS`.
+    """
+    ux_x, ux_y, ux_z = ux
+    uy_x, uy_y, uy_z = uy
+    uz_x, uz_y, uz_z = uz
+    ox, oy, oz = origin
+    return Matrix44((
+        ux_x, ux_y, ux_z, 0,
+        uy_x, uy_y, uy_z, 0,
+        uz_x, uz_y, uz_z, 0,
+        ox, oy, oz, 1,
+    ))
+
+
 class Matrix33:
     """
     Simple 3x3 Matrix for coordinate transformation.
@@ -107,6 +123,22 @@ class OCS:
         for point in points:
             yield self.to_wcs(point)
 
+    def to_wcs_matrix(self) -> Matrix44:
+        """ Returns the transformation matrix from OCS to :ref:`WCS`. """
+        return _axis_matrix(self.ux, self.uy, self.uz)
+
+    def from_wcs_matrix(self) -> Matrix44:
+        """ Returns the transformation matrix from :ref:`WCS` to OCS. """
+        return Matrix44.ucs(self.ux, self.uy, self.uz)
+
+    def points_to_wcs_array(self, points: Any) -> Any:
+        """ Returns WCS points for OCS `points` as flat ``array('d')``, see :meth:`Matrix44.transform_array`. """
+        return self.to_wcs_matrix().transform_array(points)
+
+    def points_from_wcs_array(self, points: Any) -> Any:
+        """ Returns OCS points for WCS `points` as flat ``array('d')``, see :meth:`Matrix44.transform_array`. """
+        return self.from_wcs_matrix().transform_array(points)
+
     def render_axis(self, layout: 'BaseLayout', length: float = 1, colors: Tuple[int, int, int] = (1, 3, 5)):
         """ Render axis as 3D lines into a `layout`. """
         render_axis(
@@ -245,6 +277,43 @@ class UCS:
         for point in points:
             yield self.from_wcs(point)
 
+    def to_wcs_matrix(self) -> Matrix44:
+        """ Returns the transformation matrix from UCS to :ref:`WCS`, including the translation by :attr:`origin`. """
+        return _axis_matrix(self.ux, self.uy, self.uz, self.origin)
+
+    def from_wcs_matrix(self) -> Matrix44:
+        """ Returns the transformation matrix from :ref:`WCS` to UCS, including the translation by :attr:`origin`. """
+        ox, oy, oz = self.origin
+        return Matrix44.chain(Matrix44.translate(-ox, -oy, -oz), Matrix44.ucs(self.ux, self.uy, self.uz))
+
+    def to_ocs_matrix(self) -> Matrix44:
+        """
+        Returns the transformation matrix from UCS to OCS as one fused matrix of the UCS to :ref:`WCS` and the
+        :ref:`WCS` to OCS transformation.
+
+        The :class:`OCS` is defined by the z-axis of the :class:`UCS`.
+
+        """
+        return Matrix44.chain(self.to_wcs_matrix(), OCS(self.uz).from_wcs_matrix())
+
+    def points_to_wcs_array(self, points: Any) -> Any:
+        """ Returns WCS points for UCS `points` as flat ``array('d')``, see :meth:`Matrix44.transform_array`. """
+        return self.to_wcs_matrix().transform_array(points)
+
+    def points_from_wcs_array(self, points: Any) -> Any:
+        """ Returns UCS points for WCS `points` as flat ``array('d')``, see :meth:`Matrix44.transform_array`. """
+        return self.from_wcs_matrix().transform_array(points)
+
+    def points_to_ocs_array(self, points: Any) -> Any:
+        """
+        Returns OCS points for UCS `points` as flat ``array('d')`` by a single matrix multiplication, see
+        :meth:`Matrix44.transform_array`.
+
+        The :class:`OCS` is defined by the z-axis of the :class:`UCS`.
+
+        """
+        return self.to_ocs_matrix().transform_array(points)
+
     def rotate(self, axis: 'Vertex', angle: float) -> 'UCS':
         """
         Returns a new rotated UCS, with the same origin as the source UCS.
@@ -10,6 +10,22 @@ class Options:
         self.check_entity_tag_structures = True
         self.filter_invalid_xdata_group_codes = False
 
+        # load graphic entities of the ENTITIES and BLOCKS section at first access, unmodified entities are
+        # written as loaded
+        self.lazy_loading = False
+
+        # keep the loaded tags of entities of the ENTITIES and BLOCKS section, unmodified entities are written as
+        # loaded
+        self.incremental_save = False
+
+        # update header variables $EXTMIN and $EXTMAX by the extents of the modelspace at saving, costs a full
+        # modelspace iteration at each saving
+        self.update_extents = False
+
+        # persistent cache of documents loaded by ezdxf.readfile(), None to disable the cache
+        self.load_cache_dir = None
+        self.load_cache_max_size = 256 << 20  # in bytes
+
         self.default_text_style = 'OpenSans'
         self.default_dimension_text_style = 'OpenSansCondensed-Light'
 
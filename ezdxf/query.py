@@ -2,17 +2,24 @@
 # Created: 27.04.13
 # Copyright (C) 2013, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence, Union
+from typing import (TYPE_CHECKING, Iterable, Iterator, Callable, Hashable, Dict, List, Any, Sequence, Union,
+                    Optional, Set, Tuple)
 import re
 import operator
+from functools import lru_cache
+from itertools import islice
 
 from collections import abc
 from ezdxf.queryparser import EntityQueryParser
 from ezdxf.groupby import groupby
+from ezdxf.entitydb import EntitySpace
 
 if TYPE_CHECKING:  # import forward references
     from ezdxf.eztypes import DXFEntity
 
+# count of cached compiled query strings
+QUERY_CACHE_SIZE = 256
+
 
 class EntityQuery(abc.Sequence):
     """
@@ -76,17 +83,24 @@ class EntityQuery(abc.Sequence):
         """
         Setup container with entities matching the initial query.
 
+        Candidates for an :class:`~ezdxf.entitydb.EntitySpace` are taken from an attribute index for a relation of the
+        attribute query or from the DXF type index if the entity query contains no ``*``, see :meth:`explain`.
+
         Args:
             entities: sequence of wrapped DXF entities (at least GraphicEntity class)
             query: query string, see class documentation
 
         """
+        self._plan = 'full scan'
         if entities is None:
             self.entities = []
         elif query == '*':
             self.entities = list(entities)
         else:
-            match = entity_matcher(query)
+            compiled_query = compile_query(query)
+            if isinstance(entities, EntitySpace):
+                entities, self._plan = compiled_query.candidates(entities)
+            match = compiled_query.match
             self.entities = [entity for entity in entities if match(entity)]
 
     def __len__(self) -> int:
@@ -117,6 +131,16 @@ class EntityQuery(abc.Sequence):
         else:
             return None
 
+    def explain(self) -> str:
+        """ Returns a description of the index used to select the candidates for the initial query:
+
+            - ``'attribute index: layer == "0"'``: candidates selected by an attribute index
+            - ``'DXF type index: ARC LINE'``: candidates selected by the DXF type index
+            - ``'full scan'``: no index used
+
+        """
+        return self._plan
+
     def extend(self, entities: Iterable['DXFEntity'], query: str = '*', unique: bool = True) -> 'EntityQuery':
         """ Extent the :class:`EntityQuery` container by entities matching an additional query. """
         self.entities.extend(EntityQuery(entities, query))
@@ -152,15 +176,145 @@ class EntityQuery(abc.Sequence):
         return groupby(self.entities, dxfattrib, key)
 
 
+class LazyEntityQuery:
+    """
+    Lazy evaluated query of DXF entities, the entities are tested at iteration and the result is never stored,
+    therefore :class:`LazyEntityQuery` is the better choice for large results processed only once.
+
+    All filter methods return a new :class:`LazyEntityQuery` object and can be chained::
+
+        for e in msp.iquery('LWPOLYLINE[layer=="CONTOURS"]').filter(lambda e: e.closed)[:100]:
+            export(e)
+
+    Each iteration evaluates the query again, iterating a query based on a generator works only once.
+    Use :code:`EntityQuery(lazy_query)` to store the result.
+
+    """
+
+    def __init__(self, entities: Iterable['DXFEntity'], query: str = '*'):
+        self._entities = entities
+        # stages are applied in given order, each stage gets an iterator and returns an iterator
+        self._stages = []  # type: List[Callable[[Iterator[DXFEntity]], Iterator[DXFEntity]]]
+        if query != '*':
+            match = entity_matcher(query)
+            self._stages.append(lambda entities: filter(match, entities))
+
+    def _chain(self, stage: Callable[[Iterator['DXFEntity']], Iterator['DXFEntity']]) -> 'LazyEntityQuery':
+        result = LazyEntityQuery(self._entities)
+        result._stages = self._stages + [stage]
+        return result
+
+    def __iter__(self) -> Iterator['DXFEntity']:
+        """ Returns iterator of matching DXF entities. """
+        entities = iter(self._entities)
+        for stage in self._stages:
+            entities = stage(entities)
+        return entities
+
+    def __getitem__(self, item: Union[int, slice]) -> Union['DXFEntity', 'LazyEntityQuery']:
+        """ Returns the DXF entity at index `item` or a new :class:`LazyEntityQuery` for a slice, negative indices are
+        not supported.
+        """
+        if isinstance(item, slice):
+            start, stop, step = item.start, item.stop, item.step
+            return self._chain(lambda entities: islice(entities, start, stop, step))
+        for entity in islice(self, item, None):
+            return entity
+        raise IndexError('index out of range')
+
+    @property
+    def first(self):
+        """ First entity or ``None``. """
+        return next(iter(self), None)
+
+    def query(self, query: str = '*') -> 'LazyEntityQuery':
+        """ Returns a new :class:`LazyEntityQuery` with all entities matching this additional query. """
+        if query == '*':
+            return self
+        match = entity_matcher(query)
+        return self._chain(lambda entities: filter(match, entities))
+
+    def filter(self, func: Callable[['DXFEntity'], bool]) -> 'LazyEntityQuery':
+        """ Returns a new :class:`LazyEntityQuery` with all entities for which `func` returns ``True``. """
+        return self._chain(lambda entities: filter(func, entities))
+
+    def limit(self, count: int) -> 'LazyEntityQuery':
+        """ Returns a new :class:`LazyEntityQuery` with the first `count` entities. """
+        return self[:count]
+
+    def unique(self) -> 'LazyEntityQuery':
+        """ Returns a new :class:`LazyEntityQuery` without duplicate entities, stores the handles of all entities. """
+        return self._chain(unique_entities)
+
+    def groupby(self, dxfattrib: str = '', key: Callable[['DXFEntity'], Hashable] = None) \
+            -> Dict[Hashable, List['DXFEntity']]:
+        """ Returns a dict of entity lists, where entities are grouped by a DXF attribute or a key function, see
+        :meth:`EntityQuery.groupby`.
+        """
+        return groupby(self, dxfattrib, key)
+
+
+class CompiledQuery:
+    """ Compiled query string, use :func:`compile_query` to get cached instances. (internal API) """
+
+    def __init__(self, query: str):
+        query_args = EntityQueryParser.parseString(query, parseAll=True)
+        self.query = query
+        self.dxftypes = included_names(query_args.EntityQuery)
+        match_name = build_entity_name_matcher(query_args.EntityQuery)
+        tokens = query_args.AttribQuery
+        if len(tokens):
+            ignore_case = 'i' == query_args.AttribQueryOptions
+            expr = BoolExpression(_compile_tokens(tokens, ignore_case))
+            match_attribs = compile_expression(expr)
+            # relations which are required for a match, candidates for an attribute index
+            self.relations = sorted(required_relations(expr), key=lambda r: r.op != '==')
+        else:
+            match_attribs = None
+            self.relations = []
+
+        if match_attribs is None:
+            self.match = match_name
+        else:
+            def match(entity: 'DXFEntity') -> bool:
+                return match_name(entity) and match_attribs(entity)
+
+            self.match = match
+
+    def candidates(self, entity_space: 'EntitySpace') -> Tuple[Iterable['DXFEntity'], str]:
+        """ Returns the candidates of `entity_space` and a description of the used index, prefers attribute indexes for
+        ``==`` relations over the DXF type index.
+        """
+        for relation in self.relations:
+            name = relation.dxf_attrib
+            if entity_space.attribute_index(name) is not None:
+                return entity_space.by_attribute(name, relation.match_value), 'attribute index: ' + str(relation)
+        if self.dxftypes is not None:
+            return entity_space.by_dxftypes(self.dxftypes), 'DXF type index: ' + ' '.join(sorted(self.dxftypes))
+        return entity_space, 'full scan'
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(query: str) -> CompiledQuery:
+    """ Returns the cached :class:`CompiledQuery` for `query`. (internal API) """
+    return CompiledQuery(query)
+
+
 def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
-    query_args = EntityQueryParser.parseString(query, parseAll=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+    return compile_query(query).match
 
-    def matcher(entity: 'DXFEntity') -> bool:
-        return entity_matcher_(entity) and attrib_matcher(entity)
 
-    return matcher
+def included_names(names: Sequence[str]) -> Optional[Set[str]]:
+    """ Returns the set of included entity names or ``None`` if the entity query contains the special name ``*``.
+    Excluding names without ``*`` has no effect, see :func:`name_query`.
+    """
+    include = set()
+    for name in ' '.join(names).upper().split():
+        if name == '*':
+            return None
+        elif not name.startswith('!'):
+            include.add(name)
+    return include
 
 
 def build_entity_name_matcher_old(names: Sequence[str]) -> Callable[['DXFEntity'], bool]:
@@ -195,6 +349,8 @@ class Relation:
     def __init__(self, relation: Sequence, ignore_case: bool):
         name, op, value = relation
         self.dxf_attrib = name
+        self.op = op
+        self.raw_value = value
         self.compare = Relation.CMP_OPERATORS[op]
         self.convert_case = to_lower if ignore_case else lambda x: x
 
@@ -204,10 +360,17 @@ class Relation:
         else:
             self.value = self.convert_case(value)
 
+    def __str__(self):
+        value = '"{}"'.format(self.raw_value) if isinstance(self.raw_value, str) else str(self.raw_value)
+        return '{} {} {}'.format(self.dxf_attrib, self.op, value)
+
+    def match_value(self, value: Any) -> bool:
+        """ ``True`` if the attribute `value` fulfills the relation. """
+        return self.compare(self.convert_case(value), self.value)
+
     def evaluate(self, entity: 'DXFEntity') -> bool:
         try:
-            value = self.convert_case(entity.get_dxf_attrib(self.dxf_attrib))
-            return self.compare(value, self.value)
+            return self.match_value(entity.get_dxf_attrib(self.dxf_attrib))
         except AttributeError:  # entity does not support this attribute
             return False
         except ValueError:  # entity supports this attribute, but has no value for it
@@ -265,16 +428,55 @@ def _compile_tokens(tokens: Union[str, Sequence], ignore_case: bool) -> Union[st
         return BoolExpression([_compile_tokens(token, ignore_case) for token in tokens])
 
 
+def compile_expression(expr: Union[Relation, BoolExpression]) -> Callable[['DXFEntity'], bool]:
+    """ Returns a single function for the evaluation of `expr`, without walking the token tree for each entity. """
+    if isinstance(expr, Relation):
+        return expr.evaluate
+    if isinstance(expr.tokens, Relation):
+        return expr.tokens.evaluate
+
+    funcs = [compile_expression(token) for token in expr if hasattr(token, 'evaluate')]
+    operators = set(token for token in expr if not hasattr(token, 'evaluate'))
+    count = len([token for token in expr if not hasattr(token, 'evaluate')])
+    if count == 0 and len(funcs) == 1:
+        return funcs[0]
+    if operators == {'!'} and count == 1 and len(funcs) == 1:
+        func = funcs[0]
+        return lambda entity: not func(entity)
+    if count + 1 == len(funcs):
+        if operators == {'&'}:
+            if len(funcs) == 2:
+                func1, func2 = funcs
+                return lambda entity: func1(entity) and func2(entity)
+            return lambda entity: all(func(entity) for func in funcs)
+        if operators == {'|'}:
+            if len(funcs) == 2:
+                func1, func2 = funcs
+                return lambda entity: func1(entity) or func2(entity)
+            return lambda entity: any(func(entity) for func in funcs)
+    return expr.evaluate  # mixed operators
+
+
+def required_relations(expr: Union[Relation, BoolExpression]) -> List[Relation]:
+    """ Returns all relations which have to be ``True`` for a match of `expr`. """
+    if isinstance(expr, Relation):
+        return [expr]
+    if isinstance(expr.tokens, Relation):
+        return [expr.tokens]
+    relations = []
+    operators = [token for token in expr if not hasattr(token, 'evaluate')]
+    if len(operators) == 0 or set(operators) == {'&'}:
+        for token in expr:
+            if hasattr(token, 'evaluate'):
+                relations.extend(required_relations(token))
+    return relations
+
+
 def build_entity_attributes_matcher(tokens: Sequence, options: str) -> Callable[['DXFEntity'], bool]:
     if not len(tokens):
         return lambda x: True
     ignore_case = 'i' == options  # at this time just one option is supported
-    expr = BoolExpression(_compile_tokens(tokens, ignore_case))
-
-    def match_bool_expr(entity: 'DXFEntity') -> bool:
-        return expr.evaluate(entity)
-
-    return match_bool_expr
+    return compile_expression(BoolExpression(_compile_tokens(tokens, ignore_case)))
 
 
 def unique_entities(entities: Iterable['DXFEntity']) -> Iterable['DXFEntity']:
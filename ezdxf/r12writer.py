@@ -3,15 +3,20 @@
 # Created: 14.04.2016
 # Copyright (C) 2016, Manfred Moitzi
 # License: MIT License
-from typing import TextIO, Union, Sequence, Iterable
+from typing import TextIO, Union, Sequence, Iterable, List
 from contextlib import contextmanager
+from itertools import chain, islice, zip_longest, repeat
 
 # types
 Vertex = Sequence[float]
 
+# count of entities formatted by one string operation in batch methods
+BATCH_SIZE = 1024
+
 
 def rnd(x: float) -> float:  # adjust output precision of floats by changing 'ndigits'
-    return round(x, ndigits=6)
+    # int values are written as float values, output does not depend on the input type
+    return round(float(x), ndigits=6)
 
 
 TEXT_ALIGN_FLAGS = {
@@ -31,7 +36,7 @@ TEXT_ALIGN_FLAGS = {
 
 
 @contextmanager
-def r12writer(stream: Union[TextIO, str], fixed_tables: bool=False) -> 'R12FastStreamWriter':
+def r12writer(stream: Union[TextIO, str], fixed_tables: bool = False) -> 'R12FastStreamWriter':
     """
     Context manager for writing DXF entities to a stream/file. `stream` can be any file like object
     with a :func:`write` method or just a string for writing DXF entities to the file system.
@@ -333,6 +338,122 @@ class R12FastStreamWriter:
         dxf.append(dxf_vertex(insert, code=11))  # align point
         self.stream.write(''.join(dxf))
 
+    def add_points(self,
+                   locations: Iterable[Vertex],
+                   layer: str = "0",
+                   color: int = None,
+                   linetype: str = None) -> None:
+        """
+        Add multiple POINT entities with the same DXF attributes.
+
+        Args:
+            locations: iterable of ``(x, y[, z])`` tuples or a NumPy array of shape ``(n, 2)`` or ``(n, 3)``,
+                       all locations require the same axis count
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+
+        """
+        prefix = "0\nPOINT\n" + dxf_attribs(layer, color, linetype)
+        for chunk in batches(locations):
+            template = prefix + vertex_template(len(chunk[0]))
+            self.stream.write(format_batch(template, chunk, chunk))
+
+    def add_lines(self,
+                  starts: Iterable[Vertex],
+                  ends: Iterable[Vertex],
+                  layer: str = "0",
+                  color: int = None,
+                  linetype: str = None) -> None:
+        """
+        Add multiple LINE entities with the same DXF attributes.
+
+        Args:
+            starts: iterable of start vertices as ``(x, y[, z])`` tuples or a NumPy array of shape ``(n, 2)``
+                    or ``(n, 3)``, all start vertices require the same axis count
+            ends: iterable of end vertices like `starts`, requires the same count of vertices as `starts`
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+
+        """
+        prefix = "0\nLINE\n" + dxf_attribs(layer, color, linetype)
+        for start_chunk, end_chunk in zip_longest(batches(starts), batches(ends)):
+            if start_chunk is None or end_chunk is None or len(start_chunk) != len(end_chunk):
+                raise ValueError("starts and ends require the same count of vertices.")
+            template = prefix + vertex_template(len(start_chunk[0]), 10) + vertex_template(len(end_chunk[0]), 11)
+            self.stream.write(format_batch(template, start_chunk, chain.from_iterable(zip(start_chunk, end_chunk))))
+
+    def add_3dfaces(self,
+                    faces: Iterable[Sequence[Vertex]],
+                    invisible: int = 0,
+                    layer: str = "0",
+                    color: int = None,
+                    linetype: str = None) -> None:
+        """
+        Add multiple 3DFACE entities with the same DXF attributes.
+
+        Args:
+            faces: iterable of faces, each face is a sequence of 3 or 4 ``(x, y, z)`` vertices, or a NumPy array
+                   of shape ``(n, 4, 3)``
+            invisible: bit coded flag to define the invisible edges see :meth:`add_3dface`
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+
+        """
+        prefix = "0\n3DFACE\n" + dxf_attribs(layer, color, linetype)
+        suffix = dxf_tag(70, str(invisible)) if invisible else ""
+        for chunk in batches(faces):
+            quadrilaterals = []
+            for face in chunk:
+                if len(face) == 3:
+                    face = list(face)
+                    face.append(face[-1])  # double last vertex
+                elif len(face) != 4:
+                    raise ValueError("3DFACE needs 3 or 4 vertices.")
+                quadrilaterals.append(face)
+            dim = len(quadrilaterals[0][0])
+            template = prefix + ''.join(vertex_template(dim, code) for code in range(10, 14)) + suffix
+            self.stream.write(format_batch(template, quadrilaterals, chain.from_iterable(quadrilaterals)))
+
+    def add_polylines(self,
+                      polylines: Iterable[Iterable[Vertex]],
+                      layer: str = "0",
+                      color: int = None,
+                      linetype: str = None) -> None:
+        """
+        Add multiple POLYLINE entities with the same DXF attributes, the first vertex (axis count) of each polyline
+        defines, if the POLYLINE is 2D or 3D.
+
+        Args:
+            polylines: iterable of polylines, each polyline is an iterable of ``(x, y[, z])`` tuples or a NumPy
+                       array of shape ``(n, 2)`` or ``(n, 3)``, all vertices of a polyline require the same axis count
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+
+        """
+        attribs = dxf_attribs(layer, color, linetype)
+        templates = {}
+        vertex_attribs = dxf_attribs(layer)
+        for vertices in polylines:
+            template = None
+            for chunk in batches(vertices):
+                if template is None:  # the first vertex defines the axis count of the whole polyline
+                    dim = len(chunk[0])
+                    try:
+                        header, template = templates[dim]
+                    except KeyError:
+                        polyline_flags, vertex_flags = (8, 32) if dim == 3 else (0, 0)
+                        header = "0\nPOLYLINE\n" + attribs + dxf_tag(66, 1) + dxf_tag(70, polyline_flags)
+                        template = "0\nVERTEX\n" + vertex_attribs + dxf_tag(70, vertex_flags) + vertex_template(dim)
+                        templates[dim] = header, template
+                    self.stream.write(header)
+                self.stream.write(format_batch(template, chunk, chunk))
+            if template is not None:
+                self.stream.write("0\nSEQEND\n")
+
 
 def dxf_attribs(layer: str, color: int = None, linetype: str = None) -> str:
     dxf = ["8\n%s\n" % layer]  # layer is required
@@ -346,6 +467,35 @@ def dxf_attribs(layer: str, color: int = None, linetype: str = None) -> str:
     return "".join(dxf)
 
 
+def batches(vertices: Iterable) -> Iterable[List]:
+    """ Yields lists of max. :data:`BATCH_SIZE` items, NumPy arrays are converted into lists of Python floats. """
+    if hasattr(vertices, 'tolist'):  # NumPy array
+        for start in range(0, len(vertices), BATCH_SIZE):
+            yield vertices[start:start + BATCH_SIZE].tolist()
+    else:
+        vertices = iter(vertices)
+        while True:
+            chunk = list(islice(vertices, BATCH_SIZE))
+            if not chunk:
+                return
+            yield chunk
+
+
+def vertex_template(axis_count: int, code: int = 10) -> str:
+    return ''.join("%d\n%%s\n" % (code + axis * 10) for axis in range(axis_count))
+
+
+def format_batch(template: str, entities: List, vertices: Iterable[Vertex]) -> str:
+    """ Formats all `entities` by one string operation, `template` is the DXF string of one entity and
+    `vertices` are the vertices of all entities in template order.
+    """
+    values = tuple(map(round, map(float, chain.from_iterable(vertices)), repeat(6)))  # same as rnd()
+    try:
+        return (template * len(entities)) % values
+    except TypeError:  # count of placeholders does not match count of values
+        raise ValueError("all vertices require the same axis count.")
+
+
 def dxf_vertex(vertex: Vertex, code=10) -> str:
     dxf = []
     for c in vertex:
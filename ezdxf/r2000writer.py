@@ -0,0 +1,523 @@
+# Purpose: fast & simple DXF R2000+ writer, with no in-memory entities
+# Created: 2019-11-30
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TextIO, Union, Sequence, Iterable, TYPE_CHECKING
+from contextlib import contextmanager
+from itertools import chain
+import io
+
+from ezdxf.lldxf.const import DXF2000, DXF2004, DXFVersionError, DXFValueError
+from ezdxf.r12writer import rnd, dxf_vertex, TEXT_ALIGN_FLAGS
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
+# types
+Vertex = Sequence[float]
+
+# handles reserved for streamed entities, $HANDSEED of the created DXF file is set behind the reserved handles
+RESERVED_HANDLES = 1 << 32
+
+
+@contextmanager
+def r2000writer(stream: Union[TextIO, str], dxfversion: str = 'R2000', doc: 'Drawing' = None,
+                reserved_handles: int = RESERVED_HANDLES) -> 'R2000FastStreamWriter':
+    """
+    Context manager for writing DXF entities to a stream/file. `stream` can be any file like object
+    with a :func:`write` method or just a string for writing DXF entities to the file system.
+
+    Args:
+        stream: file like object or file name
+        dxfversion: DXF version of the created DXF file, ``'R2000'`` or later, ignored if `doc` is not ``None``
+        doc: optional template :class:`~ezdxf.drawing.Drawing`, see :class:`R2000FastStreamWriter`
+        reserved_handles: count of handles reserved for the streamed entities
+
+    """
+    if hasattr(stream, 'write'):
+        writer = R2000FastStreamWriter(stream, dxfversion, doc, reserved_handles)
+        try:
+            yield writer
+        finally:
+            writer.close()
+    else:
+        writer = R2000FastStreamWriter(None, dxfversion, doc, reserved_handles)
+        with io.open(stream, mode='wt', encoding=writer.encoding, errors='dxfreplace') as fp:
+            writer.stream = fp
+            writer.write_preface()
+            try:
+                yield writer
+            finally:
+                writer.close()
+
+
+class R2000FastStreamWriter:
+    """ Fast stream writer to create DXF R2000 and later drawings without building the DXF entities in memory.
+
+    The HEADER, CLASSES, TABLES, BLOCKS and OBJECTS sections are created by a template document, which is
+    :code:`ezdxf.new(dxfversion)` by default. Use a custom template document to define layers, line types, text styles
+    or blocks, existing modelspace entities of the template document are written in front of the streamed entities.
+    The template document is not usable after creating the writer.
+
+    The streamed entities get handles from a reserved handle range, which starts at the next available handle of the
+    template document, the next available handle of the created DXF file ($HANDSEED) is set behind this range.
+
+    Args:
+        stream: a file like object with a :func:`write` method, which supports the required text encoding,
+                see :attr:`encoding`. The DXF preface is written at instantiation, except `stream` is ``None``.
+        dxfversion: DXF version of the created DXF file, ``'R2000'`` or later, ignored if `doc` is not ``None``
+        doc: optional template :class:`~ezdxf.drawing.Drawing`
+        reserved_handles: count of handles reserved for the streamed entities
+
+    """
+
+    def __init__(self, stream: TextIO = None, dxfversion: str = 'R2000', doc: 'Drawing' = None,
+                 reserved_handles: int = RESERVED_HANDLES):
+        if doc is None:
+            import ezdxf
+            doc = ezdxf.new(dxfversion)
+        if doc.dxfversion < DXF2000:
+            raise DXFVersionError('R2000FastStreamWriter requires DXF R2000 or later.')
+        self.dxfversion = doc.dxfversion
+        # text encoding of the created DXF file
+        self.encoding = doc.output_encoding
+        self.owner = doc.modelspace().layout_key
+        handles = doc.entitydb.handles
+        self._next_handle = int(str(handles), 16)
+        self._handle_limit = self._next_handle + reserved_handles
+        handles.reset('%X' % self._handle_limit)
+
+        stream_ = io.StringIO()
+        doc.write(stream_)
+        text = stream_.getvalue()
+        section_start = text.index('  0\nSECTION\n  2\nENTITIES\n')
+        section_end = text.index('  0\nENDSEC\n', section_start)
+        self._preface = text[:section_end]
+        self._tail = text[section_end:]
+        self.stream = stream
+        if stream is not None:
+            self.write_preface()
+
+    def write_preface(self) -> None:
+        """ Write all DXF sections in front of the streamed entities. Call is not necessary if a `stream` was
+        passed to the constructor or when using the context manager :func:`r2000writer`. (internal API)
+        """
+        self.stream.write(self._preface)
+        self._preface = None
+
+    def close(self) -> None:
+        """ Writes the DXF tail including the OBJECTS section. Call is not necessary when using the context manager
+        :func:`r2000writer`.
+        """
+        self.stream.write(self._tail)
+
+    def next_handle(self) -> str:
+        """ Returns next entity handle. (internal API) """
+        handle = self._next_handle
+        if handle >= self._handle_limit:
+            raise DXFValueError('Reserved handles exhausted.')
+        self._next_handle = handle + 1
+        return '%X' % handle
+
+    def _entity(self, dxftype: str, subclass: str, layer: str, color: int = None, linetype: str = None,
+                true_color: int = None, handle: str = None, owner: str = None) -> str:
+        dxf = ["0\n%s\n5\n%s\n330\n%s\n100\nAcDbEntity\n8\n%s\n" % (
+            dxftype, handle or self.next_handle(), owner or self.owner, layer)]
+        if linetype is not None:
+            dxf.append("6\n%s\n" % linetype)
+        if color is not None:
+            if 0 <= int(color) < 257:
+                dxf.append("62\n%d\n" % color)
+            else:
+                raise DXFValueError("color has to be an integer in the range from 0 to 256.")
+        if true_color is not None:
+            if self.dxfversion < DXF2004:
+                raise DXFVersionError("true color requires DXF R2004 or later.")
+            dxf.append("420\n%d\n" % true_color)
+        dxf.append("100\n%s\n" % subclass)
+        return ''.join(dxf)
+
+    def add_line(self,
+                 start: Vertex,
+                 end: Vertex,
+                 layer: str = "0",
+                 color: int = None,
+                 linetype: str = None,
+                 true_color: int = None) -> None:
+        """
+        Add a LINE entity from `start` to `end`.
+
+        Args:
+            start: start vertex as ``(x, y[, z])`` tuple
+            end: end vertex as  as ``(x, y[, z])`` tuple
+            layer: layer name as string, without a layer definition in the template document the assigned
+                   color = ``7`` (black/white) and line type is ``'Continuous'``.
+            color: color as :ref:`ACI` in the range from ``0`` to ``256``,
+                   ``0`` is `ByBlock` and ``256`` is `ByLayer`, default is `ByLayer`
+            linetype: line type as string, line type has to be defined in the template document,
+                      default is `ByLayer`
+            true_color: true color value as ``0x00RRGGBB`` int value, requires DXF R2004 or later,
+                        see :func:`ezdxf.rgb2int`
+
+        """
+        dxf = [self._entity('LINE', 'AcDbLine', layer, color, linetype, true_color)]
+        dxf.append(dxf_vertex(start, code=10))
+        dxf.append(dxf_vertex(end, code=11))
+        self.stream.write(''.join(dxf))
+
+    def add_circle(self,
+                   center: Vertex,
+                   radius: float,
+                   layer: str = "0",
+                   color: int = None,
+                   linetype: str = None,
+                   true_color: int = None) -> None:
+        """
+        Add a CIRCLE entity.
+
+        Args:
+            center: circle center point as ``(x, y)`` tuple
+            radius: circle radius as float
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('CIRCLE', 'AcDbCircle', layer, color, linetype, true_color)]
+        dxf.append(dxf_vertex(center))
+        dxf.append("40\n%s\n" % rnd(radius))
+        self.stream.write(''.join(dxf))
+
+    def add_arc(self,
+                center: Vertex,
+                radius: float,
+                start: float = 0,
+                end: float = 360,
+                layer: str = "0",
+                color: int = None,
+                linetype: str = None,
+                true_color: int = None) -> None:
+        """
+        Add an ARC entity. The arc goes counter clockwise from `start` angle to `end` angle.
+
+        Args:
+            center: arc center point as ``(x, y)`` tuple
+            radius: arc radius as float
+            start: arc start angle in degrees as float
+            end: arc end angle in degrees as float
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('ARC', 'AcDbCircle', layer, color, linetype, true_color)]
+        dxf.append(dxf_vertex(center))
+        dxf.append("40\n%s\n100\nAcDbArc\n50\n%s\n51\n%s\n" % (rnd(radius), rnd(start), rnd(end)))
+        self.stream.write(''.join(dxf))
+
+    def add_point(self,
+                  location: Vertex,
+                  layer: str = "0",
+                  color: int = None,
+                  linetype: str = None,
+                  true_color: int = None) -> None:
+        """
+        Add a POINT entity.
+
+        Args:
+            location: point location as ``(x, y [,z])`` tuple
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('POINT', 'AcDbPoint', layer, color, linetype, true_color)]
+        dxf.append(dxf_vertex(location))
+        self.stream.write(''.join(dxf))
+
+    def add_3dface(self,
+                   vertices: Iterable[Vertex],
+                   invisible: int = 0,
+                   layer: str = "0",
+                   color: int = None,
+                   linetype: str = None,
+                   true_color: int = None) -> None:
+        """
+        Add a 3DFACE entity. 3DFACE is a spatial area with 3 or 4 vertices, all vertices have to be in the same plane.
+
+        Args:
+            vertices: iterable of 3 or 4 ``(x, y, z)`` vertices.
+            invisible: bit coded flag to define the invisible edges, see
+                       :meth:`ezdxf.r12writer.R12FastStreamWriter.add_3dface`
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('3DFACE', 'AcDbFace', layer, color, linetype, true_color)]
+        dxf.append(quadrilateral('3DFACE', vertices))
+        if invisible:
+            dxf.append("70\n%d\n" % invisible)
+        self.stream.write(''.join(dxf))
+
+    def add_solid(self,
+                  vertices: Iterable[Vertex],
+                  layer: str = "0",
+                  color: int = None,
+                  linetype: str = None,
+                  true_color: int = None) -> None:
+        """
+        Add a SOLID entity. SOLID is a solid filled area with 3 or 4 edges and SOLID is a 2D entity.
+
+        Args:
+            vertices: iterable of 3 or 4 ``(x, y[, z])`` tuples, z-axis will be ignored.
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('SOLID', 'AcDbTrace', layer, color, linetype, true_color)]
+        dxf.append(quadrilateral('SOLID', vertices))
+        self.stream.write(''.join(dxf))
+
+    def add_lwpolyline(self,
+                       points: Iterable[Vertex],
+                       closed: bool = False,
+                       layer: str = "0",
+                       color: int = None,
+                       linetype: str = None,
+                       true_color: int = None) -> None:
+        """
+        Add a LWPOLYLINE entity.
+
+        Args:
+            points: iterable of ``(x, y[, start_width[, end_width[, bulge]]])`` tuples
+            closed: ``True`` for a closed polyline
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        count = 0
+        vertices = []
+        for point in points:
+            count += 1
+            vertices.append("10\n%s\n20\n%s\n" % (rnd(point[0]), rnd(point[1])))
+            if len(point) > 2:
+                start_width, end_width, bulge = (tuple(point[2:]) + (0, 0, 0))[:3]
+                if start_width or end_width:
+                    vertices.append("40\n%s\n41\n%s\n" % (rnd(start_width), rnd(end_width)))
+                if bulge:
+                    vertices.append("42\n%s\n" % rnd(bulge))
+        dxf = [self._entity('LWPOLYLINE', 'AcDbPolyline', layer, color, linetype, true_color)]
+        dxf.append("90\n%d\n70\n%d\n" % (count, int(closed)))
+        dxf.extend(vertices)
+        self.stream.write(''.join(dxf))
+
+    def add_polyline(self,
+                     vertices: Iterable[Vertex],
+                     closed: bool = False,
+                     layer: str = "0",
+                     color: int = None,
+                     linetype: str = None,
+                     true_color: int = None) -> None:
+        """
+        Add a POLYLINE entity. The first vertex (axis count) defines, if the POLYLINE is 2D or 3D.
+
+        Args:
+            vertices: iterable of ``(x, y[, z])`` tuples
+            closed: ``True`` for a closed polyline
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        vertices = iter(vertices)
+        try:
+            first = next(vertices)
+        except StopIteration:
+            return
+        if len(first) == 3:
+            subclass, vertex_subclass, flags, vertex_flags = 'AcDb3dPolyline', 'AcDb3dPolylineVertex', 8, 32
+        else:
+            subclass, vertex_subclass, flags, vertex_flags = 'AcDb2dPolyline', 'AcDb2dVertex', 0, 0
+        if closed:
+            flags |= 1
+        owner = self.next_handle()
+        polyline = self._entity('POLYLINE', subclass, layer, color, linetype, true_color, handle=owner)
+        self.stream.write("%s66\n1\n10\n0\n20\n0\n30\n0\n70\n%d\n" % (polyline, flags))
+        vertex_tail = "100\n%s\n" % vertex_subclass
+        for vertex in chain((first,), vertices):
+            dxf = [self._entity('VERTEX', 'AcDbVertex', layer, owner=owner), vertex_tail]
+            dxf.append(dxf_vertex(vertex))
+            dxf.append("70\n%d\n" % vertex_flags)
+            self.stream.write(''.join(dxf))
+        self._add_seqend(owner, layer)
+
+    def add_polyface(self,
+                     vertices: Sequence[Vertex],
+                     faces: Iterable[Sequence[int]],
+                     layer: str = "0",
+                     color: int = None,
+                     linetype: str = None,
+                     true_color: int = None) -> None:
+        """
+        Add a POLYFACE entity, a POLYLINE entity which represents a polyface mesh.
+
+        Args:
+            vertices: sequence of ``(x, y, z)`` tuples
+            faces: iterable of faces, each face is a sequence of 3 or 4 vertex indices, indices start at ``0``
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        faces = list(faces)
+        owner = self.next_handle()
+        polyline = self._entity('POLYLINE', 'AcDbPolyFaceMesh', layer, color, linetype, true_color, handle=owner)
+        self.stream.write("%s66\n1\n10\n0\n20\n0\n30\n0\n70\n64\n71\n%d\n72\n%d\n" % (
+            polyline, len(vertices), len(faces)))
+        vertex_tail = "100\nAcDbPolyFaceMeshVertex\n"
+        for vertex in vertices:
+            dxf = [self._entity('VERTEX', 'AcDbVertex', layer, owner=owner), vertex_tail]
+            dxf.append(dxf_vertex(vertex))
+            dxf.append("70\n192\n")
+            self.stream.write(''.join(dxf))
+        face_tail = "100\nAcDbFaceRecord\n10\n0\n20\n0\n30\n0\n70\n128\n"
+        for face in faces:
+            if not 2 < len(face) < 5:
+                raise DXFValueError("face needs 3 or 4 vertices.")
+            dxf = [self._entity('VERTEX', 'AcDbVertex', layer, owner=owner), face_tail]
+            dxf.extend("%d\n%d\n" % (code, index + 1) for code, index in enumerate(face, start=71))
+            self.stream.write(''.join(dxf))
+        self._add_seqend(owner, layer)
+
+    def _add_seqend(self, owner: str, layer: str) -> None:
+        self.stream.write("0\nSEQEND\n5\n%s\n330\n%s\n100\nAcDbEntity\n8\n%s\n" % (self.next_handle(), owner, layer))
+
+    def add_mesh(self,
+                 vertices: Sequence[Vertex],
+                 faces: Sequence[Sequence[int]],
+                 layer: str = "0",
+                 color: int = None,
+                 linetype: str = None,
+                 true_color: int = None) -> None:
+        """
+        Add a MESH entity without subdivision.
+
+        Args:
+            vertices: sequence of ``(x, y, z)`` tuples
+            faces: sequence of faces, each face is a sequence of vertex indices, indices start at ``0``
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            linetype: line type as string see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('MESH', 'AcDbSubDMesh', layer, color, linetype, true_color)]
+        dxf.append("71\n2\n72\n0\n91\n0\n92\n%d\n" % len(vertices))
+        dxf.extend(dxf_vertex(vertex) for vertex in vertices)
+        dxf.append("93\n%d\n" % sum(len(face) + 1 for face in faces))
+        for face in faces:
+            dxf.append("90\n%d\n" % len(face))
+            dxf.extend("90\n%d\n" % index for index in face)
+        dxf.append("94\n0\n95\n0\n90\n0\n")
+        self.stream.write(''.join(dxf))
+
+    def add_hatch(self,
+                  paths: Iterable[Iterable[Vertex]],
+                  layer: str = "0",
+                  color: int = None,
+                  true_color: int = None) -> None:
+        """
+        Add a HATCH entity with solid fill and polyline boundary paths.
+
+        Args:
+            paths: iterable of boundary paths, each path is an iterable of ``(x, y[, bulge])`` tuples,
+                   all paths are closed
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        boundaries = []
+        for path in paths:
+            path = list(path)
+            has_bulge = any(len(vertex) > 2 and vertex[2] for vertex in path)
+            boundary = ["92\n3\n72\n%d\n73\n1\n93\n%d\n" % (int(has_bulge), len(path))]
+            for vertex in path:
+                boundary.append("10\n%s\n20\n%s\n" % (rnd(vertex[0]), rnd(vertex[1])))
+                if has_bulge:
+                    boundary.append("42\n%s\n" % rnd(vertex[2] if len(vertex) > 2 else 0))
+            boundary.append("97\n0\n")
+            boundaries.append(''.join(boundary))
+        dxf = [self._entity('HATCH', 'AcDbHatch', layer, color, None, true_color)]
+        dxf.append("10\n0\n20\n0\n30\n0\n210\n0\n220\n0\n230\n1\n2\nSOLID\n70\n1\n71\n0\n91\n%d\n" % len(boundaries))
+        dxf.extend(boundaries)
+        dxf.append("75\n1\n76\n1\n98\n0\n")
+        self.stream.write(''.join(dxf))
+
+    def add_text(self,
+                 text: str,
+                 insert: Vertex = (0, 0),
+                 height: float = 1.,
+                 width: float = 1.,
+                 align: str = "LEFT",
+                 rotation: float = 0.,
+                 oblique: float = 0.,
+                 style: str = 'Standard',
+                 layer: str = "0",
+                 color: int = None,
+                 true_color: int = None) -> None:
+        """
+        Add a one line TEXT entity.
+
+        Args:
+            text: the text as string
+            insert: insert location as ``(x, y)`` tuple
+            height: text height in drawing units
+            width: text width as factor
+            align: text alignment, see :meth:`ezdxf.r12writer.R12FastStreamWriter.add_text`
+            rotation: text rotation in degrees as float
+            oblique: oblique in degrees as float, vertical = ``0`` (default)
+            style: text style name as string, text style has to be defined in the template document
+            layer: layer name as string see :meth:`add_line`
+            color: color as :ref:`ACI` see :meth:`add_line`
+            true_color: true color value see :meth:`add_line`
+
+        """
+        dxf = [self._entity('TEXT', 'AcDbText', layer, color, None, true_color)]
+        dxf.append(dxf_vertex(insert, code=10))
+        dxf.append("40\n%s\n1\n%s\n" % (rnd(height), text))
+        if rotation != 0.:
+            dxf.append("50\n%s\n" % rnd(rotation))
+        if width != 1.:
+            dxf.append("41\n%s\n" % rnd(width))
+        if oblique != 0.:
+            dxf.append("51\n%s\n" % rnd(oblique))
+        if style != 'Standard':
+            dxf.append("7\n%s\n" % style)
+        halign, valign = TEXT_ALIGN_FLAGS[align.upper()]
+        dxf.append("72\n%d\n" % halign)
+        dxf.append(dxf_vertex(insert, code=11))  # align point
+        dxf.append("100\nAcDbText\n73\n%d\n" % valign)
+        self.stream.write(''.join(dxf))
+
+
+def quadrilateral(dxftype: str, vertices: Iterable[Vertex]) -> str:
+    vertices = list(vertices)
+    if len(vertices) < 3:
+        raise DXFValueError("%s needs 3 or 4 vertices." % dxftype)
+    elif len(vertices) == 3:
+        vertices.append(vertices[-1])  # double last vertex
+    # SOLID and 3DFACE require z-axis
+    return ''.join(dxf_vertex((v[0], v[1], v[2] if len(v) > 2 else 0), code) for code, v in
+                   enumerate(vertices, start=10))
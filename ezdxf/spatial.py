@@ -0,0 +1,350 @@
+# Purpose: spatial index for DXF entities
+# Created: 2019-12-01
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Optional, Hashable, Dict, Any
+import heapq
+import math
+import itertools
+
+from ezdxf.extents import extents_vertices, Cache
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex
+
+__all__ = ['RTree', 'SpatialIndex']
+
+# 2D bounding box as (xmin, ymin, xmax, ymax) tuple
+BBox = Tuple[float, float, float, float]
+
+MAX_NODE_SIZE = 16
+
+
+class Node:
+    """ R-tree node, `children` of leaf nodes are (xmin, ymin, xmax, ymax, item) tuples, `children` of inner nodes are
+    :class:`Node` objects.
+    """
+    __slots__ = ('children', 'leaf', 'parent', 'bbox')
+
+    def __init__(self, children: List, leaf: bool):
+        self.children = children
+        self.leaf = leaf
+        self.parent = None  # type: Optional[Node]
+        self.bbox = None  # type: Optional[BBox]
+        if not leaf:
+            for child in children:
+                child.parent = self
+        self.update_bbox()
+
+    def update_bbox(self) -> None:
+        children = self.children
+        if not children:
+            self.bbox = None
+        elif self.leaf:
+            self.bbox = (
+                min(c[0] for c in children), min(c[1] for c in children),
+                max(c[2] for c in children), max(c[3] for c in children),
+            )
+        else:
+            boxes = [c.bbox for c in children]
+            self.bbox = (
+                min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes),
+            )
+
+
+def union(a: BBox, b: BBox) -> BBox:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def area(b: BBox) -> float:
+    return (b[2] - b[0]) * (b[3] - b[1])
+
+
+def distance2(x: float, y: float, b: BBox) -> float:
+    """ Returns the squared distance of point (x, y) to bounding box `b`, ``0`` if the point is inside. """
+    dx = b[0] - x if x < b[0] else (x - b[2] if x > b[2] else 0.)
+    dy = b[1] - y if y < b[1] else (y - b[3] if y > b[3] else 0.)
+    return dx * dx + dy * dy
+
+
+def pack(children: List, leaf: bool, max_size: int) -> List[Node]:
+    """ Sort-Tile-Recursive packing of `children` into nodes of max. `max_size` children. """
+    if leaf:
+        def center(c):
+            return c[0] + c[2], c[1] + c[3]
+    else:
+        def center(c):
+            b = c.bbox
+            return b[0] + b[2], b[1] + b[3]
+
+    node_count = math.ceil(len(children) / max_size)
+    slice_count = math.ceil(math.sqrt(node_count))
+    slice_size = slice_count * max_size
+    children = sorted(children, key=lambda c: center(c)[0])
+    nodes = []
+    for start in range(0, len(children), slice_size):
+        tile = sorted(children[start:start + slice_size], key=lambda c: center(c)[1])
+        for index in range(0, len(tile), max_size):
+            nodes.append(Node(tile[index:index + max_size], leaf))
+    return nodes
+
+
+class RTree:
+    """
+    2D R-tree of hashable items with axis aligned bounding boxes as ``(xmin, ymin, xmax, ymax)`` tuples. The tree is
+    bulk loaded by the Sort-Tile-Recursive algorithm and supports incremental insertion and removal of items.
+
+    Args:
+        items: iterable of ``(bbox, item)`` tuples
+        max_node_size: max. count of children per node
+
+    """
+
+    def __init__(self, items: Iterable[Tuple[BBox, Hashable]] = None, max_node_size: int = MAX_NODE_SIZE):
+        self.max_node_size = max(int(max_node_size), 4)
+        self._leaves = {}  # type: Dict[Hashable, Node]
+        entries = [tuple(bbox) + (item,) for bbox, item in (items or [])]
+        nodes = pack(entries, True, self.max_node_size) if entries else [Node([], True)]
+        for leaf in nodes:
+            for entry in leaf.children:
+                self._leaves[entry[4]] = leaf
+        while len(nodes) > 1:
+            nodes = pack(nodes, False, self.max_node_size)
+        self.root = nodes[0]
+
+    def __len__(self) -> int:
+        """ Count of items. """
+        return len(self._leaves)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """ ``True`` if `item` is stored in the tree. """
+        return item in self._leaves
+
+    @property
+    def bbox(self) -> Optional[BBox]:
+        """ Returns the bounding box of all items or ``None`` for an empty tree. """
+        return self.root.bbox
+
+    def insert(self, bbox: BBox, item: Hashable) -> None:
+        """ Insert `item` with bounding box `bbox`, an already existing `item` will be replaced. """
+        if item in self._leaves:
+            self.remove(item)
+        bbox = tuple(bbox)
+        node = self.root
+        while not node.leaf:  # choose child with least enlargement
+            node = min(node.children, key=lambda c: (area(union(c.bbox, bbox)) - area(c.bbox), area(c.bbox)))
+        node.children.append(bbox + (item,))
+        self._leaves[item] = node
+        self._adjust(node)
+
+    def remove(self, item: Hashable) -> None:
+        """ Remove `item`, raises :class:`KeyError` if `item` does not exist. """
+        node = self._leaves.pop(item)
+        node.children = [entry for entry in node.children if entry[4] != item]
+        # remove empty nodes
+        while not node.children and node.parent is not None:
+            parent = node.parent
+            parent.children.remove(node)
+            node = parent
+        while node is not None:  # shrink bounding boxes
+            node.update_bbox()
+            node = node.parent
+        root = self.root
+        while not root.leaf and len(root.children) == 1:  # shrink tree
+            root = root.children[0]
+            root.parent = None
+        if not root.children:
+            root = Node([], True)
+        self.root = root
+
+    def discard(self, item: Hashable) -> None:
+        """ Remove `item` if exist. """
+        if item in self._leaves:
+            self.remove(item)
+
+    def _adjust(self, node: Node) -> None:
+        """ Update bounding boxes from `node` up to root and split overflowing nodes. """
+        while node is not None:
+            parent = node.parent
+            if len(node.children) > self.max_node_size:
+                sibling = self._split(node)
+                if parent is None:  # new root
+                    self.root = parent = Node([node, sibling], False)
+                    return
+                sibling.parent = parent
+                parent.children.append(sibling)
+            else:
+                node.update_bbox()
+            node = parent
+
+    def _split(self, node: Node) -> Node:
+        """ Split `node` along the axis of the larger extension, returns the new sibling node. """
+        children = node.children
+        if node.leaf:
+            boxes = children
+        else:
+            boxes = [c.bbox for c in children]
+        # node.bbox does not include the new child
+        width = max(b[2] for b in boxes) - min(b[0] for b in boxes)
+        height = max(b[3] for b in boxes) - min(b[1] for b in boxes)
+        axis = 0 if width >= height else 1
+        order = sorted(range(len(children)), key=lambda i: boxes[i][axis] + boxes[i][axis + 2])
+        half = len(order) // 2
+        node.children = [children[i] for i in order[:half]]
+        node.update_bbox()
+        sibling = Node([children[i] for i in order[half:]], node.leaf)
+        if node.leaf:
+            for entry in sibling.children:
+                self._leaves[entry[4]] = sibling
+        return sibling
+
+    def search(self, bbox: BBox, inside: bool = False) -> Iterable[Hashable]:
+        """
+        Yields all items which bounding box intersects `bbox` or is completely inside `bbox` if `inside` is ``True``.
+
+        Args:
+            bbox: search window as ``(xmin, ymin, xmax, ymax)`` tuple
+            inside: ``True`` to yield only items completely inside of `bbox`
+
+        """
+        xmin, ymin, xmax, ymax = bbox
+        if self.root.bbox is None:
+            return
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                if inside:
+                    for x0, y0, x1, y1, item in node.children:
+                        if x0 >= xmin and y0 >= ymin and x1 <= xmax and y1 <= ymax:
+                            yield item
+                else:
+                    for x0, y0, x1, y1, item in node.children:
+                        if x0 <= xmax and x1 >= xmin and y0 <= ymax and y1 >= ymin:
+                            yield item
+            else:
+                for child in node.children:
+                    x0, y0, x1, y1 = child.bbox
+                    if x0 <= xmax and x1 >= xmin and y0 <= ymax and y1 >= ymin:
+                        stack.append(child)
+
+    def nearest(self, point: 'Vertex', count: int = 1) -> List[Hashable]:
+        """
+        Returns the `count` items with the smallest distance from `point` to their bounding box, nearest item first.
+
+        Args:
+            point: search location as ``(x, y[, z])`` tuple, z-axis is ignored
+            count: max. count of items to return
+
+        """
+        x, y = point[0], point[1]
+        result = []
+        if self.root.bbox is None:
+            return result
+        tie_breaker = itertools.count()
+        heap = [(0., next(tie_breaker), False, self.root)]
+        while heap and len(result) < count:
+            _, _, is_item, obj = heapq.heappop(heap)
+            if is_item:
+                result.append(obj)
+            elif obj.leaf:
+                for entry in obj.children:
+                    heapq.heappush(heap, (distance2(x, y, entry), next(tie_breaker), True, entry[4]))
+            else:
+                for child in obj.children:
+                    heapq.heappush(heap, (distance2(x, y, child.bbox), next(tie_breaker), False, child))
+        return result
+
+
+def entity_bbox(entity: 'DXFGraphic', cache: Cache = None) -> Optional[BBox]:
+    """ Returns the 2D bounding box of `entity` in :ref:`WCS` as ``(xmin, ymin, xmax, ymax)`` tuple or ``None``.
+    (internal API)
+    """
+    xs = []
+    ys = []
+    for v in extents_vertices(entity, cache):
+        xs.append(v[0])
+        ys.append(v[1])
+    if xs:
+        return min(xs), min(ys), max(xs), max(ys)
+    return None
+
+
+class SpatialIndex:
+    """
+    Spatial index of DXF entities, based on a 2D :class:`RTree` of the entity bounding boxes in the xy-plane of the
+    :ref:`WCS`. Entities without bounding box, like XLINE or RAY, are not indexed.
+
+    The index of a layout is updated automatically by adding and removing entities, but not by modifying entities,
+    call :meth:`update` for modified entities.
+
+    Args:
+        entities: iterable of DXF entities
+        max_node_size: max. count of children per R-tree node
+
+    """
+
+    def __init__(self, entities: Iterable['DXFGraphic'] = None, max_node_size: int = MAX_NODE_SIZE):
+        # block definition extents are cached, changes of block definitions are not tracked
+        self.cache = Cache()
+        items = []
+        for entity in entities or []:
+            box = entity_bbox(entity, self.cache)
+            if box is not None:
+                items.append((box, entity))
+        self.rtree = RTree(items, max_node_size)
+
+    def __len__(self) -> int:
+        """ Count of indexed entities. """
+        return len(self.rtree)
+
+    def __contains__(self, entity: 'DXFGraphic') -> bool:
+        """ ``True`` if `entity` is indexed. """
+        return entity in self.rtree
+
+    def add(self, entity: 'DXFGraphic') -> None:
+        """ Add `entity` to the index. """
+        box = entity_bbox(entity, self.cache)
+        if box is not None:
+            self.rtree.insert(box, entity)
+
+    def update(self, entity: 'DXFGraphic') -> None:
+        """ Update index for modified `entity`. """
+        self.rtree.discard(entity)
+        self.add(entity)
+
+    def discard(self, entity: 'DXFGraphic') -> None:
+        """ Remove `entity` from the index, if indexed. """
+        self.rtree.discard(entity)
+
+    def query_window(self, bbox: Any, mode: str = 'intersect') -> Iterable['DXFGraphic']:
+        """
+        Yields all entities which bounding box intersects the search window `bbox` or is completely inside the
+        search window.
+
+        Args:
+            bbox: search window as :class:`~ezdxf.math.bbox.BoundingBox` or as two ``(x, y)`` corner points
+            mode: ``'intersect'`` or ``'inside'``
+
+        """
+        if mode not in ('intersect', 'inside'):
+            raise ValueError('invalid mode: "intersect" or "inside"')
+        if hasattr(bbox, 'extmin'):
+            p1, p2 = bbox.extmin, bbox.extmax
+        else:
+            p1, p2 = bbox
+        window = min(p1[0], p2[0]), min(p1[1], p2[1]), max(p1[0], p2[0]), max(p1[1], p2[1])
+        return (e for e in self.rtree.search(window, inside=(mode == 'inside')) if e.is_alive)
+
+    def nearest(self, point: 'Vertex', count: int = 1) -> List['DXFGraphic']:
+        """
+        Returns the `count` entities nearest to `point`, nearest entity first. The distance is measured from `point`
+        to the bounding box of an entity.
+
+        Args:
+            point: search location as ``(x, y[, z])`` tuple, z-axis is ignored
+            count: max. count of entities to return
+
+        """
+        return [e for e in self.rtree.nearest(point, count) if e.is_alive]
@@ -0,0 +1,168 @@
+# Purpose: persistent cache of loaded DXF documents
+# Created: 2019-11-24
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Optional, Any, Union
+import os
+import stat
+import pickle
+import hashlib
+import tempfile
+import logging
+
+from ezdxf.version import __version__
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
+logger = logging.getLogger('ezdxf')
+
+SUFFIX = '.ezdxf-cache'
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+BLOCK_SIZE = 1 << 20
+DEFAULT_MAX_SIZE = 256 << 20  # 256 MiB
+
+
+class LoadCache:
+    """
+    Persistent cache of loaded DXF documents as pickled snapshots in a cache directory. Snapshots are keyed by the
+    content hash of the DXF file, the ezdxf version and the load arguments, a modified DXF file or a new ezdxf version
+    never reuses an old snapshot.
+
+    Snapshots are written to a temporary file and renamed, so multiple processes can share the same cache directory.
+    The least recently used snapshots are removed, if the size of all snapshots exceeds `max_size`.
+
+    Loading a pickled snapshot can execute arbitrary code, everyone who can write to the cache directory can run
+    code in the process loading the snapshots. On POSIX systems the cache is only used, if the cache directory and
+    the snapshot file are owned by the current user and are not writable by group or others, see :func:`is_trusted`.
+    A new cache directory is created with access only for the current user.
+
+    Args:
+        directory: cache directory, will be created if not exist
+        max_size: max. size of all snapshots in bytes
+
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.trusted = is_trusted(directory)
+        if not self.trusted:
+            logger.warning('Load cache directory "{}" is not owned by the current user or is writable by group or '
+                           'others, load cache disabled.'.format(directory))
+
+    def key(self, filename: str, *args: Any) -> str:
+        """ Returns cache key for DXF file `filename`, `args` are load arguments which affect the loaded document,
+        `args` should have a stable :func:`repr` representation.
+        """
+        hash_ = hashlib.sha256()
+        with open(filename, 'rb') as fp:
+            for block in iter(lambda: fp.read(BLOCK_SIZE), b''):
+                hash_.update(block)
+        hash_.update(repr((__version__, PROTOCOL) + args).encode())
+        return hash_.hexdigest()
+
+    def path(self, key: str) -> str:
+        """ Returns file path of snapshot `key`. """
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Optional['Drawing']:
+        """ Returns cached document `key` or ``None`` if not exist or if the cache directory or the snapshot file
+        are not trusted.
+        """
+        if not self.trusted:
+            return None
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as fp:
+                if not is_trusted(fp.fileno()):
+                    logger.warning('Load cache entry "{}" is not owned by the current user or is writable by group or '
+                                   'others, ignored.'.format(path))
+                    return None
+                doc = pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # damaged or incompatible snapshot
+            logger.debug('Invalid load cache entry "{}": {}'.format(path, str(e)))
+            self._remove(path)
+            return None
+        try:  # mark as recently used
+            os.utime(path)
+        except OSError:  # removed by another process
+            pass
+        return doc
+
+    def put(self, key: str, doc: 'Drawing') -> None:
+        """ Store document `doc` as snapshot `key` and remove least recently used snapshots if required, does nothing
+        if the cache directory is not trusted.
+        """
+        if not self.trusted:
+            return
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                pickle.dump(doc, fp, protocol=PROTOCOL)
+            os.replace(tmp_path, self.path(key))
+        except Exception as e:  # not picklable document or IO error, just don't cache
+            logger.debug('Can not store load cache entry "{}": {}'.format(key, str(e)))
+            self._remove(tmp_path)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """ Remove least recently used snapshots until the size of all snapshots is below `max_size`. """
+        snapshots = []
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    info = os.stat(path)
+                except OSError:  # removed by another process
+                    continue
+                snapshots.append((info.st_mtime, info.st_size, path))
+        total_size = sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def clear(self) -> None:
+        """ Remove all snapshots. """
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                self._remove(os.path.join(self.directory, name))
+
+    def size(self) -> int:
+        """ Returns the size of all snapshots in bytes. """
+        total_size = 0
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                try:
+                    total_size += os.path.getsize(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+        return total_size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def is_trusted(path: Union[str, int]) -> bool:
+    """ Returns ``True`` if the file or directory `path` is owned by the current user and is not writable by group
+    or others, `path` can be a file name or a file descriptor. Always ``True`` on systems without user IDs like
+    Windows.
+    """
+    getuid = getattr(os, 'getuid', None)
+    if getuid is None:
+        return True
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    return info.st_uid == getuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
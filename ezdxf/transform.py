@@ -0,0 +1,710 @@
+# Purpose: transformation of DXF entities by a transformation matrix
+# Created: 2019-12-14
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+from typing import TYPE_CHECKING, Iterable, Callable, Dict, List, Tuple, Sequence, Optional
+import math
+from itertools import chain
+from ezdxf.math import Vector, OCS, Matrix44, Z_AXIS
+from ezdxf.lldxf.const import DXFTypeError, DXFValueError
+from ezdxf.lldxf.packedtags import numpy_module
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex, DXFNamespace
+    from ezdxf.lldxf.packedtags import VertexArray
+
+__all__ = ['transform', 'transform_all', 'transform_direction', 'OCSTransform', 'TRANSFORMERS', 'BATCH_TRANSFORMERS']
+
+# type of functions, which transform a single entity inplace
+TransformFunc = Callable[['DXFGraphic', Matrix44], None]
+# type of functions, which transform a list of entities of the same DXF type inplace and return the entities which
+# could not be transformed
+BatchTransformFunc = Callable[[List['DXFGraphic'], Matrix44], List['DXFGraphic']]
+
+TWO_PI = math.pi * 2.
+
+
+def transform_direction(m: Matrix44, direction: 'Vertex') -> Vector:
+    """ Returns the transformed `direction` vector, only the linear part of matrix `m` is applied, the translation
+    is ignored.
+    """
+    x, y, z = direction
+    m = m.matrix
+    return Vector(
+        x * m[0] + y * m[4] + z * m[8],
+        x * m[1] + y * m[5] + z * m[9],
+        x * m[2] + y * m[6] + z * m[10],
+    )
+
+
+def ocs_to_wcs_matrix(ocs: OCS) -> Matrix44:
+    """ Returns the transformation matrix from `ocs` to :ref:`WCS`. """
+    return ocs.to_wcs_matrix()
+
+
+class OCSTransform:
+    """
+    Transformation of :ref:`OCS` coordinates by a :ref:`WCS` transformation matrix `m`. The new extrusion vector is
+    the normal vector of the transformed OCS xy-plane, the OCS coordinates of the transformed entity are located in
+    the OCS of the new extrusion vector.
+
+    Attributes:
+        old_extrusion: extrusion vector of the source OCS as :class:`~ezdxf.math.Vector`
+        new_extrusion: extrusion vector of the target OCS as :class:`~ezdxf.math.Vector`
+        scale_x: scaling factor of the OCS x-axis
+        scale_y: scaling factor of the OCS y-axis
+        scale_z: signed scaling factor of thickness values in extrusion direction
+        matrix: transformation matrix from source OCS to target OCS as :class:`~ezdxf.math.Matrix44`
+
+    """
+
+    def __init__(self, extrusion: 'Vertex' = Z_AXIS, m: Matrix44 = None):
+        m = m or Matrix44()
+        self.old_extrusion = Vector(extrusion)
+        old_ocs = OCS(self.old_extrusion)
+        ux = transform_direction(m, old_ocs.ux)
+        uy = transform_direction(m, old_ocs.uy)
+        uz = transform_direction(m, old_ocs.uz)
+        normal = ux.cross(uy)
+        if normal.is_null:
+            raise DXFValueError('Transformation collapses the OCS xy-plane.')
+        self.new_extrusion = normal.normalize()
+        self.scale_x = ux.magnitude
+        self.scale_y = uy.magnitude
+        self.scale_z = uz.dot(self.new_extrusion)
+        self._orthogonal = math.isclose(ux.dot(uy), 0., abs_tol=1e-9 * self.scale_x * self.scale_y)
+        new_ocs = OCS(self.new_extrusion)
+        self.matrix = Matrix44.chain(ocs_to_wcs_matrix(old_ocs), m, Matrix44.ucs(new_ocs.ux, new_ocs.uy, new_ocs.uz))
+
+    @property
+    def is_uniform(self) -> bool:
+        """ ``True`` if the OCS xy-plane is scaled uniform and not sheared, circles stay circles. """
+        return self._orthogonal and math.isclose(self.scale_x, self.scale_y, rel_tol=1e-9)
+
+    @property
+    def is_orthogonal(self) -> bool:
+        """ ``True`` if the OCS x- and y-axis stay perpendicular, the transformation does not shear. """
+        return self._orthogonal
+
+    @property
+    def scale_uniform(self) -> float:
+        """ Average scaling factor of the OCS xy-plane, used for width values like polyline widths. """
+        return (self.scale_x + self.scale_y) / 2.
+
+    def point(self, point: 'Vertex') -> Vector:
+        """ Returns the transformed OCS `point` as OCS point of the target OCS. """
+        return self.matrix.transform(point)
+
+    def points(self, points: Iterable['Vertex']) -> List[Vector]:
+        """ Returns the transformed OCS `points` as OCS points of the target OCS. """
+        return self.matrix.transform_vectors(points)
+
+    def direction(self, direction: 'Vertex') -> Vector:
+        """ Returns the transformed OCS `direction` vector as direction vector in the target OCS. """
+        return transform_direction(self.matrix, direction)
+
+    def angle_deg(self, angle: float) -> float:
+        """ Returns the transformed OCS `angle` in degrees as angle in degrees in the target OCS. """
+        return self.direction(Vector.from_deg_angle(angle)).angle_deg
+
+
+def _set_extrusion(dxf: 'DXFNamespace', extrusion: Vector, name: str = 'extrusion') -> None:
+    # do not add the default extrusion vector to entities without explicit extrusion vector
+    if dxf.hasattr(name) or not extrusion.isclose(Z_AXIS):
+        dxf.set(name, extrusion)
+
+
+def _scale_thickness(dxf: 'DXFNamespace', factor: float) -> None:
+    if dxf.hasattr('thickness'):
+        dxf.thickness = dxf.thickness * factor
+
+
+def _transform_wcs_extrusion(dxf: 'DXFNamespace', m: Matrix44) -> None:
+    # extrusion vector and thickness of entities with WCS coordinates like LINE and POINT
+    if dxf.hasattr('extrusion') or dxf.hasattr('thickness'):
+        extrusion = transform_direction(m, dxf.extrusion)
+        _scale_thickness(dxf, extrusion.magnitude)
+        _set_extrusion(dxf, extrusion.normalize())
+
+
+def _transform_ocs_extrusion(dxf: 'DXFNamespace', t: OCSTransform) -> None:
+    # extrusion vector and thickness of entities with OCS coordinates like CIRCLE or LWPOLYLINE
+    _scale_thickness(dxf, t.scale_z)
+    _set_extrusion(dxf, t.new_extrusion)
+
+
+def _require_uniform(entity: 'DXFGraphic', t: OCSTransform) -> None:
+    if not t.is_uniform:
+        raise DXFValueError('Non uniform scaling of {} entities is not supported.'.format(entity.dxftype()))
+
+
+def _require_uniform_bulges(entity: 'DXFGraphic', t: OCSTransform, bulges: Iterable[float]) -> None:
+    # bulge segments are circular arcs, which become elliptic arcs by non uniform scaling or shearing
+    if not t.is_uniform and any(bulges):
+        raise DXFValueError('Non uniform scaling of {} entities with bulges is not supported.'.format(
+            entity.dxftype()))
+
+
+def _ocs_group_key(entity: 'DXFGraphic') -> Tuple[float, float, float]:
+    return Vector(entity.dxf.extrusion).xyz
+
+
+def _group_by_extrusion(entities: Iterable['DXFGraphic']) -> Dict[Tuple[float, float, float], List['DXFGraphic']]:
+    groups = dict()
+    for entity in entities:
+        groups.setdefault(_ocs_group_key(entity), []).append(entity)
+    return groups
+
+
+def _transform_vertex_arrays(m: Matrix44, arrays: Sequence['VertexArray']) -> None:
+    """ Transforms the WCS vertices of all `arrays` inplace by one matrix multiplication if NumPy is available. """
+    arrays = [a for a in arrays if len(a)]
+    if not arrays:
+        return
+    np = numpy_module(optional=True)
+    if np is not None:
+        views = [a.as_numpy() for a in arrays]
+        matrix = np.array(m.matrix).reshape(4, 4)
+        vertices = np.concatenate(views) @ matrix[:3, :3] + matrix[3, :3]
+        start = 0
+        for view in views:
+            end = start + len(view)
+            view[:] = vertices[start:end]
+            start = end
+    else:
+        vertices = m.transform_vectors(chain.from_iterable(arrays))
+        start = 0
+        for vertex_array in arrays:
+            end = start + len(vertex_array)
+            vertex_array.set(v.xyz for v in vertices[start:end])
+            start = end
+
+
+def _transform_point(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    dxf.location = m.transform(dxf.location)
+    _transform_wcs_extrusion(dxf, m)
+
+
+def _transform_line(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    dxf.start = m.transform(dxf.start)
+    dxf.end = m.transform(dxf.end)
+    _transform_wcs_extrusion(dxf, m)
+
+
+def _transform_xline(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    dxf.start = m.transform(dxf.start)
+    dxf.unit_vector = transform_direction(m, dxf.unit_vector).normalize()
+
+
+def _transform_circle(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    t = OCSTransform(dxf.extrusion, m)
+    _require_uniform(entity, t)
+    dxf.center = t.point(dxf.center)
+    dxf.radius = dxf.radius * t.scale_x
+    if entity.dxftype() == 'ARC':
+        dxf.start_angle = t.angle_deg(dxf.start_angle) % 360.
+        dxf.end_angle = t.angle_deg(dxf.end_angle) % 360.
+    _transform_ocs_extrusion(dxf, t)
+
+
+def conjugate_axes(a: Vector, b: Vector) -> Tuple[Vector, Vector, float]:
+    """ Returns the major axis, the minor axis and the param shift of the ellipse ``p(t) = a*cos(t) + b*sin(t)``
+    defined by the conjugated diameters `a` and `b`, the param `t` of the source ellipse is the param
+    ``t - shift`` of the returned ellipse.
+    """
+    t0 = 0.5 * math.atan2(2. * a.dot(b), a.dot(a) - b.dot(b))
+    cos_t0 = math.cos(t0)
+    sin_t0 = math.sin(t0)
+    major = a * cos_t0 + b * sin_t0
+    minor = b * cos_t0 - a * sin_t0
+    if minor.magnitude_square > major.magnitude_square:
+        return minor, -major, t0 + math.pi / 2.
+    return major, minor, t0
+
+
+def _transform_ellipse(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    extrusion = Vector(dxf.extrusion)
+    major_axis = Vector(dxf.major_axis)
+    minor_axis = extrusion.cross(major_axis).normalize(major_axis.magnitude * dxf.ratio)
+    major_axis, minor_axis, shift = conjugate_axes(
+        transform_direction(m, major_axis), transform_direction(m, minor_axis))
+    start_param = dxf.start_param
+    end_param = dxf.end_param
+    if not math.isclose(abs(end_param - start_param), TWO_PI):  # full ellipse keeps params 0 and 2pi
+        dxf.start_param = (start_param - shift) % TWO_PI
+        dxf.end_param = (end_param - shift) % TWO_PI
+    dxf.center = m.transform(dxf.center)
+    dxf.major_axis = major_axis
+    dxf.ratio = minor_axis.magnitude / major_axis.magnitude
+    _set_extrusion(dxf, major_axis.cross(minor_axis).normalize())
+
+
+def _transform_text(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    t = OCSTransform(dxf.extrusion, m)
+    ux = Vector.from_deg_angle(dxf.rotation)
+    new_ux = t.direction(ux)
+    new_uy = t.direction(ux.orthogonal())
+    # text height is the distance of the new baseline to the transformed top line
+    scale_y = new_ux.normalize().cross(new_uy).magnitude
+    dxf.insert = t.point(dxf.insert)
+    if dxf.hasattr('align_point'):
+        dxf.align_point = t.point(dxf.align_point)
+    dxf.rotation = new_ux.angle_deg
+    dxf.height = dxf.height * scale_y
+    width_factor = dxf.get('width', 1.) * new_ux.magnitude / scale_y
+    if dxf.hasattr('width') or not math.isclose(width_factor, 1.):
+        dxf.width = width_factor
+    _transform_ocs_extrusion(dxf, t)
+
+
+def _transform_mtext(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    extrusion = Vector(dxf.extrusion)
+    if dxf.hasattr('text_direction'):
+        ux = Vector(dxf.text_direction).normalize()
+    else:
+        ux = Vector(OCS(extrusion).to_wcs(Vector.from_deg_angle(dxf.get('rotation', 0.))))
+    uy = extrusion.cross(ux).normalize()
+    new_ux = transform_direction(m, ux)
+    new_uy = transform_direction(m, uy)
+    new_extrusion = new_ux.cross(new_uy).normalize()
+    dxf.insert = m.transform(dxf.insert)
+    dxf.text_direction = new_ux.normalize()
+    dxf.discard('rotation')  # text direction has priority, remove ambiguity
+    dxf.char_height = dxf.char_height * new_extrusion.cross(new_ux).normalize().dot(new_uy)
+    if dxf.hasattr('width'):
+        dxf.width = dxf.width * new_ux.magnitude
+    _set_extrusion(dxf, new_extrusion)
+
+
+def _transform_shape(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    t = OCSTransform(dxf.extrusion, m)
+    ux = Vector.from_deg_angle(dxf.rotation)
+    new_ux = t.direction(ux)
+    scale_y = new_ux.normalize().cross(t.direction(ux.orthogonal())).magnitude
+    dxf.insert = t.point(dxf.insert)
+    dxf.rotation = new_ux.angle_deg
+    dxf.size = dxf.size * scale_y
+    xscale = dxf.get('xscale', 1.) * new_ux.magnitude / scale_y
+    if dxf.hasattr('xscale') or not math.isclose(xscale, 1.):
+        dxf.xscale = xscale
+    _transform_ocs_extrusion(dxf, t)
+
+
+def _transform_insert(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    t = OCSTransform(dxf.extrusion, m)
+    ux = Vector.from_deg_angle(dxf.rotation)
+    new_ux = t.direction(ux)
+    new_uy = t.direction(ux.orthogonal())
+    if not math.isclose(new_ux.dot(new_uy), 0., abs_tol=1e-9 * new_ux.magnitude * new_uy.magnitude):
+        raise DXFValueError('Shearing of block references is not supported.')
+    scale_x = new_ux.magnitude
+    scale_y = new_uy.magnitude
+    dxf.insert = t.point(dxf.insert)
+    dxf.rotation = new_ux.angle_deg
+    dxf.xscale = dxf.xscale * scale_x
+    dxf.yscale = dxf.yscale * scale_y
+    dxf.zscale = dxf.zscale * t.scale_z
+    if dxf.hasattr('column_spacing'):
+        dxf.column_spacing = dxf.column_spacing * scale_x
+    if dxf.hasattr('row_spacing'):
+        dxf.row_spacing = dxf.row_spacing * scale_y
+    _set_extrusion(dxf, t.new_extrusion)
+    for attrib in entity.attribs:
+        _transform_text(attrib, m)
+
+
+def _transform_solid(entity: 'DXFGraphic', m: Matrix44) -> None:
+    # SOLID and TRACE, OCS vertices
+    dxf = entity.dxf
+    t = OCSTransform(dxf.extrusion, m)
+    for name in ('vtx0', 'vtx1', 'vtx2', 'vtx3'):
+        if dxf.hasattr(name):
+            dxf.set(name, t.point(dxf.get(name)))
+    _transform_ocs_extrusion(dxf, t)
+
+
+def _transform_3dface(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    for name in ('vtx0', 'vtx1', 'vtx2', 'vtx3'):
+        if dxf.hasattr(name):
+            dxf.set(name, m.transform(dxf.get(name)))
+
+
+def _transform_lwpolyline(entity: 'DXFGraphic', m: Matrix44, t: OCSTransform = None) -> None:
+    dxf = entity.dxf
+    t = t or OCSTransform(dxf.extrusion, m)
+    values = entity.lwpoints.values
+    _require_uniform_bulges(entity, t, values[4::5])
+    elevation = dxf.elevation
+    width_scale = t.scale_uniform
+    vertices = t.points((x, y, elevation) for x, y in zip(values[0::5], values[1::5]))
+    entity.mark_modified()  # in-place changes of the values are not tracked
+    for index, vertex in enumerate(vertices):
+        index *= 5
+        values[index] = vertex.x
+        values[index + 1] = vertex.y
+        values[index + 2] *= width_scale  # start width
+        values[index + 3] *= width_scale  # end width
+    _transform_lwpolyline_attribs(dxf, t, elevation)
+
+
+def _transform_lwpolyline_attribs(dxf: 'DXFNamespace', t: OCSTransform, elevation: float) -> None:
+    new_elevation = t.point((0., 0., elevation)).z
+    if dxf.hasattr('elevation') or not math.isclose(new_elevation, 0., abs_tol=1e-12):
+        dxf.elevation = new_elevation
+    if dxf.hasattr('const_width'):
+        dxf.const_width = dxf.const_width * t.scale_uniform
+    _transform_ocs_extrusion(dxf, t)
+
+
+def _batch_transform_lwpolylines(entities: List['DXFGraphic'], m: Matrix44) -> List['DXFGraphic']:
+    np = numpy_module(optional=True)
+    failed = []
+    for extrusion, group in _group_by_extrusion(entities).items():
+        try:
+            t = OCSTransform(extrusion, m)
+        except DXFValueError:
+            failed.extend(group)
+            continue
+        if np is None:
+            for entity in group:
+                try:
+                    _transform_lwpolyline(entity, m, t)
+                except DXFValueError:
+                    failed.append(entity)
+            continue
+        views = []
+        elevations = []
+        for entity in group:
+            if not t.is_uniform and any(entity.lwpoints.values[4::5]):
+                failed.append(entity)
+                continue
+            elevation = entity.dxf.elevation
+            if len(entity.lwpoints):
+                view = entity.lwpoints.as_numpy()
+                views.append(view)
+                elevations.append(np.full(len(view), elevation))
+            _transform_lwpolyline_attribs(entity.dxf, t, elevation)
+        if not views:
+            continue
+        matrix = np.array(t.matrix.matrix).reshape(4, 4)
+        vertices = np.concatenate(views)
+        xyz = np.column_stack((vertices[:, :2], np.concatenate(elevations)))
+        xyz = xyz @ matrix[:3, :3] + matrix[3, :3]
+        start = 0
+        width_scale = t.scale_uniform
+        for view in views:
+            end = start + len(view)
+            view[:, :2] = xyz[start:end, :2]
+            view[:, 2:4] *= width_scale
+            start = end
+    return failed
+
+
+def _transform_polyline(entity: 'DXFGraphic', m: Matrix44) -> None:
+    if entity.is_2d_polyline:
+        _transform_2d_polyline(entity, OCSTransform(entity.dxf.extrusion, m))
+    else:
+        _transform_3d_polylines([entity], m)
+
+
+def _transform_2d_polyline(entity: 'DXFGraphic', t: OCSTransform) -> None:
+    dxf = entity.dxf
+    vertices = entity.vertices
+    _require_uniform_bulges(entity, t, (vertex.dxf.get('bulge', 0.) for vertex in vertices))
+    elevation = Vector(dxf.get('elevation', (0., 0., 0.))).z
+    width_scale = t.scale_uniform
+    locations = t.points(
+        (x, y, elevation) for x, y, *_ in (vertex.dxf.location for vertex in vertices)
+    )
+    for vertex, location in zip(vertices, locations):
+        vdxf = vertex.dxf
+        vdxf.location = location
+        if vdxf.hasattr('start_width'):
+            vdxf.start_width = vdxf.start_width * width_scale
+        if vdxf.hasattr('end_width'):
+            vdxf.end_width = vdxf.end_width * width_scale
+        if vdxf.hasattr('tangent'):
+            vdxf.tangent = t.angle_deg(vdxf.tangent)
+    dxf.elevation = (0., 0., t.point((0., 0., elevation)).z)
+    if dxf.hasattr('default_start_width'):
+        dxf.default_start_width = dxf.default_start_width * width_scale
+    if dxf.hasattr('default_end_width'):
+        dxf.default_end_width = dxf.default_end_width * width_scale
+    _transform_ocs_extrusion(dxf, t)
+
+
+def _transform_3d_polylines(entities: List['DXFGraphic'], m: Matrix44) -> None:
+    # 3D polylines, polymeshes and polyface meshes have WCS vertices, transformed all at once
+    vertices = [vertex for entity in entities for vertex in entity.vertices if not vertex.is_face_record]
+    locations = m.transform_vectors(vertex.dxf.location for vertex in vertices)
+    for vertex, location in zip(vertices, locations):
+        vertex.dxf.location = location
+
+
+def _batch_transform_polylines(entities: List['DXFGraphic'], m: Matrix44) -> List['DXFGraphic']:
+    polylines_2d = []
+    polylines_3d = []
+    for entity in entities:
+        (polylines_2d if entity.is_2d_polyline else polylines_3d).append(entity)
+    _transform_3d_polylines(polylines_3d, m)
+    failed = []
+    for extrusion, group in _group_by_extrusion(polylines_2d).items():
+        try:
+            t = OCSTransform(extrusion, m)
+        except DXFValueError:
+            failed.extend(group)
+            continue
+        for entity in group:
+            try:
+                _transform_2d_polyline(entity, t)
+            except DXFValueError:
+                failed.append(entity)
+    return failed
+
+
+def _spline_extrusion(entity: 'DXFGraphic', m: Matrix44) -> Optional[Vector]:
+    # normal vector of planar splines, raises DXFValueError before any modification of the spline
+    dxf = entity.dxf
+    if dxf.hasattr('extrusion'):
+        return OCSTransform(dxf.extrusion, m).new_extrusion
+    return None
+
+
+def _transform_spline_attribs(entity: 'DXFGraphic', m: Matrix44, extrusion: Optional[Vector]) -> None:
+    dxf = entity.dxf
+    for name in ('start_tangent', 'end_tangent'):
+        if dxf.hasattr(name):
+            dxf.set(name, transform_direction(m, dxf.get(name)))
+    if extrusion is not None:
+        dxf.extrusion = extrusion
+
+
+def _transform_spline(entity: 'DXFGraphic', m: Matrix44) -> None:
+    extrusion = _spline_extrusion(entity, m)
+    _transform_vertex_arrays(m, [entity.control_points, entity.fit_points])
+    _transform_spline_attribs(entity, m, extrusion)
+
+
+def _batch_transform_splines(entities: List['DXFGraphic'], m: Matrix44) -> List['DXFGraphic']:
+    failed = []
+    splines = []
+    for entity in entities:
+        try:
+            splines.append((entity, _spline_extrusion(entity, m)))
+        except DXFValueError:
+            failed.append(entity)
+    # control points and fit points of all splines by one matrix multiplication, knots and weights are invariant
+    _transform_vertex_arrays(m, [a for e, _ in splines for a in (e.control_points, e.fit_points)])
+    for entity, extrusion in splines:
+        _transform_spline_attribs(entity, m, extrusion)
+    return failed
+
+
+def _transform_mesh(entity: 'DXFGraphic', m: Matrix44) -> None:
+    _transform_vertex_arrays(m, [entity.vertices])
+
+
+def _batch_transform_meshes(entities: List['DXFGraphic'], m: Matrix44) -> List['DXFGraphic']:
+    _transform_vertex_arrays(m, [entity.vertices for entity in entities])
+    return []
+
+
+def _transform_leader(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    entity.vertices = m.transform_vectors(entity.vertices)
+    if dxf.hasattr('normal_vector'):
+        dxf.normal_vector = OCSTransform(dxf.normal_vector, m).new_extrusion
+    if dxf.hasattr('horizontal_direction'):
+        dxf.horizontal_direction = transform_direction(m, dxf.horizontal_direction).normalize()
+    for name in ('leader_offset_block_ref', 'leader_offset_annotation_placement'):
+        if dxf.hasattr(name):
+            dxf.set(name, transform_direction(m, dxf.get(name)))
+
+
+def _transform_image(entity: 'DXFGraphic', m: Matrix44) -> None:
+    # IMAGE and WIPEOUT, the boundary path is defined in pixel coordinates
+    dxf = entity.dxf
+    dxf.insert = m.transform(dxf.insert)
+    dxf.u_pixel = transform_direction(m, dxf.u_pixel)
+    dxf.v_pixel = transform_direction(m, dxf.v_pixel)
+
+
+def _transform_hatch(entity: 'DXFGraphic', m: Matrix44) -> None:
+    dxf = entity.dxf
+    t = OCSTransform(dxf.extrusion, m)
+    elevation = Vector(dxf.elevation).z
+    scale = t.scale_uniform
+
+    def point2d(point: 'Vertex') -> Tuple[float, float]:
+        x, y, *_ = point
+        v = t.point((x, y, elevation))
+        return v.x, v.y
+
+    def direction2d(direction: 'Vertex') -> Tuple[float, float]:
+        x, y, *_ = direction
+        v = t.direction((x, y, 0.))
+        return v.x, v.y
+
+    def angle_deg(angle: float, ccw: bool) -> float:
+        # angles of clockwise oriented edges are mirrored about the x-axis
+        if ccw:
+            return t.angle_deg(angle) % 360.
+        return -t.angle_deg(-angle) % 360.
+
+    # check all paths before any modification
+    for path in entity.paths.paths:
+        if path.PATH_TYPE == 'PolylinePath':
+            _require_uniform_bulges(entity, t, (bulge for x, y, bulge in path.vertices))
+        elif any(edge.EDGE_TYPE in ('ArcEdge', 'EllipseEdge') for edge in path.edges):
+            _require_uniform(entity, t)
+
+    for path in entity.paths.paths:
+        if path.PATH_TYPE == 'PolylinePath':
+            path.vertices = [point2d((x, y)) + (bulge,) for x, y, bulge in path.vertices]
+            continue
+        for edge in path.edges:
+            edge_type = edge.EDGE_TYPE
+            if edge_type == 'LineEdge':
+                edge.start = point2d(edge.start)
+                edge.end = point2d(edge.end)
+            elif edge_type == 'ArcEdge':
+                ccw = bool(edge.is_counter_clockwise)
+                edge.center = point2d(edge.center)
+                edge.radius *= t.scale_x
+                edge.start_angle = angle_deg(edge.start_angle, ccw)
+                edge.end_angle = angle_deg(edge.end_angle, ccw)
+            elif edge_type == 'EllipseEdge':
+                ccw = bool(edge.is_counter_clockwise)
+                edge.center = point2d(edge.center)
+                edge.major_axis = direction2d(edge.major_axis)
+                edge.start_angle = angle_deg(edge.start_angle, ccw)
+                edge.end_angle = angle_deg(edge.end_angle, ccw)
+            elif edge_type == 'SplineEdge':
+                edge.control_points = [point2d(p) for p in edge.control_points]
+                edge.fit_points = [point2d(p) for p in edge.fit_points]
+                if edge.start_tangent is not None:
+                    edge.start_tangent = direction2d(edge.start_tangent)
+                if edge.end_tangent is not None:
+                    edge.end_tangent = direction2d(edge.end_tangent)
+
+    entity.seeds = [point2d(seed) for seed in entity.seeds]
+    pattern = entity.pattern
+    if pattern is not None:
+        for line in pattern.lines:
+            line.angle = t.angle_deg(line.angle) % 360.
+            line.base_point = point2d(line.base_point)
+            line.offset = direction2d(line.offset)
+            line.dash_length_items = [length * scale for length in line.dash_length_items]
+        dxf.pattern_scale = dxf.pattern_scale * scale
+        dxf.pattern_angle = t.angle_deg(dxf.pattern_angle) % 360.
+    gradient = entity.gradient
+    if gradient is not None:
+        gradient.rotation = t.angle_deg(gradient.rotation) % 360.
+    dxf.elevation = (0., 0., t.point((0., 0., elevation)).z)
+    _set_extrusion(dxf, t.new_extrusion)
+
+
+# Transformation functions of single entities by DXF type, DIMENSION, VIEWPORT and ACIS based entities are not
+# supported.
+TRANSFORMERS = {
+    'LINE': _transform_line,
+    'POINT': _transform_point,
+    'XLINE': _transform_xline,
+    'RAY': _transform_xline,
+    'CIRCLE': _transform_circle,
+    'ARC': _transform_circle,
+    'ELLIPSE': _transform_ellipse,
+    'TEXT': _transform_text,
+    'ATTRIB': _transform_text,
+    'ATTDEF': _transform_text,
+    'MTEXT': _transform_mtext,
+    'SHAPE': _transform_shape,
+    'INSERT': _transform_insert,
+    'SOLID': _transform_solid,
+    'TRACE': _transform_solid,
+    '3DFACE': _transform_3dface,
+    'LWPOLYLINE': _transform_lwpolyline,
+    'POLYLINE': _transform_polyline,
+    'SPLINE': _transform_spline,
+    'MESH': _transform_mesh,
+    'LEADER': _transform_leader,
+    'IMAGE': _transform_image,
+    'WIPEOUT': _transform_image,
+    'HATCH': _transform_hatch,
+}  # type: Dict[str, TransformFunc]
+
+# Batch transformation functions for vertex heavy DXF types, transforms all entities of the same DXF type at once
+BATCH_TRANSFORMERS = {
+    'LWPOLYLINE': _batch_transform_lwpolylines,
+    'POLYLINE': _batch_transform_polylines,
+    'SPLINE': _batch_transform_splines,
+    'MESH': _batch_transform_meshes,
+}  # type: Dict[str, BatchTransformFunc]
+
+
+def transform(entity: 'DXFGraphic', m: Matrix44) -> 'DXFGraphic':
+    """
+    Transforms `entity` inplace by the transformation matrix `m` and returns `entity`.
+
+    Args:
+        entity: DXF entity
+        m: transformation matrix as :class:`~ezdxf.math.Matrix44`
+
+    Raises:
+        DXFTypeError: transformation of the DXF type is not supported
+        DXFValueError: the transformation is not supported for `entity`, like non uniform scaling of CIRCLE and ARC
+            or of polylines with bulges
+
+    """
+    func = TRANSFORMERS.get(entity.dxftype())
+    if func is None:
+        raise DXFTypeError('Transformation of {} entities is not supported.'.format(entity.dxftype()))
+    func(entity, m)
+    return entity
+
+
+def transform_all(entities: Iterable['DXFGraphic'], m: Matrix44) -> List['DXFGraphic']:
+    """
+    Transforms all `entities` inplace by the transformation matrix `m`. The entities are grouped by DXF type, the
+    vertex heavy DXF types LWPOLYLINE, POLYLINE, SPLINE and MESH are transformed in batches by NumPy if available,
+    else by :meth:`Matrix44.transform_vectors`.
+
+    Returns a list of all entities which could not be transformed, because the DXF type is not supported or the
+    transformation is not supported for the entity, like non uniform scaling of CIRCLE and ARC or of
+    polylines with bulges.
+
+    Args:
+        entities: iterable of DXF entities
+        m: transformation matrix as :class:`~ezdxf.math.Matrix44`
+
+    """
+    groups = dict()  # type: Dict[str, List[DXFGraphic]]
+    for entity in entities:
+        groups.setdefault(entity.dxftype(), []).append(entity)
+
+    failed = []
+    for dxftype, group in groups.items():
+        batch = BATCH_TRANSFORMERS.get(dxftype)
+        if batch is not None:
+            failed.extend(batch(group, m))
+            continue
+        func = TRANSFORMERS.get(dxftype)
+        if func is None:
+            failed.extend(group)
+            continue
+        for entity in group:
+            try:
+                func(entity, m)
+            except DXFValueError:
+                failed.append(entity)
+    return failed
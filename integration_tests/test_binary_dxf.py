@@ -0,0 +1,36 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import os
+import ezdxf
+from ezdxf.lldxf.const import versions_supported_by_new
+from ezdxf.lldxf.validator import is_binary_dxf_file
+
+NONE_ASCII = "äöüÄÖÜß±ØáàÀÁóòÓÒéèÉÈ"
+
+
+@pytest.fixture(params=versions_supported_by_new)
+def doc(request):
+    return ezdxf.new(request.param)
+
+
+def test_write_and_read_binary_dxf(doc, tmpdir):
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 2, 3), dxfattribs={'layer': 'LINES'})
+    msp.add_text(NONE_ASCII)
+    filename = str(tmpdir.join('binary_%s.dxf' % doc.dxfversion))
+    doc.saveas(filename, fmt='bin')
+    assert os.path.exists(filename)
+    assert is_binary_dxf_file(filename)
+
+    doc = ezdxf.readfile(filename)
+    msp = doc.modelspace()
+    line = msp.query('LINE')[0]
+    assert line.dxf.layer == 'LINES'
+    assert line.dxf.end == (1, 2, 3)
+    assert msp.query('TEXT')[0].dxf.text == NONE_ASCII
+
+
+def test_invalid_output_format(doc, tmpdir):
+    with pytest.raises(ezdxf.DXFValueError):
+        doc.saveas(str(tmpdir.join('invalid.dxf')), fmt='xyz')
@@ -2,6 +2,7 @@
 # License: MIT License
 import pytest
 import os
+from io import StringIO
 from random import random
 import ezdxf
 from ezdxf.r12writer import r12writer
@@ -57,3 +58,75 @@ def test_context_manager(filename):
     assert len(entities) == 1
     assert entities[0].dxftype() == 'LINE'
 
+
+def write_batch_or_single(batch: bool) -> str:
+    stream = StringIO()
+    points = [(1.1234567, 2, 3), (4, 5, 6)]
+    starts = [(0, 0), (1, 1)]
+    ends = [(1, 0), (2, 1)]
+    faces = [[(0, 0, 0), (1, 0, 0), (1, 1, 0)], [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]]
+    polylines = [[(5, 5), (7, 3), (7, 6)], [(4, 3, 2), (8, 5, 0)], []]
+    with r12writer(stream) as dxf:
+        if batch:
+            dxf.add_points(points, layer='POINTS', color=1)
+            dxf.add_lines(starts, ends, linetype='DASHED')
+            dxf.add_3dfaces(faces, invisible=3)
+            dxf.add_polylines(polylines, layer='POLYLINES')
+        else:
+            for point in points:
+                dxf.add_point(point, layer='POINTS', color=1)
+            for start, end in zip(starts, ends):
+                dxf.add_line(start, end, linetype='DASHED')
+            for face in faces:
+                dxf.add_3dface(face, invisible=3)
+            for polyline in polylines:
+                dxf.add_polyline(polyline, layer='POLYLINES')
+    return stream.getvalue()
+
+
+def test_batch_methods():
+    assert write_batch_or_single(batch=True) == write_batch_or_single(batch=False)
+
+
+def test_batch_size(monkeypatch):
+    from ezdxf import r12writer as module
+    monkeypatch.setattr(module, 'BATCH_SIZE', 3)
+    stream = StringIO()
+    with r12writer(stream) as dxf:
+        dxf.add_points((x, x) for x in range(10))
+        dxf.add_polylines([[(x, x) for x in range(10)]])
+    doc = ezdxf.read(StringIO(stream.getvalue()))
+    msp = doc.modelspace()
+    assert len(msp.query('POINT')) == 10
+    assert len(msp.query('POLYLINE')[0]) == 10
+
+
+def test_batch_mixed_axis_count():
+    with pytest.raises(ValueError):
+        with r12writer(StringIO()) as dxf:
+            dxf.add_points([(0, 0), (1, 1, 1)])
+
+
+def test_batch_polyline_axis_count_is_defined_by_first_vertex(monkeypatch):
+    from ezdxf import r12writer as module
+    monkeypatch.setattr(module, 'BATCH_SIZE', 2)
+    with pytest.raises(ValueError):
+        with r12writer(StringIO()) as dxf:
+            dxf.add_polylines([[(0, 0, 0), (1, 1, 1), (2, 2), (3, 3)]])
+
+
+def test_batch_lines_count_mismatch():
+    with pytest.raises(ValueError):
+        with r12writer(StringIO()) as dxf:
+            dxf.add_lines([(0, 0), (1, 1)], [(0, 0)])
+
+
+def test_batch_numpy_arrays():
+    np = pytest.importorskip('numpy')
+    stream = StringIO()
+    with r12writer(stream) as dxf:
+        dxf.add_points(np.array([(1.1234567, 2, 3), (4, 5, 6)]), layer='POINTS', color=1)
+    expected = StringIO()
+    with r12writer(expected) as dxf:
+        dxf.add_points([(1.1234567, 2, 3), (4, 5, 6)], layer='POINTS', color=1)
+    assert stream.getvalue() == expected.getvalue()
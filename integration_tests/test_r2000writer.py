@@ -0,0 +1,125 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+from io import StringIO
+import ezdxf
+from ezdxf.r2000writer import r2000writer, R2000FastStreamWriter
+from ezdxf.lldxf.const import DXFVersionError, DXFValueError
+
+CIRCLE_COUNT = 999
+
+
+@pytest.fixture(scope='module')
+def filename(tmpdir_factory):
+    return str(tmpdir_factory.getbasetemp().join("r2000writer.dxf"))
+
+
+def write_entities(dxf):
+    dxf.add_line((0, 0), (17, 23), linetype='DASHED')
+    dxf.add_arc((0, 0), radius=3, start=0, end=175)
+    dxf.add_solid([(0, 0), (1, 0), (0, 1), (1, 1)])
+    dxf.add_3dface([(0, 0, 0), (1, 0, 0), (1, 1, 1)])
+    dxf.add_point((1.5, 1.5))
+    dxf.add_polyline([(5, 5), (7, 3), (7, 6)], closed=True)  # 2d polyline
+    dxf.add_polyline([(4, 3, 2), (8, 5, 0), (2, 4, 9)])  # 3d polyline
+    dxf.add_lwpolyline([(0, 0), (1, 0, 0, 0, 0.5), (1, 1, 0.1, 0.2)], closed=True)
+    dxf.add_polyface([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [(0, 1, 2, 3)])
+    dxf.add_mesh([(0, 0, 0), (1, 0, 0), (1, 1, 0)], [(0, 1, 2)])
+    dxf.add_hatch([[(0, 0), (1, 0), (1, 1)], [(2, 2), (3, 2, 0.5), (3, 3)]], color=3)
+    dxf.add_text("test the text entity", align="MIDDLE_CENTER", layer='TEXT')
+    for i in range(CIRCLE_COUNT):
+        dxf.add_circle((i, i), radius=2)
+
+
+def test_write_r2000(filename):
+    template = ezdxf.new('R2000', setup=True)
+    template.layers.new('TEXT', dxfattribs={'color': 2})
+    with r2000writer(filename, doc=template) as dxf:
+        write_entities(dxf)
+
+    doc = ezdxf.readfile(filename)
+    assert doc.dxfversion == 'AC1015'
+    msp = doc.modelspace()
+    assert len(msp.query('CIRCLE')) == CIRCLE_COUNT
+    assert doc.layers.get('TEXT').dxf.color == 2
+    assert msp.query('LINE')[0].dxf.linetype == 'DASHED'
+
+    text = msp.query('TEXT')[0]
+    assert text.dxf.layer == 'TEXT'
+    assert text.get_align() == 'MIDDLE_CENTER'
+
+    polylines = msp.query('POLYLINE')
+    assert polylines[0].is_closed is True
+    assert polylines[1].is_3d_polyline is True
+    assert len(polylines[1]) == 3
+    assert polylines[2].is_poly_face_mesh is True
+    assert len(list(polylines[2].faces())) == 1
+
+    lwpolyline = msp.query('LWPOLYLINE')[0]
+    assert lwpolyline.closed is True
+    assert lwpolyline[1] == (1, 0, 0, 0, 0.5)
+    assert lwpolyline[2] == (1, 1, 0.1, 0.2, 0)
+
+    mesh = msp.query('MESH')[0]
+    assert [list(face) for face in mesh.faces] == [[0, 1, 2]]
+    hatch = msp.query('HATCH')[0]
+    assert len(hatch.paths) == 2
+    assert hatch.dxf.color == 3
+
+
+def test_handles_and_owners(filename):
+    doc = ezdxf.readfile(filename)
+    msp = doc.modelspace()
+    handles = [entity.dxf.handle for entity in doc.entitydb.values()]
+    assert len(handles) == len(set(handles))
+    assert all(entity.dxf.owner == msp.layout_key for entity in msp)
+    seed = int(doc.header['$HANDSEED'], 16)
+    assert all(int(handle, 16) < seed for handle in handles)
+
+
+def test_template_entities():
+    template = ezdxf.new('R2000')
+    template.modelspace().add_line((0, 0), (1, 0))
+    stream = StringIO()
+    with r2000writer(stream, doc=template) as dxf:
+        dxf.add_circle((0, 0), radius=1)
+    doc = ezdxf.read(StringIO(stream.getvalue()))
+    assert [e.dxftype() for e in doc.modelspace()] == ['LINE', 'CIRCLE']
+
+
+def test_true_color():
+    stream = StringIO()
+    with r2000writer(stream, dxfversion='R2004') as dxf:
+        dxf.add_line((0, 0), (1, 0), true_color=0x102030)
+    doc = ezdxf.read(StringIO(stream.getvalue()))
+    assert doc.modelspace()[0].rgb == (0x10, 0x20, 0x30)
+
+
+def test_true_color_requires_r2004():
+    dxf = R2000FastStreamWriter(StringIO())
+    with pytest.raises(DXFVersionError):
+        dxf.add_line((0, 0), (1, 0), true_color=0x102030)
+
+
+def test_r12_template_is_not_supported():
+    with pytest.raises(DXFVersionError):
+        R2000FastStreamWriter(StringIO(), dxfversion='R12')
+
+
+def test_reserved_handles_exhausted():
+    dxf = R2000FastStreamWriter(StringIO(), reserved_handles=3)
+    dxf.add_line((0, 0), (1, 0))
+    with pytest.raises(DXFValueError):
+        dxf.add_polyline([(0, 0), (1, 0)])
+
+
+def test_context_manager(filename):
+    with pytest.raises(ValueError):
+        with r2000writer(filename) as dxf:
+            dxf.add_line((0, 0), (17, 23))
+            raise ValueError()
+
+    doc = ezdxf.readfile(filename)
+    entities = list(doc.modelspace())
+    assert len(entities) == 1
+    assert entities[0].dxftype() == 'LINE'
@@ -0,0 +1,72 @@
+# Copyright (c) 2019 Manfred Moitzi
+# License: MIT License
+# Compares the slow path tag_compiler(low_level_tagger(stream)) with the fast path ascii_tag_compiler(stream)
+import os
+import time
+import tempfile
+import ezdxf
+from ezdxf.lldxf.tagger import low_level_tagger, tag_compiler, ascii_tag_compiler
+
+ENTITY_COUNT = 50000
+
+
+def create_big_file(filename: str, dxfversion: str) -> None:
+    doc = ezdxf.new(dxfversion)
+    msp = doc.modelspace()
+    for index in range(ENTITY_COUNT):
+        x = float(index)
+        msp.add_line((x, 0), (x, 10, 1), dxfattribs={'layer': 'LINES'})
+        msp.add_circle((x, 20), radius=0.5, dxfattribs={'layer': 'CIRCLES'})
+        msp.add_text('TEXT{}'.format(index), dxfattribs={'insert': (x, 30)})
+    doc.saveas(filename)
+
+
+def slow_path(filename: str) -> int:
+    with open(filename, mode='rt', encoding='cp1252') as fp:
+        return sum(1 for _ in tag_compiler(low_level_tagger(fp)))
+
+
+def fast_path(filename: str) -> int:
+    with open(filename, mode='rt', encoding='cp1252') as fp:
+        return sum(1 for _ in ascii_tag_compiler(fp))
+
+
+def readfile(filename: str) -> int:
+    return len(ezdxf.readfile(filename).entitydb)
+
+
+class ReadlineOnly:
+    # Drawing.read() uses the slow path for streams without a read() method
+    def __init__(self, stream):
+        self.readline = stream.readline
+
+
+def slow_readfile(filename: str) -> int:
+    with open(filename, mode='rt', encoding='cp1252') as fp:
+        return len(ezdxf.read(ReadlineOnly(fp)).entitydb)
+
+
+def measure(func, filename: str) -> float:
+    start = time.perf_counter()
+    func(filename)
+    return time.perf_counter() - start
+
+
+def print_result(name: str, slow: float, fast: float):
+    print('{}: slow path {:.2f}s, fast path {:.2f}s, speedup {:.2f}x'.format(name, slow, fast, slow / fast))
+
+
+def main():
+    folder = tempfile.mkdtemp()
+    for dxfversion in ('R12', 'R2018'):
+        filename = os.path.join(folder, 'big_{}.dxf'.format(dxfversion))
+        create_big_file(filename, dxfversion)
+        print('{}: {:.1f} MB'.format(dxfversion, os.path.getsize(filename) / 1e6))
+        print_result('tagging ' + dxfversion, measure(slow_path, filename), measure(fast_path, filename))
+        print_result('readfile ' + dxfversion, measure(slow_readfile, filename), measure(readfile, filename))
+        os.remove(filename)
+    os.rmdir(folder)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# Copyright (c) 2019 Manfred Moitzi
+# License: MIT License
+import gc
+import time
+import tracemalloc
+import ezdxf
+
+
+def add_regular_lines(msp, count):
+    for i in range(count):
+        msp.add_line((i, 0), (i, 10), dxfattribs={'layer': 'LINES', 'color': i % 256})
+
+
+def add_compact_lines(msp, count):
+    store = msp.compact_store
+    for i in range(count):
+        store.add_line((i, 0), (i, 10), dxfattribs={'layer': 'LINES', 'color': i % 256})
+
+
+def measure(func, count):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    func(msp, count)
+    seconds = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, seconds
+
+
+def main(count):
+    for name, func in [('regular', add_regular_lines), ('compact', add_compact_lines)]:
+        size, seconds = measure(func, count)
+        print_result(name, count, size, seconds)
+
+
+def print_result(name, count, size, seconds):
+    print('Profiling: {} {} LINE entities; takes {:.2f} seconds, {:.1f} MB, {:.0f} bytes per entity'.format(
+        count, name, seconds, size / 1e6, size / count))
+
+
+if __name__ == '__main__':
+    main(100000)
@@ -0,0 +1,54 @@
+# Copyright (c) 2019 Manfred Moitzi
+# License: MIT License
+import gc
+import time
+import tracemalloc
+import ezdxf
+from ezdxf.entities.dxfentity import DXFNamespace, namespace_class
+
+
+def create_namespaces(cls, entity, count):
+    namespaces = []
+    for i in range(count):
+        dxf = cls(entity=entity)
+        dxf.layer = 'LINES'
+        dxf.color = i % 256
+        dxf.start = (i, 0)
+        dxf.end = (i, 10)
+        namespaces.append(dxf)
+    return namespaces
+
+
+def read_attribs(namespaces):
+    for dxf in namespaces:
+        dxf.layer, dxf.color, dxf.start, dxf.end, dxf.linetype, dxf.thickness
+
+
+def measure(cls, entity, count):
+    gc.collect()
+    tracemalloc.start()
+    namespaces = create_namespaces(cls, entity, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del namespaces
+    gc.collect()
+    t0 = time.perf_counter()
+    namespaces = create_namespaces(cls, entity, count)
+    create_seconds = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    read_attribs(namespaces)
+    read_seconds = time.perf_counter() - t0
+    return size, create_seconds, read_seconds
+
+
+def main(count):
+    doc = ezdxf.new()
+    line = doc.modelspace().add_line((0, 0), (1, 0))
+    for name, cls in [('dict', DXFNamespace), ('slots', namespace_class(line.__class__))]:
+        size, create_seconds, read_seconds = measure(cls, line, count)
+        print('Profiling: {} {} LINE namespaces; create {:.2f} seconds, read {:.2f} seconds, {:.1f} MB, '
+              '{:.0f} bytes per namespace'.format(count, name, create_seconds, read_seconds, size / 1e6, size / count))
+
+
+if __name__ == '__main__':
+    main(100000)
@@ -0,0 +1,55 @@
+# Copyright (c) 2019 Manfred Moitzi
+# License: MIT License
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+import ezdxf
+from ezdxf import options
+
+
+def create_file(filename, count):
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    for i in range(count // 6):
+        msp.add_line((i, 0), (i, 10), dxfattribs={'layer': 'LINES', 'color': i % 256})
+        msp.add_circle((i, 20), radius=1, dxfattribs={'layer': 'CIRCLES'})
+        msp.add_arc((i, 30), radius=1, start_angle=0, end_angle=90, dxfattribs={'layer': 'ARCS'})
+        msp.add_text('TEXT{}'.format(i), dxfattribs={'layer': 'TEXT', 'insert': (i, 40)})
+        msp.add_point((i, 50), dxfattribs={'layer': 'POINTS'})
+        msp.add_lwpolyline([(i, 60), (i + 1, 60), (i + 1, 61)], dxfattribs={'layer': 'POLYLINES'})
+    doc.saveas(filename)
+
+
+def measure(filename, lazy):
+    options.lazy_loading = lazy
+    try:
+        gc.collect()
+        t0 = time.perf_counter()
+        ezdxf.readfile(filename)
+        seconds = time.perf_counter() - t0  # without tracing overhead
+        gc.collect()
+        tracemalloc.start()
+        doc = ezdxf.readfile(filename)
+        gc.collect()
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del doc
+    finally:
+        options.lazy_loading = False
+    return size, peak, seconds
+
+
+def main(count):
+    filename = os.path.join(tempfile.gettempdir(), 'ezdxf_lazy_loading_memory.dxf')
+    create_file(filename, count)
+    for name, lazy in [('eager', False), ('lazy', True)]:
+        size, peak, seconds = measure(filename, lazy)
+        print('Profiling: {} loading of {} entities; takes {:.2f} seconds, retains {:.1f} MB, peak {:.1f} MB'.format(
+            name, count, seconds, size / 1e6, peak / 1e6))
+    os.remove(filename)
+
+
+if __name__ == '__main__':
+    main(90000)
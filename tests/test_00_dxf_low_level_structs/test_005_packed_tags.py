@@ -4,6 +4,7 @@ import pytest
 from ezdxf.lldxf.packedtags import TagArray, VertexArray
 from ezdxf.lldxf.extendedtags import ExtendedTags
 from ezdxf.lldxf.tagwriter import TagCollector
+from ezdxf.lldxf.const import DXFValueError
 
 
 @pytest.fixture()
@@ -126,6 +127,44 @@ def test_vertex_array_to_dxf_tags():
     assert tags[-1] == (30, 60.)
 
 
+def test_tag_array_numpy_view(numbers):
+    np = pytest.importorskip('numpy')
+    array = TagArray(data=np.array(numbers))
+    assert list(array.values) == numbers
+    view = array.as_numpy()
+    view[0] = 7
+    assert array.values[0] == 7, 'expected shared memory'
+    del view
+    array.set_values(np.arange(3))
+    assert list(array.values) == [0, 1, 2]
+
+
+def test_vertex_array_numpy_view():
+    np = pytest.importorskip('numpy')
+    vertices = VertexArray(np.array([(1, 2, 3), (4, 5, 6)]))
+    assert list(vertices) == [(1, 2, 3), (4, 5, 6)]
+    view = vertices.as_numpy()
+    assert view.shape == (2, 3)
+    view[:, 2] = 0
+    assert vertices[1] == (4, 5, 0), 'expected shared memory'
+    del view
+    vertices.extend(np.array([(7, 8, 9)]))
+    assert vertices[-1] == (7, 8, 9)
+    with pytest.raises(DXFValueError):
+        vertices.extend(np.array([(7, 8)]))
+    vertices.set(np.zeros((4, 3)))
+    assert len(vertices) == 4
+
+
+def test_vertex_array_can_not_resize_with_existing_view():
+    pytest.importorskip('numpy')
+    vertices = VertexArray([1, 2, 3])
+    view = vertices.as_numpy()
+    with pytest.raises(BufferError):
+        vertices.append((4, 5, 6))
+    assert view.shape == (1, 3)
+
+
 ROOTDICT = """0
 DICTIONARY
 5
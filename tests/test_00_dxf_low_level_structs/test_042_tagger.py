@@ -3,7 +3,8 @@
 import pytest
 from io import StringIO
 
-from ezdxf.lldxf.tagger import internal_tag_compiler, low_level_tagger, tag_compiler, DXFStructureError
+from ezdxf.lldxf.tagger import internal_tag_compiler, low_level_tagger, tag_compiler, ascii_tag_compiler
+from ezdxf.lldxf.tagger import DXFStructureError
 from ezdxf.lldxf.types import strtag, DXFTag, DXFVertex
 from ezdxf.math.vector import Vector
 
@@ -437,3 +438,47 @@ AVE_ENTITY_MATERIAL
 1002
 }
 """
+
+
+@pytest.mark.parametrize('text', [
+    TAGS1, TAGS_3D_COORDS, XDATA_COORDS, TEST_TAGREADER, TEST_NO_EOF,
+    TEST_TAGREADER_COMMENTS, POINT_TAGS, POINT_2D_TAGS, FLOAT_FOR_INT_TAGS, TAGS_WITH_ERROR, POLYLINE_WITH_XDATA,
+])
+@pytest.mark.parametrize('block_size', [1, 7, 4096])
+def test_ascii_tag_compiler_same_as_external_tag_compiler(text, block_size):
+    expected = list(external_tag_compiler(text))
+    assert list(ascii_tag_compiler(StringIO(text), block_size=block_size)) == expected
+
+
+@pytest.mark.parametrize('text', [TAGS_2D_COORDS, TAGS_2D_COORDS2])
+def test_ascii_tag_compiler_2d_point_at_eof(text):
+    # tag_compiler() drops a 2D point at EOF
+    assert list(ascii_tag_compiler(StringIO(text))) == list(internal_tag_compiler(text))
+
+
+def test_ascii_tag_compiler_no_line_break_at_eof():
+    tags = list(ascii_tag_compiler(StringIO(TAGS_NO_LINE_BREAK_AT_EOF), block_size=5))
+    assert tags[-1] == (11, (1000, 2000))
+
+
+def test_ascii_tag_compiler_not_skip_comments():
+    tags = list(ascii_tag_compiler(StringIO('999\ncomment\n0\nEOF\n'), skip_comments=False))
+    assert tags == [(999, 'comment'), (0, 'EOF')]
+
+
+def test_ascii_tag_compiler_coord_error():
+    with pytest.raises(DXFStructureError):
+        list(ascii_tag_compiler(StringIO(TAGS_WITH_COORD_ERROR)))
+
+
+def test_ascii_tag_compiler_invalid_group_code_line_number():
+    with pytest.raises(DXFStructureError) as e:
+        list(ascii_tag_compiler(StringIO(TEST_TAGREADER.replace('  9\n$DWGCODEPAGE', 'XX\n$DWGCODEPAGE')),
+                                block_size=3))
+    assert 'line 9.' in str(e.value)
+
+
+def test_ascii_tag_compiler_invalid_float_line_number():
+    with pytest.raises(DXFStructureError) as e:
+        list(ascii_tag_compiler(StringIO(' 40\n1.0\n 40\nXXX\n'), block_size=3))
+    assert 'near line: 4.' in str(e.value)
@@ -3,7 +3,8 @@
 # License: MIT License
 import pytest
 from ezdxf.lldxf.tagger import internal_tag_compiler
-from ezdxf.lldxf.loader import load_dxf_structure
+from ezdxf.lldxf.loader import load_dxf_structure, skip_sections, filter_entities
+from ezdxf.lldxf.tags import group_tags
 from ezdxf.lldxf.const import DXFStructureError
 
 
@@ -81,6 +82,29 @@ def test_missing_section():
         validator("  0\nENDSEC\n  0\nSECTION\n  2\nCLASSES\n  0\nENDSEC\n  0\nEOF\n")
 
 
+def test_skip_sections():
+    # TABLES section is required by the ENTITIES section
+    sections = load_dxf_structure(skip_sections(internal_tag_compiler(TEST_HEADER), {'ENTITIES'}))
+    assert list(sections.keys()) == ['HEADER', 'TABLES', 'ENTITIES']
+
+
+def test_skip_sections_does_not_skip_header():
+    sections = load_dxf_structure(skip_sections(internal_tag_compiler(TEST_HEADER), set()))
+    assert list(sections.keys()) == ['HEADER']
+
+
+def test_filter_entities():
+    entities = list(group_tags(internal_tag_compiler(ENTITIES)))
+    result = list(filter_entities(entities, lambda tags: tags.get_first_value(8, '0') == 'A'))
+    assert [e[0].value for e in result] == ['POLYLINE', 'VERTEX', 'SEQEND', 'LINE']
+
+
+def test_filter_linked_entities():
+    entities = list(group_tags(internal_tag_compiler(ENTITIES)))
+    result = list(filter_entities(entities, lambda tags: tags[0].value != 'POLYLINE'))
+    assert [e[0].value for e in result] == ['LINE', 'LINE']
+
+
 TEST_HEADER = """  0
 SECTION
   2
@@ -124,3 +148,25 @@ SECTION
   0
 ENDSEC
 """
+
+ENTITIES = """  0
+POLYLINE
+  8
+A
+  0
+VERTEX
+  8
+B
+  0
+SEQEND
+  8
+B
+  0
+LINE
+  8
+A
+  0
+LINE
+  8
+B
+"""
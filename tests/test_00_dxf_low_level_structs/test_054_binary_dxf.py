@@ -0,0 +1,122 @@
+# Copyright (c) 2019 Manfred Moitzi
+# License: MIT License
+import pytest
+from io import BytesIO
+
+from ezdxf.lldxf.tagger import binary_tagger
+from ezdxf.lldxf.tagwriter import BinaryTagWriter
+from ezdxf.lldxf.types import DXFTag, DXFVertex, DXFBinaryTag
+from ezdxf.lldxf.const import DXFStructureError, DXF_BINARY_SIGNATURE, DXF12, DXF2000
+from ezdxf.lldxf.validator import binary_dxf_info
+
+
+def write_tags(tags, dxfversion=DXF2000, encoding='utf8'):
+    stream = BytesIO()
+    tagwriter = BinaryTagWriter(stream, dxfversion=dxfversion, encoding=encoding)
+    tagwriter.write_signature()
+    tagwriter.write_str('  0\nSECTION\n  2\nENTITIES\n')
+    for tag in tags:
+        tagwriter.write_tag(tag)
+    tagwriter.write_tag2(0, 'EOF')
+    return stream.getvalue()
+
+
+def read_tags(data, encoding='utf8'):
+    tags = list(binary_tagger(data, encoding=encoding))
+    # remove SECTION, ENTITIES and EOF
+    return tags[2:-1]
+
+
+@pytest.fixture(params=[DXF12, DXF2000])
+def dxfversion(request):
+    return request.param
+
+
+def test_signature():
+    data = write_tags([])
+    assert data.startswith(DXF_BINARY_SIGNATURE)
+
+
+def test_r12_uses_1_byte_group_codes():
+    data = write_tags([], dxfversion=DXF12)
+    assert data[len(DXF_BINARY_SIGNATURE):].startswith(b'\x00SECTION\x00')
+
+
+def test_r2000_uses_2_byte_group_codes():
+    data = write_tags([], dxfversion=DXF2000)
+    assert data[len(DXF_BINARY_SIGNATURE):].startswith(b'\x00\x00SECTION\x00')
+
+
+def test_value_types(dxfversion):
+    tags = [
+        DXFTag(0, 'LINE'),
+        DXFTag(5, 'FFFF'),
+        DXFTag(8, 'Layer'),
+        DXFTag(40, 3.1415),
+        DXFTag(62, -7),
+        DXFTag(90, 2 ** 30),
+        DXFTag(160, 2 ** 40),
+        DXFTag(290, 1),
+        DXFTag(1000, 'xdata'),
+        DXFTag(1071, -2 ** 30),
+    ]
+    result = read_tags(write_tags(tags, dxfversion=dxfversion))
+    assert result == tags
+    assert type(result[3].value) is float
+    assert type(result[4].value) is int
+
+
+def test_vertices(dxfversion):
+    tags = [DXFTag(0, 'LINE'), DXFVertex(10, (1, 2, 3)), DXFVertex(11, (4, 5)), DXFTag(62, 1)]
+    result = read_tags(write_tags(tags, dxfversion=dxfversion))
+    assert result == tags
+    assert isinstance(result[1], DXFVertex)
+    assert isinstance(result[2], DXFVertex)
+    assert len(result[2].value) == 2
+
+
+def test_xdata_vertices(dxfversion):
+    tags = [DXFTag(0, 'LINE'), DXFTag(1001, 'EZDXF'), DXFVertex(1010, (1, 2, 3))]
+    assert read_tags(write_tags(tags, dxfversion=dxfversion)) == tags
+
+
+def test_binary_data_chunks():
+    data = bytes(range(256))
+    tags = [DXFTag(0, 'ACIS'), DXFBinaryTag(310, data)]
+    result = read_tags(write_tags(tags))
+    assert len(result) == 4  # 127 + 127 + 2 bytes
+    assert all(isinstance(tag, DXFBinaryTag) for tag in result[1:])
+    assert b''.join(tag.value for tag in result[1:]) == data
+
+
+def test_skip_comments():
+    tags = [DXFTag(0, 'LINE'), DXFTag(999, 'comment'), DXFTag(8, '0')]
+    assert read_tags(write_tags(tags)) == [DXFTag(0, 'LINE'), DXFTag(8, '0')]
+
+
+def test_encoding():
+    tags = [DXFTag(0, 'TEXT'), DXFTag(1, 'äöü')]
+    assert read_tags(write_tags(tags, encoding='cp1252'), encoding='cp1252') == tags
+
+
+def test_invalid_signature():
+    with pytest.raises(DXFStructureError):
+        list(binary_tagger(b'  0\nSECTION\n'))
+
+
+def test_truncated_data():
+    data = write_tags([DXFTag(0, 'LINE'), DXFTag(40, 1.)])
+    with pytest.raises(DXFStructureError):
+        list(binary_tagger(data[:-10]))
+
+
+def test_binary_dxf_info():
+    stream = BytesIO()
+    tagwriter = BinaryTagWriter(stream, dxfversion=DXF2000)
+    tagwriter.write_signature()
+    tagwriter.write_str('  0\nSECTION\n  2\nHEADER\n  9\n$ACADVER\n  1\nAC1015\n  9\n$DWGCODEPAGE\n  3\nANSI_1251\n')
+    tagwriter.write_str('  9\n$HANDSEED\n  5\nFFFF\n  0\nENDSEC\n  0\nEOF\n')
+    info = binary_dxf_info(stream.getvalue())
+    assert info.version == 'AC1015'
+    assert info.encoding == 'cp1251'
+    assert info.handseed == 'FFFF'
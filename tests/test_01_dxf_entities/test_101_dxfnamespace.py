@@ -1,9 +1,11 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
 import pytest
+import pickle
 from copy import deepcopy
 from ezdxf.math import Vector
-from ezdxf.entities.dxfentity import base_class, DXFAttributes, DXFNamespace, SubclassProcessor
+from ezdxf.entities.dxfentity import base_class, DXFAttributes, DXFNamespace, SubclassProcessor, SlotsDXFNamespace
+from ezdxf.entities.dxfentity import namespace_class
 from ezdxf.entities.dxfgfx import acdb_entity
 from ezdxf.entities.line import acdb_line
 from ezdxf.lldxf.extendedtags import ExtendedTags
@@ -204,6 +206,80 @@ def test_load_doublettes():
     assert ns.test3 == '3'
 
 
+class TestSlotsNamespace:
+    @pytest.fixture
+    def attribs(self, processor):
+        from ezdxf.entities.line import Line
+        return namespace_class(Line)(processor, Line())
+
+    def test_generated_class(self, attribs):
+        from ezdxf.entities.line import Line
+        assert isinstance(attribs, SlotsDXFNamespace)
+        assert namespace_class(Line) is type(attribs), 'expected cached class'
+        assert not hasattr(attribs, '__dict__')
+        assert {'handle', 'owner', 'layer', 'color', 'start', 'end'} <= set(type(attribs).__slots__)
+        assert 'thickness' not in type(attribs).__slots__, 'rarely used optional attribute'
+
+    def test_default_values(self, attribs):
+        assert attribs.handle == 'FFFF'
+        assert attribs.layer == '0'
+        assert attribs.thickness == 0
+        assert attribs.color_name is None
+        assert attribs.hasattr('layer') is False
+        assert attribs.hasattr('thickness') is False
+        assert attribs.get('layer', 'mozman') == 'mozman'
+        with pytest.raises(DXFAttributeError):
+            _ = attribs.mozman
+        with pytest.raises(DXFAttributeError):
+            attribs.get('mozman')
+
+    def test_set_values(self, attribs):
+        attribs.start = (1, 2)
+        assert isinstance(attribs.start, Vector)
+        attribs.color = '7'
+        assert attribs.color == 7
+        attribs.thickness = 3  # stored in the attribute dict
+        assert attribs.thickness == 3.
+        assert attribs.all_existing_dxf_attribs() == {
+            'handle': 'FFFF', 'owner': 'ABBA', 'color': 7, 'start': (1, 2, 0), 'thickness': 3.,
+        }
+        with pytest.raises(DXFAttributeError):
+            attribs.mozman = 0
+
+    def test_delete_attribs(self, attribs):
+        attribs.color = 1
+        attribs.thickness = 3
+        del attribs.color
+        del attribs.thickness
+        assert attribs.color == 256
+        assert attribs._attribs is None, 'expected removed attribute dict'
+        with pytest.raises(DXFAttributeError):
+            del attribs.thickness
+        attribs.discard('color')
+
+    def test_setter_event(self, attribs):
+        changes = []
+        attribs._entity.on_layer_change = changes.append
+        attribs.layer = 'mozman'
+        assert changes == ['mozman']
+
+    def test_copy(self, attribs):
+        attribs.thickness = 3
+        copy = deepcopy(attribs)
+        assert type(copy) is type(attribs)
+        assert copy.all_existing_dxf_attribs() == attribs.all_existing_dxf_attribs()
+        copy.thickness = 4
+        assert attribs.thickness == 3
+
+    def test_pickle(self, attribs):
+        attribs.color = 1
+        attribs.thickness = 3
+        copy = pickle.loads(pickle.dumps(attribs))
+        assert type(copy) is type(attribs)
+        assert copy.all_existing_dxf_attribs() == attribs.all_existing_dxf_attribs()
+        assert copy._entity is None, 'rewired by the parent entity'
+
+
 TEST_1 = """0
 DXFENTITY
 5
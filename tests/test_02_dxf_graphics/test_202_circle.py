@@ -129,3 +129,10 @@ def test_write_dxf(txt, ver):
     collector2 = TagCollector(dxfversion=ver, optional=False)
     circle.export_dxf(collector2)
     assert collector.has_all_tags(collector2)
+
+
+def test_flattening():
+    circle = Circle.new(dxfattribs={'center': (1, 2, 3), 'radius': 2.5, 'extrusion': (0, 0, -1)})
+    vertices = [Vector(circle.flattening(.01)[i:i + 3]) for i in range(0, 6, 3)]
+    assert vertices[0].isclose(Vector(-3.5, 2, -3))
+    assert len(circle.flattening(.001)) > len(circle.flattening(.1))
@@ -141,3 +141,10 @@ def test_write_dxf(txt, ver):
     collector2 = TagCollector(dxfversion=ver, optional=False)
     arc.export_dxf(collector2)
     assert collector.has_all_tags(collector2)
+
+
+def test_flattening():
+    arc = Arc.new(dxfattribs={'center': (1, 2), 'radius': 2, 'start_angle': 0, 'end_angle': 90})
+    vertices = arc.flattening(.01)
+    assert Vector(vertices[:3]).isclose(Vector(3, 2))
+    assert Vector(vertices[-3:]).isclose(Vector(1, 4))
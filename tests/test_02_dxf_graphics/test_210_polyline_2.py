@@ -672,3 +672,14 @@ AcDbEntity
   0
 ENDSEC
 """
+
+
+def test_flattening(layout):
+    polyline = layout.add_polyline2d([(0, 0), (1, 0)])
+    polyline.vertices[0].dxf.bulge = 1
+    assert len(polyline.flattening(.01)) > 6
+    polyline3d = layout.add_polyline3d([(0, 0, 0), (1, 0, 1)])
+    assert list(polyline3d.flattening(.01)) == [0, 0, 0, 1, 0, 1]
+    mesh = layout.add_polymesh(size=(2, 2))
+    with pytest.raises(ezdxf.DXFTypeError):
+        mesh.flattening(.01)
@@ -213,6 +213,29 @@ def test_packed_points_to_dxf_tags_with_bulge():
     assert tags[5] == (42, -1)
 
 
+def test_numpy_interface():
+    np = pytest.importorskip('numpy')
+    line = lwpolyline(np.array([(0, 0), (1, 0), (1, 1)]), dxfattribs=None)
+    assert line.get_points('xy') == [(0, 0), (1, 0), (1, 1)]
+    line.append_points(np.array([(2, 2, 0.5)]), format='xyb')
+    assert line[-1] == (2, 2, 0, 0, 0.5)
+    view = line.lwpoints.as_numpy()
+    assert view.shape == (4, 5)
+    view[:, 1] += 1
+    assert line[0] == (0, 1, 0, 0, 0)
+    del view
+    with pytest.raises(ezdxf.DXFValueError):
+        line.set_points(np.array([(0, 0)]), format='vb')
+    assert len(line) == 4, 'invalid input should not remove existing points'
+
+
+def test_set_invalid_points_keeps_existing_points():
+    line = lwpolyline([(0, 0), (1, 0)], dxfattribs=None)
+    with pytest.raises(TypeError):
+        line.set_points([(2, 2), (3, 'invalid')], format='xy')
+    assert line.get_points('xy') == [(0, 0), (1, 0)]
+
+
 LWPOLYLINE1 = """0
 LWPOLYLINE
 5
@@ -244,3 +267,11 @@ AcDbPolyline
 20
 0.5
 """
+
+
+def test_flattening():
+    line = lwpolyline([(0, 0, 0, 0, 1), (1, 0)], dxfattribs={'elevation': 2, 'extrusion': (0, 0, -1)})
+    vertices = line.flattening(.01)
+    assert len(vertices) > 6
+    assert tuple(vertices[:3]) == (0, 0, -2)
+    assert tuple(vertices[-3:]) == (-1, 0, -2)
@@ -115,3 +115,16 @@ def test_write_dxf():
     result = TagCollector.dxftags(entity)
     expected = basic_tags_from_text(ELLIPSE)
     assert result == expected
+
+
+def test_flattening():
+    ellipse = Ellipse.new(dxfattribs={
+        'center': (1, 2, 3),
+        'major_axis': (2, 0, 0),
+        'ratio': .5,
+        'start_param': 0,
+        'end_param': math.pi / 2,
+    })
+    vertices = ellipse.flattening(.01)
+    assert Vector(vertices[:3]).isclose(ellipse.start_point)
+    assert Vector(vertices[-3:]).isclose(ellipse.end_point)
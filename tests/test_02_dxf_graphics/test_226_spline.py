@@ -285,6 +285,20 @@ def test_closed_rational_spline(msp, points, weights):
     assert spline.closed is True
 
 
+def test_numpy_interface():
+    np = pytest.importorskip('numpy')
+    from ezdxf.lldxf.packedtags import numpy_view
+    spline = Spline.new()
+    spline.control_points = np.array([(0, 0, 0), (1, 1, 0), (2, 0, 0), (3, 1, 0)])
+    spline.knots = np.arange(8)
+    spline.weights = np.ones(4)
+    assert spline.dxf.n_control_points == 4
+    assert spline.control_points[1] == (1, 1, 0)
+    assert spline.control_points.as_numpy().shape == (4, 3)
+    assert list(numpy_view(spline.knots)) == list(range(8))
+    assert list(numpy_view(spline.weights)) == [1, 1, 1, 1]
+
+
 SPLINE2 = """  0
 SPLINE
   5
@@ -442,3 +456,13 @@ AcDbSpline
  31
 0.0
 """
+
+
+def test_flattening(msp, points):
+    spline = msp.add_open_spline(points, degree=3)
+    vertices = spline.flattening(.01)
+    assert len(vertices) % 3 == 0
+    assert tuple(vertices[:3]) == points[0]
+    assert tuple(vertices[-3:]) == pytest.approx(points[-1])
+    closed_spline = msp.add_closed_spline(points, degree=3)
+    assert len(closed_spline.flattening(.01)) > 6
@@ -77,6 +77,22 @@ def test_face_indices_as_array():
     assert a.typecode == 'L'
 
 
+def test_numpy_interface(mesh):
+    np = pytest.importorskip('numpy')
+    vertices = mesh.vertices.as_numpy()
+    assert vertices.shape == (len(mesh.vertices), 3)
+    assert tuple(vertices[0]) == mesh.vertices[0]
+    assert mesh.edges.as_numpy().shape == (len(mesh.edges), 2)
+    assert mesh.faces.as_numpy().shape == (len(mesh.faces), 4)
+
+    mesh.vertices = np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    mesh.faces = np.array([(0, 1, 2, 3)])
+    mesh.edges = np.array([(0, 1), (1, 2)])
+    assert mesh.vertices[2] == (1, 1, 0)
+    assert list(mesh.faces) == [face_to_array([0, 1, 2, 3])]
+    assert list(mesh.edges) == [(0, 1), (1, 2)]
+
+
 MESH = """  0
 MESH
 5
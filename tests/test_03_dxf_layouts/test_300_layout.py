@@ -54,11 +54,57 @@ def test_delete_all_entities(doc):
     assert paperspace_count + 5 == len(paperspace)
 
 
+def test_delete_entities():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    lines = [msp.add_line((x, 0), (x, 1)) for x in range(10)]
+    msp.delete_entities(lines[::2])
+    assert len(msp) == 5
+    assert all(line.is_alive is False for line in lines[::2])
+    assert [line.dxf.start.x for line in msp] == [1, 3, 5, 7, 9]
+    assert msp[0] is lines[1]
+
+
+def test_unlink_entities():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    lines = [msp.add_line((x, 0), (x, 1)) for x in range(10)]
+    msp.unlink_entities(lines[:8])
+    assert len(msp) == 2
+    assert all(line.dxf.owner is None for line in lines[:8])
+    assert all(line.dxf.handle in doc.entitydb for line in lines[:8])
+    assert msp.entity_space.has_handle(lines[8].dxf.handle) is True
+    assert msp.entity_space.has_handle(lines[0].dxf.handle) is False
+    with pytest.raises(ValueError):
+        msp.unlink_entities(lines[:1])
+
+    psp = doc.layout()
+    for line in lines[:8]:
+        psp.add_entity(line)
+    assert all(line in psp.entity_space for line in lines[:8])
+
+
 def test_paper_space(paperspace):
     line = paperspace.add_line((0, 0), (1, 1))
     assert line.dxf.paperspace == 1
 
 
+def test_has_handle_after_handle_reassignment():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    space = msp.entity_space
+    old_handle = line.dxf.handle
+    assert space.has_handle(old_handle) is True
+    db = doc.entitydb
+    del db[old_handle]
+    new_handle = db.next_handle()
+    line.update_handle(new_handle)
+    db[new_handle] = line
+    assert space.has_handle(new_handle) is True
+    assert space.has_handle(old_handle) is False
+
+
 def test_iter_layout(doc):
     paperspace = doc.layout()
     paperspace.delete_all_entities()
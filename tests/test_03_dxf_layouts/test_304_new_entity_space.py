@@ -80,4 +80,90 @@ def test_reorder_priority(space):
     assert list(e.priority for e in space) == sorted(NUMBERS, reverse=True), 'highest priority first'
 
 
+def test_remove_keeps_order(space):
+    entities = list(space)
+    space.remove(entities[1])
+    space.remove(entities[4])
+    assert list(e.priority for e in space) == [1, 5, 6, -4, 7]
+    assert len(space) == 5
+    assert space[1].priority == 5
+    assert space[-1].priority == 7
+
+
+def test_remove_not_existing_entity(space):
+    with pytest.raises(ValueError):
+        space.remove(Entity(1))
+    e = space[0]
+    space.remove(e)
+    with pytest.raises(ValueError):
+        space.remove(e)
+
+
+def test_compaction(space):
+    entities = list(space)
+    for e in entities[:4]:
+        space.remove(e)
+    assert len(space.entities) < 7, 'compacted'
+    assert list(e.priority for e in space) == [76, -4, 7]
+    for e in entities[4:]:
+        assert e in space
+    space.add(entities[0])
+    space.remove(entities[5])
+    assert list(e.priority for e in space) == [76, 7, 1]
+
+
+def test_add_existing_entity(space):
+    e = space[2]
+    space.add(e)
+    assert len(space) == 7, 'ignore existing entity'
+    assert list(e.priority for e in space) == NUMBERS
+    space.remove(e)
+    assert e not in space
+    assert len(space) == 6
+    space.add(e)
+    assert list(e.priority for e in space)[-1] == 5
+
+
+def test_init_with_duplicates():
+    e = Entity(1)
+    space = EntitySpace([e, Entity(2), e])
+    assert len(space) == 2
+    space.remove(e)
+    assert e not in space
+
 
+def test_reorder_after_remove(space):
+    space.remove(space[4])
+    space.reorder(order=2)
+    assert list(e.priority for e in space) == [-4, 1, 4, 5, 6, 7]
+    space.remove(space[0])
+    assert list(e.priority for e in space) == [1, 4, 5, 6, 7]
+
+
+class TypedEntity(Entity):
+    def __init__(self, priority, dxftype):
+        super().__init__(priority)
+        self._dxftype = dxftype
+
+    def dxftype(self):
+        return self._dxftype
+
+
+def test_by_dxftypes():
+    space = EntitySpace(TypedEntity(p, t) for p, t in [(1, 'LINE'), (2, 'ARC'), (3, 'LINE'), (4, 'TEXT')])
+    assert [e.priority for e in space.by_dxftypes(['LINE'])] == [1, 3]
+    assert [e.priority for e in space.by_dxftypes(['TEXT', 'LINE'])] == [1, 3, 4], 'order of appearance'
+    assert space.by_dxftypes(['CIRCLE']) == []
+
+
+def test_by_dxftypes_maintained_by_add_and_remove():
+    space = EntitySpace(TypedEntity(p, t) for p, t in [(1, 'LINE'), (2, 'ARC'), (3, 'LINE')])
+    assert len(space.by_dxftypes(['LINE'])) == 2  # create index
+    space.remove(space[0])
+    space.add(TypedEntity(4, 'LINE'))
+    space.add(TypedEntity(5, 'CIRCLE'))
+    assert [e.priority for e in space.by_dxftypes(['LINE', 'CIRCLE'])] == [3, 4, 5]
+    space[2].is_alive = False
+    assert [e.priority for e in space.by_dxftypes(['LINE', 'CIRCLE'])] == [3, 5]
+    space.reorder(order=1)
+    assert [e.priority for e in space.by_dxftypes(['LINE', 'CIRCLE'])] == [5, 3]
@@ -1,9 +1,11 @@
 # Copyright (c) 2013-2019, Manfred Moitzi
 # License: MIT-License
 import pytest
+import gc
 import ezdxf
 
 from ezdxf.query import EntityQuery, name_query
+from ezdxf.entities.dxfentity import ATTRIBUTE_INDEXES
 
 
 class TestNameQuery:
@@ -174,3 +176,156 @@ def test_match_full_string():
     names = "ONEONE TWO THREE"
     result = list(name_query(names.split(), 'ONE'))
     assert len(result) == 0
+
+
+def test_included_names():
+    from ezdxf.query import included_names
+    assert included_names(['LINE', 'TEXT']) == {'LINE', 'TEXT'}
+    assert included_names(['LINE', '!TEXT']) == {'LINE'}
+    assert included_names(['*', '!TEXT']) is None
+
+
+def test_layout_query_by_dxftype_index(modelspace):
+    result = modelspace.query('TEXT POLYLINE LINE')
+    assert [e.dxftype() for e in result] == ['LINE', 'POLYLINE', 'TEXT'], 'order of appearance'
+    result = modelspace.query('POLYLINE TEXT[color==6]')
+    assert [e.dxftype() for e in result] == ['POLYLINE', 'TEXT']
+    result = modelspace.query('LINE TEXT[layer=="lay_lines"]')
+    assert [e.dxftype() for e in result] == ['LINE']
+
+
+def test_compiled_query_is_cached():
+    from ezdxf.query import compile_query
+    assert compile_query('LINE[color==7]') is compile_query('LINE[color==7]')
+
+
+@pytest.mark.parametrize('query, count', [
+    ('*[layer=="lay_lines" & color==7]', 1),
+    ('*[layer=="lay_lines" | color==6]', 3),
+    ('*[!layer=="lay_lines"]', 1),
+    ('*[layer=="lay_lines" & !(color==7 | color==5)]', 1),
+    ('*[(layer=="lay_lines" | layer=="lay_text") & color==6 & layer!="lay_text"]', 1),
+])
+def test_compiled_attribute_expressions(modelspace, query, count):
+    assert len(EntityQuery(list(modelspace), query)) == count
+
+
+def test_explain_without_index(modelspace):
+    assert modelspace.query('*[color==6]').explain() == 'full scan'
+    assert modelspace.query('LINE TEXT[color==6]').explain() == 'DXF type index: LINE TEXT'
+
+
+def test_attribute_index():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), {'layer': 'A', 'color': 1})
+    msp.add_circle((0, 0), 1, {'layer': 'B', 'color': 2})
+    msp.add_line((0, 0), (2, 0), {'layer': 'a', 'color': 3})
+    index = msp.create_attribute_index('layer')
+    assert len(index) == 3
+
+    result = msp.query('*[color>1 & layer=="a"]')
+    assert result.explain() == 'attribute index: layer == "a"'
+    assert len(result) == 1
+    result = msp.query('*[layer=="A"]i')
+    assert [e.dxf.color for e in result] == [1, 3], 'order of appearance'
+    result = msp.query('*[layer!="B"]')
+    assert result.explain() == 'attribute index: layer != "B"'
+    assert len(result) == 2
+    assert msp.query('*[layer=="B" | color==1]').explain() == 'full scan'
+
+    circle = msp.query('CIRCLE').first
+    circle.dxf.layer = 'A'
+    assert len(msp.query('*[layer=="A"]')) == 2, 'index updated by setting DXF attribute'
+    circle.dxf.discard('layer')
+    assert len(msp.query('*[layer=="A"]')) == 1, 'index updated by discarding DXF attribute'
+    circle.dxf.layer = 'A'
+    assert len(msp.query('*[layer=="A"]')) == 2
+
+    line = msp.add_line((0, 0), (3, 0), {'layer': 'A'})
+    assert len(msp.query('*[layer=="A"]')) == 3
+    msp.delete_entity(line)
+    assert len(msp.query('*[layer=="A"]')) == 2
+
+    msp.remove_attribute_index('layer')
+    assert msp.query('*[layer=="A"]').explain() == 'full scan'
+
+
+def test_attribute_index_of_other_layouts_is_not_affected():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    blk = doc.blocks.new('BLK')
+    line = msp.add_line((0, 0), (1, 0), {'layer': 'A'})
+    blk.add_line((0, 0), (1, 0), {'layer': 'A'})
+    index = msp.create_attribute_index('layer')
+    blk_index = blk.create_attribute_index('layer')
+    line.dxf.layer = 'B'
+    assert len(blk_index) == 1
+    assert len(blk.query('*[layer=="B"]')) == 0
+    msp.remove_attribute_index('layer')
+    line.dxf.layer = 'C'
+    assert len(list(index.select(lambda value: value == 'C'))) == 0, 'removed index is not updated'
+
+
+def test_removed_attribute_indexes_are_unregistered():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    msp.create_attribute_index('color')
+    assert 'color' in ATTRIBUTE_INDEXES
+    msp.remove_attribute_index('color')
+    assert 'color' not in ATTRIBUTE_INDEXES, 'setting DXF attribute color does not check for indexes'
+
+    other_doc = ezdxf.new()
+    other_doc.modelspace().create_attribute_index('color')
+    del other_doc
+    gc.collect()
+    line.dxf.color = 1
+    assert 'color' not in ATTRIBUTE_INDEXES, 'garbage collected indexes are removed at the next update'
+
+
+class TestLazyEntityQuery:
+    @pytest.fixture
+    def msp(self):
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        for color in range(1, 7):
+            msp.add_line((0, 0), (color, 0), {'layer': 'lines', 'color': color})
+            msp.add_circle((0, 0), color, {'layer': 'circles', 'color': color})
+        return msp
+
+    def test_query(self, msp):
+        result = msp.iquery('LINE')
+        assert not isinstance(result, EntityQuery)
+        assert len(list(result)) == 6
+        assert len(list(result)) == 6, 'is reusable'
+
+    def test_chained_filters(self, msp):
+        result = msp.iquery('*[layer=="lines"]').query('*[color>2]').filter(lambda e: e.dxf.color != 4)
+        assert [e.dxf.color for e in result] == [3, 5, 6]
+
+    def test_slicing(self, msp):
+        result = msp.iquery('CIRCLE')
+        assert [e.dxf.color for e in result[1:3]] == [2, 3]
+        assert [e.dxf.color for e in result.limit(2)] == [1, 2]
+        assert [e.dxf.color for e in result[::2].limit(2)] == [1, 3]
+        assert result[2].dxf.color == 3
+        with pytest.raises(IndexError):
+            _ = result[6]
+
+    def test_first(self, msp):
+        assert msp.iquery('CIRCLE').first.dxf.color == 1
+        assert msp.iquery('TEXT').first is None
+
+    def test_unique(self, msp):
+        lines = list(msp.query('LINE'))
+        result = EntityQuery(lines + lines).query('*')
+        assert len(list(ezdxf.query.LazyEntityQuery(result).unique())) == 6
+
+    def test_groupby(self, msp):
+        groups = msp.iquery('*[color<3]').groupby('layer')
+        assert len(groups['lines']) == 2
+        assert len(groups['circles']) == 2
+
+    def test_entity_query_from_lazy_query(self, msp):
+        assert len(EntityQuery(msp.iquery('LINE'))) == 6
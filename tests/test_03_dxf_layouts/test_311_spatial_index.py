@@ -0,0 +1,63 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.math.bbox import BoundingBox
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    for x in range(10):
+        for y in range(10):
+            msp.add_circle((x * 10, y * 10), radius=1)
+    msp.add_line((0, 0), (100, 0), dxfattribs={'layer': 'LINES'})
+    msp.add_xline((0, 0), (1, 1))
+    return msp
+
+
+def test_spatial_index_is_created_on_demand(msp):
+    index = msp.spatial_index
+    assert len(index) == 101, 'XLINE has no bounding box'
+    assert msp.spatial_index is index
+
+
+def test_query_window_intersect(msp):
+    result = msp.query_window([(8, 8), (21, 21)])
+    assert len(result) == 4
+    result = msp.query_window(BoundingBox([(-5, -5), (5, 5)]))
+    assert len(result) == 2, 'circle and line'
+    result = msp.query_window([(-5, -5), (5, 5)], query='CIRCLE')
+    assert len(result) == 1
+
+
+def test_query_window_inside(msp):
+    assert len(msp.query_window([(8, 8), (21, 21)], mode='inside')) == 4
+    assert len(msp.query_window([(8, 8), (20.5, 20.5)], mode='inside')) == 1
+    with pytest.raises(ValueError):
+        msp.query_window([(0, 0), (1, 1)], mode='xxx')
+
+
+def test_index_follows_add_and_delete(msp):
+    index = msp.spatial_index
+    circle = msp.add_circle((500, 500), radius=1)
+    assert circle in index
+    assert msp.query_window([(490, 490), (510, 510)])[0] is circle
+
+    msp.delete_entity(circle)
+    assert circle not in index
+    assert len(msp.query_window([(490, 490), (510, 510)])) == 0
+
+
+def test_update_modified_entity(msp):
+    circle = msp.query_window([(45, 45), (55, 55)])[0]
+    circle.dxf.center = (500, 500)
+    msp.spatial_index.update(circle)
+    assert len(msp.query_window([(45, 45), (55, 55)])) == 0
+    assert msp.query_window([(490, 490), (510, 510)])[0] is circle
+
+
+def test_nearest_entities(msp):
+    result = msp.nearest_entities((52, 48), count=2)
+    assert [e.dxf.center for e in result] == [(50, 50), (50, 40)]
@@ -0,0 +1,190 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import io
+import ezdxf
+from ezdxf.compact import CompactEntityStore, CompactEntity
+from ezdxf.lldxf.const import DXFAttributeError, DXFTypeError
+from ezdxf.lldxf.tagwriter import TagCollector
+
+
+@pytest.fixture
+def doc():
+    return ezdxf.new('R2000')
+
+
+@pytest.fixture
+def store(doc):
+    return doc.modelspace().compact_store
+
+
+def test_compact_store_is_created_once(doc):
+    msp = doc.modelspace()
+    assert isinstance(msp.compact_store, CompactEntityStore)
+    assert msp.compact_store is msp.compact_store
+    assert len(msp.compact_store) == 0
+
+
+def test_add_line(store):
+    line = store.add_line((0, 0), (1, 2, 3), dxfattribs={'layer': 'LINES', 'color': 1})
+    assert isinstance(line, CompactEntity)
+    assert line.dxftype() == 'LINE'
+    assert line.is_alive
+    assert line.dxf.start == (0, 0, 0)
+    assert line.dxf.end == (1, 2, 3)
+    assert line.dxf.layer == 'LINES'
+    assert line.dxf.color == 1
+    assert line.dxf.linetype == 'BYLAYER'
+    assert line.dxf.owner == store.owner
+    assert line.dxf.thickness == 0, 'DXF default value'
+    assert line.dxf.get('thickness') is None
+    assert line.dxf.hasattr('start')
+    assert line.dxf.hasattr('thickness') is False
+    assert len(store) == 1
+
+
+def test_unique_handles(store):
+    handles = {store.add_point((i, 0)).dxf.handle for i in range(10)}
+    assert len(handles) == 10
+
+
+def test_proxies_are_equal(store):
+    store.add_point((0, 0))
+    assert list(store) == list(store)
+
+
+def test_set_attributes(store):
+    arc = store.add_arc((0, 0), 2, 0, 90)
+    arc.dxf.center = (1, 1)
+    arc.dxf.radius = 3
+    arc.dxf.layer = 'ARCS'
+    arc.set_dxf_attrib('end_angle', 180)
+    assert arc.dxf.center == (1, 1, 0)
+    assert arc.dxf.radius == 3
+    assert arc.dxf.layer == 'ARCS'
+    assert arc.dxf.end_angle == 180
+
+
+def test_unsupported_attributes(store):
+    circle = store.add_circle((0, 0), 1)
+    with pytest.raises(DXFAttributeError):
+        circle.dxf.thickness = 1
+    with pytest.raises(DXFAttributeError):
+        circle.dxf.handle = 'FFFF'
+    with pytest.raises(DXFAttributeError):
+        _ = circle.dxf.text
+    with pytest.raises(DXFAttributeError):
+        store.add_line((0, 0), (1, 0), dxfattribs={'extrusion': (0, 0, -1)})
+    with pytest.raises(DXFTypeError):
+        store.new_entity('TEXT', {})
+
+
+def test_delete_and_purge(store):
+    points = [store.add_point((i, 0)) for i in range(5)]
+    store.delete_entity(points[1])
+    store.delete_entity(points[1])
+    assert points[1].is_alive is False
+    assert len(store) == 4
+    store.purge()
+    assert len(store) == 4
+    assert [p.dxf.location.x for p in store] == [0, 2, 3, 4]
+
+
+def test_3dface(store):
+    face = store.add_3dface([(0, 0), (1, 0), (1, 1)])
+    assert face.dxf.vtx3 == (1, 1, 0)
+    assert face.dxf.invisible == 0
+
+
+def test_export_r2000(store):
+    store.add_arc((1, 2), 3, 45, 90, dxfattribs={'layer': 'ARCS', 'linetype': 'DASHED', 'lineweight': 25})
+    collector = TagCollector(dxfversion='AC1015')
+    store.export_dxf(collector)
+    tags = collector.tags
+    assert tags[0] == (0, 'ARC')
+    assert (330, store.owner) in tags
+    assert (100, 'AcDbEntity') in tags
+    assert (100, 'AcDbCircle') in tags
+    assert (100, 'AcDbArc') in tags
+    assert (8, 'ARCS') in tags
+    assert (6, 'DASHED') in tags
+    assert (370, 25) in tags
+    assert (40, 3) in tags
+    assert (62, 256) not in tags
+
+
+def test_export_r12():
+    doc = ezdxf.new('R12')
+    store = doc.modelspace().compact_store
+    store.add_line((0, 0), (1, 0), dxfattribs={'lineweight': 25})
+    collector = TagCollector(dxfversion='AC1009')
+    store.export_dxf(collector)
+    codes = [tag.code for tag in collector.tags]
+    assert 100 not in codes
+    assert 330 not in codes
+    assert 370 not in codes
+
+
+def test_save_and_reload(doc, monkeypatch):
+    monkeypatch.setattr(ezdxf.options, 'update_extents', True)
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    msp.compact_store.add_line((0, 0), (5, 5), dxfattribs={'layer': 'COMPACT'})
+    msp.compact_store.add_circle((0, 0), 10)
+    stream = io.StringIO()
+    doc.write(stream)
+    doc2 = ezdxf.read(io.StringIO(stream.getvalue()))
+    entities = list(doc2.modelspace())
+    assert [e.dxftype() for e in entities] == ['LINE', 'LINE', 'CIRCLE']
+    assert entities[1].dxf.layer == 'COMPACT'
+    assert doc2.header['$EXTMAX'] == (10, 10, 0), 'compact entities are included'
+
+
+def test_paperspace_entities():
+    doc = ezdxf.new('R2000')
+    store = doc.layout().compact_store
+    line = store.add_line((0, 0), (1, 0))
+    assert line.dxf.paperspace == 1
+    collector = TagCollector(dxfversion='AC1015')
+    store.export_dxf(collector)
+    assert (67, 1) in collector.tags
+
+
+def test_compact_entities_of_layout(doc):
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES', 'color': 3})
+    handle = line.dxf.handle
+    msp.add_circle((0, 0), 1, dxfattribs={'thickness': 2})  # not supported
+    msp.add_text('TEXT')
+    msp.add_point((0, 0)).set_xdata('ACAD', [(1000, 'x')])  # not supported
+    assert msp.compact_entities() == 1
+    assert len(msp) == 3
+    assert line.is_alive is False
+    compact_line = list(msp.compact_store)[0]
+    assert compact_line.dxf.handle == handle
+    assert compact_line.dxf.layer == 'LINES'
+    assert compact_line.dxf.color == 3
+
+
+def test_compacted_entities_vanish_from_layout_and_entitydb(doc):
+    msp = doc.modelspace()
+    handle = msp.add_line((0, 0), (1, 0)).dxf.handle
+    assert msp.compact_entities() == 1
+    assert len(msp.query('LINE')) == 0
+    assert handle not in doc.entitydb
+    assert [e.dxf.handle for e in msp.compact_store] == [handle]
+
+
+def test_query_compact_entities(store):
+    store.add_line((0, 0), (1, 0), dxfattribs={'layer': 'A'})
+    store.add_line((0, 0), (1, 0), dxfattribs={'layer': 'B'})
+    store.add_point((0, 0), dxfattribs={'layer': 'A'})
+    result = ezdxf.query.new(store, 'LINE[layer=="A"]')
+    assert len(result) == 1
+
+
+def test_delete_all_entities(doc):
+    msp = doc.modelspace()
+    msp.compact_store.add_point((0, 0))
+    msp.delete_all_entities()
+    assert len(msp.compact_store) == 0
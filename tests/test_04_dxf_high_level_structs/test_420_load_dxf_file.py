@@ -29,3 +29,31 @@ def test_load_dxf(dxf):
     psp = doc.layout()
     assert len(psp) == 1
     assert psp[0].dxftype() == 'CIRCLE'
+
+
+@pytest.mark.skipif(ezdxf.PYPY_ON_WINDOWS, reason='Does not work on Windows with PyPy 3.5.3')
+def test_load_selected_sections(dxf):
+    doc = ezdxf.readfile(dxf, sections={'TABLES', 'ENTITIES'})
+    assert len(doc.modelspace()) == 1
+    assert len(doc.layout()) == 1
+
+
+@pytest.mark.skipif(ezdxf.PYPY_ON_WINDOWS, reason='Does not work on Windows with PyPy 3.5.3')
+@pytest.mark.parametrize('sections', [{'OBJECTS'}, {'ENTITIES', 'OBJECTS'}, {'BLOCKS', 'OBJECTS'}])
+def test_tables_section_is_loaded_implicit(tmpdir, sections):
+    doc = ezdxf.new()
+    doc.layers.new('LAYER_FROM_FILE')
+    doc.modelspace().add_line((0, 0), (1, 0))
+    filename = tmpdir.join('tables.dxf')
+    doc.saveas(filename)
+
+    doc = ezdxf.readfile(filename, sections=sections)
+    assert 'LAYER_FROM_FILE' in doc.layers
+    assert len(doc.modelspace()) == (1 if 'ENTITIES' in sections else 0)
+
+
+@pytest.mark.skipif(ezdxf.PYPY_ON_WINDOWS, reason='Does not work on Windows with PyPy 3.5.3')
+def test_load_filtered_entities(dxf):
+    doc = ezdxf.readfile(dxf, entity_filter=lambda tags: tags[0].value == 'LINE')
+    assert len(doc.modelspace()) == 1
+    assert len(doc.layout()) == 0
@@ -0,0 +1,220 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import pickle
+from io import StringIO
+
+import ezdxf
+from ezdxf import options
+from ezdxf.entities import DXFEntity, Line
+
+
+def create_doc(dxfversion):
+    doc = ezdxf.new(dxfversion)
+    doc.layers.new('LINES')
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x, 10), dxfattribs={'layer': 'LINES', 'color': 1})
+    msp.add_circle((0, 0), radius=3)
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)])
+    blk = doc.blocks.new('BLK')
+    blk.add_text('TEXT')
+    psp = doc.layout()
+    psp.add_line((0, 0), (1, 1))
+    return doc
+
+
+def dxfstr(doc) -> str:
+    stream = StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def load(text, lazy):
+    prev = options.lazy_loading
+    options.lazy_loading = lazy
+    try:
+        return ezdxf.read(StringIO(text))
+    finally:
+        options.lazy_loading = prev
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def text(request):
+    return dxfstr(create_doc(request.param))
+
+
+def test_lazy_loading_is_disabled_by_default():
+    assert options.lazy_loading is False
+
+
+def test_load_lazy_entities(text):
+    doc = load(text, lazy=True)
+    msp = doc.modelspace()
+    lines = [e for e in msp if e.dxftype() == 'LINE']
+    assert len(lines) == 10
+    assert all(line.is_lazy for line in lines)
+    # linked entities are always loaded
+    polyline = msp.query('POLYLINE')[0]
+    assert polyline.is_lazy is False
+    assert len(polyline) == 3
+
+
+def test_base_attributes_do_not_load_entity(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    assert line.dxf.handle is not None
+    assert line.dxf.owner == doc.modelspace().layout_key
+    assert line.dxf.layer == 'LINES'
+    assert line.dxf.paperspace == 0
+    assert line.dxf.hasattr('layer')
+    assert line.is_lazy is True
+
+
+def test_attribute_access_loads_entity(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    assert line.dxf.color == 1
+    assert line.is_lazy is False
+    assert line.dxf.end == (0, 10)
+    assert line.dxf.owner == doc.modelspace().layout_key
+
+
+def test_instance_attributes_of_lazy_entities(text):
+    doc = load(text, lazy=True)
+    text_entity = doc.blocks.get('BLK').query('TEXT')[0]
+    assert text_entity.is_lazy is True
+    assert text_entity.xdata is None
+    assert text_entity.priority == 0
+    assert text_entity.is_lazy is True
+    assert isinstance(text_entity._lazy_tags, str), 'expected compact DXF string'
+
+
+def test_lazy_entities_are_instances_of_the_entity_class(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    assert type(line) is Line
+    assert line.dxf.color == 1
+    assert type(line) is Line
+    with pytest.raises(AttributeError):
+        line.unknown_attribute
+
+
+def test_lazy_loading_does_not_change_entity_classes(text):
+    load(text, lazy=True)
+    for cls in (DXFEntity, Line):
+        assert '__getattr__' not in vars(cls)
+        assert 'xdata' not in vars(cls)
+        assert 'dxf' not in vars(cls)
+
+
+def test_entities_with_extended_data_are_loaded():
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0)).set_xdata('ACAD', [(1000, 'ezdxf')])
+    msp.add_line((0, 0), (1, 0)).set_reactors(['ABBA'])
+    msp.add_line((0, 0), (1, 0))
+    lines = load(dxfstr(doc), lazy=True).modelspace().query('LINE')
+    assert [line.is_lazy for line in lines] == [False, False, True]
+    assert lines[0].get_xdata('ACAD') == [(1000, 'ezdxf')]
+    assert lines[1].get_reactors() == ['ABBA']
+
+
+def test_entities_with_specific_data_are_loaded():
+    doc = ezdxf.new('R2000')
+    doc.modelspace().add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+    lwpolyline = load(dxfstr(doc), lazy=True).modelspace()[0]
+    assert lwpolyline.is_lazy is False
+    assert len(lwpolyline) == 3
+
+
+def test_pickle_lazy_entity(text):
+    doc = pickle.loads(pickle.dumps(load(text, lazy=True)))
+    line = doc.modelspace().query('LINE')[0]
+    assert line.is_lazy is True
+    assert type(line) is Line
+    assert line.dxf.color == 1
+    assert line.is_lazy is False
+
+
+def test_query_by_layer_does_not_load_entities(text):
+    doc = load(text, lazy=True)
+    lines = doc.modelspace().query('*[layer=="LINES"]')
+    assert len(lines) == 10
+    assert all(line.is_lazy for line in lines)
+
+
+def test_stale_namespace_reference_after_loading(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    dxf = line.dxf
+    line.dxf.color = 3
+    assert line.is_lazy is False
+    assert dxf.color == 3
+    dxf.color = 4
+    assert line.dxf.color == 4
+
+
+def entity_sections(text: str) -> str:
+    # header contains time stamps and GUIDs
+    end = text.find('OBJECTS\n')  # DXF R12 has no OBJECTS section
+    return text[text.index('BLOCKS\n'):end if end > 0 else None]
+
+
+def test_unmodified_export_is_identical(text):
+    assert entity_sections(dxfstr(load(text, lazy=True))) == entity_sections(dxfstr(load(text, lazy=False)))
+
+
+def test_modified_entity_export(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    line.dxf.color = 5
+    doc2 = load(dxfstr(doc), lazy=False)
+    assert doc2.entitydb[line.dxf.handle].dxf.color == 5
+
+
+def test_move_lazy_entity_to_paperspace(text):
+    doc = load(text, lazy=True)
+    msp = doc.modelspace()
+    psp = doc.layout()
+    line = msp.query('LINE')[0]
+    msp.move_to_layout(line, psp)
+    assert line.is_lazy is True
+    assert line.dxf.paperspace == 1
+
+    doc2 = load(dxfstr(doc), lazy=False)
+    line2 = doc2.entitydb[line.dxf.handle]
+    assert line2.dxf.paperspace == 1
+    assert line2.dxf.color == 1
+
+
+def test_delete_lazy_entity(text):
+    doc = load(text, lazy=True)
+    msp = doc.modelspace()
+    line = msp.query('LINE')[0]
+    msp.delete_entity(line)
+    assert line.is_alive is False
+    assert len(msp.query('LINE')) == 9
+
+
+def test_lazy_block_entities(text):
+    doc = load(text, lazy=True)
+    text_entity = doc.blocks.get('BLK').query('TEXT')[0]
+    assert text_entity.is_lazy is True
+    assert text_entity.dxf.text == 'TEXT'
+    assert text_entity.is_lazy is False
+
+
+def test_copy_lazy_entity(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    copy = line.copy()
+    assert copy.is_lazy is False
+    assert copy.dxf.color == 1
+    assert copy.dxf.handle is None
+
+
+def test_export_does_not_load_unmodified_entities(text):
+    doc = load(text, lazy=True)
+    dxfstr(doc)
+    assert all(line.is_lazy for line in doc.modelspace().query('LINE'))
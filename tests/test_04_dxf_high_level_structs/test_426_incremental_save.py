@@ -0,0 +1,302 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import pickle
+from io import StringIO
+
+import ezdxf
+from ezdxf import options
+from ezdxf.entities import LWPolyline, Hatch
+
+
+def create_doc(dxfversion):
+    doc = ezdxf.new(dxfversion)
+    doc.appids.new('EZDXF')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'color': 1}).set_xdata('EZDXF', [(1000, 'loaded')])
+    if dxfversion != 'R12':
+        msp.add_lwpolyline([(0, 0), (1, 0), (1, 1)])
+        hatch = msp.add_hatch()
+        hatch.paths.add_polyline_path([(0, 0), (1, 0), (1, 1)])
+    blk = doc.blocks.new('BLK')
+    blk.add_attdef('TAG')
+    msp.add_blockref('BLK', (0, 0)).add_attrib('TAG', 'value')
+    return doc
+
+
+def dxfstr(doc) -> str:
+    stream = StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def load(text, lazy=False):
+    prev = options.incremental_save, options.lazy_loading
+    options.incremental_save = True
+    options.lazy_loading = lazy
+    try:
+        return ezdxf.read(StringIO(text))
+    finally:
+        options.incremental_save, options.lazy_loading = prev
+
+
+def reload(doc):
+    return ezdxf.read(StringIO(dxfstr(doc)))
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def text(request):
+    return dxfstr(create_doc(request.param))
+
+
+def entity_sections(text: str) -> str:
+    # header contains time stamps and GUIDs
+    end = text.find('OBJECTS\n')  # DXF R12 has no OBJECTS section
+    return text[text.index('BLOCKS\n'):end if end > 0 else None]
+
+
+def test_incremental_save_is_disabled_by_default():
+    assert options.incremental_save is False
+
+
+def test_unmodified_entities_keep_loaded_tags(text):
+    doc = load(text)
+    line = doc.modelspace().query('LINE')[0]
+    assert line.is_modified() is False
+    dxfstr(doc)
+    assert line.is_modified() is False
+    assert '_loaded_tags' in line.__dict__
+
+
+def test_unmodified_export_is_identical(text):
+    assert entity_sections(dxfstr(load(text))) == entity_sections(dxfstr(ezdxf.read(StringIO(text))))
+
+
+def test_modified_dxf_attribute(text):
+    doc = load(text)
+    line = doc.modelspace().query('LINE')[0]
+    line.dxf.color = 5
+    assert line.is_modified() is True
+    doc2 = reload(doc)
+    assert doc2.entitydb[line.dxf.handle].dxf.color == 5
+
+
+def test_modified_xdata(text):
+    doc = load(text)
+    line = doc.modelspace().query('LINE')[0]
+    line.set_xdata('EZDXF', [(1000, 'text')])
+    assert line.is_modified() is True
+    doc2 = reload(doc)
+    assert doc2.entitydb[line.dxf.handle].get_xdata('EZDXF') == [(1000, 'text')]
+
+
+def test_modified_lwpolyline_points(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    lwp = doc.modelspace().query('LWPOLYLINE')[0]
+    lwp[1] = (7, 0)
+    assert lwp.is_modified() is True
+    doc2 = reload(doc)
+    assert doc2.entitydb[lwp.dxf.handle][1][:2] == (7, 0)
+
+
+def test_modified_hatch_paths(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    hatch = doc.modelspace().query('HATCH')[0]
+    hatch.paths.add_polyline_path([(0, 0), (2, 0), (2, 2)])
+    assert hatch.is_modified() is True
+    doc2 = reload(doc)
+    assert len(doc2.entitydb[hatch.dxf.handle].paths) == 2
+
+
+@pytest.fixture(scope='module')
+def hatch_text():
+    doc = ezdxf.new('R2000')
+    hatch = doc.modelspace().add_hatch()
+    hatch.paths.add_polyline_path([(0, 0), (1, 0), (1, 1)])
+    edge_path = hatch.paths.add_edge_path()
+    edge_path.add_line((0, 0), (1, 0))
+    edge_path.add_line((1, 0), (0, 0))
+    hatch.set_pattern_fill('ANSI31')
+    hatch.set_seed_points([(0, 0)])
+    return dxfstr(doc)
+
+
+def test_in_place_changes_of_boundary_paths(hatch_text):
+    doc = load(hatch_text)
+    hatch = doc.modelspace().query('HATCH')[0]
+    hatch.paths.paths[1].edges[0].start = (5, 5)
+    assert hatch.is_modified() is True
+    assert reload(doc).entitydb[hatch.dxf.handle].paths[1].edges[0].start == (5, 5)
+
+    doc = load(hatch_text)
+    hatch = doc.modelspace().query('HATCH')[0]
+    hatch.paths.paths[0].vertices.append((9, 9, 0))
+    assert hatch.is_modified() is True
+    assert len(reload(doc).entitydb[hatch.dxf.handle].paths[0].vertices) == 4
+
+
+def test_in_place_changes_of_pattern_and_seeds(hatch_text):
+    doc = load(hatch_text)
+    hatch = doc.modelspace().query('HATCH')[0]
+    assert hatch.is_modified() is False
+    hatch.pattern.lines[0].dash_length_items.append(1.)
+    assert hatch.is_modified() is True
+
+    doc = load(hatch_text)
+    hatch = doc.modelspace().query('HATCH')[0]
+    hatch.seeds.append((1, 1))
+    assert hatch.is_modified() is True
+    assert len(reload(doc).entitydb[hatch.dxf.handle].seeds) == 2
+
+
+def test_modified_attrib(text):
+    doc = load(text)
+    insert = doc.modelspace().query('INSERT')[0]
+    attrib = insert.get_attrib('TAG')
+    attrib.dxf.text = 'new'
+    assert attrib.is_modified() is True
+    assert insert.is_modified() is False
+    doc2 = reload(doc)
+    assert doc2.entitydb[insert.dxf.handle].get_attrib_text('TAG') == 'new'
+
+
+def test_lazy_loaded_entity_keeps_loaded_tags(text):
+    doc = load(text, lazy=True)
+    line = doc.modelspace().query('LINE')[0]
+    assert line.dxf.color == 1  # loads entity
+    assert line.is_lazy is False
+    assert line.is_modified() is False
+    line.dxf.color = 2
+    assert line.is_modified() is True
+    assert reload(doc).entitydb[line.dxf.handle].dxf.color == 2
+
+
+def test_changed_dxf_version_discards_loaded_tags(text):
+    doc = load(text)
+    if doc.dxfversion != 'AC1009':
+        pytest.skip('requires DXF R12')
+    doc.dxfversion = 'AC1015'
+    doc2 = reload(doc)
+    assert doc2.dxfversion == 'AC1015'
+    assert doc2.modelspace().query('LINE')[0].dxf.color == 1
+
+
+def test_pickle_keeps_loaded_state(text):
+    doc = pickle.loads(pickle.dumps(load(text)))
+    line = doc.modelspace().query('LINE')[0]
+    assert line.is_modified() is False
+    line.dxf.color = 6
+    assert line.is_modified() is True
+    assert reload(doc).entitydb[line.dxf.handle].dxf.color == 6
+
+
+def test_discarded_dxf_attribute(text):
+    doc = load(text)
+    line = doc.modelspace().query('LINE')[0]
+    line.dxf.discard('color')
+    assert line.is_modified() is True
+    assert reload(doc).entitydb[line.dxf.handle].dxf.color == 256
+
+
+def test_reading_entity_data_does_not_set_dirty_flag(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    msp = doc.modelspace()
+    lwp = msp.query('LWPOLYLINE')[0]
+    assert len(lwp.lwpoints) == 3
+    assert list(lwp.vertices()) == [(0, 0), (1, 0), (1, 1)]
+    hatch = msp.query('HATCH')[0]
+    assert len(hatch.paths[0].vertices) == 3
+    assert len(msp.query_window([(-1, -1), (2, 2)])) > 0
+    assert lwp.is_modified() is False
+    assert hatch.is_modified() is False
+    assert type(lwp) is LWPolyline
+
+
+def test_entity_data_mutators_set_dirty_flag(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    lwp = doc.modelspace().query('LWPOLYLINE')[0]
+    lwp.lwpoints.append((5, 5, 0, 0, 0))  # direct container access
+    assert lwp.is_modified() is True
+    assert type(lwp) is LWPolyline
+    assert len(reload(doc).entitydb[lwp.dxf.handle]) == 4
+
+
+def test_boundary_path_mutators_set_dirty_flag(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    hatch = doc.modelspace().query('HATCH')[0]
+    hatch.paths[0].set_vertices([(0, 0), (3, 0), (3, 3)])
+    assert hatch.is_modified() is True
+    assert reload(doc).entitydb[hatch.dxf.handle].paths[0].vertices[1] == (3, 0, 0)
+
+
+def test_xdata_mutators_set_dirty_flag(text):
+    doc = load(text)
+    line = doc.modelspace().query('LINE')[0]
+    assert line.xdata.get('EZDXF') == [(1001, 'EZDXF'), (1000, 'loaded')]
+    assert line.is_modified() is False
+    line.xdata.add('EZDXF', [(1000, 'changed')])  # direct container access
+    assert line.is_modified() is True
+    assert reload(doc).entitydb[line.dxf.handle].get_xdata('EZDXF') == [(1000, 'changed')]
+
+
+def test_assigning_entity_data_sets_dirty_flag(text):
+    doc = load(text)
+    line = doc.modelspace().query('LINE')[0]
+    line.priority = 1
+    assert line.is_modified() is False, 'priority is not exported'
+    line.xdata = None
+    assert line.is_modified() is True
+
+
+def test_new_entities_do_not_track_modifications(text):
+    doc = load(text)
+    loaded = doc.modelspace().query('LINE')[0]
+    line = doc.modelspace().add_line((0, 0), (1, 0))
+    assert type(line.dxf) is not type(loaded.dxf), 'only entities with loaded tags use the tracking namespace'
+    line.dxf.color = 6
+    assert line.is_modified() is True
+    assert '_dirty' not in vars(line)
+
+
+def test_add_attrib_sets_dirty_flag(text):
+    doc = load(text)
+    insert = doc.modelspace().query('INSERT')[0]
+    assert len(insert.attribs) == 1
+    assert insert.is_modified() is False, 'linked entities are not tracked'
+    insert.add_attrib('TAG2', 'value2')
+    assert insert.is_modified() is True
+
+
+def test_copy_of_unmodified_entity(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    hatch = doc.modelspace().query('HATCH')[0]
+    copy = hatch.copy()
+    assert type(copy) is Hatch
+    assert len(copy.paths) == 1
+    copy.paths.clear()
+    assert hatch.is_modified() is False, 'copied data is not linked to the source entity'
+
+
+def test_pickle_unmodified_entity_data(text):
+    doc = load(text)
+    if doc.dxfversion == 'AC1009':
+        pytest.skip('requires DXF R2000')
+    doc = pickle.loads(pickle.dumps(doc))
+    hatch = doc.modelspace().query('HATCH')[0]
+    assert hatch.is_modified() is False
+    assert len(hatch.paths) == 1
+    assert hatch.is_modified() is False
+    hatch.paths.add_polyline_path([(0, 0), (2, 0), (2, 2)])
+    assert hatch.is_modified() is True
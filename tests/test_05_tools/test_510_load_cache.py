@@ -0,0 +1,158 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import os
+import pickle
+
+import ezdxf
+from ezdxf import options
+from ezdxf.tools.loadcache import LoadCache
+
+
+@pytest.fixture(scope='module')
+def doc():
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES'})
+    msp.add_polyline3d([(0, 0, 0), (1, 1, 1)])
+    blk = doc.blocks.new('BLK')
+    blk.add_attdef('TAG')
+    msp.add_blockref('BLK', (0, 0)).add_attrib('TAG', 'value')
+    return doc
+
+
+@pytest.fixture
+def filename(doc, tmpdir):
+    filename = str(tmpdir.join('test.dxf'))
+    doc.saveas(filename)
+    return filename
+
+
+@pytest.fixture
+def cache_dir(tmpdir):
+    cache_dir = str(tmpdir.join('cache'))
+    options.load_cache_dir = cache_dir
+    yield cache_dir
+    options.load_cache_dir = None
+
+
+def test_pickle_entity_without_document(doc):
+    line = doc.modelspace()[0]
+    line2 = pickle.loads(pickle.dumps(line))
+    assert line2.doc is None
+    assert line2.dxf.layer == 'LINES'
+    assert line2.dxf.end == (1, 0)
+    assert line2.dxf.dxftype == 'LINE'
+
+
+def test_pickle_document(doc):
+    doc2 = pickle.loads(pickle.dumps(doc))
+    msp = doc2.modelspace()
+    assert len(msp) == 3
+    assert all(e.doc is doc2 for e in msp)
+    insert = msp.query('INSERT')[0]
+    assert insert.get_attrib_text('TAG') == 'value'
+    assert insert.attribs[0].doc is doc2
+    assert len(msp.query('POLYLINE')[0].vertices) == 2
+
+
+def test_cache_key(filename, tmpdir):
+    cache = LoadCache(str(tmpdir.join('cache')))
+    assert cache.key(filename) == cache.key(filename)
+    assert cache.key(filename, True) != cache.key(filename, False)
+
+
+def test_readfile_creates_snapshot(filename, cache_dir):
+    doc = ezdxf.readfile(filename)
+    cache = LoadCache(cache_dir)
+    assert cache.size() > 0
+    doc2 = ezdxf.readfile(filename)
+    assert doc2 is not doc
+    assert doc2.filename == filename
+    assert len(doc2.modelspace()) == 3
+
+
+def test_incremental_save_option_is_part_of_the_key(filename, cache_dir):
+    ezdxf.readfile(filename)
+    options.incremental_save = True
+    try:
+        doc = ezdxf.readfile(filename)
+    finally:
+        options.incremental_save = False
+    line = doc.modelspace().query('LINE')[0]
+    assert line.is_modified() is False, 'expected loaded tags of a not cached document'
+
+
+def test_loader_options_are_part_of_the_key(filename, cache_dir):
+    ezdxf.readfile(filename)
+    count = len(os.listdir(cache_dir))
+    options.filter_invalid_xdata_group_codes = True
+    try:
+        ezdxf.readfile(filename)
+    finally:
+        options.filter_invalid_xdata_group_codes = False
+    assert len(os.listdir(cache_dir)) == count + 1, 'expected new snapshot'
+    options.check_entity_tag_structures = False
+    try:
+        ezdxf.readfile(filename)
+    finally:
+        options.check_entity_tag_structures = True
+    assert len(os.listdir(cache_dir)) == count + 2, 'expected new snapshot'
+
+
+def test_modified_file_invalidates_snapshot(filename, cache_dir):
+    doc = ezdxf.readfile(filename)
+    doc.modelspace().add_circle((0, 0), 1)
+    doc.save()
+    doc2 = ezdxf.readfile(filename)
+    assert len(doc2.modelspace()) == 4
+
+
+def test_damaged_snapshot(filename, cache_dir):
+    ezdxf.readfile(filename)
+    cache = LoadCache(cache_dir)
+    key = cache.key(filename, None, False, None, False, False, True, False)
+    with open(cache.path(key), 'wb') as fp:
+        fp.write(b'invalid')
+    assert cache.get(key) is None
+    assert os.path.exists(cache.path(key)) is False
+
+
+def test_lru_eviction(doc, tmpdir):
+    cache = LoadCache(str(tmpdir.join('cache')))
+    cache.put('first', doc)
+    size = cache.size()
+    cache.max_size = int(size * 1.5)
+    os.utime(cache.path('first'), (0, 0))  # least recently used
+    cache.put('second', doc)
+    assert os.path.exists(cache.path('first')) is False
+    assert os.path.exists(cache.path('second')) is True
+
+
+def test_clear(doc, tmpdir):
+    cache = LoadCache(str(tmpdir.join('cache')))
+    cache.put('first', doc)
+    cache.clear()
+    assert cache.size() == 0
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='requires POSIX file permissions')
+def test_ignore_cache_directory_writable_by_others(doc, tmpdir):
+    directory = str(tmpdir.join('cache'))
+    cache = LoadCache(directory)
+    cache.put('first', doc)
+    os.chmod(directory, 0o777)
+    cache = LoadCache(directory)
+    assert cache.trusted is False
+    assert cache.get('first') is None
+    cache.put('second', doc)
+    assert os.path.exists(cache.path('second')) is False
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='requires POSIX file permissions')
+def test_ignore_snapshot_writable_by_others(doc, tmpdir):
+    cache = LoadCache(str(tmpdir.join('cache')))
+    cache.put('first', doc)
+    os.chmod(cache.path('first'), 0o666)
+    assert cache.get('first') is None
+    assert os.path.exists(cache.path('first')) is True, 'do not remove untrusted files'
@@ -0,0 +1,96 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import random
+from ezdxf.spatial import RTree
+
+
+def brute_force_search(items, window, inside=False):
+    xmin, ymin, xmax, ymax = window
+    result = set()
+    for (x0, y0, x1, y1), item in items:
+        if inside:
+            if x0 >= xmin and y0 >= ymin and x1 <= xmax and y1 <= ymax:
+                result.add(item)
+        elif x0 <= xmax and x1 >= xmin and y0 <= ymax and y1 >= ymin:
+            result.add(item)
+    return result
+
+
+@pytest.fixture(scope='module')
+def items():
+    rnd = random.Random(42)
+    result = []
+    for index in range(2000):
+        x, y = rnd.uniform(0, 1000), rnd.uniform(0, 1000)
+        result.append(((x, y, x + rnd.uniform(0, 10), y + rnd.uniform(0, 10)), index))
+    return result
+
+
+def test_empty_tree():
+    tree = RTree()
+    assert len(tree) == 0
+    assert tree.bbox is None
+    assert list(tree.search((0, 0, 1, 1))) == []
+    assert tree.nearest((0, 0)) == []
+
+
+def test_bulk_load(items):
+    tree = RTree(items)
+    assert len(tree) == 2000
+    assert 7 in tree
+    window = (100, 100, 300, 200)
+    assert set(tree.search(window)) == brute_force_search(items, window)
+    assert set(tree.search(window, inside=True)) == brute_force_search(items, window, inside=True)
+
+
+def test_incremental_insert(items):
+    tree = RTree(max_node_size=4)
+    for bbox, item in items:
+        tree.insert(bbox, item)
+    assert len(tree) == 2000
+    window = (500, 0, 600, 1000)
+    assert set(tree.search(window)) == brute_force_search(items, window)
+
+
+def test_insert_replaces_existing_item():
+    tree = RTree([((0, 0, 1, 1), 'a')])
+    tree.insert((5, 5, 6, 6), 'a')
+    assert len(tree) == 1
+    assert list(tree.search((0, 0, 2, 2))) == []
+    assert list(tree.search((4, 4, 7, 7))) == ['a']
+
+
+def test_remove(items):
+    tree = RTree(items[:1000])
+    for bbox, item in items[1000:]:
+        tree.insert(bbox, item)
+    removed = set(range(0, 2000, 3))
+    for item in removed:
+        tree.remove(item)
+    remaining = [(bbox, item) for bbox, item in items if item not in removed]
+    assert len(tree) == len(remaining)
+    window = (250, 250, 750, 750)
+    assert set(tree.search(window)) == brute_force_search(remaining, window)
+
+    with pytest.raises(KeyError):
+        tree.remove(0)
+    tree.discard(0)  # does not raise an exception
+
+    for _, item in remaining:
+        tree.remove(item)
+    assert len(tree) == 0
+    assert tree.bbox is None
+
+
+def test_nearest(items):
+    tree = RTree(items)
+
+    def distance(bbox):
+        x0, y0, x1, y1 = bbox
+        dx = max(x0 - 500, 0, 500 - x1)
+        dy = max(y0 - 500, 0, 500 - y1)
+        return dx * dx + dy * dy
+
+    expected = [item for _, item in sorted((distance(bbox), item) for bbox, item in items)[:5]]
+    assert tree.nearest((500, 500, 0), count=5) == expected
@@ -0,0 +1,181 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+import io
+import ezdxf
+from ezdxf.extents import bbox, extents, Cache, update_header_extents
+from ezdxf.math import Vector
+
+
+@pytest.fixture(scope='module')
+def doc():
+    doc = ezdxf.new('R2000')
+    block = doc.blocks.new('LINE', base_point=(1, 1))
+    block.add_line((0, 0), (2, 2))
+    block.add_attdef('TAG', (100, 100))  # ignored
+    nested = doc.blocks.new('NESTED')
+    nested.add_blockref('LINE', (10, 0), dxfattribs={'rotation': 90})
+    return doc
+
+
+@pytest.fixture
+def msp(doc):
+    msp = doc.modelspace()
+    msp.delete_all_entities()
+    return msp
+
+
+def is_close_box(box, extmin, extmax):
+    return Vector(box.extmin).isclose(extmin, abs_tol=1e-9) and Vector(box.extmax).isclose(extmax, abs_tol=1e-9)
+
+
+def test_unsupported_entity(msp):
+    assert bbox(msp.add_xline((0, 0), (1, 0))) is None
+
+
+def test_line(msp):
+    box = bbox(msp.add_line((3, 0, 1), (1, 2, 0)))
+    assert is_close_box(box, (1, 0, 0), (3, 2, 1))
+
+
+def test_arc(msp):
+    arc = msp.add_arc((0, 0), radius=2, start_angle=0, end_angle=90)
+    assert is_close_box(bbox(arc), (0, 0, 0), (2, 2, 0))
+    assert is_close_box(bbox(arc, fast=True), (-2, -2, 0), (2, 2, 0))
+
+    arc = msp.add_arc((0, 0), radius=2, start_angle=350, end_angle=10)
+    box = bbox(arc)
+    assert math.isclose(box.extmax.x, 2)
+    assert math.isclose(box.extmin.x, 2 * math.cos(math.radians(10)))
+
+
+def test_arc_with_extrusion(msp):
+    arc = msp.add_arc((0, 0), radius=2, start_angle=0, end_angle=90, dxfattribs={'extrusion': (0, 0, -1)})
+    assert is_close_box(bbox(arc), (-2, 0, 0), (0, 2, 0))
+
+
+def test_ellipse(msp):
+    ellipse = msp.add_ellipse((0, 0), major_axis=(2, 0), ratio=0.5, start_param=0, end_param=math.pi / 2)
+    assert is_close_box(bbox(ellipse), (0, 0, 0), (2, 1, 0))
+
+
+def test_lwpolyline_with_bulge(msp):
+    polyline = msp.add_lwpolyline([(0, 0, 0, 0, 1), (2, 0, 0, 0, 0)], format='xyseb')
+    assert is_close_box(bbox(polyline), (0, -1, 0), (2, 0, 0))
+
+
+def test_spline(msp):
+    spline = msp.add_open_spline([(0, 0, 0), (2, 6, 0), (4, 0, 0)], degree=2)
+    assert is_close_box(bbox(spline, fast=True), (0, 0, 0), (4, 6, 0))
+    box = bbox(spline)
+    assert 3 <= box.extmax.y < 3.01, 'contains the curve'
+
+
+def test_spline_extents_contain_the_curve(msp):
+    spline = msp.add_open_spline([(0, 0, 0), (1, 5, 0), (2, -5, 0), (3, 5, 0), (4, 0, 0)])
+    points = list(spline.construction_tool().approximate(1000))
+    for fast in (True, False):
+        box = bbox(spline, fast=fast)
+        assert all(box.inside(p) for p in points)
+
+
+def test_spline_defined_by_fit_points(msp):
+    spline = msp.add_spline(fit_points=[(0, 0, 0), (1, 2, 0), (2, -2, 0), (3, 0, 0)])
+    assert len(spline.control_points) == 0
+    points = list(spline.construction_tool().approximate(1000))
+    for fast in (True, False):
+        box = bbox(spline, fast=fast)
+        assert all(box.inside(p) for p in points)
+
+
+def test_text(msp):
+    text = msp.add_text('ABCD', dxfattribs={'height': 1})
+    box = bbox(text)
+    assert box.extmin == (0, 0, 0)
+    assert box.extmax.y == 1
+    assert box.extmax.x > 2
+
+    text.set_pos((10, 10), align='MIDDLE_CENTER')
+    box = bbox(text)
+    assert box.inside((10, 10, 0))
+    assert math.isclose(box.extmin.y, 9.5)
+
+
+def test_mtext(msp):
+    mtext = msp.add_mtext('line1\\Pline2', dxfattribs={'char_height': 1, 'width': 10})
+    box = bbox(mtext)
+    assert box.extmin.x == 0
+    assert box.extmax.x == 10
+    assert box.extmax.y == 0, 'top left attachment point'
+    assert box.extmin.y < -2
+
+
+def test_insert(msp):
+    box = bbox(msp.add_blockref('LINE', (0, 0)))
+    assert is_close_box(box, (-1, -1, 0), (1, 1, 0)), 'base point (1, 1), ATTDEF ignored'
+
+    box = bbox(msp.add_blockref('LINE', (0, 0), dxfattribs={'xscale': 2, 'rotation': 90}))
+    assert is_close_box(box, (-1, -2, 0), (1, 2, 0))
+
+
+def test_nested_insert(msp):
+    box = bbox(msp.add_blockref('NESTED', (0, 0)))
+    assert is_close_box(box, (9, -1, 0), (11, 1, 0))
+
+
+def test_minsert(msp):
+    insert = msp.add_blockref('LINE', (0, 0))
+    insert.grid(size=(2, 3), spacing=(10, 5))
+    assert is_close_box(bbox(insert), (-1, -1, 0), (11, 11, 0))
+
+
+def test_minsert_with_zero_scaling(msp):
+    insert = msp.add_blockref('LINE', (0, 0), dxfattribs={'yscale': 0})
+    insert.grid(size=(2, 3), spacing=(10, 5))
+    assert is_close_box(bbox(insert), (-1, 0, 0), (11, 10, 0))
+
+
+def test_cached_block_extents_depend_on_fast_mode(doc, msp):
+    block = doc.blocks.new('ARC_BLOCK')
+    block.add_arc((0, 0), radius=1, start_angle=0, end_angle=90)
+    insert = msp.add_blockref('ARC_BLOCK', (0, 0))
+    cache = Cache()
+    assert is_close_box(bbox(insert, cache=cache, fast=True), (-1, -1, 0), (1, 1, 0))
+    assert is_close_box(bbox(insert, cache=cache), (0, 0, 0), (1, 1, 0))
+    assert cache.misses == 2
+
+
+def test_cache_block_extents(msp):
+    for x in range(10):
+        msp.add_blockref('NESTED', (x, 0))
+    cache = Cache()
+    box = extents(msp, cache=cache)
+    assert is_close_box(box, (9, -1, 0), (20, 1, 0))
+    assert cache.misses == 2, 'NESTED and LINE'
+    assert cache.hits == 9
+
+
+def test_update_header_extents(msp):
+    doc = msp.doc
+    msp.add_circle((10, 20), radius=5)
+    update_header_extents(doc)
+    assert doc.header['$EXTMIN'] == (5, 15, 0)
+    assert doc.header['$EXTMAX'] == (15, 25, 0)
+
+
+def test_extents_not_updated_at_saving_by_default():
+    doc = ezdxf.new('R2000')
+    extmin = doc.header['$EXTMIN']
+    doc.modelspace().add_line((1, 2), (3, 4))
+    doc.write(io.StringIO())
+    assert doc.header['$EXTMIN'] == extmin
+
+
+def test_extents_updated_at_saving(monkeypatch):
+    monkeypatch.setattr(ezdxf.options, 'update_extents', True)
+    doc = ezdxf.new('R2000')
+    doc.modelspace().add_line((1, 2), (3, 4))
+    doc.write(io.StringIO())
+    assert doc.header['$EXTMIN'] == (1, 2, 0)
+    assert doc.header['$EXTMAX'] == (3, 4, 0)
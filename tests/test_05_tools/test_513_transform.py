@@ -0,0 +1,302 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from io import StringIO
+import ezdxf
+from ezdxf import options
+from ezdxf.lldxf import packedtags
+from ezdxf.transform import transform, transform_all, OCSTransform, conjugate_axes
+from ezdxf.math import Vector, Matrix44, OCS
+from ezdxf.lldxf.const import DXFTypeError, DXFValueError
+
+# rotate 90 deg about the z-axis, scale by 2 and translate by (1, 2, 3)
+M = Matrix44.chain(Matrix44.z_rotate(math.pi / 2), Matrix44.scale(2), Matrix44.translate(1, 2, 3))
+
+
+@pytest.fixture(scope='module')
+def doc():
+    doc = ezdxf.new('R2010')
+    doc.blocks.new('BLK')
+    return doc
+
+
+@pytest.fixture
+def msp(doc):
+    msp = doc.modelspace()
+    msp.delete_all_entities()
+    return msp
+
+
+@pytest.fixture(params=[True, False])
+def use_numpy(request, monkeypatch):
+    monkeypatch.setattr(packedtags, 'USE_NUMPY', request.param)
+
+
+def isclose(v1, v2):
+    return Vector(v1).isclose(v2, abs_tol=1e-9)
+
+
+def test_unsupported_entity(msp):
+    body = msp.add_body()
+    with pytest.raises(DXFTypeError):
+        transform(body, M)
+
+
+def test_ocs_transform_mirror_flips_extrusion():
+    t = OCSTransform((0, 0, 1), Matrix44.scale(-1, 1, 1))
+    assert isclose(t.new_extrusion, (0, 0, -1))
+    assert t.is_uniform is True
+    # mirrored x-axis in WCS is the x-axis of the OCS (0, 0, -1)
+    assert math.isclose(t.angle_deg(0), 0, abs_tol=1e-9)
+    assert isclose(OCS(t.new_extrusion).to_wcs(t.point((1, 0, 0))), (-1, 0, 0))
+
+
+def test_conjugate_axes():
+    major, minor, shift = conjugate_axes(Vector(1, 1), Vector(0, 1))
+    assert math.isclose(major.dot(minor), 0, abs_tol=1e-9)
+    assert major.magnitude >= minor.magnitude
+    for param in (0, 1, 2):
+        p = Vector(1, 1) * math.cos(param) + Vector(0, 1) * math.sin(param)
+        q = major * math.cos(param - shift) + minor * math.sin(param - shift)
+        assert isclose(p, q)
+
+
+def test_line(msp):
+    line = msp.add_line((0, 0), (1, 0), dxfattribs={'thickness': 1})
+    assert line.transform(M) is line
+    assert isclose(line.dxf.start, (1, 2, 3))
+    assert isclose(line.dxf.end, (1, 4, 3))
+    assert math.isclose(line.dxf.thickness, 2)
+
+
+def test_arc(msp):
+    arc = msp.add_arc((1, 0), radius=1, start_angle=0, end_angle=90)
+    arc.transform(M)
+    assert isclose(arc.dxf.center, (1, 4, 3))
+    assert math.isclose(arc.dxf.radius, 2)
+    assert math.isclose(arc.dxf.start_angle, 90)
+    assert math.isclose(arc.dxf.end_angle, 180)
+    assert arc.dxf.hasattr('extrusion') is False
+
+
+def test_arc_non_uniform_scaling(msp):
+    arc = msp.add_arc((0, 0), radius=1, start_angle=0, end_angle=90)
+    with pytest.raises(DXFValueError):
+        arc.transform(Matrix44.scale(2, 1, 1))
+    assert arc.dxf.radius == 1, 'entity is not modified'
+
+
+def test_circle_rotated_into_ocs(msp):
+    circle = msp.add_circle((1, 0), radius=1)
+    circle.transform(Matrix44.x_rotate(math.pi / 2))
+    assert isclose(circle.dxf.extrusion, (0, -1, 0))
+    assert isclose(circle.ocs().to_wcs(circle.dxf.center), (1, 0, 0))
+
+
+def test_ellipse_non_uniform_scaling(msp):
+    ellipse = msp.add_ellipse((1, 1), major_axis=(2, 1), ratio=.5, start_param=.2, end_param=2)
+    m = Matrix44.chain(Matrix44.scale(3, 1, 1), Matrix44.z_rotate(.3))
+
+    def point(e, param):
+        dxf = e.dxf
+        major_axis = Vector(dxf.major_axis)
+        minor_axis = Vector(dxf.extrusion).cross(major_axis).normalize(major_axis.magnitude * dxf.ratio)
+        return Vector(dxf.center) + major_axis * math.cos(param) + minor_axis * math.sin(param)
+
+    start = m.transform(point(ellipse, .2))
+    end = m.transform(point(ellipse, 2))
+    ellipse.transform(m)
+    assert ellipse.dxf.ratio <= 1
+    assert isclose(point(ellipse, ellipse.dxf.start_param), start)
+    assert isclose(point(ellipse, ellipse.dxf.end_param), end)
+
+
+def test_text(msp):
+    text = msp.add_text('TEXT', dxfattribs={'height': 1, 'rotation': 30})
+    text.transform(Matrix44.chain(Matrix44.scale(2, 3, 1), Matrix44.z_rotate(math.pi / 2)))
+    ux = Vector(2 * math.cos(math.pi / 6), 3 * math.sin(math.pi / 6))
+    assert math.isclose(text.dxf.rotation, ux.angle_deg + 90)
+    # distance of the base line to the top line after non uniform scaling
+    uy = Vector(-2 * math.sin(math.pi / 6), 3 * math.cos(math.pi / 6))
+    height = ux.normalize().cross(uy).magnitude
+    assert math.isclose(text.dxf.height, height)
+    assert math.isclose(text.dxf.width, ux.magnitude / height)
+
+
+def test_mtext(msp):
+    mtext = msp.add_mtext('TEXT', dxfattribs={'char_height': 1, 'rotation': 90})
+    mtext.transform(M)
+    assert isclose(mtext.dxf.text_direction, (-1, 0, 0))
+    assert mtext.dxf.hasattr('rotation') is False
+    assert math.isclose(mtext.dxf.char_height, 2)
+
+
+def test_insert_with_attribs(msp):
+    insert = msp.add_blockref('BLK', (1, 0), dxfattribs={'xscale': 2, 'yscale': 3})
+    insert.add_attrib('TAG', 'VALUE', (1, 0))
+    insert.transform(M)
+    assert isclose(insert.dxf.insert, (1, 4, 3))
+    assert math.isclose(insert.dxf.rotation, 90)
+    assert math.isclose(insert.dxf.xscale, 4)
+    assert math.isclose(insert.dxf.yscale, 6)
+    assert math.isclose(insert.dxf.zscale, 2)
+    attrib = insert.attribs[0]
+    assert isclose(attrib.dxf.insert, (1, 4, 3))
+    assert math.isclose(attrib.dxf.rotation, 90)
+
+
+def test_insert_shearing(msp):
+    insert = msp.add_blockref('BLK', (0, 0), dxfattribs={'rotation': 45})
+    with pytest.raises(DXFValueError):
+        insert.transform(Matrix44.scale(2, 1, 1))
+
+
+def test_lwpolyline(msp, use_numpy):
+    points = [(0, 0, 1, 1, 0), (1, 0, 0, 0, .5)]
+    polylines = [msp.add_lwpolyline(points, format='xyseb', dxfattribs={'elevation': 1}) for _ in range(3)]
+    assert transform_all(polylines, M) == []
+    for polyline in polylines:
+        assert polyline.dxf.elevation == 5
+        assert [isclose(p[:2], e) for p, e in zip(polyline, [(1, 2), (1, 4)])] == [True, True]
+        assert polyline[0][2:] == (2, 2, 0)
+        assert polyline[1][4] == .5
+
+
+def test_2d_and_3d_polylines(msp):
+    polyline2d = msp.add_polyline2d([(0, 0), (1, 0)], dxfattribs={'elevation': (0, 0, 1)})
+    polyline3d = msp.add_polyline3d([(0, 0, 0), (1, 0, 1)])
+    assert transform_all([polyline2d, polyline3d], M) == []
+    assert isclose(polyline2d.dxf.elevation, (0, 0, 5))
+    assert [isclose(v.dxf.location[:2], e) for v, e in zip(polyline2d.vertices, [(1, 2), (1, 4)])] == [True, True]
+    assert isclose(polyline3d.vertices[1].dxf.location, (1, 4, 5))
+
+
+def test_spline_and_mesh(msp, use_numpy):
+    spline = msp.add_open_spline([(0, 0, 0), (1, 0, 0), (2, 1, 0), (3, 0, 0)])
+    mesh = msp.add_mesh()
+    with mesh.edit_data() as data:
+        data.vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+        data.faces = [(0, 1, 2)]
+    assert transform_all([spline, mesh], M) == []
+    assert isclose(spline.control_points[1], (1, 4, 3))
+    assert isclose(mesh.vertices[2], (-1, 4, 3))
+
+
+@pytest.fixture(scope='module')
+def incremental_save_text():
+    doc = ezdxf.new('R2010')
+    msp = doc.modelspace()
+    msp.add_lwpolyline([(0, 0), (1, 0)])
+    msp.add_open_spline([(0, 0, 0), (1, 0, 0), (2, 1, 0), (3, 0, 0)])
+    mesh = msp.add_mesh()
+    with mesh.edit_data() as data:
+        data.vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0)]
+        data.faces = [(0, 1, 2)]
+    stream = StringIO()
+    doc.write(stream)
+    return stream.getvalue()
+
+
+def load_incremental(text):
+    prev = options.incremental_save
+    options.incremental_save = True
+    try:
+        return ezdxf.read(StringIO(text))
+    finally:
+        options.incremental_save = prev
+
+
+def reload(doc):
+    stream = StringIO()
+    doc.write(stream)
+    return ezdxf.read(StringIO(stream.getvalue()))
+
+
+@pytest.mark.parametrize('batch', [True, False])
+def test_transformed_entities_are_not_saved_as_loaded(incremental_save_text, use_numpy, batch):
+    # translation in the xy-plane changes only the vertices and no DXF attributes
+    m = Matrix44.translate(1, 2, 0)
+    doc = load_incremental(incremental_save_text)
+    entities = list(doc.modelspace())
+    assert [e.dxftype() for e in entities] == ['LWPOLYLINE', 'SPLINE', 'MESH']
+    assert not any(e.is_modified() for e in entities)
+    if batch:
+        assert transform_all(entities, m) == []
+    else:
+        for entity in entities:
+            transform(entity, m)
+    assert all(e.is_modified() for e in entities)
+
+    lwpolyline, spline, mesh = reload(doc).modelspace()
+    assert isclose(lwpolyline[1][:2], (2, 2))
+    assert isclose(spline.control_points[1], (2, 2, 0))
+    assert isclose(mesh.vertices[2], (2, 3, 0))
+
+
+def test_hatch(msp):
+    hatch = msp.add_hatch()
+    hatch.paths.add_polyline_path([(0, 0), (1, 0), (1, 1)])
+    path = hatch.paths.add_edge_path()
+    path.add_line((0, 0), (1, 0))
+    path.add_arc((0, 0), 1, 0, 90, is_counter_clockwise=0)
+    hatch.set_pattern_fill('ANSI31', scale=1)
+    hatch.transform(M)
+    x, y, bulge = hatch.paths.paths[0].vertices[1]
+    assert isclose((x, y), (1, 4))
+    line, arc = hatch.paths.paths[1].edges
+    assert isclose(line.end, (1, 4))
+    assert math.isclose(arc.radius, 2)
+    # clockwise arc from 0 to -90 deg becomes clockwise arc from 90 to 0 deg
+    assert math.isclose(arc.start_angle, 270)
+    assert math.isclose(arc.end_angle, 0, abs_tol=1e-9) or math.isclose(arc.end_angle, 360)
+    assert math.isclose(hatch.dxf.pattern_scale, 2)
+    assert math.isclose(hatch.dxf.pattern_angle, 90)
+
+
+def test_transform_all_returns_failed_entities(msp):
+    line = msp.add_line((0, 0), (1, 0))
+    circle = msp.add_circle((0, 0), 1)
+    xline = msp.add_xline((0, 0), (1, 0))
+    body = msp.add_body()
+    failed = transform_all([line, circle, xline, body], Matrix44.scale(2, 1, 1))
+    assert failed == [circle, body]
+    assert isclose(line.dxf.end, (2, 0, 0))
+    assert isclose(xline.dxf.unit_vector, (1, 0, 0))
+
+
+def test_non_uniform_scaling_of_bulges_fails(msp, use_numpy):
+    bulged = msp.add_lwpolyline([(0, 0, 1), (1, 0, 0)], format='xyb')
+    straight = msp.add_lwpolyline([(0, 0, 0), (1, 1, 0)], format='xyb')
+    polyline2d = msp.add_polyline2d([(0, 0), (1, 0)])
+    polyline2d.vertices[0].dxf.bulge = 1
+    hatch = msp.add_hatch()
+    hatch.paths.add_polyline_path([(0, 0, 1), (1, 0, 0), (1, 1, 0)])
+    failed = transform_all([bulged, straight, polyline2d, hatch], Matrix44.scale(2, 1, 1))
+    assert failed == [bulged, polyline2d, hatch]
+    assert bulged[1][:2] == (1, 0), 'failed entities are not modified'
+    assert isclose(straight[1][:2], (2, 1))
+    with pytest.raises(DXFValueError):
+        bulged.transform(Matrix44.scale(2, 1, 1))
+    assert transform_all([bulged, polyline2d, hatch], Matrix44.scale(2, 2, 2)) == []
+
+
+def test_collapsing_ocs_fails_per_ocs_group(msp, use_numpy):
+    collapsed = msp.add_lwpolyline([(0, 0), (1, 0)], dxfattribs={'extrusion': (1, 0, 0)})
+    lwpolyline = msp.add_lwpolyline([(0, 0), (1, 1)])
+    polyline2d = msp.add_polyline2d([(0, 0), (1, 0)], dxfattribs={'extrusion': (1, 0, 0)})
+    spline = msp.add_open_spline([(0, 0, 0), (1, 0, 0), (2, 1, 0)], dxfattribs={'extrusion': (1, 0, 0)})
+    failed = transform_all([collapsed, lwpolyline, polyline2d, spline], Matrix44.scale(1, 1, 0))
+    assert failed == [collapsed, polyline2d, spline]
+    assert isclose(lwpolyline[1][:2], (1, 1))
+    assert isclose(spline.control_points[1], (1, 0, 0)), 'failed entities are not modified'
+
+
+def test_layout_transform_all_updates_spatial_index(msp):
+    line = msp.add_line((0, 0), (1, 1))
+    msp.add_circle((0, 0), 1)
+    assert list(msp.query_window([(0, 0), (2, 2)], query='LINE')) == [line]
+    failed = msp.transform_all(Matrix44.translate(10, 0, 0), query='LINE')
+    assert failed == []
+    assert list(msp.query_window([(0, 0), (2, 2)], query='LINE')) == []
+    assert list(msp.query_window([(10, 0), (12, 2)])) == [line]
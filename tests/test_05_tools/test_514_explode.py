@@ -0,0 +1,124 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.explode import Cache, virtual_entities, insert_matrices
+from ezdxf.math import Vector
+
+
+@pytest.fixture(scope='module')
+def doc():
+    doc = ezdxf.new('R2010')
+    block = doc.blocks.new('LINE', base_point=(1, 0))
+    block.add_line((1, 0), (2, 0))
+    block.add_circle((1, 0), 1, dxfattribs={'color': 0})  # BYBLOCK
+    block.add_attdef('TAG', (0, 0))  # ignored
+    nested = doc.blocks.new('NESTED')
+    nested.add_blockref('LINE', (10, 0), dxfattribs={'rotation': 90})
+    circular = doc.blocks.new('CIRCULAR')
+    circular.add_blockref('CIRCULAR', (0, 0))
+    circular.add_point((1, 1))
+    curves = doc.blocks.new('CURVES')
+    curves.add_lwpolyline([(0, 0, 1), (1, 0, 0), (1, 1, 0)], format='xyb', dxfattribs={'color': 1})
+    curves.add_line((0, 0), (1, 1))
+    hatch = curves.add_hatch()
+    path = hatch.paths.add_edge_path()
+    path.add_line((1, 0), (0, 1))
+    path.add_arc((0, 0), 1, start_angle=270, end_angle=360, is_counter_clockwise=0)
+    return doc
+
+
+@pytest.fixture
+def msp(doc):
+    msp = doc.modelspace()
+    msp.delete_all_entities()
+    return msp
+
+
+def isclose(v1, v2):
+    return Vector(v1).isclose(v2, abs_tol=1e-9)
+
+
+def test_insert_matrices_include_base_point(msp):
+    insert = msp.add_blockref('LINE', (5, 5))
+    m, = insert_matrices(insert)
+    assert isclose(m.transform((1, 0, 0)), (5, 5, 0))
+
+
+def test_virtual_entities(msp):
+    insert = msp.add_blockref('LINE', (5, 5), dxfattribs={'layer': 'L1', 'color': 3})
+    insert.add_attrib('TAG', 'VALUE', (0, 0))
+    attrib, line, circle = insert.virtual_entities()
+    assert line.dxftype() == 'LINE'
+    assert line.dxf.handle is None, 'virtual entity'
+    assert isclose(line.dxf.start, (5, 5, 0))
+    assert isclose(line.dxf.end, (6, 5, 0))
+    assert line.dxf.layer == 'L1', 'layer 0 inherits the layer of the block reference'
+    assert circle.dxf.color == 3, 'BYBLOCK inherits the color of the block reference'
+    assert attrib.dxftype() == 'ATTRIB'
+    assert attrib is not insert.attribs[0]
+
+
+def test_nested_block_reference(msp):
+    insert = msp.add_blockref('NESTED', (0, 0), dxfattribs={'xscale': 2})
+    entities = list(insert.virtual_entities())
+    line = entities[0]
+    assert isclose(line.dxf.start, (20, 0, 0))
+    assert isclose(line.dxf.end, (20, 1, 0))
+    ellipse = entities[1]
+    assert ellipse.dxftype() == 'ELLIPSE', 'non uniform scaled CIRCLE'
+    assert isclose(ellipse.dxf.center, (20, 0, 0))
+    assert isclose(ellipse.dxf.major_axis, (2, 0, 0))
+    assert ellipse.dxf.ratio == .5
+
+
+def test_minsert_grid(msp):
+    insert = msp.add_blockref('LINE', (0, 0), dxfattribs={'rotation': 90}).grid(size=(2, 3), spacing=(5, 7))
+    starts = [e.dxf.start for e in insert.virtual_entities() if e.dxftype() == 'LINE']
+    assert len(starts) == 6
+    # 2 rows and 3 columns, the grid is rotated but not scaled
+    assert isclose(starts[-1], (-5, 14, 0))
+
+
+def test_cache_reuses_block_content(msp):
+    cache = Cache()
+    for _ in range(3):
+        list(msp.add_blockref('NESTED', (0, 0)).virtual_entities(cache))
+    assert cache.misses == 2, 'NESTED and LINE'
+    assert cache.hits == 2
+
+
+def test_circular_block_reference(msp):
+    insert = msp.add_blockref('CIRCULAR', (1, 0))
+    points = list(virtual_entities(insert))
+    assert len(points) == 1
+    assert isclose(points[0].dxf.location, (2, 1, 0))
+
+
+def test_layout_flatten_inserts(msp):
+    point = msp.add_point((0, 0))
+    msp.add_blockref('LINE', (5, 5))
+    entities = list(msp.flatten_inserts())
+    assert entities[0] is point
+    assert [e.dxftype() for e in entities[1:]] == ['LINE', 'CIRCLE']
+    assert len(msp) == 2, 'virtual entities are not added to the layout'
+
+
+def test_non_uniform_scaled_curves(msp):
+    insert = msp.add_blockref('CURVES', (0, 0), dxfattribs={'xscale': 2})
+    polyline, line, hatch = insert.virtual_entities()
+    assert polyline.dxftype() == 'POLYLINE', 'flattened LWPOLYLINE with bulges'
+    assert polyline.is_3d_polyline
+    assert polyline.dxf.color == 1
+    points = list(polyline.points())
+    assert len(points) > 3
+    assert isclose(points[0], (0, 0, 0))
+    assert isclose(points[-1], (2, 1, 0))
+    assert all(-.5 - 1e-9 <= p.y <= 1 for p in points), 'bulge arc below the x-axis is scaled only in x-direction'
+    assert line.dxftype() == 'LINE'
+
+    edges = hatch.paths.paths[0].edges
+    assert {edge.EDGE_TYPE for edge in edges} == {'LineEdge'}, 'flattened arc edge'
+    assert isclose(edges[0].end, (0, 1))
+    assert isclose(edges[1].start, (0, 1)), 'clockwise arc edge starts at 90 deg'
+    assert isclose(edges[-1].end, (2, 0))
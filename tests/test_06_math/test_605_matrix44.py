@@ -2,6 +2,7 @@
 # Created: 19.04.2010
 # License: MIT License
 import pytest
+from array import array
 from math import radians, sin, cos, pi, isclose
 from ezdxf.math.matrix44 import Matrix44
 
@@ -220,3 +221,42 @@ class TestMatrix44:
     def test_inverse_error(self):
         m = Matrix44([1] * 16)
         pytest.raises(ZeroDivisionError, m.inverse)
+
+
+@pytest.fixture(params=[True, False])
+def use_numpy(request, monkeypatch):
+    from ezdxf.lldxf import packedtags
+    monkeypatch.setattr(packedtags, 'USE_NUMPY', request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('points', [
+    [(1, 2, 3), (4, 5, 6)],
+    [1, 2, 3, 4, 5, 6],
+    array('d', [1, 2, 3, 4, 5, 6]),
+])
+def test_transform_array(points, use_numpy):
+    m = Matrix44.chain(Matrix44.z_rotate(.5), Matrix44.scale(2, 3, 4), Matrix44.translate(7, 8, 9))
+    result = m.transform_array(points)
+    assert isinstance(result, array)
+    expected = [value for point in m.transform_vectors([(1, 2, 3), (4, 5, 6)]) for value in point]
+    assert len(result) == 6
+    assert all(isclose(v1, v2, abs_tol=1e-9) for v1, v2 in zip(result, expected))
+
+
+def test_transform_ndarray():
+    np = pytest.importorskip('numpy')
+    m = Matrix44.chain(Matrix44.z_rotate(.5), Matrix44.scale(2, 3, 4), Matrix44.translate(7, 8, 9))
+    result = m.transform_ndarray(np.array([(1, 2, 3), (4, 5, 6)]))
+    assert result.shape == (2, 3)
+    expected = [value for point in m.transform_vectors([(1, 2, 3), (4, 5, 6)]) for value in point]
+    assert all(isclose(v1, v2, abs_tol=1e-9) for v1, v2 in zip(result.ravel(), expected))
+
+
+def test_transform_ndarray_of_array():
+    pytest.importorskip('numpy')
+    m = Matrix44.translate(7, 8, 9)
+    points = array('d', [1, 2, 3, 4, 5, 6])
+    result = m.transform_ndarray(points)
+    assert result.tolist() == [[8, 10, 12], [11, 13, 15]]
+    assert list(points) == [1, 2, 3, 4, 5, 6], 'input array is not modified'
@@ -20,6 +20,7 @@ center point, (-5.53851623, 8.87677359, 5.87096886)
 Extrusion direction relative to UCS: X=0.70819791  Y=0.07548520  Z=0.70196702
 
 """
+from array import array
 from ezdxf.math.ucs import OCS
 from ezdxf.math.matrix44 import Matrix44
 
@@ -101,3 +102,18 @@ def test_matrix44_to_wcs():
         (-9.56460754, 8.44764172, 9.97894327),
         places=6,
     )
+
+
+def test_array_transformations():
+    ocs = OCS(EXTRUSION)
+    wcs_points = [(1, 2, 3), (-4, 5, 0), (7, -8, 9)]
+    ocs_points = ocs.points_from_wcs_array(wcs_points)
+    assert isinstance(ocs_points, array)
+    for p1, p2 in zip(xyz_tuples(ocs_points), ocs.points_from_wcs(wcs_points)):
+        assert is_close_points(p1, p2)
+    for p1, p2 in zip(xyz_tuples(ocs.points_to_wcs_array(ocs_points)), wcs_points):
+        assert is_close_points(p1, p2)
+
+
+def xyz_tuples(values):
+    return [tuple(values[i:i + 3]) for i in range(0, len(values), 3)]
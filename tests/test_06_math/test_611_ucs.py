@@ -122,3 +122,22 @@ def test_rotate_z_axis():
     assert ucs.ux.isclose((0, 1, 0))
     assert ucs.uy.isclose((-1, 0, 0))
     assert ucs.uz.isclose((0, 0, 1))
+
+
+def test_array_transformations():
+    from array import array
+    ucs = UCS(origin=(1, 2, 3), ux=(1, 1, 0), uz=(1, -1, 1))
+    points = [(1, 2, 3), (-4, 5, 0), (7, -8, 9)]
+    flat_points = array('d', [value for point in points for value in point])
+
+    def flatten(result):
+        return [Vector(value) for value in result] if len(result) == len(points) else \
+            [Vector(result[i:i + 3]) for i in range(0, len(result), 3)]
+
+    wcs_points = flatten(ucs.points_to_wcs_array(flat_points))
+    for p1, p2 in zip(wcs_points, ucs.points_to_wcs(points)):
+        assert p1.isclose(p2)
+    for p1, p2 in zip(flatten(ucs.points_from_wcs_array(wcs_points)), points):
+        assert p1.isclose(p2)
+    for p1, p2 in zip(flatten(ucs.points_to_ocs_array(points)), ucs.points_to_ocs(points)):
+        assert p1.isclose(p2)
@@ -0,0 +1,124 @@
+# Copyright (c) 2019 Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.lldxf import packedtags
+from ezdxf.math import bspline
+from ezdxf.math.bspline import BSpline, DBSpline, Basis, DBasis, bspline_basis_vector, open_uniform_knot_vector
+from ezdxf.math.bspline import BSplineU, BSplineClosed, DBSplineU
+from ezdxf.math.deboor import find_span, basis_funcs, basis_table, numpy_basis_table
+from ezdxf.math import Vector
+
+DEFPOINTS = [(0.0, 0.0, 0.0), (10., 20., 20.), (30., 10., 25.), (40., 10., 25.), (50., 0., 30.), (60., 5., 0.)]
+KNOTS = [0., 0., 0., 0., 1., 2., 3., 3., 3., 3.]
+
+
+@pytest.fixture(params=[True, False])
+def use_numpy(request, monkeypatch):
+    monkeypatch.setattr(packedtags, 'USE_NUMPY', request.param)
+    monkeypatch.setattr(bspline, 'NUMPY_THRESHOLD', 1)
+
+
+def test_find_span():
+    count = 6
+    assert find_span(KNOTS, count, 0.) == 3
+    assert find_span(KNOTS, count, .5) == 3
+    assert find_span(KNOTS, count, 1.) == 4
+    assert find_span(KNOTS, count, 2.5) == 5
+    assert find_span(KNOTS, count, 3.) == 5, 'end of valid range is located in the last span'
+
+
+def test_sparse_basis_funcs_equal_full_basis_vector():
+    count = 10
+    degree = 3
+    knots = open_uniform_knot_vector(count, order=degree + 1)
+    for u in (0, .5, 2., 2.5, 3.5, 4., 6.99):
+        span = find_span(knots, count, u)
+        expected = bspline_basis_vector(u, count=count, degree=degree, knots=knots)
+        assert basis_funcs(knots, span, degree + 1, u) == expected[span - degree:span + 1]
+        assert sum(expected[:span - degree]) + sum(expected[span + 1:]) == 0.
+
+
+def test_numpy_basis_table():
+    np = pytest.importorskip('numpy')
+    t = [0, .3, 1., 1.7, 2.2, 3.]
+    spans, table = basis_table(KNOTS, 6, 4, t)
+    np_spans, np_table = numpy_basis_table(np, KNOTS, 6, 4, t)
+    assert np_spans.tolist() == spans
+    assert np_table.tolist() == table
+
+
+def test_basis_table_cache():
+    basis = Basis(KNOTS, order=4, count=6)
+    table = basis.basis_table([0, .5, 1.])
+    assert basis.basis_table((0, .5, 1.)) is table
+    basis.count = 6
+    assert basis.basis_table([0, .5, 1.]) is not table, 'cache cleared'
+
+
+def test_points_equal_point(use_numpy):
+    curve = BSpline(DEFPOINTS, order=4, weights=[1, 2, 3, 1, 2, 1])
+    t = [i * .1 for i in range(int(curve.max_t * 10) + 1)]
+    for p1, p2 in zip(curve.points(t), (curve.point(u) for u in t)):
+        assert p1.isclose(p2, abs_tol=1e-9)
+
+
+def test_insert_knot_clears_cache():
+    curve = BSpline(DEFPOINTS, order=4)
+    expected = list(curve.approximate(10))
+    curve.insert_knot(1.5)
+    for p1, p2 in zip(curve.approximate(10), expected):
+        assert p1.isclose(p2, abs_tol=1e-9)
+
+
+def test_rational_derivatives():
+    weights = [1, 2, 3, 1, 2, 1]
+    curve = DBSpline(DEFPOINTS, order=4)
+    curve.basis = DBasis(curve.knot_values(), 4, len(DEFPOINTS), weights=weights)
+    reference = BSpline(DEFPOINTS, order=4, weights=weights)
+    h = 1e-5
+    for t in (.5, 1.2, 2.7):
+        p, d1, d2 = curve.point(t)
+        assert p.isclose(reference.point(t), abs_tol=1e-9)
+        p0 = reference.point(t - h)
+        p1 = reference.point(t + h)
+        assert d1.isclose((p1 - p0) / (2 * h), abs_tol=1e-4)
+        assert d2.isclose((p1 - 2 * p + p0) / (h * h), abs_tol=1e-2)
+
+
+def test_derivative_points_equal_point():
+    curve = DBSpline(DEFPOINTS, order=3)
+    t = [0, .5, 1.5, curve.max_t]
+    for values1, values2 in zip(curve.points(t), (curve.point(u) for u in t)):
+        for v1, v2 in zip(values1, values2):
+            assert Vector(v1).isclose(v2)
+
+
+END_POINTS = [(0, 0, 0), (10, 20, 20), (30, 10, 25), (40, 10, 25), (50, 0, 30), (8, 0, 1)]
+
+
+@pytest.mark.parametrize('cls, t, expected', [
+    # expected values of the dense basis implementation
+    (BSplineU, 6., (41.33333333333333, 1.6666666666666665, 24.333333333333332)),  # end of valid range
+    (BSplineU, 6.5, (28.625, 0.20833333333333331, 15.375)),
+    (BSplineU, 9., (8, 0, 1)),  # max_t picks up the last control point
+    (BSplineClosed, 9., (11.666666666666666, 14.999999999999998, 17.5)),  # end of valid range
+    (BSplineClosed, 9.5, (19.166666666666668, 14.375, 21.5625)),
+    (BSplineClosed, 12., (30, 10, 25)),
+])
+def test_uniform_bspline_end_points(cls, t, expected, use_numpy):
+    curve = cls(END_POINTS, order=4)
+    assert curve.point(t).isclose(expected, abs_tol=1e-9)
+    assert curve.points([0, t])[1].isclose(expected, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize('t, expected', [
+    # expected values of the dense basis implementation
+    (6., [(41.33333333333333, 1.6666666666666665, 24.333333333333332), (-16, -5, -12), (-52, 10, -34)]),
+    (6.5, [(28.625, 0.20833333333333331, 15.375), (-31.25, -1.25, -21.25), (-9, 5, -3)]),
+    (9., [(0, 0, 0), (0, 0, 0), (0, 0, 0)]),
+])
+def test_uniform_derivative_bspline_end_points(t, expected):
+    curve = DBSplineU(END_POINTS, order=4)
+    for value, expected_value in zip(curve.point(t), expected):
+        assert value.isclose(expected_value, abs_tol=1e-9)
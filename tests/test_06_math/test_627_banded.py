@@ -0,0 +1,79 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import random
+from ezdxf.math import Matrix, Vector
+from ezdxf.math.banded import BandedMatrix, BandedLU, banded_solve, tridiagonal_solve
+from ezdxf.math.bspline import bspline_control_frame
+
+
+def random_banded_matrix(n, m1, m2):
+    matrix = BandedMatrix(n, m1, m2)
+    for row in range(n):
+        for col in range(max(0, row - m1), min(n, row + m2 + 1)):
+            matrix[row, col] = random.uniform(-1, 1)
+    return matrix
+
+
+def assert_close(rows1, rows2):
+    for row1, row2 in zip(rows1, rows2):
+        for value1, value2 in zip(row1, row2):
+            assert value1 == pytest.approx(value2, abs=1e-9)
+
+
+def test_from_rows():
+    matrix = BandedMatrix.from_rows(4, [0, 0, 1, 2], [[1, 2], [3, 4, 5], [6, 7], [8, 9]])
+    assert (matrix.m1, matrix.m2) == (1, 1)
+    assert matrix.dense() == [
+        [1, 2, 0, 0],
+        [3, 4, 5, 0],
+        [0, 6, 7, 0],
+        [0, 0, 8, 9],
+    ]
+
+
+def test_set_outside_of_band():
+    matrix = BandedMatrix(4, 1, 1)
+    with pytest.raises(IndexError):
+        matrix[0, 2] = 1.
+
+
+@pytest.mark.parametrize('n, m1, m2', [(10, 1, 1), (10, 2, 1), (12, 1, 3), (20, 3, 3), (5, 0, 2), (3, 4, 4)])
+def test_banded_solve_against_dense_solver(n, m1, m2):
+    random.seed(n + m1 + m2)
+    matrix = random_banded_matrix(n, m1, m2)
+    b = [[random.random(), random.random()] for _ in range(n)]
+    expected = Matrix(matrix.dense()).gauss_matrix(b).rows()
+    assert_close(banded_solve(matrix, b), expected)
+
+
+def test_reuse_lu_decomposition():
+    random.seed(0)
+    matrix = random_banded_matrix(8, 2, 2)
+    lu = BandedLU(matrix)
+    for _ in range(2):
+        b = [[random.random()] for _ in range(8)]
+        assert_close(lu.solve(b), Matrix(matrix.dense()).gauss_matrix(b).rows())
+
+
+def test_tridiagonal_solve():
+    random.seed(1)
+    matrix = random_banded_matrix(10, 1, 1)
+    for row in matrix.rows:  # diagonal dominant
+        row[1] = 3.
+    b = [[random.random(), random.random(), random.random()] for _ in range(10)]
+    rows = matrix.rows
+    result = tridiagonal_solve([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows], b)
+    assert_close(result, banded_solve(matrix, b))
+
+
+def test_row_count_mismatch():
+    with pytest.raises(ValueError):
+        banded_solve(BandedMatrix(3, 1, 1), [[1.], [2.]])
+
+
+def test_control_frame_with_many_fit_points():
+    fit_points = [(x, (x % 7) * .5, (x % 3) * .25) for x in range(500)]
+    spline = bspline_control_frame(fit_points, degree=3)
+    for t, fit_point in zip(spline.t_array[::50], fit_points[::50]):
+        assert spline.point(t).isclose(Vector(fit_point), abs_tol=1e-9)
@@ -0,0 +1,119 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+from ezdxf.math import flatten, Vector, Bezier, Bezier4P, BSpline, EulerSpiral, ConstructionArc
+from ezdxf.math.flatten import vertices
+
+
+def max_distance(points, curve_points):
+    """ Returns the max. distance of `curve_points` to the polyline `points`. """
+    def segment_distance(p, a, b):
+        ab = b - a
+        t = min(max((p - a).dot(ab) / ab.dot(ab), 0.), 1.) if ab.magnitude > 0. else 0.
+        return p.distance(a + ab * t)
+
+    return max(min(segment_distance(p, a, b) for a, b in zip(points, points[1:])) for p in curve_points)
+
+
+def test_segment_count():
+    assert flatten.segment_count(1, math.pi, 2) == 1
+    # the chord height of a 90 degree segment is r * (1 - cos(45 deg))
+    assert flatten.segment_count(1, math.pi * 2, 1 - math.cos(math.pi / 4) + 1e-9) == 4
+    assert flatten.segment_count(100, math.pi * 2, .01) > flatten.segment_count(1, math.pi * 2, .01)
+    with pytest.raises(ValueError):
+        flatten.segment_count(1, math.pi, 0)
+
+
+def test_arc():
+    points = list(vertices(flatten.arc((1, 2, 3), 2, 270, 90, .01)))
+    assert points[0].isclose(Vector(1, 0, 3))
+    assert points[-1].isclose(Vector(1, 4, 3))
+    assert all(math.isclose(p.distance((1, 2, 3)), 2) for p in points)
+    assert all(p.x >= 1 - 1e-9 for p in points), 'counter clockwise from 270 to 90 deg'
+
+
+def test_circle_vertex_count_scales_with_radius():
+    small = flatten.circle((0, 0), 1, .01)
+    big = flatten.circle((0, 0), 1000, .01)
+    assert len(big) > len(small)
+    points = list(vertices(small))
+    assert points[0].isclose(points[-1])
+
+
+@pytest.mark.parametrize('b', [1, -1, .3, -2.5])
+def test_bulge(b):
+    from ezdxf.math.bulge import bulge_center, bulge_radius
+    points = list(vertices(flatten.bulge((1, 0), (0, 1), b, .001, elevation=2)))
+    assert points[0] == (1, 0, 2)
+    assert points[-1] == (0, 1, 2)
+    assert len(points) > 2
+    center = Vector(bulge_center((1, 0), (0, 1), b)).replace(z=2)
+    radius = bulge_radius((1, 0), (0, 1), b)
+    assert all(math.isclose(p.distance(center), radius) for p in points)
+
+
+def test_polyline():
+    points = list(vertices(flatten.polyline([(0, 0, 0), (1, 0, 1), (1, 1, 0)], .01, closed=True)))
+    assert points[0] == points[-1] == (0, 0, 0)
+    assert points[1] == (1, 0, 0)
+    assert (1, 1, 0) in points
+    assert any(p.x > 1.2 for p in points), 'half circle right of the segment (1, 0) - (1, 1)'
+
+
+def test_ellipse():
+    major_axis = Vector(3, 0)
+    points = list(vertices(flatten.ellipse((0, 0, 0), major_axis, .5, 0, math.pi, (0, 0, 1), .01)))
+    assert points[0].isclose((3, 0, 0))
+    assert points[-1].isclose((-3, 0, 0))
+    params = [math.pi * i / 100 for i in range(101)]
+    curve_points = [Vector(math.cos(t) * 3, math.sin(t) * 1.5) for t in params]
+    assert max_distance(points, curve_points) <= .01 + 1e-9
+
+
+@pytest.mark.parametrize('distance', [.1, .01, .001])
+def test_bspline(distance):
+    spline = BSpline([(0, 0), (1, 5), (2, -5), (3, 5), (4, 0)], order=4)
+    points = list(vertices(spline.flattening(distance)))
+    assert points[0].isclose(spline.control_points[0])
+    assert points[-1].isclose(spline.control_points[-1])
+    assert max_distance(points, spline.approximate(200)) <= distance * 1.01
+
+
+def test_bspline_sharp_turn():
+    # the curve turns sharply and passes the ends of short chords, close to the extension of the chord line
+    spline = BSpline([(6.6, 7.0), (4.5, 9.2), (9.7, 3.8), (8.0, 4.3), (1.6, 3.3), (1.3, 9.1)], order=4)
+    points = list(vertices(spline.flattening(.01)))
+    assert max_distance(points, spline.approximate(500)) <= .01
+    # sharp turn close to the start of a knot span
+    spline = BSpline([(8.49, 3.55), (3.55, 9.11), (9.9, 7.89), (2.29, 9.42), (3.66, 8.68), (3.22, 2.18)], order=4)
+    points = list(vertices(spline.flattening(.01)))
+    assert max_distance(points, spline.approximate(500)) <= .01
+
+
+def test_vertex_count_scales_with_tolerance():
+    spline = BSpline([(0, 0), (1, 5), (2, -5), (3, 5), (4, 0)], order=4)
+    assert len(spline.flattening(.001)) > len(spline.flattening(.1))
+
+
+def test_bezier():
+    curve = Bezier([(0, 0), (1, 2), (2, -2), (3, 0)])
+    curve4p = Bezier4P([(0, 0), (1, 2), (2, -2), (3, 0)])
+    points = list(vertices(curve.flattening(.01)))
+    assert points == list(vertices(curve4p.flattening(.01)))
+    assert max_distance(points, curve.approximate(100)) <= .01 + 1e-9
+
+
+def test_euler_spiral():
+    spiral = EulerSpiral(2)
+    points = list(vertices(spiral.flattening(5, .01)))
+    assert points[0] == (0, 0, 0)
+    assert points[-1].isclose(spiral.point(5))
+    assert max_distance(points, spiral.approximate(5, 200)) <= .01 + 1e-9
+
+
+def test_construction_arc():
+    arc = ConstructionArc((0, 0), 1, 0, 90)
+    points = list(vertices(arc.flattening(.01)))
+    assert points[0].isclose((1, 0, 0))
+    assert points[-1].isclose((0, 1, 0))
@@ -0,0 +1,181 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+import math
+import random
+from array import array
+
+from ezdxf.lldxf import packedtags
+from ezdxf.math import points2d, convex_hull, offset_vertices_2d, Vec2, Shape2d
+from ezdxf.lldxf.packedtags import VertexArray
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    if request.param:
+        pytest.importorskip('numpy')
+    monkeypatch.setattr(packedtags, 'USE_NUMPY', request.param)
+    return request.param
+
+
+def vec2s(values):
+    return list(points2d.vertices(values))
+
+
+def test_result_types(use_numpy):
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    for result in (
+            points2d.convex_hull(square),
+            points2d.offset_polyline(square, 1),
+            points2d.signed_areas([square]),
+            points2d.centroids([square]),
+            points2d.douglas_peucker(square, 1),
+            points2d.visvalingam_whyatt(square, 1),
+    ):
+        assert isinstance(result, array)
+        assert result.typecode == 'd'
+
+
+def test_ndarray_variants():
+    pytest.importorskip('numpy')
+    points = sine_wave(100)
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    for func, args in [
+        (points2d.convex_hull, (points,)),
+        (points2d.offset_polyline, (points, 1)),
+        (points2d.douglas_peucker, (points, .01)),
+        (points2d.visvalingam_whyatt, (points, 1e-4)),
+        (points2d.centroids, ([square, points],)),
+    ]:
+        ndarray_func = getattr(points2d, func.__name__ + '_ndarray')
+        result = ndarray_func(*args)
+        assert result.shape[1] == 2
+        assert list(result.flatten()) == list(func(*args))
+    result = points2d.signed_areas_ndarray([square, points])
+    assert result.shape == (2, )
+    assert list(result) == list(points2d.signed_areas([square, points]))
+
+
+def test_vertex_array_input(use_numpy):
+    vertices = VertexArray([0, 0, 7, 2, 0, 7, 2, 2, 7, 0, 2, 7])
+    assert list(points2d.signed_areas([vertices])) == [4.]
+    assert vec2s(points2d.centroids([vertices])) == [(1, 1)]
+
+
+def test_numpy_input():
+    np = pytest.importorskip('numpy')
+    points = np.array([(0, 0, 1), (2, 0, 2), (2, 2, 3), (1, 1, 4), (0, 2, 5)], dtype=float)
+    assert vec2s(points2d.convex_hull(points)) == [(0, 0), (0, 2), (2, 2), (2, 0)]
+
+
+def test_convex_hull_is_equal_to_convex_hull_function(use_numpy):
+    random.seed(17)
+    points = [(random.uniform(-10, 10), random.uniform(-5, 5)) for _ in range(500)]
+    expected = [Vec2(p) for p in convex_hull(points)]
+    assert vec2s(points2d.convex_hull(points)) == expected
+
+
+def test_convex_hull_removes_collinear_points(use_numpy):
+    points = [(x, y) for x in range(20) for y in range(20)]
+    assert vec2s(points2d.convex_hull(points)) == [(0, 0), (0, 19), (19, 19), (19, 0)]
+
+
+def test_convex_hull_function_keeps_collinear_points_of_vertical_edges(use_numpy):
+    points = [(-10, 3), (-2, 3), (9, 2), (9, 0), (9, -1), (-2, -2), (0, 0)]
+    assert convex_hull(points) == [(-10, 3), (-2, 3), (9, 2), (9, 0), (9, -1), (-2, -2)]
+    assert vec2s(points2d.convex_hull(points)) == [(-10, 3), (-2, 3), (9, 2), (9, -1), (-2, -2)]
+
+
+def test_shape_convex_hull_is_equal_to_convex_hull_function():
+    points = [(-10, 3), (-2, 3), (9, 2), (9, 0), (9, -1), (-2, -2), (0, 0)]
+    assert Shape2d(points).convex_hull().vertices == [Vec2(p) for p in convex_hull(points)]
+
+
+def test_convex_hull_raises(use_numpy):
+    with pytest.raises(ValueError):
+        points2d.convex_hull([(0, 0), (0, 0), (1, 1)])
+
+
+@pytest.mark.parametrize('closed', [False, True])
+def test_offset_polyline_is_equal_to_offset_vertices_2d(closed, use_numpy):
+    points = [(0, 0), (300, 150), (450, 50), (200, -40), (100, -20)]
+    expected = list(offset_vertices_2d(points, 10, closed=closed))
+    result = vec2s(points2d.offset_polyline(points, 10, closed=closed))
+    assert len(result) == len(expected)
+    assert all(v1.isclose(v2, abs_tol=1e-9) for v1, v2 in zip(result, expected))
+
+
+def test_offset_closed_collinear_polyline(use_numpy):
+    result = vec2s(points2d.offset_polyline([(1, 2), (5, 2), (9, 2)], 1, closed=True))
+    assert result == [(1, 1), (1, 3), (5, 3), (9, 3), (9, 1)]
+
+
+def test_offset_removes_duplicate_points(use_numpy):
+    result = vec2s(points2d.offset_polyline([(0, 0), (5, 0), (5, 0), (5, 5), (0, 5), (0, 0)], 1, closed=True))
+    assert result == [(1, 1), (4, 1), (4, 4), (1, 4)]
+
+
+def test_offset_raises(use_numpy):
+    with pytest.raises(ValueError):
+        points2d.offset_polyline([(1, 1), (1, 1)], 1)
+
+
+def test_signed_areas(use_numpy):
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    triangle = [(0, 0), (4, 0), (0, 3), (0, 0)]  # first and last vertex are equal
+    areas = list(points2d.signed_areas([square, list(reversed(square)), triangle, [], [(1, 1), (2, 2)]]))
+    assert areas == [4., -4., 6., 0., 0.]
+
+
+def test_centroids(use_numpy):
+    square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    l_shape = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+    result = vec2s(points2d.centroids([square, l_shape, [], [(1, 1), (3, 3)]]))
+    assert result[0].isclose(Vec2((1, 1)))
+    assert result[1].isclose(Vec2((5 / 6, 5 / 6)))
+    assert result[2] == (0, 0)
+    assert result[3] == (2, 2)  # mean of vertices for polygons without area
+
+
+def sine_wave(count):
+    return [(x * .01, math.sin(x * .01)) for x in range(count)]
+
+
+def distance_to_polyline(point, polyline):
+    def distance(p, a, b):
+        ab = b - a
+        t = max(0., min(1., (p - a).dot(ab) / ab.dot(ab)))
+        return p.distance(a + ab * t)
+
+    return min(distance(point, a, b) for a, b in zip(polyline, polyline[1:]))
+
+
+def test_douglas_peucker(use_numpy):
+    points = sine_wave(700)
+    result = vec2s(points2d.douglas_peucker(points, .01))
+    assert 2 < len(result) < 50
+    assert result[0] == points[0]
+    assert result[-1] == points[-1]
+    assert max(distance_to_polyline(Vec2(p), result) for p in points) <= .01
+
+
+def test_douglas_peucker_keeps_short_polylines(use_numpy):
+    assert vec2s(points2d.douglas_peucker([(0, 0), (1, 0)], 1)) == [(0, 0), (1, 0)]
+
+
+def test_visvalingam_whyatt(use_numpy):
+    points = [(0, 0), (1, .01), (2, 0), (3, 2), (4, 0)]
+    assert vec2s(points2d.visvalingam_whyatt(points, .1)) == [(0, 0), (2, 0), (3, 2), (4, 0)]
+    result = vec2s(points2d.visvalingam_whyatt(sine_wave(700), 1e-4))
+    assert 2 < len(result) < 100
+    assert result[0] == (0, 0)
+
+
+def test_simplification_is_equal_for_numpy_and_python(monkeypatch):
+    pytest.importorskip('numpy')
+    points = sine_wave(500)
+    monkeypatch.setattr(packedtags, 'USE_NUMPY', True)
+    expected = (vec2s(points2d.douglas_peucker(points, 1e-3)), vec2s(points2d.visvalingam_whyatt(points, 1e-5)))
+    monkeypatch.setattr(packedtags, 'USE_NUMPY', False)
+    result = (vec2s(points2d.douglas_peucker(points, 1e-3)), vec2s(points2d.visvalingam_whyatt(points, 1e-5)))
+    assert result == expected
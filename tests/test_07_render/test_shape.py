@@ -1,4 +1,5 @@
 import pytest
+from ezdxf.math import Vec2
 from ezdxf.math.shape import Shape2d
 
 
@@ -58,3 +59,22 @@ def test_rotate_center(square):
     assert square[0] == (2, 2)
     assert square[2] == (1, 3)
 
+
+def test_area_and_centroid(square):
+    assert square.area == 1.
+    assert square.centroid.isclose(Vec2((.5, .5)))
+
+
+def test_convex_hull():
+    shape = Shape2d([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)])
+    assert shape.convex_hull().vertices == [(0, 0), (0, 2), (2, 2), (2, 0)]
+
+
+def test_offset(square):
+    result = square.offset(-.25, closed=True)
+    assert result.vertices == [(-.25, -.25), (1.25, -.25), (1.25, 1.25), (-.25, 1.25)]
+
+
+def test_simplify():
+    shape = Shape2d([(0, 0), (1, .001), (2, 0), (2, 2)])
+    assert shape.simplify(.01).vertices == [(0, 0), (2, 0), (2, 2)]
@@ -0,0 +1,85 @@
+# Copyright (c) 2019, Manfred Moitzi
+# License: MIT License
+import pytest
+from collections import Counter
+import ezdxf
+from ezdxf.addons import iterdxf
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def filename(request, tmpdir_factory):
+    doc = ezdxf.new(request.param)
+    doc.layers.new('LINES')
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LINES'})
+        msp.add_circle((x, 0), radius=1)
+    msp.add_polyline3d([(0, 0, 0), (1, 1, 1), (2, 2, 0)])
+    doc.blocks.new('BLK').add_attdef('TAG', (0, 0))
+    msp.add_blockref('BLK', (0, 0)).add_attrib('TAG', 'value')
+    msp.add_text('ÄÖÜ')
+    doc.layout().add_line((0, 0), (9, 9))  # paperspace entity
+    name = str(tmpdir_factory.mktemp('iterdxf').join('iterdxf_{}.dxf'.format(request.param)))
+    doc.saveas(name)
+    return name
+
+
+@pytest.fixture(params=[True, False], ids=['mmap', 'file'])
+def use_mmap(request):
+    return request.param
+
+
+def test_iterate_modelspace(filename, use_mmap):
+    counter = Counter(e.dxftype() for e in iterdxf.modelspace(filename, use_mmap=use_mmap))
+    assert counter == {'LINE': 10, 'CIRCLE': 10, 'POLYLINE': 1, 'INSERT': 1, 'TEXT': 1}
+
+
+def test_linked_entities(filename, use_mmap):
+    doc = iterdxf.opendxf(filename, use_mmap=use_mmap)
+    polyline, insert = list(doc.modelspace(types=['POLYLINE', 'INSERT']))
+    doc.close()
+    assert len(polyline) == 3
+    assert insert.attribs[0].dxf.text == 'value'
+
+
+def test_filter_types(filename):
+    counter = Counter(e.dxftype() for e in iterdxf.modelspace(filename, types=['CIRCLE', 'TEXT']))
+    assert counter == {'CIRCLE': 10, 'TEXT': 1}
+
+
+def test_decoding(filename):
+    text = list(iterdxf.modelspace(filename, types=['TEXT']))[0]
+    assert text.dxf.text == 'ÄÖÜ'
+
+
+def test_resource_document(filename):
+    doc = iterdxf.opendxf(filename)
+    assert 'LINES' in doc.doc.layers
+    doc.close()
+
+
+def test_small_scan_blocks(filename, use_mmap, monkeypatch):
+    monkeypatch.setattr(iterdxf, 'SCAN_BLOCK_SIZE', 256)
+    assert len(list(iterdxf.modelspace(filename, use_mmap=use_mmap))) == 23
+
+
+def test_single_pass_modelspace(filename):
+    with open(filename, mode='rt', encoding='cp1252') as fp:
+        counter = Counter(e.dxftype() for e in iterdxf.single_pass_modelspace(fp, types=['LINE', 'INSERT']))
+    assert counter == {'LINE': 10, 'INSERT': 1}
+
+
+def test_export(filename, tmpdir):
+    doc = iterdxf.opendxf(filename)
+    outname = str(tmpdir.join('export.dxf'))
+    exporter = doc.export(outname)
+    for entity in doc.modelspace(types=['LINE', 'POLYLINE', 'INSERT']):
+        exporter.write(entity)
+    exporter.close()
+    doc.close()
+
+    doc = ezdxf.readfile(outname)
+    msp = doc.modelspace()
+    assert Counter(e.dxftype() for e in msp) == {'LINE': 10, 'POLYLINE': 1, 'INSERT': 1}
+    assert len(msp.query('POLYLINE')[0]) == 3
+    assert 'BLK' in doc.blocks